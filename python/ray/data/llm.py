@@ -105,11 +105,20 @@ class vLLMEngineProcessorConfig(_vLLMEngineProcessorConfig):
             each batch. The default value may not be optimal when the batch size
             or the batch processing latency is too small, but it should be good
             enough for batch size >= 64.
+        length_bucketing_window: The number of rows to sort by prompt length
+            before batching them for the engine, so that each batch holds prompts
+            of similar lengths and doesn't wait on a few long ones. It should be
+            a multiple of the batch size. If not specified, rows are batched in
+            the input order.
         apply_chat_template: Whether to apply chat template.
         chat_template: The chat template to use. This is usually not needed if the
             model checkpoint already contains the chat template.
         tokenize: Whether to tokenize the input before passing it to the vLLM engine.
             If not, vLLM will tokenize the prompt in the engine.
+        fuse_chat_template_and_tokenize: Whether to apply the chat template and
+            tokenize in a single stage, which loads the tokenizer once and shares
+            it across the actors of the stage. Only used if both
+            apply_chat_template and tokenize are enabled.
         detokenize: Whether to detokenize the output.
         has_image: Whether the input messages have images.
         accelerator_type: The accelerator type used by the LLM stage in a processor.
@@ -193,11 +202,20 @@ class SGLangEngineProcessorConfig(_SGLangEngineProcessorConfig):
             each batch. The default value may not be optimal when the batch size
             or the batch processing latency is too small, but it should be good
             enough for batch size >= 64.
+        length_bucketing_window: The number of rows to sort by prompt length
+            before batching them for the engine, so that each batch holds prompts
+            of similar lengths and doesn't wait on a few long ones. It should be
+            a multiple of the batch size. If not specified, rows are batched in
+            the input order.
         apply_chat_template: Whether to apply chat template.
         chat_template: The chat template to use. This is usually not needed if the
             model checkpoint already contains the chat template.
         tokenize: Whether to tokenize the input before passing it to the vLLM engine.
             If not, vLLM will tokenize the prompt in the engine.
+        fuse_chat_template_and_tokenize: Whether to apply the chat template and
+            tokenize in a single stage, which loads the tokenizer once and shares
+            it across the actors of the stage. Only used if both
+            apply_chat_template and tokenize are enabled.
         detokenize: Whether to detokenize the output.
         accelerator_type: The accelerator type used by the LLM stage in a processor.
             Default to None, meaning that only the CPU will be used.
@@ -75,6 +75,15 @@ class OfflineProcessorConfig(ProcessorConfig):
         "or the batch processing latency is too small, but it should be good "
         "enough for batch size >= 32.",
     )
+    length_bucketing_window: Optional[int] = Field(
+        default=None,
+        description="The number of rows to sort by prompt length before "
+        "batching them for the engine. Long and short prompts in the same batch "
+        "keep the batch running until the longest one finishes, so sorting "
+        "rows within a window of a few batches keeps the engine saturated. "
+        "It should be a multiple of the batch size. If not specified, rows "
+        "are batched in the input order.",
+    )
 
     # Processor stage configurations.
     apply_chat_template: bool = Field(
@@ -90,6 +99,14 @@ class OfflineProcessorConfig(ProcessorConfig):
         description="Whether to tokenize the input before passing it to the "
         "backend engine. If not, the backend engine will tokenize the prompt.",
     )
+    fuse_chat_template_and_tokenize: bool = Field(
+        default=False,
+        description="Whether to apply the chat template and tokenize in a single "
+        "stage. The processor is loaded once and shared by the actors of the stage "
+        "through the object store, and the token IDs are passed to the next stage "
+        "as int32 arrays. Only used if both apply_chat_template and tokenize are "
+        "enabled.",
+    )
     detokenize: bool = Field(
         default=True,
         description="Whether to detokenize the output.",
@@ -22,11 +22,14 @@ from ray.llm._internal.batch.processor.base import (
 )
 from ray.llm._internal.batch.stages import (
     ChatTemplateStage,
+    ChatTemplateTokenizeStage,
     DetokenizeStage,
+    LengthBucketStage,
     PrepareImageStage,
     TokenizeStage,
     vLLMEngineStage,
 )
+from ray.llm._internal.batch.stages.chat_template_tokenize_stage import put_processor
 from ray.llm._internal.batch.stages.vllm_engine_stage import vLLMTaskType
 from ray.llm._internal.common.observability.telemetry_utils import DEFAULT_GPU_TYPE
 from ray.llm._internal.common.utils.download_utils import (
@@ -109,12 +112,17 @@ def build_vllm_engine_processor(
                 ),
             )
         )
-    if config.apply_chat_template:
+    if (
+        config.apply_chat_template
+        and config.tokenize
+        and config.fuse_chat_template_and_tokenize
+    ):
         stages.append(
-            ChatTemplateStage(
+            ChatTemplateTokenizeStage(
                 fn_constructor_kwargs=dict(
                     model=config.model_source,
                     chat_template=config.chat_template,
+                    processor_ref=put_processor(config.model_source),
                 ),
                 map_batches_kwargs=dict(
                     zero_copy_batch=True,
@@ -124,17 +132,45 @@ def build_vllm_engine_processor(
                 ),
             )
         )
+    else:
+        if config.apply_chat_template:
+            stages.append(
+                ChatTemplateStage(
+                    fn_constructor_kwargs=dict(
+                        model=config.model_source,
+                        chat_template=config.chat_template,
+                    ),
+                    map_batches_kwargs=dict(
+                        zero_copy_batch=True,
+                        concurrency=processor_concurrency,
+                        batch_size=config.batch_size,
+                        runtime_env=config.runtime_env,
+                    ),
+                )
+            )
+
+        if config.tokenize:
+            stages.append(
+                TokenizeStage(
+                    fn_constructor_kwargs=dict(
+                        model=config.model_source,
+                    ),
+                    map_batches_kwargs=dict(
+                        zero_copy_batch=True,
+                        concurrency=processor_concurrency,
+                        batch_size=config.batch_size,
+                        runtime_env=config.runtime_env,
+                    ),
+                )
+            )
 
-    if config.tokenize:
+    if config.length_bucketing_window:
         stages.append(
-            TokenizeStage(
-                fn_constructor_kwargs=dict(
-                    model=config.model_source,
-                ),
+            LengthBucketStage(
                 map_batches_kwargs=dict(
                     zero_copy_batch=True,
                     concurrency=processor_concurrency,
-                    batch_size=config.batch_size,
+                    batch_size=config.length_bucketing_window,
                     runtime_env=config.runtime_env,
                 ),
             )
@@ -4,7 +4,11 @@ from ray.llm._internal.batch.stages.base import (
     wrap_preprocess,
 )
 from ray.llm._internal.batch.stages.chat_template_stage import ChatTemplateStage
+from ray.llm._internal.batch.stages.chat_template_tokenize_stage import (
+    ChatTemplateTokenizeStage,
+)
 from ray.llm._internal.batch.stages.http_request_stage import HttpRequestStage
+from ray.llm._internal.batch.stages.length_bucket_stage import LengthBucketStage
 from ray.llm._internal.batch.stages.prepare_image_stage import PrepareImageStage
 from ray.llm._internal.batch.stages.sglang_engine_stage import SGLangEngineStage
 from ray.llm._internal.batch.stages.tokenize_stage import DetokenizeStage, TokenizeStage
@@ -14,7 +18,9 @@ __all__ = [
     "StatefulStage",
     "HttpRequestStage",
     "ChatTemplateStage",
+    "ChatTemplateTokenizeStage",
     "TokenizeStage",
+    "LengthBucketStage",
     "DetokenizeStage",
     "vLLMEngineStage",
     "SGLangEngineStage",
@@ -12,6 +12,28 @@ from ray.llm._internal.common.utils.download_utils import (
 )
 
 
+def load_processor(model: str) -> Any:
+    """Load the HuggingFace processor of the model.
+
+    Args:
+        model: The model to load the processor of.
+
+    Returns:
+        The processor. For text-only models, this is the tokenizer.
+    """
+    from transformers import AutoProcessor
+
+    # NOTE: We always use processor instead of tokenizer, because tokenizers
+    # of VLM models may not have chat template attribute.
+    model_path = download_model_files(
+        model_id=model,
+        mirror_config=None,
+        download_model=NodeModelDownloadable.TOKENIZER_ONLY,
+        download_extra_files=False,
+    )
+    return AutoProcessor.from_pretrained(model_path, trust_remote_code=True)
+
+
 class ChatTemplateUDF(StatefulStageUDF):
     def __init__(
         self,
@@ -31,34 +53,19 @@ class ChatTemplateUDF(StatefulStageUDF):
                            usually not needed if the model checkpoint already contains the
                            chat template.
         """
-        from transformers import AutoProcessor
-
         super().__init__(data_column, expected_input_keys)
-
-        # NOTE: We always use processor instead of tokenizer in this stage,
-        # because tokenizers of VLM models may not have chat template attribute.
-        # However, this may not be a reliable solution, because processors and
-        # tokenizers are not standardized across different models.
-        model_path = download_model_files(
-            model_id=model,
-            mirror_config=None,
-            download_model=NodeModelDownloadable.TOKENIZER_ONLY,
-            download_extra_files=False,
-        )
-        self.processor = AutoProcessor.from_pretrained(
-            model_path, trust_remote_code=True
-        )
+        self.processor = load_processor(model)
         self.chat_template = chat_template
 
-    async def udf(self, batch: List[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+    def apply_chat_template(self, batch: List[Dict[str, Any]]) -> List[str]:
         """
-        Apply chat template to the given batch.
+        Apply chat template to the messages of each row in the given batch.
 
         Args:
-            batch: A list of rows to send.
+            batch: A list of rows with messages.
 
-        Yields:
-            A generator of rows with the chat template applied.
+        Returns:
+            The prompts with the chat template applied.
         """
         prompts = []
         for row in batch:
@@ -83,8 +90,19 @@ class ChatTemplateUDF(StatefulStageUDF):
                 )
             )
         assert len(batch) == len(prompts)
+        return prompts
+
+    async def udf(self, batch: List[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Apply chat template to the given batch.
 
-        for row, prompt in zip(batch, prompts):
+        Args:
+            batch: A list of rows to send.
+
+        Yields:
+            A generator of rows with the chat template applied.
+        """
+        for row, prompt in zip(batch, self.apply_chat_template(batch)):
             yield {
                 self.IDX_IN_BATCH_COLUMN: row[self.IDX_IN_BATCH_COLUMN],
                 "prompt": prompt,
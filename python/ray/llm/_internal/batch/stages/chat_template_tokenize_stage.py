@@ -0,0 +1,121 @@
+"""Apply chat template and tokenize stage"""
+
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Type
+
+import numpy as np
+
+import ray
+from ray.llm._internal.batch.stages.base import StatefulStageUDF
+from ray.llm._internal.batch.stages.chat_template_stage import (
+    ChatTemplateStage,
+    ChatTemplateUDF,
+    load_processor,
+)
+from ray.llm._internal.batch.utils import get_cached_tokenizer
+
+logger = logging.getLogger(__name__)
+
+
+def put_processor(model: str) -> Optional[ray.ObjectRef]:
+    """Load the processor of the model once and put it in the object store,
+    so that the actors of the stage share it instead of each of them
+    downloading and parsing the tokenizer files.
+
+    Args:
+        model: The model to load the processor of.
+
+    Returns:
+        The reference to the processor, or None if it cannot be serialized
+        (e.g., it uses remote code), in which case every actor loads it.
+    """
+    try:
+        return ray.put(load_processor(model))
+    except Exception:
+        logger.warning(
+            "Failed to share the processor of %s across actors, every actor "
+            "will load it instead.",
+            model,
+            exc_info=True,
+        )
+        return None
+
+
+class ChatTemplateTokenizeUDF(ChatTemplateUDF):
+    def __init__(
+        self,
+        data_column: str,
+        expected_input_keys: List[str],
+        model: str,
+        chat_template: Optional[str] = None,
+        processor_ref: Optional[ray.ObjectRef] = None,
+    ):
+        """
+        Initialize the ChatTemplateTokenizeUDF.
+
+        Args:
+            data_column: The data column name.
+            expected_input_keys: The expected input keys of the stage.
+            model: The model to use for the chat template and the tokenizer.
+            chat_template: The chat template in Jinja template format. This is
+                           usually not needed if the model checkpoint already contains the
+                           chat template.
+            processor_ref: The reference to the processor of the model shared by
+                           all actors of the stage. If None or if it cannot be
+                           fetched, the processor is loaded from the model files.
+        """
+        StatefulStageUDF.__init__(self, data_column, expected_input_keys)
+
+        processor = None
+        if processor_ref is not None:
+            try:
+                processor = ray.get(processor_ref)
+            except Exception:
+                logger.warning(
+                    "Failed to get the shared processor of %s, loading it "
+                    "from the model files instead.",
+                    model,
+                    exc_info=True,
+                )
+        if processor is None:
+            processor = load_processor(model)
+
+        self.processor = processor
+        self.chat_template = chat_template
+        # Tokenize with the tokenizer of the processor instead of loading it again.
+        self.tokenizer = get_cached_tokenizer(self.processor)
+
+    async def udf(self, batch: List[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Apply chat template to the given batch and tokenize the prompts with
+        one batched tokenizer call.
+
+        Args:
+            batch: A list of rows to send.
+
+        Yields:
+            A generator of rows with the chat template applied and the
+            tokenized prompt.
+        """
+        prompts = self.apply_chat_template(batch)
+        all_prompt_token_ids = self.tokenizer(prompts, return_attention_mask=False)[
+            "input_ids"
+        ]
+        for row, prompt, prompt_token_ids in zip(batch, prompts, all_prompt_token_ids):
+            yield {
+                self.IDX_IN_BATCH_COLUMN: row[self.IDX_IN_BATCH_COLUMN],
+                "prompt": prompt,
+                # Emit int32 arrays so that the token IDs are stored as
+                # list<int32> columns in Arrow instead of lists of Python ints.
+                "tokenized_prompt": np.asarray(prompt_token_ids, dtype=np.int32),
+            }
+
+
+class ChatTemplateTokenizeStage(ChatTemplateStage):
+    """
+    A stage that applies chat template and tokenizes the prompts. This is
+    equivalent to a ChatTemplateStage followed by a TokenizeStage, but loads
+    the tokenizer once and doesn't pass the prompts between stages.
+    """
+
+    fn: Type[StatefulStageUDF] = ChatTemplateTokenizeUDF
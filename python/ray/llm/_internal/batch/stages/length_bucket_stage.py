@@ -0,0 +1,112 @@
+"""Length bucketing stage"""
+
+import logging
+from typing import Any, AsyncIterator, Dict, List, Type
+
+from ray.llm._internal.batch.stages.base import (
+    StatefulStage,
+    StatefulStageUDF,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def get_prompt_length(row: Dict[str, Any]) -> int:
+    """Get the length of the prompt in a row. This is the number of tokens
+    if the prompt is tokenized, and the number of characters otherwise.
+
+    Args:
+        row: The row.
+
+    Returns:
+        The length of the prompt.
+    """
+    tokenized_prompt = row.get("tokenized_prompt")
+    if tokenized_prompt is not None:
+        return len(tokenized_prompt)
+    return len(row["prompt"])
+
+
+class LengthBucketUDF(StatefulStageUDF):
+    def __init__(
+        self,
+        data_column: str,
+        expected_input_keys: List[str],
+    ):
+        """
+        Initialize the LengthBucketUDF.
+
+        Args:
+            data_column: The data column name.
+            expected_input_keys: The expected input keys of the stage.
+        """
+        super().__init__(data_column, expected_input_keys)
+
+    async def udf(self, batch: List[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Reorder the given window of rows from the longest to the shortest prompt.
+        Rows are streamed to the next stage in the order they are yielded, so
+        the batches of the next stage are cut from consecutive rows of
+        similar lengths.
+
+        Args:
+            batch: A list of rows in the bucketing window.
+
+        Yields:
+            A generator of rows in the descending order of prompt lengths.
+        """
+        for row in sorted(batch, key=get_prompt_length, reverse=True):
+            yield {self.IDX_IN_BATCH_COLUMN: row[self.IDX_IN_BATCH_COLUMN]}
+
+
+class LengthBucketStage(StatefulStage):
+    """
+    A stage that sorts rows by prompt length within a window, so that the
+    engine stage gets batches of similar lengths. A batch holds one of the
+    `max_concurrent_batches` slots of the engine until its longest request
+    finishes, so mixing long and short prompts in a batch leaves the engine
+    running only the stragglers.
+
+    The window size is the `batch_size` in `map_batches_kwargs`. It should be
+    a multiple of the processor batch size, so that the batches of the engine
+    stage don't span multiple windows.
+    """
+
+    fn: Type[StatefulStageUDF] = LengthBucketUDF
+
+    def get_required_input_keys(self) -> Dict[str, str]:
+        """The required input keys of the stage and their descriptions."""
+        return {"prompt": "The text prompt (str)."}
+
+    def get_optional_input_keys(self) -> Dict[str, str]:
+        """The optional input keys of the stage and their descriptions."""
+        return {
+            "tokenized_prompt": "The tokenized prompt. If provided, rows are "
+            "sorted by the number of tokens instead of the number of characters.",
+        }
+
+    def get_dataset_map_batches_kwargs(
+        self,
+        batch_size: int,
+        data_column: str,
+    ) -> Dict[str, Any]:
+        """Use the bucketing window instead of the processor batch size as
+        the batch size of this stage.
+
+        Args:
+            batch_size: The batch size set by the processor config.
+            data_column: The data column name set by the processor.
+
+        Returns:
+            The dataset map_batches kwargs.
+        """
+        window_size = self.map_batches_kwargs.get("batch_size", batch_size)
+        if window_size % batch_size != 0:
+            logger.warning(
+                "The length bucketing window (%d) is not a multiple of the "
+                "batch size (%d), so some batches will mix rows from "
+                "different windows.",
+                window_size,
+                batch_size,
+            )
+        return super().get_dataset_map_batches_kwargs(window_size, data_column)
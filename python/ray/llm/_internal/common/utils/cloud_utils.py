@@ -275,6 +275,37 @@ class CloudFileSystem:
             logger.exception(f"Error downloading files from {bucket_uri}: {e}")
             raise
 
+    @staticmethod
+    def get_model_hash(fs: pa_fs.FileSystem, source_path: str, bucket_uri: str) -> str:
+        """Get the hash of a model from the `hash` file in its cloud directory.
+
+        Args:
+            fs: Filesystem of the cloud directory
+            source_path: Path of the cloud directory in the filesystem
+            bucket_uri: URI of the cloud directory, used for logging
+
+        Returns:
+            The hash, or a hash of all zeros if the directory has no hash file.
+        """
+        hash_path = os.path.join(source_path, "hash")
+        hash_info = fs.get_file_info(hash_path)
+
+        if hash_info.type == pa_fs.FileType.File:
+            # Download and read hash file
+            with fs.open_input_file(hash_path) as f:
+                f_hash = f.read().decode("utf-8").strip()
+            logger.info(
+                f"Detected hash file in bucket {bucket_uri}. "
+                f"Using {f_hash} as the hash."
+            )
+        else:
+            f_hash = "0000000000000000000000000000000000000000"
+            logger.info(
+                f"Hash file does not exist in bucket {bucket_uri}. "
+                f"Using {f_hash} as the hash."
+            )
+        return f_hash
+
     @staticmethod
     def download_model(
         destination_path: str, bucket_uri: str, tokenizer_only: bool
@@ -291,25 +322,7 @@ class CloudFileSystem:
         """
         try:
             fs, source_path = CloudFileSystem.get_fs_and_path(bucket_uri)
-
-            # Check for hash file
-            hash_path = os.path.join(source_path, "hash")
-            hash_info = fs.get_file_info(hash_path)
-
-            if hash_info.type == pa_fs.FileType.File:
-                # Download and read hash file
-                with fs.open_input_file(hash_path) as f:
-                    f_hash = f.read().decode("utf-8").strip()
-                logger.info(
-                    f"Detected hash file in bucket {bucket_uri}. "
-                    f"Using {f_hash} as the hash."
-                )
-            else:
-                f_hash = "0000000000000000000000000000000000000000"
-                logger.info(
-                    f"Hash file does not exist in bucket {bucket_uri}. "
-                    f"Using {f_hash} as the hash."
-                )
+            f_hash = CloudFileSystem.get_model_hash(fs, source_path, bucket_uri)
 
             # Write hash to refs/main
             main_dir = os.path.join(destination_path, "refs")
@@ -1,10 +1,25 @@
 import enum
+import hashlib
+import json
 import os
+import random
+import shutil
+import uuid
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
+import pyarrow.fs as pa_fs
 from filelock import FileLock
 
+import ray
+from ray._private.internal_api import free
+from ray.experimental.internal_kv import (
+    _internal_kv_del,
+    _internal_kv_get,
+    _internal_kv_initialized,
+    _internal_kv_list,
+    _internal_kv_put,
+)
 from ray.llm._internal.common.observability.logging import get_logger
 from ray.llm._internal.common.utils.cloud_utils import (
     CloudFileSystem,
@@ -13,11 +28,43 @@ from ray.llm._internal.common.utils.cloud_utils import (
     is_remote_path,
 )
 from ray.llm._internal.common.utils.import_utils import try_import
+from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 
 torch = try_import("torch")
 
 logger = get_logger(__name__)
 
+# Directory of the node-local cache of model files, e.g., ~/.cache/ray/llm/weights.
+# The cache is disabled if not set.
+RAYLLM_NODE_WEIGHT_CACHE_DIR = os.getenv("RAYLLM_NODE_WEIGHT_CACHE_DIR", "")
+
+# Maximum total size of the entries in the node-local cache of model files. The
+# least recently used entries are removed when it's exceeded. No limit if 0.
+RAYLLM_NODE_WEIGHT_CACHE_MAX_SIZE_BYTES = int(
+    os.getenv("RAYLLM_NODE_WEIGHT_CACHE_MAX_SIZE_BYTES", 0)
+)
+
+# Whether to fetch model files from other nodes that have them cached, instead of
+# downloading them from cloud storage.
+RAYLLM_ENABLE_PEER_WEIGHT_TRANSFER = (
+    os.getenv("RAYLLM_ENABLE_PEER_WEIGHT_TRANSFER", "1") == "1"
+)
+
+# Size of the chunks model files are sent in between nodes.
+RAYLLM_PEER_WEIGHT_TRANSFER_CHUNK_SIZE_BYTES = int(
+    os.getenv("RAYLLM_PEER_WEIGHT_TRANSFER_CHUNK_SIZE_BYTES", 64 * 1024 * 1024)
+)
+
+# Maximum number of chunks a peer reads ahead of the node writing them, so that a
+# slow writer doesn't make the peer fill the object store.
+RAYLLM_PEER_WEIGHT_TRANSFER_MAX_CHUNKS_IN_FLIGHT = int(
+    os.getenv("RAYLLM_PEER_WEIGHT_TRANSFER_MAX_CHUNKS_IN_FLIGHT", 2)
+)
+
+_WEIGHT_CACHE_KV_NAMESPACE = "rayllm_node_weight_cache"
+_MANIFEST_FILE_NAME = ".manifest.json"
+_TOKENIZER_FILE_SUBSTRINGS = ["tokenizer", "config.json"]
+
 
 class NodeModelDownloadable(enum.Enum):
     """Defines which files to download from cloud storage."""
@@ -100,6 +147,289 @@ def get_model_location_on_disk(model_id: str) -> str:
     return model_id_or_path
 
 
+@ray.remote(num_cpus=0)
+def _list_cached_files(cache_root: str, digest: str) -> Optional[List[str]]:
+    cache = NodeWeightCache(cache_root)
+    if not cache.contains(digest):
+        return None
+    return cache.list_files(digest)
+
+
+@ray.remote(num_cpus=0)
+def _read_cached_file(
+    cache_root: str, digest: str, rel_path: str, chunk_size: int
+) -> Iterator[bytes]:
+    with open(NodeWeightCache(cache_root).get_path(digest) / rel_path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+class NodeWeightCache:
+    """Content-addressed cache of model files shared by all processes on a node.
+
+    Each entry is a directory named after the digest of its contents. Entries are
+    filled at most once per node: the first process downloads the files while the
+    others wait on a file lock, and an entry is only visible once it's complete.
+
+    When running in a Ray cluster, nodes register the entries they hold, and new
+    nodes copy the files from a peer over Ray's object transfer instead of
+    downloading them from cloud storage again.
+
+    If the total size of the entries exceeds `max_size_bytes`, the least recently
+    used entries are removed from the node and deregistered. The entry that was
+    just added is always kept, so the limit should leave room for all models
+    that are used on the node at the same time.
+
+    Args:
+        root: Directory of the cache. Defaults to `RAYLLM_NODE_WEIGHT_CACHE_DIR`.
+        max_size_bytes: Maximum total size of the entries, no limit if 0.
+            Defaults to `RAYLLM_NODE_WEIGHT_CACHE_MAX_SIZE_BYTES`.
+    """
+
+    def __init__(
+        self, root: Optional[str] = None, max_size_bytes: Optional[int] = None
+    ):
+        self.root = Path(root or RAYLLM_NODE_WEIGHT_CACHE_DIR).expanduser()
+        self.max_size_bytes = (
+            RAYLLM_NODE_WEIGHT_CACHE_MAX_SIZE_BYTES
+            if max_size_bytes is None
+            else max_size_bytes
+        )
+
+    def get_path(self, digest: str) -> Path:
+        return self.root / digest
+
+    def contains(self, digest: str) -> bool:
+        return (self.get_path(digest) / _MANIFEST_FILE_NAME).exists()
+
+    def list_files(self, digest: str) -> List[str]:
+        """Returns the paths of the files in an entry, relative to the entry."""
+        return self._read_manifest(digest)["files"]
+
+    def _read_manifest(self, digest: str) -> Dict[str, Any]:
+        with open(self.get_path(digest) / _MANIFEST_FILE_NAME) as f:
+            return json.load(f)
+
+    def _touch(self, digest: str) -> None:
+        """Marks an entry as used now, for the LRU eviction."""
+        try:
+            os.utime(self.get_path(digest) / _MANIFEST_FILE_NAME)
+        except FileNotFoundError:
+            pass
+
+    def get_or_fetch(self, digest: str, download_fn: Callable[[str], None]) -> Path:
+        """Returns the path of an entry, filling it first if it isn't cached.
+
+        The entry is copied from a peer node if possible, else `download_fn` is
+        called with the directory to download the files to.
+        """
+        path = self.get_path(digest)
+        if self.contains(digest):
+            self._touch(digest)
+            return path
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        with FileLock(self.root / f"{digest}.lock", timeout=-1):
+            if self.contains(digest):
+                self._touch(digest)
+                return path
+
+            tmp_path = self.root / f"{digest}.tmp-{uuid.uuid4().hex}"
+            try:
+                if not self._fetch_from_peers(digest, tmp_path):
+                    tmp_path.mkdir(parents=True)
+                    download_fn(str(tmp_path))
+
+                file_paths = sorted(p for p in tmp_path.rglob("*") if p.is_file())
+                files = [str(p.relative_to(tmp_path)) for p in file_paths]
+                size_bytes = sum(p.stat().st_size for p in file_paths)
+                with open(tmp_path / _MANIFEST_FILE_NAME, "w") as f:
+                    json.dump({"files": files, "size_bytes": size_bytes}, f)
+                os.rename(tmp_path, path)
+            finally:
+                shutil.rmtree(tmp_path, ignore_errors=True)
+
+        self._register(digest)
+        if self.max_size_bytes > 0:
+            self._evict(keep_digest=digest)
+        return path
+
+    def _evict(self, keep_digest: str) -> None:
+        """Removes the least recently used entries until the cache fits its limit.
+
+        Entries that are being filled or removed by other processes are skipped.
+        """
+        with FileLock(self.root / ".evict.lock", timeout=-1):
+            entries = []
+            total_size_bytes = 0
+            for manifest_path in self.root.glob(f"*/{_MANIFEST_FILE_NAME}"):
+                digest = manifest_path.parent.name
+                if "." in digest:
+                    # An entry that is being filled or removed.
+                    continue
+                try:
+                    last_used_s = manifest_path.stat().st_mtime
+                    # Entries written before sizes were recorded count as empty.
+                    size_bytes = self._read_manifest(digest).get("size_bytes", 0)
+                except (OSError, ValueError):
+                    continue
+                total_size_bytes += size_bytes
+                if digest != keep_digest:
+                    entries.append((last_used_s, digest, size_bytes))
+
+            entries.sort()
+            for _, digest, size_bytes in entries:
+                if total_size_bytes <= self.max_size_bytes:
+                    break
+                try:
+                    with FileLock(self.root / f"{digest}.lock", timeout=0):
+                        self._remove(digest)
+                except TimeoutError:
+                    continue
+                total_size_bytes -= size_bytes
+
+    def _remove(self, digest: str) -> None:
+        """Deregisters an entry and removes it from the node."""
+        self._deregister(digest)
+        path = self.get_path(digest)
+        # Hide the entry before deleting its files, so it's never used partially.
+        removed_path = self.root / f"{digest}.removed-{uuid.uuid4().hex}"
+        os.rename(path, removed_path)
+        shutil.rmtree(removed_path, ignore_errors=True)
+        logger.info("Removed cached model files %s from %s.", digest, self.root)
+
+    def _register(self, digest: str) -> None:
+        if not ray.is_initialized() or not _internal_kv_initialized():
+            return
+
+        node_id = ray.get_runtime_context().get_node_id()
+        _internal_kv_put(
+            f"{digest}/{node_id}",
+            str(self.root),
+            overwrite=True,
+            namespace=_WEIGHT_CACHE_KV_NAMESPACE,
+        )
+
+    def _deregister(self, digest: str) -> None:
+        if not ray.is_initialized() or not _internal_kv_initialized():
+            return
+
+        key = f"{digest}/{ray.get_runtime_context().get_node_id()}"
+        root = _internal_kv_get(key, namespace=_WEIGHT_CACHE_KV_NAMESPACE)
+        if root is not None and Path(root.decode()) == self.root:
+            _internal_kv_del(key, namespace=_WEIGHT_CACHE_KV_NAMESPACE)
+
+    def _get_peers(self, digest: str) -> List[Tuple[str, str]]:
+        """Returns the (node ID, cache root) of other caches that hold the entry."""
+        if (
+            not RAYLLM_ENABLE_PEER_WEIGHT_TRANSFER
+            or not ray.is_initialized()
+            or not _internal_kv_initialized()
+        ):
+            return []
+
+        alive_node_ids = {node["NodeID"] for node in ray.nodes() if node["Alive"]}
+        self_node_id = ray.get_runtime_context().get_node_id()
+        peers = []
+        for key in _internal_kv_list(
+            f"{digest}/", namespace=_WEIGHT_CACHE_KV_NAMESPACE
+        ):
+            node_id = key.decode().split("/", 1)[1]
+            if node_id not in alive_node_ids:
+                # The node is gone, and so are its cached files.
+                _internal_kv_del(key, namespace=_WEIGHT_CACHE_KV_NAMESPACE)
+                continue
+            root = _internal_kv_get(key, namespace=_WEIGHT_CACHE_KV_NAMESPACE)
+            if root is None:
+                continue
+            root = root.decode()
+            if node_id == self_node_id and Path(root) == self.root:
+                continue
+            peers.append((node_id, root))
+
+        # Spread the load if many nodes fetch the same entry at once.
+        random.shuffle(peers)
+        return peers
+
+    def _fetch_from_peers(self, digest: str, dest: Path) -> bool:
+        """Copies an entry from a peer node to `dest`. Returns whether it succeeded."""
+        for node_id, root in self._get_peers(digest):
+            strategy = NodeAffinitySchedulingStrategy(node_id=node_id, soft=False)
+            try:
+                rel_paths = ray.get(
+                    _list_cached_files.options(scheduling_strategy=strategy).remote(
+                        root, digest
+                    )
+                )
+                if rel_paths is None:
+                    # The peer removed the entry since, its registration is stale.
+                    _internal_kv_del(
+                        f"{digest}/{node_id}", namespace=_WEIGHT_CACHE_KV_NAMESPACE
+                    )
+                    continue
+
+                for rel_path in rel_paths:
+                    file_path = dest / rel_path
+                    file_path.parent.mkdir(parents=True, exist_ok=True)
+                    chunks = _read_cached_file.options(
+                        scheduling_strategy=strategy,
+                        _generator_backpressure_num_objects=(
+                            RAYLLM_PEER_WEIGHT_TRANSFER_MAX_CHUNKS_IN_FLIGHT
+                        ),
+                    ).remote(
+                        root,
+                        digest,
+                        rel_path,
+                        RAYLLM_PEER_WEIGHT_TRANSFER_CHUNK_SIZE_BYTES,
+                    )
+                    with open(file_path, "wb") as f:
+                        for chunk in chunks:
+                            f.write(ray.get(chunk))
+                            # Release the chunk right away rather than when the
+                            # reference goes out of scope.
+                            free([chunk])
+            except Exception:
+                logger.warning(
+                    "Failed to fetch cached model files %s from node %s.",
+                    digest,
+                    node_id,
+                    exc_info=True,
+                )
+                shutil.rmtree(dest, ignore_errors=True)
+                continue
+
+            logger.info("Fetched cached model files %s from node %s.", digest, node_id)
+            return True
+
+        return False
+
+
+def _get_model_files_digest(
+    fs: pa_fs.FileSystem, source_path: str, f_hash: str, tokenizer_only: bool
+) -> Tuple[str, List[Tuple[str, int, Optional[int]]]]:
+    """Computes the digest of a model in cloud storage from its file listing.
+
+    Returns the digest and the (relative path, size, mtime) of each file.
+    """
+    entries = []
+    for file_info in fs.get_file_info(pa_fs.FileSelector(source_path, recursive=True)):
+        if file_info.type != pa_fs.FileType.File:
+            continue
+        rel_path = file_info.path[len(source_path) :].lstrip("/")
+        if tokenizer_only and not any(
+            substring in rel_path for substring in _TOKENIZER_FILE_SUBSTRINGS
+        ):
+            continue
+        entries.append((rel_path, file_info.size, file_info.mtime_ns))
+    entries.sort()
+
+    digest = hashlib.sha256(json.dumps([f_hash, entries]).encode()).hexdigest()
+    return digest, entries
+
+
 class CloudModelDownloader(CloudModelAccessor):
     """Unified downloader for models stored in cloud storage (S3 or GCS).
 
@@ -135,7 +465,7 @@ class CloudModelDownloader(CloudModelAccessor):
             # This ensures that subsequent processes don't duplicate work.
             with FileLock(lock_path, timeout=0):
                 try:
-                    CloudFileSystem.download_model(
+                    self._download_model(
                         destination_path=path,
                         bucket_uri=bucket_uri,
                         tokenizer_only=tokenizer_only,
@@ -158,6 +488,76 @@ class CloudModelDownloader(CloudModelAccessor):
                 pass
         return get_model_location_on_disk(self.model_id)
 
+    def _download_model(
+        self, destination_path: Path, bucket_uri: str, tokenizer_only: bool
+    ) -> None:
+        """Downloads the model in the HuggingFace cache layout.
+
+        If the node weight cache is enabled, the snapshot directory is a link to an
+        entry of the cache, so the files are only downloaded once per node (or
+        copied from a peer node) for as long as they don't change.
+        """
+        if not RAYLLM_NODE_WEIGHT_CACHE_DIR:
+            CloudFileSystem.download_model(
+                destination_path=destination_path,
+                bucket_uri=bucket_uri,
+                tokenizer_only=tokenizer_only,
+            )
+            return
+
+        fs, source_path = CloudFileSystem.get_fs_and_path(bucket_uri)
+        f_hash = CloudFileSystem.get_model_hash(fs, source_path, bucket_uri)
+        snapshot_path = Path(destination_path, "snapshots", f_hash)
+        if snapshot_path.exists() and not snapshot_path.is_symlink():
+            # Downloaded before the cache was enabled, keep updating it in place.
+            CloudFileSystem.download_model(
+                destination_path=destination_path,
+                bucket_uri=bucket_uri,
+                tokenizer_only=tokenizer_only,
+            )
+            return
+
+        cache = NodeWeightCache()
+        digest, entries = _get_model_files_digest(
+            fs, source_path, f_hash, tokenizer_only
+        )
+        linked_digest = (
+            Path(os.readlink(snapshot_path)).name
+            if snapshot_path.is_symlink()
+            else None
+        )
+        if (
+            tokenizer_only
+            and linked_digest is not None
+            and cache.contains(linked_digest)
+            and {rel_path for rel_path, _, _ in entries}
+            <= set(cache.list_files(linked_digest))
+        ):
+            # Don't replace a snapshot that already has the whole model.
+            cache_path = cache.get_path(linked_digest)
+        else:
+            cache_path = cache.get_or_fetch(
+                digest,
+                lambda path: CloudFileSystem.download_files(
+                    path=path,
+                    bucket_uri=bucket_uri,
+                    substrings_to_include=(
+                        _TOKENIZER_FILE_SUBSTRINGS if tokenizer_only else []
+                    ),
+                ),
+            )
+
+        refs_path = Path(destination_path, "refs")
+        refs_path.mkdir(parents=True, exist_ok=True)
+        with open(refs_path / "main", "w") as f:
+            f.write(f_hash)
+
+        if linked_digest != cache_path.name:
+            snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_link_path = snapshot_path.with_name(f"{f_hash}.tmp-{uuid.uuid4().hex}")
+            os.symlink(cache_path, tmp_link_path, target_is_directory=True)
+            os.replace(tmp_link_path, snapshot_path)
+
     def get_extra_files(self) -> List[str]:
         """Gets user-specified extra files from cloud storage and stores them in
         provided paths.
@@ -48,6 +48,22 @@ MAX_NUM_TOPLOGPROBS_ALLOWED = 5
 MODEL_RESPONSE_BATCH_TIMEOUT_MS = float(
     os.getenv("RAYLLM_MODEL_RESPONSE_BATCH_TIMEOUT_MS", "50")
 )
+# If true, the interval at which streamed responses are batched adapts to the
+# number of concurrent streams on the replica and to how slowly each stream's
+# consumer reads, between the min and max intervals below.
+ENABLE_ADAPTIVE_RESPONSE_BATCHING = (
+    os.getenv("RAYLLM_ENABLE_ADAPTIVE_RESPONSE_BATCHING", "0") == "1"
+)
+MODEL_RESPONSE_BATCH_MIN_TIMEOUT_MS = float(
+    os.getenv("RAYLLM_MODEL_RESPONSE_BATCH_MIN_TIMEOUT_MS", "5")
+)
+MODEL_RESPONSE_BATCH_MAX_TIMEOUT_MS = float(
+    os.getenv("RAYLLM_MODEL_RESPONSE_BATCH_MAX_TIMEOUT_MS", "100")
+)
+# Number of concurrent streams at which the adaptive interval reaches the max.
+MODEL_RESPONSE_BATCH_SATURATION_STREAMS = int(
+    os.getenv("RAYLLM_MODEL_RESPONSE_BATCH_SATURATION_STREAMS", "64")
+)
 RAYLLM_ENABLE_REQUEST_PROMPT_LOGS = (
     os.environ.get("RAYLLM_ENABLE_REQUEST_PROMPT_LOGS", "1") == "1"
 )
@@ -1,5 +1,5 @@
 import abc
-from typing import AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, Dict, Optional
 
 from transformers.dynamic_module_utils import init_hf_modules
 
@@ -60,6 +60,12 @@ class LLMEngine(abc.ABC):
     # to sleep during training and wake up during rollouts.
     ##############################################################
 
+    def routing_stats(self) -> Dict[str, Any]:
+        """Returns the latest engine stats used for request routing, e.g., the KV
+        cache usage under the `kv_cache_usage` key. Empty if not supported.
+        """
+        return {}
+
     async def sleep(self):
         """Puts the engine to sleep"""
         pass
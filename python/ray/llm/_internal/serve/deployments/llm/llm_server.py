@@ -11,7 +11,11 @@ from ray._common.utils import import_attr
 from ray.llm._internal.serve.configs.constants import (
     DEFAULT_HEALTH_CHECK_PERIOD_S,
     DEFAULT_HEALTH_CHECK_TIMEOUT_S,
+    ENABLE_ADAPTIVE_RESPONSE_BATCHING,
     ENGINE_START_TIMEOUT_S,
+    MODEL_RESPONSE_BATCH_MAX_TIMEOUT_MS,
+    MODEL_RESPONSE_BATCH_MIN_TIMEOUT_MS,
+    MODEL_RESPONSE_BATCH_SATURATION_STREAMS,
     MODEL_RESPONSE_BATCH_TIMEOUT_MS,
     RAYLLM_VLLM_ENGINE_CLS_ENV,
 )
@@ -54,7 +58,10 @@ from ray.llm._internal.serve.deployments.llm.vllm.vllm_engine import VLLMEngine
 from ray.llm._internal.serve.deployments.llm.vllm.vllm_models import (
     VLLMEmbeddingRequest,
 )
-from ray.llm._internal.serve.deployments.utils.batcher import OpenAIResponseBatcher
+from ray.llm._internal.serve.deployments.utils.batcher import (
+    AdaptiveBatchInterval,
+    OpenAIResponseBatcher,
+)
 from ray.llm._internal.serve.deployments.utils.error_handling_utils import (
     StreamingErrorHandler,
 )
@@ -465,6 +472,7 @@ class LLMServer(_LLMServerBase):
             )(lambda lora_model_id: self._load_model(lora_model_id))
 
         self.response_postprocessor = ResponsePostprocessor()
+        self._adaptive_batch_interval = self._get_adaptive_batch_interval()
 
     @property
     def _get_engine_class(self) -> Type[LLMEngine]:
@@ -536,6 +544,27 @@ class LLMServer(_LLMServerBase):
             stream_batching_interval_ms = MODEL_RESPONSE_BATCH_TIMEOUT_MS
         return stream_batching_interval_ms if stream else None
 
+    def _get_adaptive_batch_interval(self) -> Optional[AdaptiveBatchInterval]:
+        """Create the interval shared by the response streams of this replica,
+        if adaptive batching is enabled."""
+        experimental_configs = self._llm_config.experimental_configs
+        if not experimental_configs.get(
+            "stream_batching_adaptive", ENABLE_ADAPTIVE_RESPONSE_BATCHING
+        ):
+            return None
+        return AdaptiveBatchInterval(
+            min_interval_ms=experimental_configs.get(
+                "stream_batching_min_interval_ms", MODEL_RESPONSE_BATCH_MIN_TIMEOUT_MS
+            ),
+            max_interval_ms=experimental_configs.get(
+                "stream_batching_max_interval_ms", MODEL_RESPONSE_BATCH_MAX_TIMEOUT_MS
+            ),
+            saturation_num_streams=experimental_configs.get(
+                "stream_batching_saturation_streams",
+                MODEL_RESPONSE_BATCH_SATURATION_STREAMS,
+            ),
+        )
+
     def _process_llm_request(
         self, request: Union[ChatCompletionRequest, CompletionRequest], is_chat: bool
     ) -> Union[LLMChatResponse, LLMCompletionsResponse]:
@@ -583,6 +612,7 @@ class LLMServer(_LLMServerBase):
             batched_openai_response_stream = OpenAIResponseBatcher(
                 openai_resp_generator,
                 interval_ms=self._get_batch_interval_ms(),
+                adaptive_interval=self._adaptive_batch_interval,
             )
 
             return batched_openai_response_stream.stream()
@@ -618,6 +648,12 @@ class LLMServer(_LLMServerBase):
         """
         return await self.engine.check_health()
 
+    async def record_routing_stats(self) -> Dict[str, Any]:
+        """Reports the engine stats used by request routers, e.g., the KV cache
+        usage. Called periodically by Serve for each replica.
+        """
+        return self.engine.routing_stats()
+
     async def embeddings(self, request: EmbeddingRequest) -> LLMEmbeddingsResponse:
         """Runs an embeddings request to the vllm engine, and return the response.
 
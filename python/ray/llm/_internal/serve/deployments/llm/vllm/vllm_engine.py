@@ -1,10 +1,11 @@
 import asyncio
+import functools
 import os
 import re
 import time
 import uuid
 from concurrent.futures.thread import ThreadPoolExecutor
-from typing import TYPE_CHECKING, AsyncGenerator, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List, Optional, Tuple
 
 import ray
 from ray.llm._internal.common.utils.import_utils import try_import
@@ -232,6 +233,8 @@ class VLLMEngine(LLMEngine):
         self.engine_config = VLLMEngineConfig.from_llm_config(llm_config)
 
         self._stats = VLLMEngineStatTracker()
+        # Latest scheduler stats reported by the engine, used for request routing.
+        self._routing_stats: Dict[str, float] = {}
         self.running = False
         self.model_config: "ModelConfig" = None
         self.engine = None
@@ -511,6 +514,23 @@ class VLLMEngine(LLMEngine):
             # For now, assume folks enabling log_engine_metrics do not require LoggingStatLogger, PrometheusStatLogger
             custom_stat_loggers = [RayPrometheusStatLogger]
 
+        if use_v1:
+            from ray.llm._internal.serve.deployments.llm.vllm.vllm_loggers import (
+                RoutingStatsLogger,
+            )
+
+            if custom_stat_loggers is None:
+                # Custom loggers replace vLLM's default ones, so keep those.
+                from vllm.v1.metrics.loggers import (
+                    LoggingStatLogger,
+                    PrometheusStatLogger,
+                )
+
+                custom_stat_loggers = [PrometheusStatLogger, LoggingStatLogger]
+            custom_stat_loggers.append(
+                functools.partial(RoutingStatsLogger, routing_stats=self._routing_stats)
+            )
+
         executor_class = Executor.get_class(vllm_config)
         logger.info(f"Using executor class: {executor_class}")
         engine = vllm.engine.async_llm_engine.AsyncLLMEngine(
@@ -821,6 +841,12 @@ class VLLMEngine(LLMEngine):
             logger.exception("Healthcheck failed. The replica will be restarted")
             raise e from None
 
+    def routing_stats(self) -> Dict[str, Any]:
+        """Returns the latest KV cache usage and number of running and waiting
+        requests reported by the engine scheduler.
+        """
+        return dict(self._routing_stats)
+
     @staticmethod
     def _collect_usage_metrics(sampling_params: VLLMSamplingParams) -> None:
         if sampling_params.best_of is not None:
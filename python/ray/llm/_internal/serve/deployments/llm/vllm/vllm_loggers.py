@@ -1,4 +1,4 @@
-from typing import Optional, Type, cast
+from typing import Dict, Optional, Type, cast
 
 import prometheus_client
 from vllm.config import SpeculativeConfig, SupportsMetricsInfo, VllmConfig
@@ -555,3 +555,30 @@ class RayPrometheusStatLogger(PrometheusStatLogger):
 
     def info(self, type: str, obj: SupportsMetricsInfo) -> None:
         return None
+
+
+class RoutingStatsLogger(StatLoggerBase):
+    """Keeps the latest scheduler stats of an engine in a shared dict.
+
+    The stats are reported to Serve request routers through the deployment's
+    `record_routing_stats` method.
+    """
+
+    def __init__(
+        self,
+        vllm_config: VllmConfig,
+        engine_index: int = 0,
+        *,
+        routing_stats: Dict[str, float],
+    ):
+        self.routing_stats = routing_stats
+
+    def record(
+        self, scheduler_stats: SchedulerStats, iteration_stats: Optional[IterationStats]
+    ):
+        self.routing_stats["kv_cache_usage"] = scheduler_stats.gpu_cache_usage
+        self.routing_stats["num_running_requests"] = scheduler_stats.num_running_reqs
+        self.routing_stats["num_waiting_requests"] = scheduler_stats.num_waiting_reqs
+
+    def log_engine_initialized(self):
+        pass
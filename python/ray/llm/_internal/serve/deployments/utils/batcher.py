@@ -1,4 +1,5 @@
 import asyncio
+import time
 from typing import AsyncGenerator, Generic, Iterable, List, Optional, TypeVar
 
 from ray.llm._internal.serve.configs.constants import (
@@ -15,6 +16,76 @@ logger = get_logger(__name__)
 T = TypeVar("T")
 
 
+class AdaptiveBatchInterval:
+    """This class picks the batching interval of the streams on a replica.
+
+    With a single stream, the interval is `min_interval_ms` to keep the
+    inter-token latency low. It grows linearly with the number of concurrent
+    streams and reaches `max_interval_ms` at `saturation_num_streams`, so that
+    the proxy handles fewer, larger chunks at high concurrency.
+
+    A stream whose consumer is slow to take each batch (write backpressure)
+    gets an interval of at least `write_time_multiplier` times its recent write
+    time, so that writes don't take up most of its time.
+
+    A single instance is shared by all the Batchers of a replica.
+
+    Args:
+        min_interval_ms: the interval used when there is a single stream.
+        max_interval_ms: the upper bound of the interval.
+        saturation_num_streams: the number of concurrent streams at which the
+            interval reaches max_interval_ms.
+        write_time_multiplier: the minimum ratio between the interval and the
+            time it takes the consumer to take a batch.
+    """
+
+    def __init__(
+        self,
+        min_interval_ms: float,
+        max_interval_ms: float,
+        saturation_num_streams: int,
+        write_time_multiplier: float = 4.0,
+    ):
+        if min_interval_ms < 0 or max_interval_ms < min_interval_ms:
+            raise ValueError(
+                "Expected 0 <= min_interval_ms <= max_interval_ms, got "
+                f"min_interval_ms={min_interval_ms} and "
+                f"max_interval_ms={max_interval_ms}."
+            )
+        if saturation_num_streams < 1:
+            raise ValueError(
+                "saturation_num_streams must be at least 1, got "
+                f"{saturation_num_streams}."
+            )
+
+        self.min_interval_s = min_interval_ms / 1000
+        self.max_interval_s = max_interval_ms / 1000
+        self.saturation_num_streams = saturation_num_streams
+        self.write_time_multiplier = write_time_multiplier
+        self.num_active_streams = 0
+
+    def add_stream(self):
+        self.num_active_streams += 1
+
+    def remove_stream(self):
+        self.num_active_streams = max(0, self.num_active_streams - 1)
+
+    def get_interval_s(self, write_time_s: float = 0.0) -> float:
+        """Return the interval of a stream with the given recent write time."""
+        if self.saturation_num_streams == 1:
+            fraction = 1.0 if self.num_active_streams > 1 else 0.0
+        else:
+            fraction = min(
+                1.0,
+                max(0, self.num_active_streams - 1) / (self.saturation_num_streams - 1),
+            )
+        interval_s = self.min_interval_s + fraction * (
+            self.max_interval_s - self.min_interval_s
+        )
+        interval_s = max(interval_s, self.write_time_multiplier * write_time_s)
+        return min(interval_s, self.max_interval_s)
+
+
 class Batcher(Generic[T]):
     """This class batches multiple LLMRawResponses from a generator into a
     single response, at some time interval.
@@ -25,12 +96,19 @@ class Batcher(Generic[T]):
         interval_ms: the interval at which this class yields the current batch.
             If None, this class will batch all responses from the generator
             together and yield the entire batch once.
+        adaptive_interval: if set, the interval is taken from it after every
+            batch instead of from interval_ms. The time the consumer took to
+            take the previous batch counts towards the next interval.
     """
 
+    # Weight of the latest write time in the moving average of write times.
+    _WRITE_TIME_EWMA_ALPHA = 0.3
+
     def __init__(
         self,
         generator: AsyncGenerator[T, None],
         interval_ms: Optional[float] = MODEL_RESPONSE_BATCH_TIMEOUT_MS,
+        adaptive_interval: Optional[AdaptiveBatchInterval] = None,
     ):
         self.generator = generator
         self.queue: asyncio.Queue = asyncio.Queue()
@@ -40,6 +118,12 @@ class Batcher(Generic[T]):
         else:
             self.interval_s = interval_ms / 1000
 
+        self.adaptive_interval = adaptive_interval
+        # Moving average of the time the consumer takes to take a batch.
+        self.write_time_s = 0.0
+        # Time the consumer took to take the last batch.
+        self._last_write_time_s = 0.0
+
         self.done_event: asyncio.Event = asyncio.Event()
 
         # We are okay with this task getting cancelled (to propagate cancellations)
@@ -48,18 +132,37 @@ class Batcher(Generic[T]):
     def _merge_results(self, results: List[T]) -> Iterable[T]:
         return results
 
+    def _get_timeout_s(self) -> Optional[float]:
+        if self.adaptive_interval is None:
+            return self.interval_s
+
+        # Responses kept coming in while the consumer was taking the last
+        # batch, so that time counts towards the interval.
+        interval_s = self.adaptive_interval.get_interval_s(self.write_time_s)
+        return max(0.0, interval_s - self._last_write_time_s)
+
+    def _record_write_time(self, write_time_s: float):
+        self._last_write_time_s = write_time_s
+        self.write_time_s = (
+            self._WRITE_TIME_EWMA_ALPHA * write_time_s
+            + (1 - self._WRITE_TIME_EWMA_ALPHA) * self.write_time_s
+        )
+
     async def stream(self) -> AsyncGenerator[Iterable[T], None]:
         """Drain from the queue every interval_ms and yield the merged results"""
+        if self.adaptive_interval is not None:
+            self.adaptive_interval.add_stream()
         try:
             while True:
                 # Wait for the interval or until we finish, whichever is faster.
                 # We use an event to avoid asyncio.wait_for cancelling the real task on timeout.
+                timeout_s = self._get_timeout_s()
                 try:
-                    if self.interval_s is None:
+                    if timeout_s is None:
                         await self.done_event.wait()
                     else:
                         await asyncio.wait_for(
-                            self.done_event.wait(), timeout=self.interval_s
+                            self.done_event.wait(), timeout=timeout_s
                         )
                 except asyncio.TimeoutError:
                     pass
@@ -70,7 +173,11 @@ class Batcher(Generic[T]):
                 # If there are results, merge and yield them
                 if results:
                     output = self._merge_results(results)
+                    write_start_s = time.monotonic()
                     yield output
+                    self._record_write_time(time.monotonic() - write_start_s)
+                else:
+                    self._last_write_time_s = 0.0
 
                 # If the read task is done, exit the stream task
                 if is_done:
@@ -78,6 +185,8 @@ class Batcher(Generic[T]):
                     self.read_task.result()
                     break
         finally:
+            if self.adaptive_interval is not None:
+                self.adaptive_interval.remove_stream()
             # If the stream task is done, make sure to exit the read task
             if not self.read_task.done():
                 self.read_task.cancel()
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import logging
 import os
+from collections import deque
 from threading import RLock
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 import ray
 from ray.serve._private.constants import (
@@ -14,6 +16,56 @@ from ray.serve._private.constants import (
 logger = logging.getLogger(SERVE_LOGGER_NAME)
 
 
+class EvictionLoopMixin:
+    """Runs LRU eviction for every tenant of a prefix tree periodically.
+
+    Requires `lock`, `tenant_to_char_count`, `evict_tenant_by_lru()` and an
+    `_eviction_task` attribute initialized to `None`.
+    """
+
+    def start_eviction_loop(
+        self, eviction_threshold: int, eviction_target: int, interval_secs: float
+    ) -> bool:
+        """Start a single eviction loop within the actor itself
+        Parameters:
+            eviction_threshold: Minimum number of characters a tenant must have to be evicted
+            eviction_target: The maximum number of characters a tenant should have after eviction
+            interval_secs: Number of seconds between eviction checks
+
+        Returns:
+            True if the loop was started, False if it was already running
+        """
+        with self.lock:
+            if self._eviction_task is None:
+                self._eviction_task = asyncio.create_task(
+                    self._run_eviction_loop(
+                        eviction_threshold, eviction_target, interval_secs
+                    )
+                )
+                return True
+            else:
+                logger.debug("[_start_eviction_loop] Eviction loop already running")
+                return False
+
+    async def _run_eviction_loop(
+        self, eviction_threshold, eviction_target, interval_secs
+    ):
+        while True:
+            await asyncio.sleep(interval_secs)
+            with self.lock:
+                for tenant, char_count in self.tenant_to_char_count.items():
+                    if char_count > eviction_threshold:
+                        excess = char_count - eviction_target
+                        self.evict_tenant_by_lru(tenant, excess)
+
+    def stop_eviction_loop(self):
+        with self.lock:
+            if self._eviction_task:
+                self._eviction_task.cancel()
+                # self._eviction_task.close()
+                self._eviction_task = None
+
+
 class Node:
     """
     Node in a prefix tree that represents a segment of text and can belong to multiple tenants.
@@ -49,7 +101,7 @@ class Node:
         self.tenant_to_newer_node: Dict[str, Optional[Node]] = {}
 
 
-class PrefixTree:
+class PrefixTree(EvictionLoopMixin):
     """
     Thread-safe multi-tenant prefix tree (approximate radix tree).
 
@@ -451,6 +503,117 @@ class PrefixTree:
 
             return matched_text, matched_tenants
 
+    def prefix_match_batch(
+        self,
+        texts: List[str],
+        available_tenants: Optional[List[Optional[List[str]]]] = None,
+    ) -> List[Tuple[str, Optional[List[str]]]]:
+        """
+        Match many texts against the tree while holding the lock once.
+
+        Args:
+            texts: Texts to match
+            available_tenants: For each text, the list of tenants to match against
+                (or None for all). Matches against all tenants if not specified.
+
+        Returns:
+            List of (matched_text, matched_tenants), see `prefix_match()`.
+        """
+        if available_tenants is None:
+            available_tenants = [None] * len(texts)
+        elif len(available_tenants) != len(texts):
+            raise ValueError(
+                "available_tenants must have the same length as texts, got "
+                f"{len(available_tenants)} and {len(texts)}."
+            )
+
+        with self.lock:
+            return [
+                self.prefix_match(text, tenants)
+                for text, tenants in zip(texts, available_tenants)
+            ]
+
+    def prefix_match_lengths(
+        self, text: str, available_tenants: Optional[List[str]] = None
+    ) -> Dict[str, int]:
+        """
+        Match text against tree and return the matched length for each tenant.
+
+        Args:
+            text: Text to match
+            available_tenants: List of tenants to match against (or None for all)
+
+        Returns:
+            Dict mapping each available tenant in the tree to the number of leading
+            characters of the text it has a cached prefix for (0 if none).
+        """
+        with self.lock:
+            if available_tenants:
+                available_tenants = [
+                    tenant
+                    for tenant in available_tenants
+                    if tenant in self.tenant_to_char_count
+                ]
+            else:
+                available_tenants = list(self.tenant_to_char_count.keys())
+            match_lengths: Dict[str, int] = {tenant: 0 for tenant in available_tenants}
+
+            curr_node: Node = self.root
+            i: int = 0
+            text_len: int = len(text)
+            while i < text_len and available_tenants:
+                child: Optional[Node] = curr_node.edge_label_to_child.get(text[i])
+                if child is None:
+                    break
+
+                # A tenant that owns a node also owns all of its ancestors, so only
+                # tenants that own this node can match further.
+                available_tenants = [
+                    tenant
+                    for tenant in available_tenants
+                    if tenant in child.tenant_to_last_access_time
+                ]
+                shared_count: int = self._shared_prefix_count(child.text, text[i:])
+                i += shared_count
+                for tenant in available_tenants:
+                    match_lengths[tenant] = i
+
+                if shared_count < len(child.text):
+                    break
+                curr_node = child
+
+            return match_lengths
+
+    def prefix_match_lengths_batch(
+        self,
+        texts: List[str],
+        available_tenants: Optional[List[Optional[List[str]]]] = None,
+    ) -> List[Dict[str, int]]:
+        """
+        Match many texts against the tree while holding the lock once.
+
+        Args:
+            texts: Texts to match
+            available_tenants: For each text, the list of tenants to match against
+                (or None for all). Matches against all tenants if not specified.
+
+        Returns:
+            List of matched lengths by tenant, see `prefix_match_lengths()`.
+        """
+        if available_tenants is None:
+            available_tenants = [None] * len(texts)
+        elif len(available_tenants) != len(texts):
+            raise ValueError(
+                "available_tenants must have the same length as texts, got "
+                f"{len(available_tenants)} and {len(texts)}."
+            )
+
+        with self.lock:
+            return [
+                self.prefix_match_lengths(text, tenants)
+                for text, tenants in zip(texts, available_tenants)
+            ]
+
     def remove_tenants(self, tenants: List[str]) -> Dict[str, int]:
         """
         Remove multiple tenants and all their nodes from the tree.
@@ -570,47 +733,544 @@ class PrefixTree:
                 if count == min_count
             ]
 
-    def start_eviction_loop(
-        self, eviction_threshold: int, eviction_target: int, interval_secs: float
-    ) -> bool:
-        """Start a single eviction loop within the actor itself
-        Parameters:
-            eviction_threshold: Minimum number of characters a tenant must have to be evicted
-            eviction_target: The maximum number of characters a tenant should have after eviction
-            interval_secs: Number of seconds between eviction checks
 
-        Returns:
-            True if the loop was started, False if it was already running
+class ChunkedPrefixTree(EvictionLoopMixin):
+    """
+    Thread-safe multi-tenant prefix tree over fixed-size chunks of text.
+
+    Has the same interface as `PrefixTree`, but text is split into chunks of
+    `chunk_size` characters (the last chunk may be shorter) and each node stores a
+    single chunk, so prefixes are matched at chunk granularity. Walking the tree
+    takes one dictionary lookup per chunk instead of per character.
+
+    Nodes are stored in arrays indexed by node ID, and the tenants that own a node
+    are stored as a bitmask, so checking whether any of the requested tenants own a
+    node is a single integer operation. Node IDs are reused after nodes are removed.
+
+    Example tree structure with chunk_size=4:
+        Representing the strings inserted in order:
+            - "helloworld"  at time 1 by tenant_1 (bit 1)
+            - "hellothere"  at time 2 by tenant_2 (bit 2)
+
+        0: root                        mask=0b11
+            1: "hell"                  mask=0b11
+                2: "owor" → 3: "ld"    mask=0b01
+                4: "othe" → 5: "re"    mask=0b10
+
+    The tree can optionally record the operations applied to it, so that other
+    instances can be kept in sync incrementally with `get_updates()` and
+    `apply_updates()`, falling back to `get_state()` and `set_state()` if they
+    fall too far behind.
+    """
+
+    ROOT_ID = 0
+
+    def __init__(self, chunk_size: int = 64, max_recorded_ops: int = 0) -> None:
+        """
+        Initialize an empty prefix tree.
+
+        Args:
+            chunk_size: Number of characters per node.
+            max_recorded_ops: Number of recent operations to keep for incremental
+                synchronization. Operations aren't recorded if 0.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}.")
+
+        self.lock: RLock = RLock()
+        self.chunk_size: int = chunk_size
+
+        # Node storage, indexed by node ID.
+        self._node_parent: List[int] = [-1]
+        self._node_chunk: List[str] = [""]
+        self._node_depth: List[int] = [0]
+        self._node_tenant_mask: List[int] = [0]
+        self._free_node_ids: List[int] = []
+        # Maps (parent node ID, chunk) to the child node ID.
+        self._children: Dict[Tuple[int, str], int] = {}
+
+        # Tracks total character count per tenant. Also uses the keys to track the
+        # active tenants in the tree.
+        self.tenant_to_char_count: Dict[str, int] = {}
+        self._tenant_to_bit: Dict[str, int] = {}
+        self._free_bits: List[int] = []
+        self._next_bit: int = 0
+        # For each tenant, the last access time of each node it owns.
+        self._tenant_to_node_access_time: Dict[str, Dict[int, float]] = {}
+
+        self._eviction_task: Optional[asyncio.Task] = None
+
+        # Recent operations for incremental synchronization, and the sequence
+        # number of the next operation.
+        self._max_recorded_ops: int = max_recorded_ops
+        self._ops: Deque[Tuple] = deque(maxlen=max(max_recorded_ops, 1))
+        self._next_op_seq: int = 0
+
+    def get_chunk_size(self) -> int:
+        """Get the number of characters per node."""
+        return self.chunk_size
+
+    def _record_op(self, *op) -> None:
+        if self._max_recorded_ops > 0:
+            self._ops.append(op)
+        self._next_op_seq += 1
+
+    def _chunks(self, text: str) -> List[str]:
+        size = self.chunk_size
+        return [text[i : i + size] for i in range(0, len(text), size)]
+
+    def _new_node(self, parent: int, chunk: str) -> int:
+        if self._free_node_ids:
+            node = self._free_node_ids.pop()
+            self._node_parent[node] = parent
+            self._node_chunk[node] = chunk
+            self._node_depth[node] = self._node_depth[parent] + 1
+            self._node_tenant_mask[node] = 0
+        else:
+            node = len(self._node_parent)
+            self._node_parent.append(parent)
+            self._node_chunk.append(chunk)
+            self._node_depth.append(self._node_depth[parent] + 1)
+            self._node_tenant_mask.append(0)
+        self._children[(parent, chunk)] = node
+        return node
+
+    def _remove_tenant_from_node(self, tenant: str, node: int) -> int:
+        """Remove a tenant from a node, deleting the node if it has no tenants left.
+
+        Returns the number of characters removed.
+        """
+        self._node_tenant_mask[node] &= ~(1 << self._tenant_to_bit[tenant])
+        num_chars = len(self._node_chunk[node])
+        self.tenant_to_char_count[tenant] -= num_chars
+        if self._node_tenant_mask[node] == 0:
+            self._children.pop((self._node_parent[node], self._node_chunk[node]), None)
+            self._node_chunk[node] = ""
+            self._free_node_ids.append(node)
+        return num_chars
+
+    def _tenants_mask(self, tenants: List[str]) -> int:
+        mask = 0
+        for tenant in tenants:
+            bit = self._tenant_to_bit.get(tenant)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+
+    def add_tenants(self, tenants: List[str], time_s: float) -> None:
+        """
+        Add multiple new tenants to the tree. Tenants that already exist are skipped.
+
+        Args:
+            tenants: List of tenants to add
+            time_s: Current timestamp in seconds
         """
         with self.lock:
-            if self._eviction_task is None:
-                self._eviction_task = asyncio.create_task(
-                    self._run_eviction_loop(
-                        eviction_threshold, eviction_target, interval_secs
+            for tenant in tenants:
+                if tenant in self.tenant_to_char_count:
+                    logger.debug(
+                        f"[_add_tenants] Tenant '{tenant}' already exists. Skipping."
                     )
+                    continue
+
+                if self._free_bits:
+                    bit = self._free_bits.pop()
+                else:
+                    bit = self._next_bit
+                    self._next_bit += 1
+                self._tenant_to_bit[tenant] = bit
+                self.tenant_to_char_count[tenant] = 0
+                self._tenant_to_node_access_time[tenant] = {}
+                self._node_tenant_mask[self.ROOT_ID] |= 1 << bit
+
+            self._record_op("add_tenants", tenants, time_s)
+
+    def insert(self, text: str, tenant: str, time_s: float) -> None:
+        """
+        Insert text into tree for a specific tenant, but only if the tenant already
+        exists. Use add_tenants() first to add a new tenant.
+
+        Args:
+            text: Text to insert
+            tenant: Tenant
+            time_s: Current timestamp in seconds
+        """
+        with self.lock:
+            if tenant not in self.tenant_to_char_count:
+                logger.debug(
+                    f"[_insert] Tenant '{tenant}' does not exist. Use add_tenants() first."
                 )
-                return True
+                return
+
+            bit = 1 << self._tenant_to_bit[tenant]
+            node_access_time = self._tenant_to_node_access_time[tenant]
+            node = self.ROOT_ID
+            for chunk in self._chunks(text):
+                child = self._children.get((node, chunk))
+                if child is None:
+                    child = self._new_node(node, chunk)
+                node = child
+
+                if not self._node_tenant_mask[node] & bit:
+                    self._node_tenant_mask[node] |= bit
+                    self.tenant_to_char_count[tenant] += len(chunk)
+                    node_access_time[node] = time_s
+                elif node_access_time[node] < time_s:
+                    # Operations may be applied out of order when synchronizing.
+                    node_access_time[node] = time_s
+
+            self._record_op("insert", text, tenant, time_s)
+
+    def prefix_match(
+        self, text: str, available_tenants: Optional[List[str]] = None
+    ) -> Tuple[str, Optional[List[str]]]:
+        """
+        Match text against tree and return matched text and matching tenants.
+
+        Args:
+            text: Text to match
+            available_tenants: List of tenants to match against (or None for all)
+
+        Returns:
+            Tuple of (matched_text, matched_tenants):
+                If the list of available tenants doesn't match any tenants in the tree: returns ("", None)
+                When no prefix match is found: returns ("", list of available tenants)
+                When a prefix match is found: returns (matched_prefix, list of tenants that own the matched node)
+        """
+        with self.lock:
+            return self._prefix_match(text, available_tenants)
+
+    def prefix_match_batch(
+        self,
+        texts: List[str],
+        available_tenants: Optional[List[Optional[List[str]]]] = None,
+    ) -> List[Tuple[str, Optional[List[str]]]]:
+        """
+        Match many texts against the tree while holding the lock once.
+
+        Args:
+            texts: Texts to match
+            available_tenants: For each text, the list of tenants to match against
+                (or None for all). Matches against all tenants if not specified.
+
+        Returns:
+            List of (matched_text, matched_tenants), see `prefix_match()`.
+        """
+        if available_tenants is None:
+            available_tenants = [None] * len(texts)
+        elif len(available_tenants) != len(texts):
+            raise ValueError(
+                "available_tenants must have the same length as texts, got "
+                f"{len(available_tenants)} and {len(texts)}."
+            )
+
+        with self.lock:
+            return [
+                self._prefix_match(text, tenants)
+                for text, tenants in zip(texts, available_tenants)
+            ]
+
+    def prefix_match_lengths(
+        self, text: str, available_tenants: Optional[List[str]] = None
+    ) -> Dict[str, int]:
+        """
+        Match text against tree and return the matched length for each tenant.
+
+        Args:
+            text: Text to match
+            available_tenants: List of tenants to match against (or None for all)
+
+        Returns:
+            Dict mapping each available tenant in the tree to the number of leading
+            characters of the text it has a cached prefix for (0 if none), at chunk
+            granularity.
+        """
+        with self.lock:
+            if available_tenants:
+                available_tenants = [
+                    tenant
+                    for tenant in available_tenants
+                    if tenant in self.tenant_to_char_count
+                ]
             else:
-                logger.debug("[_start_eviction_loop] Eviction loop already running")
-                return False
+                available_tenants = list(self.tenant_to_char_count.keys())
+            match_lengths: Dict[str, int] = {tenant: 0 for tenant in available_tenants}
+            mask = self._tenants_mask(available_tenants)
+
+            node = self.ROOT_ID
+            matched_chars = 0
+            size = self.chunk_size
+            for i in range(0, len(text), size):
+                chunk = text[i : i + size]
+                child = self._children.get((node, chunk))
+                if child is None:
+                    break
+                child_mask = self._node_tenant_mask[child] & mask
+                if not child_mask:
+                    break
 
-    async def _run_eviction_loop(
-        self, eviction_threshold, eviction_target, interval_secs
-    ):
-        while True:
-            await asyncio.sleep(interval_secs)
-            with self.lock:
-                for tenant, char_count in self.tenant_to_char_count.items():
-                    if char_count > eviction_threshold:
-                        excess = char_count - eviction_target
-                        self.evict_tenant_by_lru(tenant, excess)
+                # Tenants that don't own this node stop matching at its parent.
+                dropped_mask = mask & ~child_mask
+                if dropped_mask:
+                    for tenant in available_tenants:
+                        if dropped_mask & (1 << self._tenant_to_bit[tenant]):
+                            match_lengths[tenant] = matched_chars
+                mask = child_mask
+                node = child
+                matched_chars += len(chunk)
+
+            for tenant in available_tenants:
+                if mask & (1 << self._tenant_to_bit[tenant]):
+                    match_lengths[tenant] = matched_chars
+
+            return match_lengths
+
+    def prefix_match_lengths_batch(
+        self,
+        texts: List[str],
+        available_tenants: Optional[List[Optional[List[str]]]] = None,
+    ) -> List[Dict[str, int]]:
+        """
+        Match many texts against the tree while holding the lock once.
+
+        Args:
+            texts: Texts to match
+            available_tenants: For each text, the list of tenants to match against
+                (or None for all). Matches against all tenants if not specified.
+
+        Returns:
+            List of matched lengths by tenant, see `prefix_match_lengths()`.
+        """
+        if available_tenants is None:
+            available_tenants = [None] * len(texts)
+        elif len(available_tenants) != len(texts):
+            raise ValueError(
+                "available_tenants must have the same length as texts, got "
+                f"{len(available_tenants)} and {len(texts)}."
+            )
 
-    def stop_eviction_loop(self):
         with self.lock:
-            if self._eviction_task:
-                self._eviction_task.cancel()
-                # self._eviction_task.close()
-                self._eviction_task = None
+            return [
+                self.prefix_match_lengths(text, tenants)
+                for text, tenants in zip(texts, available_tenants)
+            ]
+
+    def _prefix_match(
+        self, text: str, available_tenants: Optional[List[str]]
+    ) -> Tuple[str, Optional[List[str]]]:
+        if available_tenants:
+            available_tenants = [
+                tenant
+                for tenant in available_tenants
+                if tenant in self.tenant_to_char_count
+            ]
+            if not available_tenants:
+                return "", None
+        else:
+            available_tenants = list(self.tenant_to_char_count.keys())
+        mask = self._tenants_mask(available_tenants)
+
+        node = self.ROOT_ID
+        matched_chars = 0
+        size = self.chunk_size
+        for i in range(0, len(text), size):
+            chunk = text[i : i + size]
+            child = self._children.get((node, chunk))
+            if child is None or not self._node_tenant_mask[child] & mask:
+                break
+            node = child
+            matched_chars += len(chunk)
+
+        node_mask = self._node_tenant_mask[node]
+        matched_tenants = [
+            tenant
+            for tenant in available_tenants
+            if node_mask & (1 << self._tenant_to_bit[tenant])
+        ] or None
+
+        return text[:matched_chars], matched_tenants
+
+    def remove_tenants(self, tenants: List[str]) -> Dict[str, int]:
+        """
+        Remove multiple tenants and all their nodes from the tree.
+
+        Args:
+            tenants: List of tenants to remove
+
+        Returns:
+            Dictionary mapping each tenant to the number of characters removed
+            (0 if tenant doesn't exist)
+        """
+        chars_removed: Dict[str, int] = {}
+
+        with self.lock:
+            for tenant in tenants:
+                if tenant not in self.tenant_to_char_count:
+                    logger.debug(
+                        f"[_remove_tenants] Tenant '{tenant}' does not exist. Skipping."
+                    )
+                    chars_removed[tenant] = 0
+                    continue
+
+                tenant_chars_removed = 0
+                for node in self._tenant_to_node_access_time.pop(tenant):
+                    tenant_chars_removed += self._remove_tenant_from_node(tenant, node)
+
+                bit = self._tenant_to_bit.pop(tenant)
+                self._node_tenant_mask[self.ROOT_ID] &= ~(1 << bit)
+                self._free_bits.append(bit)
+                self.tenant_to_char_count.pop(tenant)
+                chars_removed[tenant] = tenant_chars_removed
+
+            self._record_op("remove_tenants", tenants)
+            return chars_removed
+
+    def evict_tenant_by_lru(self, tenant: str, min_remove_size: int) -> int:
+        """
+        Evict least recently used nodes for a tenant until minimum size is freed.
+
+        All nodes with the same oldest access time are removed together, and
+        descendants are always removed before their ancestors.
+
+        Args:
+            tenant: The tenant to evict nodes from
+            min_remove_size: Minimum number of characters to remove
+
+        Returns:
+            Actual number of characters removed (0 if tenant doesn't exist)
+        """
+        with self.lock:
+            if tenant not in self.tenant_to_char_count:
+                logger.debug(
+                    f"[_evict_tenant_by_lru] Cannot evict tenant '{tenant}': tenant does not exist. No action taken."
+                )
+                return 0
+
+            node_access_time = self._tenant_to_node_access_time[tenant]
+            nodes_by_age = sorted(
+                node_access_time,
+                key=lambda node: (node_access_time[node], -self._node_depth[node]),
+            )
+
+            total_chars_removed = 0
+            cutoff_time_s = None
+            for node in nodes_by_age:
+                access_time_s = node_access_time[node]
+                if total_chars_removed >= min_remove_size and (
+                    access_time_s != cutoff_time_s
+                ):
+                    break
+                cutoff_time_s = access_time_s
+                total_chars_removed += len(self._node_chunk[node])
+
+            if cutoff_time_s is not None:
+                self._evict_tenant_until(tenant, cutoff_time_s)
+            return total_chars_removed
+
+    def _evict_tenant_until(self, tenant: str, cutoff_time_s: float) -> int:
+        """Remove all nodes of the tenant last accessed at or before the cutoff."""
+        if tenant not in self.tenant_to_char_count:
+            return 0
+
+        node_access_time = self._tenant_to_node_access_time[tenant]
+        evicted = [
+            node
+            for node, access_time_s in node_access_time.items()
+            if access_time_s <= cutoff_time_s
+        ]
+        # Remove descendants first so chunks of removed nodes are still valid keys.
+        evicted.sort(key=lambda node: -self._node_depth[node])
+        chars_removed = 0
+        for node in evicted:
+            del node_access_time[node]
+            chars_removed += self._remove_tenant_from_node(tenant, node)
+
+        self._record_op("evict_until", tenant, cutoff_time_s)
+        return chars_removed
+
+    def get_smallest_tenants(self) -> Optional[List[str]]:
+        """
+        Get the tenants with the smallest total character count.
+
+        Returns:
+            Tenants with smallest character count, or None if no tenants
+        """
+        with self.lock:
+            if not self.tenant_to_char_count:
+                return None
+
+            min_count = min(self.tenant_to_char_count.values())
+            return [
+                tenant
+                for tenant, count in self.tenant_to_char_count.items()
+                if count == min_count
+            ]
+
+    def get_updates(self, since_seq: int) -> Tuple[int, Optional[List[Tuple]]]:
+        """
+        Get the operations applied to the tree since a sequence number.
+
+        Args:
+            since_seq: Sequence number returned by the previous call, or 0.
+
+        Returns:
+            Tuple of (next_seq, ops). `ops` is None if the operations since
+            `since_seq` are no longer recorded, in which case the caller should
+            resynchronize with `get_state()`.
+        """
+        with self.lock:
+            num_ops = self._next_op_seq - since_seq
+            if num_ops < 0 or num_ops > len(self._ops) or self._max_recorded_ops <= 0:
+                return self._next_op_seq, None
+            if num_ops == 0:
+                return self._next_op_seq, []
+            return self._next_op_seq, list(self._ops)[-num_ops:]
+
+    def apply_updates(self, ops: List[Tuple]) -> None:
+        """Apply operations returned by `get_updates()` of another tree."""
+        with self.lock:
+            for op_name, *args in ops:
+                if op_name == "add_tenants":
+                    self.add_tenants(*args)
+                elif op_name == "insert":
+                    self.insert(*args)
+                elif op_name == "remove_tenants":
+                    self.remove_tenants(*args)
+                elif op_name == "evict_until":
+                    self._evict_tenant_until(*args)
+                else:
+                    raise ValueError(f"Unknown prefix tree operation: {op_name}.")
+
+    _STATE_ATTRIBUTES = (
+        "chunk_size",
+        "_node_parent",
+        "_node_chunk",
+        "_node_depth",
+        "_node_tenant_mask",
+        "_free_node_ids",
+        "_children",
+        "tenant_to_char_count",
+        "_tenant_to_bit",
+        "_free_bits",
+        "_next_bit",
+        "_tenant_to_node_access_time",
+        "_next_op_seq",
+    )
+
+    def get_state(self) -> Dict[str, Any]:
+        """Get a snapshot of the tree to initialize another tree with `set_state()`."""
+        with self.lock:
+            return {
+                attribute: copy.deepcopy(getattr(self, attribute))
+                for attribute in self._STATE_ATTRIBUTES
+            }
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """Replace the contents of the tree with a snapshot from `get_state()`."""
+        with self.lock:
+            for attribute in self._STATE_ATTRIBUTES:
+                setattr(self, attribute, state[attribute])
+            self._ops.clear()
 
 
 @ray.remote
@@ -624,3 +1284,13 @@ class PrefixTreeActor(PrefixTree):
 
     def setattr(self, attribute: str, value: Any) -> None:
         setattr(self, attribute, value)
+
+
+@ray.remote
+class ChunkedPrefixTreeActor(ChunkedPrefixTree):
+    def getattr(self, attribute: str) -> Any:
+        """
+        Get an attribute of the ChunkedPrefixTree.
+        Note: This method is intended to be used only in tests.
+        """
+        return getattr(self, attribute)
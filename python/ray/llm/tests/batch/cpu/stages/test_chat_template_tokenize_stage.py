@@ -0,0 +1,134 @@
+import sys
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+import ray
+from ray.llm._internal.batch.stages import ChatTemplateTokenizeStage
+from ray.llm._internal.batch.stages.chat_template_tokenize_stage import (
+    ChatTemplateTokenizeUDF,
+)
+
+
+@pytest.fixture
+def mock_processor_setup():
+    # See test_chat_template_stage.py for why AutoProcessor is imported here.
+    from transformers import AutoProcessor  # noqa: F401
+
+    with patch("transformers.AutoProcessor") as mock_auto_processor, patch(
+        "ray.llm._internal.batch.stages.chat_template_tokenize_stage."
+        "get_cached_tokenizer",
+        side_effect=lambda processor: processor,
+    ):
+        mock_processor = MagicMock()
+        mock_processor.apply_chat_template.side_effect = lambda conversation, **_: (
+            f"<chat>{conversation[-1]['content']}</chat>"
+        )
+        mock_processor.side_effect = lambda prompts, **_: {
+            "input_ids": [list(range(len(prompt))) for prompt in prompts]
+        }
+        mock_auto_processor.from_pretrained.return_value = mock_processor
+        yield mock_auto_processor, mock_processor
+
+
+def _messages(content: str):
+    return [{"role": "user", "content": content}]
+
+
+@pytest.mark.asyncio
+async def test_chat_template_tokenize_udf_basic(mock_processor_setup):
+    mock_auto_processor, mock_processor = mock_processor_setup
+
+    udf = ChatTemplateTokenizeUDF(
+        data_column="__data",
+        expected_input_keys=["messages"],
+        model="test-model",
+    )
+    batch = {
+        "__data": [
+            {"messages": _messages("Hi")},
+            {"messages": _messages("Hello AI")},
+        ]
+    }
+
+    results = []
+    async for result in udf(batch):
+        results.append(result["__data"][0])
+
+    assert [result["prompt"] for result in results] == [
+        "<chat>Hi</chat>",
+        "<chat>Hello AI</chat>",
+    ]
+    for result in results:
+        assert result["tokenized_prompt"].dtype == np.int32
+        assert result["tokenized_prompt"].tolist() == list(range(len(result["prompt"])))
+
+    # The processor is loaded once, and all prompts are tokenized in one call.
+    mock_auto_processor.from_pretrained.assert_called_once()
+    assert mock_processor.call_count == 1
+    assert mock_processor.call_args.args[0] == [
+        "<chat>Hi</chat>",
+        "<chat>Hello AI</chat>",
+    ]
+
+    # The token IDs are stored as list<int32> columns in Arrow.
+    table = pa.Table.from_pylist(results)
+    assert table.schema.field("tokenized_prompt").type == pa.list_(pa.int32())
+
+
+@pytest.mark.asyncio
+async def test_chat_template_tokenize_udf_assistant_prefill(mock_processor_setup):
+    _, mock_processor = mock_processor_setup
+
+    udf = ChatTemplateTokenizeUDF(
+        data_column="__data",
+        expected_input_keys=["messages"],
+        model="test-model",
+    )
+    conversation = _messages("Hi") + [{"role": "assistant", "content": "Hello"}]
+    async for _ in udf({"__data": [{"messages": conversation}]}):
+        pass
+
+    kwargs = mock_processor.apply_chat_template.call_args.kwargs
+    assert kwargs["add_generation_prompt"] is False
+    assert kwargs["continue_final_message"] is True
+
+
+@pytest.mark.asyncio
+async def test_chat_template_tokenize_udf_shared_processor(mock_processor_setup):
+    mock_auto_processor, mock_processor = mock_processor_setup
+
+    with patch.object(ray, "get", return_value=mock_processor) as mock_get:
+        udf = ChatTemplateTokenizeUDF(
+            data_column="__data",
+            expected_input_keys=["messages"],
+            model="test-model",
+            processor_ref="processor-ref",
+        )
+    mock_get.assert_called_once_with("processor-ref")
+    mock_auto_processor.from_pretrained.assert_not_called()
+    assert udf.tokenizer is mock_processor
+
+    # Fall back to loading the processor if the shared one can't be fetched.
+    with patch.object(ray, "get", side_effect=RuntimeError("failed")):
+        ChatTemplateTokenizeUDF(
+            data_column="__data",
+            expected_input_keys=["messages"],
+            model="test-model",
+            processor_ref="processor-ref",
+        )
+    mock_auto_processor.from_pretrained.assert_called_once()
+
+
+def test_chat_template_tokenize_stage():
+    stage = ChatTemplateTokenizeStage(
+        fn_constructor_kwargs=dict(model="test-model"),
+    )
+    assert stage.fn is ChatTemplateTokenizeUDF
+    assert set(stage.get_required_input_keys()) == {"messages"}
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-v", __file__]))
@@ -0,0 +1,60 @@
+import sys
+
+import pytest
+
+from ray.llm._internal.batch.stages.length_bucket_stage import (
+    LengthBucketStage,
+    LengthBucketUDF,
+)
+
+
+@pytest.mark.asyncio
+async def test_length_bucket_udf_sorts_by_tokens():
+    udf = LengthBucketUDF(data_column="__data", expected_input_keys=["prompt"])
+    batch = {
+        "__data": [
+            {"id": 0, "prompt": "a", "tokenized_prompt": [1, 2]},
+            {"id": 1, "prompt": "b", "tokenized_prompt": [1, 2, 3, 4]},
+            {"id": 2, "prompt": "c", "tokenized_prompt": [1]},
+            {"id": 3, "prompt": "d", "tokenized_prompt": [1, 2, 3]},
+        ]
+    }
+
+    results = []
+    async for result in udf(batch):
+        results.append(result["__data"][0])
+
+    assert [row["id"] for row in results] == [1, 3, 0, 2]
+    # The rows are passed through as-is.
+    assert results[0] == {"id": 1, "prompt": "b", "tokenized_prompt": [1, 2, 3, 4]}
+
+
+@pytest.mark.asyncio
+async def test_length_bucket_udf_untokenized_prompt():
+    udf = LengthBucketUDF(data_column="__data", expected_input_keys=["prompt"])
+    batch = {"__data": [{"prompt": "ab"}, {"prompt": "abcd"}, {"prompt": "a"}]}
+
+    results = []
+    async for result in udf(batch):
+        results.append(result["__data"][0]["prompt"])
+
+    assert results == ["abcd", "ab", "a"]
+
+
+def test_length_bucket_stage_window_size():
+    stage = LengthBucketStage(
+        map_batches_kwargs=dict(zero_copy_batch=True, batch_size=256),
+    )
+    assert stage.get_required_input_keys() == {"prompt": "The text prompt (str)."}
+
+    # The window size overrides the processor batch size.
+    kwargs = stage.get_dataset_map_batches_kwargs(batch_size=64, data_column="__data")
+    assert kwargs["batch_size"] == 256
+    assert kwargs["fn_constructor_kwargs"] == {
+        "data_column": "__data",
+        "expected_input_keys": ["prompt"],
+    }
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-v", __file__]))
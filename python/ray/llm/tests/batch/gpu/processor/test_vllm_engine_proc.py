@@ -65,6 +65,56 @@ def test_vllm_engine_processor(gpu_type, model_opt_125m):
     }
 
 
+def test_vllm_engine_processor_length_bucketing(model_opt_125m):
+    config = vLLMEngineProcessorConfig(
+        model_source=model_opt_125m,
+        batch_size=64,
+        length_bucketing_window=512,
+        apply_chat_template=True,
+        tokenize=True,
+        detokenize=True,
+    )
+    processor = ProcessorBuilder.build(config)
+    assert processor.list_stage_names() == [
+        "ChatTemplateStage",
+        "TokenizeStage",
+        "LengthBucketStage",
+        "vLLMEngineStage",
+        "DetokenizeStage",
+    ]
+
+    stage = processor.get_stage_by_name("LengthBucketStage")
+    kwargs = stage.get_dataset_map_batches_kwargs(
+        batch_size=config.batch_size, data_column=processor.DATA_COLUMN
+    )
+    assert kwargs["batch_size"] == 512
+
+
+def test_vllm_engine_processor_fused_chat_template_and_tokenize(model_opt_125m):
+    config = vLLMEngineProcessorConfig(
+        model_source=model_opt_125m,
+        batch_size=64,
+        apply_chat_template=True,
+        tokenize=True,
+        fuse_chat_template_and_tokenize=True,
+        detokenize=True,
+    )
+    processor = ProcessorBuilder.build(config)
+    assert processor.list_stage_names() == [
+        "ChatTemplateTokenizeStage",
+        "vLLMEngineStage",
+        "DetokenizeStage",
+    ]
+
+    stage = processor.get_stage_by_name("ChatTemplateTokenizeStage")
+    processor_ref = stage.fn_constructor_kwargs.pop("processor_ref")
+    assert isinstance(processor_ref, ray.ObjectRef)
+    assert stage.fn_constructor_kwargs == {
+        "model": model_opt_125m,
+        "chat_template": None,
+    }
+
+
 def test_generation_model(gpu_type, model_opt_125m):
     # OPT models don't have chat template, so we use ChatML template
     # here to demonstrate the usage of custom chat template.
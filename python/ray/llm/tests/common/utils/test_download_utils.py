@@ -0,0 +1,248 @@
+import os
+import shutil
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pyarrow.fs as pa_fs
+import pytest
+
+import ray
+from ray.llm._internal.common.utils import download_utils
+from ray.llm._internal.common.utils.cloud_utils import (
+    CloudFileSystem,
+    CloudMirrorConfig,
+)
+from ray.llm._internal.common.utils.download_utils import (
+    CloudModelDownloader,
+    NodeWeightCache,
+)
+
+
+@pytest.fixture
+def ray_instance():
+    ray.init(num_cpus=2)
+    yield
+    ray.shutdown()
+
+
+@pytest.fixture
+def bucket(tmp_path):
+    """A local directory standing in for a model in cloud storage."""
+    bucket_path = tmp_path / "bucket"
+    bucket_path.mkdir()
+    (bucket_path / "hash").write_text("abcdef")
+    (bucket_path / "config.json").write_text("{}")
+    (bucket_path / "tokenizer.json").write_text("{}")
+    (bucket_path / "model.safetensors").write_bytes(os.urandom(1024))
+
+    with patch.object(
+        CloudFileSystem,
+        "get_fs_and_path",
+        return_value=(pa_fs.LocalFileSystem(), str(bucket_path)),
+    ), patch.object(
+        CloudFileSystem, "download_files", wraps=CloudFileSystem.download_files
+    ) as download_files:
+        yield bucket_path, download_files
+
+
+def _downloader(model_id: str = "test-model") -> CloudModelDownloader:
+    return CloudModelDownloader(
+        model_id, CloudMirrorConfig(bucket_uri="s3://bucket/model")
+    )
+
+
+class TestNodeWeightCache:
+    def test_get_or_fetch_downloads_once(self, tmp_path):
+        downloads = []
+
+        def download(path: str):
+            downloads.append(path)
+            Path(path, "sub").mkdir()
+            Path(path, "sub", "weights.bin").write_bytes(b"weights")
+
+        cache = NodeWeightCache(str(tmp_path / "cache"))
+        assert not cache.contains("digest")
+        path = cache.get_or_fetch("digest", download)
+        assert len(downloads) == 1
+        assert cache.contains("digest")
+        assert cache.list_files("digest") == ["sub/weights.bin"]
+        assert (path / "sub" / "weights.bin").read_bytes() == b"weights"
+
+        # Other processes on the node use the cached files.
+        other_cache = NodeWeightCache(str(tmp_path / "cache"))
+        assert other_cache.get_or_fetch("digest", download) == path
+        assert len(downloads) == 1
+
+    def test_failed_download_is_not_cached(self, tmp_path):
+        def download(path: str):
+            Path(path, "partial.bin").write_bytes(b"partial")
+            raise RuntimeError("download failed")
+
+        cache = NodeWeightCache(str(tmp_path / "cache"))
+        with pytest.raises(RuntimeError):
+            cache.get_or_fetch("digest", download)
+        assert not cache.contains("digest")
+        assert [p.name for p in cache.root.iterdir()] == ["digest.lock"]
+
+    def test_lru_eviction(self, tmp_path):
+        def download(path: str):
+            Path(path, "weights.bin").write_bytes(b"0" * 10)
+
+        cache = NodeWeightCache(str(tmp_path / "cache"), max_size_bytes=25)
+        for digest in ["a", "b"]:
+            cache.get_or_fetch(digest, download)
+        os.utime(cache.get_path("a") / ".manifest.json", (100, 100))
+        os.utime(cache.get_path("b") / ".manifest.json", (200, 200))
+
+        # Using "a" makes "b" the least recently used entry.
+        cache.get_or_fetch("a", download)
+        cache.get_or_fetch("c", download)
+        assert cache.contains("a")
+        assert not cache.contains("b")
+        assert cache.contains("c")
+
+        # The new entry is kept even if it doesn't fit on its own.
+        small_cache = NodeWeightCache(str(tmp_path / "cache"), max_size_bytes=5)
+        small_cache.get_or_fetch("d", download)
+        assert [p.name for p in cache.root.iterdir() if p.is_dir()] == ["d"]
+
+    def test_fetch_from_peer(self, tmp_path, ray_instance):
+        def download(path: str):
+            Path(path, "weights.bin").write_bytes(b"weights" * 1000)
+
+        peer_cache = NodeWeightCache(str(tmp_path / "peer_cache"))
+        peer_cache.get_or_fetch("digest", download)
+
+        def fail_download(path: str):
+            raise AssertionError("Should fetch the files from the peer.")
+
+        # Use small chunks to send the file in multiple objects.
+        with patch.object(
+            download_utils, "RAYLLM_PEER_WEIGHT_TRANSFER_CHUNK_SIZE_BYTES", 1000
+        ):
+            cache = NodeWeightCache(str(tmp_path / "cache"))
+            path = cache.get_or_fetch("digest", fail_download)
+
+        assert (path / "weights.bin").read_bytes() == b"weights" * 1000
+        assert cache.list_files("digest") == ["weights.bin"]
+
+    def test_removed_entries_are_deregistered(self, tmp_path, ray_instance):
+        def download(path: str):
+            Path(path, "weights.bin").write_bytes(b"0" * 10)
+
+        peer_cache = NodeWeightCache(str(tmp_path / "peer_cache"), max_size_bytes=15)
+        peer_cache.get_or_fetch("a", download)
+        assert peer_cache._get_peers("a") == []
+        assert NodeWeightCache(str(tmp_path / "cache"))._get_peers("a")
+
+        # Evicting "a" removes its registration, so it's not fetched from the peer.
+        peer_cache.get_or_fetch("b", download)
+        assert not peer_cache.contains("a")
+        assert NodeWeightCache(str(tmp_path / "cache"))._get_peers("a") == []
+
+        # Registrations of entries deleted by other means are removed when found.
+        shutil.rmtree(peer_cache.get_path("b"))
+        downloads = []
+        cache = NodeWeightCache(str(tmp_path / "cache"))
+        cache.get_or_fetch("b", lambda path: downloads.append(path))
+        assert len(downloads) == 1
+        assert NodeWeightCache(str(tmp_path / "other_cache"))._get_peers("b") == [
+            (ray.get_runtime_context().get_node_id(), str(cache.root))
+        ]
+
+    def test_peer_transfer_disabled(self, tmp_path, ray_instance):
+        def download(path: str):
+            Path(path, "weights.bin").write_bytes(b"weights")
+
+        NodeWeightCache(str(tmp_path / "peer_cache")).get_or_fetch("digest", download)
+
+        downloads = []
+        with patch.object(download_utils, "RAYLLM_ENABLE_PEER_WEIGHT_TRANSFER", False):
+            NodeWeightCache(str(tmp_path / "cache")).get_or_fetch(
+                "digest", downloads.append
+            )
+        assert len(downloads) == 1
+
+
+class TestCloudModelDownloaderWithCache:
+    @pytest.fixture(autouse=True)
+    def weight_cache_dir(self, tmp_path):
+        with patch.object(
+            download_utils, "RAYLLM_NODE_WEIGHT_CACHE_DIR", str(tmp_path / "cache")
+        ):
+            yield
+
+    def test_cold_and_warm_start(self, tmp_path, bucket):
+        _, download_files = bucket
+        destination = tmp_path / "hf" / "models--test-model"
+
+        _downloader()._download_model(destination, "s3://bucket/model", False)
+        assert download_files.call_count == 1
+        snapshot = destination / "snapshots" / "abcdef"
+        assert (destination / "refs" / "main").read_text() == "abcdef"
+        assert snapshot.is_symlink()
+        assert sorted(p.name for p in snapshot.iterdir()) == [
+            ".manifest.json",
+            "config.json",
+            "hash",
+            "model.safetensors",
+            "tokenizer.json",
+        ]
+
+        # Restarting a replica, or starting another model with the same files,
+        # doesn't download them again.
+        _downloader()._download_model(destination, "s3://bucket/model", False)
+        other_destination = tmp_path / "hf" / "models--other-model"
+        _downloader("other-model")._download_model(
+            other_destination, "s3://bucket/model", False
+        )
+        assert download_files.call_count == 1
+        assert (other_destination / "snapshots" / "abcdef").resolve() == (
+            snapshot.resolve()
+        )
+
+    def test_changed_files_are_downloaded(self, tmp_path, bucket):
+        bucket_path, download_files = bucket
+        destination = tmp_path / "hf" / "models--test-model"
+
+        _downloader()._download_model(destination, "s3://bucket/model", False)
+        (bucket_path / "model.safetensors").write_bytes(os.urandom(2048))
+        _downloader()._download_model(destination, "s3://bucket/model", False)
+
+        assert download_files.call_count == 2
+        snapshot = destination / "snapshots" / "abcdef"
+        assert (snapshot / "model.safetensors").stat().st_size == 2048
+
+    def test_tokenizer_only(self, tmp_path, bucket):
+        _, download_files = bucket
+        destination = tmp_path / "hf" / "models--test-model"
+        snapshot = destination / "snapshots" / "abcdef"
+
+        _downloader()._download_model(destination, "s3://bucket/model", True)
+        assert not (snapshot / "model.safetensors").exists()
+        assert (snapshot / "tokenizer.json").exists()
+
+        _downloader()._download_model(destination, "s3://bucket/model", False)
+        assert (snapshot / "model.safetensors").exists()
+        assert download_files.call_count == 2
+
+        # The whole model already includes the tokenizer.
+        _downloader()._download_model(destination, "s3://bucket/model", True)
+        assert (snapshot / "model.safetensors").exists()
+        assert download_files.call_count == 2
+
+    def test_existing_snapshot_directory(self, tmp_path, bucket):
+        _, download_files = bucket
+        destination = tmp_path / "hf" / "models--test-model"
+        snapshot = destination / "snapshots" / "abcdef"
+        snapshot.mkdir(parents=True)
+
+        _downloader()._download_model(destination, "s3://bucket/model", False)
+        assert not snapshot.is_symlink()
+        assert (snapshot / "model.safetensors").exists()
+        assert download_files.call_count == 1
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-v", __file__]))
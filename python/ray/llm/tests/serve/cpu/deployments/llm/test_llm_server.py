@@ -1,5 +1,5 @@
 import sys
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -209,6 +209,34 @@ class TestLLMServer:
         server = await create_server(llm_config, engine_cls=MockVLLMEngine)
         assert server._get_batch_interval_ms() == 0
 
+    @pytest.mark.asyncio
+    async def test_get_adaptive_batch_interval(self, create_server):
+        """Test that adaptive batching is only set up when enabled."""
+        llm_config = LLMConfig(
+            model_loading_config=ModelLoadingConfig(
+                model_id="llm_model_id",
+            ),
+        )
+        server = await create_server(llm_config, engine_cls=MockVLLMEngine)
+        assert server._adaptive_batch_interval is None
+
+        llm_config = LLMConfig(
+            model_loading_config=ModelLoadingConfig(
+                model_id="llm_model_id",
+            ),
+            experimental_configs={
+                "stream_batching_adaptive": True,
+                "stream_batching_min_interval_ms": 2,
+                "stream_batching_max_interval_ms": 40,
+                "stream_batching_saturation_streams": 8,
+            },
+        )
+        server = await create_server(llm_config, engine_cls=MockVLLMEngine)
+        adaptive_interval = server._adaptive_batch_interval
+        assert adaptive_interval.min_interval_s == pytest.approx(0.002)
+        assert adaptive_interval.max_interval_s == pytest.approx(0.04)
+        assert adaptive_interval.saturation_num_streams == 8
+
     @pytest.mark.asyncio
     async def test_chat_streaming(self, create_server):
         """Test chat completion in streaming mode."""
@@ -387,6 +415,21 @@ class TestLLMServer:
         await server.check_health()
         server.engine.check_health.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_record_routing_stats(self, create_server):
+        """Test that the engine's routing stats are reported to Serve."""
+        llm_config = LLMConfig(
+            model_loading_config=ModelLoadingConfig(
+                model_id="test_model",
+            ),
+        )
+
+        server = await create_server(llm_config, engine_cls=MockVLLMEngine)
+        assert await server.record_routing_stats() == {}
+
+        server.engine.routing_stats = MagicMock(return_value={"kv_cache_usage": 0.5})
+        assert await server.record_routing_stats() == {"kv_cache_usage": 0.5}
+
     @pytest.mark.asyncio
     async def test_error_handling(self, create_server):
         """Test error handling in the server."""
@@ -6,6 +6,7 @@ import pytest
 import ray
 from ray._common.utils import get_or_create_event_loop
 from ray.llm._internal.serve.request_router.prefix_aware.prefix_tree import (
+    ChunkedPrefixTreeActor,
     PrefixTreeActor,
 )
 from ray.serve._private.common import (
@@ -15,7 +16,9 @@ from ray.serve._private.common import (
 )
 from ray.serve._private.request_router.common import PendingRequest
 from ray.serve._private.request_router.prefix_aware_router import (
+    KVCacheAwarePrefixReplicaRouter,
     PrefixAwarePow2ReplicaRouter,
+    ReplicaCostModel,
 )
 from ray.serve._private.test_utils import MockTimer
 from ray.serve._private.utils import generate_request_id
@@ -250,6 +253,59 @@ class TestPrefixAwareLogic:
                 await prefix_request_router.choose_replica_for_request(chat_req) == r1
             )
 
+    @pytest.mark.asyncio
+    async def test_concurrent_prefix_matches_are_batched(
+        self, prefix_request_router, tree_actor
+    ):
+        """Requests routed concurrently are matched in one call to the tree actor."""
+        r1 = FakeRunningReplica("r1")
+        r1.set_queue_len_response(0)
+        r2 = FakeRunningReplica("r2")
+        r2.set_queue_len_response(0)
+        prefix_request_router.update_replicas([r1, r2])
+        r1_id = r1.replica_id.to_full_id_str()
+        r2_id = r2.replica_id.to_full_id_str()
+        ray.get(tree_actor.insert.remote("Hello world", r1_id, time.time()))
+        ray.get(tree_actor.insert.remote("Goodbye world", r2_id, time.time()))
+
+        batch_sizes = []
+        prefix_match_batch = tree_actor.prefix_match_batch
+
+        class BatchCountingTreeActor:
+            def __getattr__(self, name):
+                return getattr(tree_actor, name)
+
+            class prefix_match_batch:
+                @staticmethod
+                def remote(texts, available_tenants):
+                    batch_sizes.append(len(texts))
+                    return prefix_match_batch.remote(texts, available_tenants)
+
+        prefix_request_router._tree_actor = BatchCountingTreeActor()
+        texts = ["Hello world", "Hello there", "Goodbye world", "Nothing"]
+        results = await asyncio.gather(
+            *[
+                prefix_request_router._prefix_match(text, [r1_id, r2_id])
+                for text in texts
+            ]
+        )
+        assert results == [
+            ray.get(tree_actor.prefix_match.remote(text, [r1_id, r2_id]))
+            for text in texts
+        ]
+        assert batch_sizes == [4]
+
+        chosen = await asyncio.gather(
+            *[
+                prefix_request_router.choose_replica_for_request(
+                    fake_pending_request(prompt=prompt)
+                )
+                for prompt in ["Hello world", "Goodbye world"] * 5
+            ]
+        )
+        assert chosen == [r1, r2] * 5
+        assert sum(batch_sizes[1:]) == 10
+
 
 class TestEvictionBehavior:
     """Tests for prefix tree eviction behavior."""
@@ -328,3 +384,319 @@ class TestEvictionBehavior:
 
         ray.get(prefix_request_router._tree_actor.stop_eviction_loop.remote())
         await asyncio.sleep(0.1)
+
+
+class TestLocalPrefixTree:
+    """Tests for routing with a local copy of a chunked prefix tree."""
+
+    @pytest.fixture
+    def local_tree_request_router(self):
+        tree_actor = ChunkedPrefixTreeActor.remote(chunk_size=2, max_recorded_ops=100)
+
+        async def construct_request_router():
+            return PrefixAwarePow2ReplicaRouter(
+                deployment_id=DeploymentID(name="TEST_DEPLOYMENT"),
+                handle_source=DeploymentHandleSource.REPLICA,
+                use_replica_queue_len_cache=False,
+                get_curr_time_s=TIMER.time,
+                tree_actor=tree_actor,
+                tree_chunk_size=2,
+                local_tree_sync_interval_s=100,
+            )
+
+        request_router = asyncio.new_event_loop().run_until_complete(
+            construct_request_router()
+        )
+        yield request_router
+        request_router.shutdown()
+        ray.kill(tree_actor)
+
+    def test_local_tree_requires_chunked_tree(self, tree_actor):
+        with pytest.raises(ValueError):
+            PrefixAwarePow2ReplicaRouter(
+                deployment_id=DeploymentID(name="TEST_DEPLOYMENT"),
+                handle_source=DeploymentHandleSource.REPLICA,
+                tree_actor=tree_actor,
+                local_tree_sync_interval_s=1,
+            )
+
+    def test_shared_tree_chunk_size_mismatch(self):
+        tree_actor = ChunkedPrefixTreeActor.options(
+            name="LlmChunkedPrefixTreeActor", lifetime="detached"
+        ).remote(chunk_size=4)
+        try:
+            with pytest.raises(ValueError, match="tree_chunk_size"):
+                PrefixAwarePow2ReplicaRouter(
+                    deployment_id=DeploymentID(name="TEST_DEPLOYMENT"),
+                    handle_source=DeploymentHandleSource.REPLICA,
+                    tree_chunk_size=2,
+                )
+
+            # The existing actor is reused if the chunk size matches.
+            router = PrefixAwarePow2ReplicaRouter(
+                deployment_id=DeploymentID(name="TEST_DEPLOYMENT"),
+                handle_source=DeploymentHandleSource.REPLICA,
+                tree_chunk_size=4,
+            )
+            assert router._tree_actor._actor_id == tree_actor._actor_id
+        finally:
+            ray.kill(tree_actor)
+
+    @pytest.mark.asyncio
+    async def test_local_tree_sync_task_stopped(self, local_tree_request_router):
+        router = local_tree_request_router
+        r1 = FakeRunningReplica("r1")
+        r1.set_queue_len_response(0)
+        router.update_replicas([r1])
+
+        await router._choose_replica_for_request(fake_pending_request(prompt="Hi"))
+        task = router._local_tree_sync_task
+        assert task is not None
+
+        # The task is stopped when there are no replicas left to route to.
+        router.update_replicas([])
+        await asyncio.sleep(0)
+        assert task.cancelled()
+        assert router._local_tree_sync_task is None
+
+        # It's restarted when routing again, and stopped on shutdown.
+        router.update_replicas([r1])
+        await router._choose_replica_for_request(fake_pending_request(prompt="Hi"))
+        task = router._local_tree_sync_task
+        assert task is not None
+        router.shutdown()
+        await asyncio.sleep(0)
+        assert task.cancelled()
+        assert router._local_tree_sync_task is None
+
+    @pytest.mark.asyncio
+    async def test_routes_with_local_tree(self, local_tree_request_router):
+        router = local_tree_request_router
+        r1 = FakeRunningReplica("r1")
+        r1.set_queue_len_response(0)
+        r2 = FakeRunningReplica("r2")
+        r2.set_queue_len_response(0)
+        router.update_replicas([r1, r2])
+        r1_id = r1.replica_id.to_full_id_str()
+        r2_id = r2.replica_id.to_full_id_str()
+        assert router._local_tree.tenant_to_char_count == {r1_id: 0, r2_id: 0}
+
+        # Another router inserted a prompt into the shared tree.
+        ray.get(router._tree_actor.insert.remote("Hello world", r2_id, time.time()))
+        matched_text, matched_tenants = router._local_tree.prefix_match("Hello world")
+        assert matched_text == ""
+        assert set(matched_tenants) == {r1_id, r2_id}
+        await router._sync_local_tree()
+        assert router._local_tree.prefix_match("Hello world") == (
+            "Hello world",
+            [r2_id],
+        )
+
+        req = fake_pending_request(prompt="Hello world")
+        for _ in range(10):
+            assert await router._choose_replica_for_request(req) == r2
+        assert router._local_tree_sync_task is not None
+
+        # Routed requests are inserted into both trees.
+        router.on_request_routed(
+            fake_pending_request(prompt="Goodbye"), r1.replica_id, None
+        )
+        assert router._local_tree.prefix_match("Goodbye") == ("Goodbye", [r1_id])
+        await router._sync_local_tree()
+        assert ray.get(router._tree_actor.prefix_match.remote("Goodbye")) == (
+            "Goodbye",
+            [r1_id],
+        )
+
+
+class FakeRunningReplicaWithStats(FakeRunningReplica):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._routing_stats = {}
+
+    @property
+    def routing_stats(self):
+        return self._routing_stats
+
+    def set_routing_stats(self, routing_stats):
+        self._routing_stats = routing_stats
+
+
+class TestKVCacheAwareRouting:
+    """Tests for routing by expected cost."""
+
+    @pytest.fixture
+    def kv_cache_aware_request_router(self, tree_actor):
+        async def construct_request_router():
+            return KVCacheAwarePrefixReplicaRouter(
+                deployment_id=DeploymentID(name="TEST_DEPLOYMENT"),
+                handle_source=DeploymentHandleSource.REPLICA,
+                use_replica_queue_len_cache=False,
+                get_curr_time_s=TIMER.time,
+                tree_actor=tree_actor,
+                queue_len_weight=0.25,
+            )
+
+        request_router = asyncio.new_event_loop().run_until_complete(
+            construct_request_router()
+        )
+        yield request_router
+        assert request_router.curr_num_routing_tasks == 0
+        assert request_router.num_pending_requests == 0
+
+    def test_cost_model(self):
+        model = ReplicaCostModel(
+            queue_len_weight=0.5, prefill_weight=1.0, kv_cache_weight=1.0
+        )
+        assert model.cost(0, 1.0, 0.0) == 0
+        assert model.cost(2, 0.0, 0.0) == pytest.approx(2.0)
+        assert model.cost(0, 0.5, 0.5) == pytest.approx(1.5)
+        # A full cache has a large but finite cost.
+        assert model.cost(0, 1.0, 1.0) == pytest.approx(99)
+
+    @pytest.mark.asyncio
+    async def test_ranks_replicas_by_cost(self, kv_cache_aware_request_router):
+        router = kv_cache_aware_request_router
+        r1 = FakeRunningReplicaWithStats("r1")
+        r1.set_queue_len_response(0)
+        r2 = FakeRunningReplicaWithStats("r2")
+        r2.set_queue_len_response(0)
+        r3 = FakeRunningReplicaWithStats("r3")
+        r3.set_queue_len_response(DEFAULT_MAX_ONGOING_REQUESTS)
+        router.update_replicas([r1, r2, r3])
+
+        ray.get(
+            router._tree_actor.insert.remote(
+                "Hello world", r2.replica_id.to_full_id_str(), time.time()
+            )
+        )
+        ray.get(
+            router._tree_actor.insert.remote(
+                "Hello world", r3.replica_id.to_full_id_str(), time.time()
+            )
+        )
+
+        # The replica with the cached prefix is preferred, the full one is skipped.
+        req = fake_pending_request(prompt="Hello world")
+        assert await router.choose_replicas(
+            list(router.curr_replicas.values()), req
+        ) == [
+            [r2],
+            [r1],
+        ]
+        assert await router._choose_replica_for_request(req) == r2
+
+        # A long queue outweighs the prefix hit.
+        r2.set_queue_len_response(5)
+        assert await router.choose_replicas(
+            list(router.curr_replicas.values()), req
+        ) == [
+            [r1],
+            [r2],
+        ]
+
+        # So does a nearly full KV cache.
+        r2.set_queue_len_response(0)
+        r2.set_routing_stats({"kv_cache_usage": 0.9})
+        assert await router.choose_replicas(
+            list(router.curr_replicas.values()), req
+        ) == [
+            [r1],
+            [r2],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_scores_bounded_number_of_replicas(
+        self, kv_cache_aware_request_router
+    ):
+        router = kv_cache_aware_request_router
+        router.max_replicas_to_score = 2
+        replicas = [FakeRunningReplicaWithStats(f"r{i}") for i in range(10)]
+        for replica in replicas:
+            replica.set_queue_len_response(0)
+        router.update_replicas(replicas)
+
+        probed = []
+        probe_queue_lens = router._probe_queue_lens
+
+        async def _probe_queue_lens(candidates, backoff_index):
+            probed.append(list(candidates))
+            return await probe_queue_lens(candidates, backoff_index)
+
+        router._probe_queue_lens = _probe_queue_lens
+
+        ray.get(
+            router._tree_actor.insert.remote(
+                "Hello world", replicas[7].replica_id.to_full_id_str(), time.time()
+            )
+        )
+        req = fake_pending_request(prompt="Hello world")
+        ranks = await router.choose_replicas(list(router.curr_replicas.values()), req)
+
+        # Only the best prefix match and one random replica are probed and ranked.
+        assert len(probed) == 1 and len(probed[0]) == 2
+        assert replicas[7] in probed[0]
+        assert ranks[0] == [replicas[7]]
+        assert len(ranks) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_prefix_match_lengths_are_batched(
+        self, kv_cache_aware_request_router, tree_actor
+    ):
+        """Requests routed concurrently are matched in one call to the tree actor."""
+        router = kv_cache_aware_request_router
+        r1 = FakeRunningReplicaWithStats("r1")
+        r1.set_queue_len_response(0)
+        r2 = FakeRunningReplicaWithStats("r2")
+        r2.set_queue_len_response(0)
+        router.update_replicas([r1, r2])
+        r1_id = r1.replica_id.to_full_id_str()
+        r2_id = r2.replica_id.to_full_id_str()
+        ray.get(tree_actor.insert.remote("Hello world", r1_id, time.time()))
+        ray.get(tree_actor.insert.remote("Goodbye world", r2_id, time.time()))
+
+        batch_sizes = []
+        prefix_match_lengths_batch = tree_actor.prefix_match_lengths_batch
+
+        class BatchCountingTreeActor:
+            def __getattr__(self, name):
+                return getattr(tree_actor, name)
+
+            class prefix_match_lengths_batch:
+                @staticmethod
+                def remote(texts, available_tenants):
+                    batch_sizes.append(len(texts))
+                    return prefix_match_lengths_batch.remote(texts, available_tenants)
+
+        router._tree_actor = BatchCountingTreeActor()
+        texts = ["Hello world", "Goodbye world", "Nothing"]
+        results = await asyncio.gather(
+            *[router._prefix_match_lengths(text, [r1_id, r2_id]) for text in texts]
+        )
+        assert results == [
+            ray.get(tree_actor.prefix_match_lengths.remote(text, [r1_id, r2_id]))
+            for text in texts
+        ]
+        assert batch_sizes == [3]
+
+        chosen = await asyncio.gather(
+            *[
+                router.choose_replicas(
+                    list(router.curr_replicas.values()),
+                    fake_pending_request(prompt=prompt),
+                )
+                for prompt in ["Hello world", "Goodbye world"] * 5
+            ]
+        )
+        assert [ranks[0] for ranks in chosen] == [[r1], [r2]] * 5
+        assert sum(batch_sizes[1:]) == 10
+
+    @pytest.mark.asyncio
+    async def test_fallback_when_no_prompt(self, kv_cache_aware_request_router):
+        router = kv_cache_aware_request_router
+        r1 = FakeRunningReplicaWithStats("r1")
+        r1.set_queue_len_response(0)
+        router.update_replicas([r1])
+
+        req = fake_pending_request()
+        assert await router._choose_replica_for_request(req) == r1
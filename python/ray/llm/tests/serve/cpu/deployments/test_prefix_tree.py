@@ -5,6 +5,8 @@ import pytest
 
 import ray
 from ray.llm._internal.serve.request_router.prefix_aware.prefix_tree import (
+    ChunkedPrefixTree,
+    ChunkedPrefixTreeActor,
     Node,
     PrefixTree,
     PrefixTreeActor,
@@ -364,6 +366,55 @@ class TestPrefixTreeMatch:
         assert matched_text == ""
         assert matched_tenants is None
 
+    def test_prefix_match_batch(self, tree: PrefixTree) -> None:
+        """Test prefix_match_batch matches each text like prefix_match."""
+        tree.add_tenants(["tenant_1", "tenant_2"], 0)
+        tree.insert("helloworld", "tenant_1", 1)
+        tree.insert("hellothere", "tenant_2", 2)
+
+        texts = ["helloworld", "hellothere", "nothing"]
+        assert tree.prefix_match_batch(texts) == [
+            tree.prefix_match(text) for text in texts
+        ]
+        assert tree.prefix_match_batch(texts, [["tenant_2"], None, ["unknown"]]) == [
+            ("hello", ["tenant_2"]),
+            ("hellothere", ["tenant_2"]),
+            ("", None),
+        ]
+        with pytest.raises(ValueError):
+            tree.prefix_match_batch(texts, [None])
+
+    def test_prefix_match_lengths(self, tree: PrefixTree) -> None:
+        """Test prefix_match_lengths returns the matched length for every tenant."""
+        tree.add_tenants(["tenant_1", "tenant_2", "tenant_3"], 0)
+        tree.insert("helloworld", "tenant_1", 1)
+        tree.insert("hellothere", "tenant_2", 2)
+        assert tree.prefix_match_lengths("hellothereextra") == {
+            "tenant_1": 5,
+            "tenant_2": 10,
+            "tenant_3": 0,
+        }
+        assert tree.prefix_match_lengths("hellow", ["tenant_1", "unknown"]) == {
+            "tenant_1": 6
+        }
+        assert tree.prefix_match_lengths("foo", ["unknown"]) == {}
+
+    def test_prefix_match_lengths_batch(self, tree: PrefixTree) -> None:
+        """Test prefix_match_lengths_batch matches each text like prefix_match_lengths."""
+        tree.add_tenants(["tenant_1", "tenant_2"], 0)
+        tree.insert("helloworld", "tenant_1", 1)
+        tree.insert("hellothere", "tenant_2", 2)
+
+        texts = ["helloworld", "hellothere", "nothing"]
+        assert tree.prefix_match_lengths_batch(texts) == [
+            tree.prefix_match_lengths(text) for text in texts
+        ]
+        assert tree.prefix_match_lengths_batch(
+            texts, [["tenant_2"], None, ["unknown"]]
+        ) == [{"tenant_2": 5}, {"tenant_1": 5, "tenant_2": 10}, {}]
+        with pytest.raises(ValueError):
+            tree.prefix_match_lengths_batch(texts, [None])
+
 
 class TestPrefixTreeRemove:
     def test_remove_single_leaf_node_pruned(self, tree: PrefixTree) -> None:
@@ -992,6 +1043,191 @@ class TestPrefixTreeActorEvictionLoop:
         assert char_count["tenant_1"] == 6
 
 
+@pytest.fixture
+def chunked_tree() -> ChunkedPrefixTree:
+    """Create a fresh ChunkedPrefixTree with 4 characters per chunk."""
+    return ChunkedPrefixTree(chunk_size=4, max_recorded_ops=100)
+
+
+class TestChunkedPrefixTree:
+    def test_insert_and_match_by_chunk(self, chunked_tree: ChunkedPrefixTree) -> None:
+        chunked_tree.add_tenants(["tenant_1", "tenant_2"], 0)
+        chunked_tree.insert("helloworld", "tenant_1", 1)
+        chunked_tree.insert("hellothere", "tenant_2", 2)
+        assert chunked_tree.tenant_to_char_count == {"tenant_1": 10, "tenant_2": 10}
+
+        # "hell" is shared, "owor" and "othe" diverge.
+        assert chunked_tree.prefix_match("hello") == ("hell", ["tenant_1", "tenant_2"])
+        assert chunked_tree.prefix_match("helloworld") == ("helloworld", ["tenant_1"])
+        assert chunked_tree.prefix_match("hellothere") == ("hellothere", ["tenant_2"])
+        # Partial chunks only match if they're identical.
+        assert chunked_tree.prefix_match("helloworld!") == ("hellowor", ["tenant_1"])
+        assert chunked_tree.prefix_match("hellotherefore") == (
+            "hellothe",
+            ["tenant_2"],
+        )
+        assert chunked_tree.prefix_match("foo") == ("", ["tenant_1", "tenant_2"])
+
+        # Inserting the same text again doesn't increase the char count.
+        chunked_tree.insert("helloworld", "tenant_1", 3)
+        assert chunked_tree.tenant_to_char_count["tenant_1"] == 10
+
+    def test_match_with_tenant_filter(self, chunked_tree: ChunkedPrefixTree) -> None:
+        chunked_tree.add_tenants(["tenant_1", "tenant_2"], 0)
+        chunked_tree.insert("helloworld", "tenant_1", 1)
+
+        assert chunked_tree.prefix_match("helloworld", ["tenant_2"]) == (
+            "",
+            ["tenant_2"],
+        )
+        assert chunked_tree.prefix_match("helloworld", ["tenant_1"]) == (
+            "helloworld",
+            ["tenant_1"],
+        )
+        assert chunked_tree.prefix_match("helloworld", ["unknown"]) == ("", None)
+
+    def test_prefix_match_batch(self, chunked_tree: ChunkedPrefixTree) -> None:
+        chunked_tree.add_tenants(["tenant_1", "tenant_2"], 0)
+        chunked_tree.insert("helloworld", "tenant_1", 1)
+        chunked_tree.insert("foobarbaz", "tenant_2", 2)
+
+        texts = ["helloworld", "foobar", "nothing"]
+        assert chunked_tree.prefix_match_batch(texts) == [
+            chunked_tree.prefix_match(text) for text in texts
+        ]
+        assert chunked_tree.prefix_match_batch(
+            texts, [["tenant_2"], None, ["tenant_1"]]
+        ) == [("", ["tenant_2"]), ("foob", ["tenant_2"]), ("", ["tenant_1"])]
+        with pytest.raises(ValueError):
+            chunked_tree.prefix_match_batch(texts, [None])
+
+    def test_prefix_match_lengths(self, chunked_tree: ChunkedPrefixTree) -> None:
+        chunked_tree.add_tenants(["tenant_1", "tenant_2", "tenant_3"], 0)
+        chunked_tree.insert("helloworld", "tenant_1", 1)
+        chunked_tree.insert("hellothere", "tenant_2", 2)
+
+        assert chunked_tree.prefix_match_lengths("hellothereextra") == {
+            "tenant_1": 4,
+            "tenant_2": 8,
+            "tenant_3": 0,
+        }
+        assert chunked_tree.prefix_match_lengths("helloworld", ["tenant_1"]) == {
+            "tenant_1": 10
+        }
+        assert chunked_tree.prefix_match_lengths("foo", ["unknown"]) == {}
+
+    def test_prefix_match_lengths_batch(self, chunked_tree: ChunkedPrefixTree) -> None:
+        chunked_tree.add_tenants(["tenant_1", "tenant_2"], 0)
+        chunked_tree.insert("helloworld", "tenant_1", 1)
+        chunked_tree.insert("hellothere", "tenant_2", 2)
+
+        texts = ["helloworld", "hellothere", "nothing"]
+        assert chunked_tree.prefix_match_lengths_batch(texts) == [
+            chunked_tree.prefix_match_lengths(text) for text in texts
+        ]
+        assert chunked_tree.prefix_match_lengths_batch(
+            texts, [["tenant_2"], None, ["unknown"]]
+        ) == [{"tenant_2": 4}, {"tenant_1": 4, "tenant_2": 10}, {}]
+        with pytest.raises(ValueError):
+            chunked_tree.prefix_match_lengths_batch(texts, [None])
+
+    def test_remove_tenants(self, chunked_tree: ChunkedPrefixTree) -> None:
+        chunked_tree.add_tenants(["tenant_1", "tenant_2"], 0)
+        chunked_tree.insert("helloworld", "tenant_1", 1)
+        chunked_tree.insert("hellothere", "tenant_2", 2)
+
+        assert chunked_tree.remove_tenants(["tenant_1", "unknown"]) == {
+            "tenant_1": 10,
+            "unknown": 0,
+        }
+        assert chunked_tree.tenant_to_char_count == {"tenant_2": 10}
+        assert chunked_tree.prefix_match("helloworld") == ("hell", ["tenant_2"])
+        # Only the nodes of the remaining tenant are left.
+        assert len(chunked_tree._children) == 3
+
+        # Node IDs and tenant bits are reused.
+        num_nodes = len(chunked_tree._node_parent)
+        chunked_tree.add_tenants(["tenant_3"], 3)
+        chunked_tree.insert("helloworld", "tenant_3", 4)
+        assert len(chunked_tree._node_parent) == num_nodes
+        assert chunked_tree.prefix_match("helloworld") == ("helloworld", ["tenant_3"])
+
+    def test_eviction(self, chunked_tree: ChunkedPrefixTree) -> None:
+        chunked_tree.add_tenants(["tenant_1"], 0)
+        chunked_tree.insert("aaaabbbb", "tenant_1", 1)
+        chunked_tree.insert("aaaacccc", "tenant_1", 2)
+        chunked_tree.insert("dddd", "tenant_1", 3)
+        assert chunked_tree.tenant_to_char_count["tenant_1"] == 16
+
+        # Only "bbbb" was last accessed at time 1, "aaaa" was accessed at time 2.
+        assert chunked_tree.evict_tenant_by_lru("tenant_1", 1) == 4
+        assert chunked_tree.prefix_match("aaaabbbb") == ("aaaa", ["tenant_1"])
+        assert chunked_tree.prefix_match("aaaacccc") == ("aaaacccc", ["tenant_1"])
+
+        # Descendants are evicted together with their ancestors.
+        assert chunked_tree.evict_tenant_by_lru("tenant_1", 5) == 8
+        assert chunked_tree.tenant_to_char_count["tenant_1"] == 4
+        assert chunked_tree.prefix_match("aaaacccc") == ("", ["tenant_1"])
+        assert chunked_tree.prefix_match("dddd") == ("dddd", ["tenant_1"])
+
+        assert chunked_tree.evict_tenant_by_lru("unknown", 1) == 0
+
+    def test_incremental_sync(self, chunked_tree: ChunkedPrefixTree) -> None:
+        replica = ChunkedPrefixTree(chunk_size=4)
+        chunked_tree.add_tenants(["tenant_1", "tenant_2"], 0)
+        chunked_tree.insert("helloworld", "tenant_1", 1)
+
+        seq, ops = chunked_tree.get_updates(0)
+        replica.apply_updates(ops)
+        assert replica.prefix_match("helloworld") == ("helloworld", ["tenant_1"])
+
+        chunked_tree.insert("hellothere", "tenant_2", 2)
+        chunked_tree.evict_tenant_by_lru("tenant_1", 1)
+        chunked_tree.remove_tenants(["tenant_2"])
+        seq, ops = chunked_tree.get_updates(seq)
+        assert len(ops) == 3
+        replica.apply_updates(ops)
+        assert replica.tenant_to_char_count == chunked_tree.tenant_to_char_count
+        for text in ["helloworld", "hellothere"]:
+            assert replica.prefix_match(text) == chunked_tree.prefix_match(text)
+
+        assert chunked_tree.get_updates(seq) == (seq, [])
+
+    def test_sync_falls_back_to_snapshot(self) -> None:
+        tree = ChunkedPrefixTree(chunk_size=4, max_recorded_ops=2)
+        tree.add_tenants(["tenant_1"], 0)
+        for i in range(5):
+            tree.insert(f"text{i}", "tenant_1", i)
+
+        seq, ops = tree.get_updates(0)
+        assert ops is None
+
+        replica = ChunkedPrefixTree(chunk_size=4)
+        replica.set_state(tree.get_state())
+        assert replica.tenant_to_char_count == tree.tenant_to_char_count
+        assert replica.prefix_match("text3") == ("text3", ["tenant_1"])
+
+        # Changes to the original tree don't affect the snapshot.
+        tree.remove_tenants(["tenant_1"])
+        assert replica.prefix_match("text3") == ("text3", ["tenant_1"])
+
+
+@pytest.mark.asyncio
+async def test_chunked_prefix_tree_actor_eviction_loop() -> None:
+    tree_actor = ChunkedPrefixTreeActor.remote(chunk_size=4)
+    ray.get(tree_actor.start_eviction_loop.remote(10, 8, 0.1))
+    ray.get(tree_actor.add_tenants.remote(["tenant_1"], 0))
+    ray.get(tree_actor.insert.remote("hello", "tenant_1", 1))
+    ray.get(tree_actor.insert.remote("excess", "tenant_1", 2))
+    assert ray.get(tree_actor.getattr.remote("tenant_to_char_count")) == {
+        "tenant_1": 11
+    }
+
+    await asyncio.sleep(0.3)
+
+    assert ray.get(tree_actor.getattr.remote("tenant_to_char_count")) == {"tenant_1": 6}
+
+
 if __name__ == "__main__":
     import sys
 
@@ -6,7 +6,10 @@ import pytest
 
 from ray.llm._internal.serve.configs.constants import MODEL_RESPONSE_BATCH_TIMEOUT_MS
 from ray.llm._internal.serve.configs.server_models import LLMRawResponse
-from ray.llm._internal.serve.deployments.utils.batcher import LLMRawResponseBatcher
+from ray.llm._internal.serve.deployments.utils.batcher import (
+    AdaptiveBatchInterval,
+    LLMRawResponseBatcher,
+)
 
 TEXT_VALUE = "foo"
 FINAL_TEXT_VALUE = "bar"
@@ -182,5 +185,121 @@ class TestBatching:
         # Inner task is checked automatically with pytest.raises
 
 
+class TestAdaptiveBatchInterval:
+    def test_interval_grows_with_num_streams(self):
+        adaptive_interval = AdaptiveBatchInterval(
+            min_interval_ms=10, max_interval_ms=100, saturation_num_streams=10
+        )
+        assert adaptive_interval.get_interval_s() == pytest.approx(0.01)
+
+        adaptive_interval.add_stream()
+        assert adaptive_interval.get_interval_s() == pytest.approx(0.01)
+
+        for _ in range(4):
+            adaptive_interval.add_stream()
+        assert adaptive_interval.get_interval_s() == pytest.approx(0.05)
+
+        for _ in range(20):
+            adaptive_interval.add_stream()
+        assert adaptive_interval.get_interval_s() == pytest.approx(0.1)
+
+        for _ in range(30):
+            adaptive_interval.remove_stream()
+        assert adaptive_interval.num_active_streams == 0
+        assert adaptive_interval.get_interval_s() == pytest.approx(0.01)
+
+    def test_interval_grows_with_write_time(self):
+        adaptive_interval = AdaptiveBatchInterval(
+            min_interval_ms=10,
+            max_interval_ms=100,
+            saturation_num_streams=10,
+            write_time_multiplier=4,
+        )
+        assert adaptive_interval.get_interval_s(0.001) == pytest.approx(0.01)
+        assert adaptive_interval.get_interval_s(0.01) == pytest.approx(0.04)
+        assert adaptive_interval.get_interval_s(1) == pytest.approx(0.1)
+
+    def test_saturation_at_one_stream(self):
+        adaptive_interval = AdaptiveBatchInterval(
+            min_interval_ms=10, max_interval_ms=100, saturation_num_streams=1
+        )
+        adaptive_interval.add_stream()
+        assert adaptive_interval.get_interval_s() == pytest.approx(0.01)
+        adaptive_interval.add_stream()
+        assert adaptive_interval.get_interval_s() == pytest.approx(0.1)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            dict(min_interval_ms=-1, max_interval_ms=10, saturation_num_streams=1),
+            dict(min_interval_ms=20, max_interval_ms=10, saturation_num_streams=1),
+            dict(min_interval_ms=1, max_interval_ms=10, saturation_num_streams=0),
+        ],
+    )
+    def test_invalid_args(self, kwargs):
+        with pytest.raises(ValueError):
+            AdaptiveBatchInterval(**kwargs)
+
+    @pytest.mark.asyncio
+    async def test_batcher_tracks_active_streams(self):
+        adaptive_interval = AdaptiveBatchInterval(
+            min_interval_ms=MODEL_RESPONSE_BATCH_TIMEOUT_MS / 10,
+            max_interval_ms=MODEL_RESPONSE_BATCH_TIMEOUT_MS,
+            saturation_num_streams=2,
+        )
+        batchers = [
+            LLMRawResponseBatcher(
+                fake_generator_slow(num_batches=10),
+                adaptive_interval=adaptive_interval,
+            )
+            for _ in range(2)
+        ]
+
+        async def consume(batcher):
+            counts = []
+            async for x in batcher.stream():
+                counts.append(x.num_generated_tokens)
+                assert adaptive_interval.num_active_streams >= 1
+            return counts
+
+        results = await asyncio.gather(*(consume(b) for b in batchers))
+
+        assert adaptive_interval.num_active_streams == 0
+        for counts in results:
+            assert sum(counts) == 100
+            # Two streams saturate the interval, so it matches the fixed one.
+            assert 9 <= len(counts) <= 13
+
+    @pytest.mark.asyncio
+    async def test_batcher_coalesces_under_backpressure(self):
+        """A slow consumer gets fewer, larger batches."""
+        adaptive_interval = AdaptiveBatchInterval(
+            min_interval_ms=1, max_interval_ms=1000, saturation_num_streams=64
+        )
+
+        async def consume(batcher, write_time_s):
+            count = 0
+            async for _x in batcher.stream():
+                count += 1
+                await asyncio.sleep(write_time_s)
+            return count
+
+        fast_count = await consume(
+            LLMRawResponseBatcher(
+                fake_generator_slow(num_batches=10),
+                adaptive_interval=adaptive_interval,
+            ),
+            write_time_s=0,
+        )
+        slow_count = await consume(
+            LLMRawResponseBatcher(
+                fake_generator_slow(num_batches=10),
+                adaptive_interval=adaptive_interval,
+            ),
+            write_time_s=MODEL_RESPONSE_BATCH_TIMEOUT_MS / 1000 / 5,
+        )
+        assert slow_count < fast_count / 2
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(["-v", __file__]))
@@ -0,0 +1,201 @@
+"""Benchmark the controller's deployment state reconciliation loop.
+
+Runs `DeploymentStateManager.update()` against mocked replica actors, so it
+doesn't need a Ray cluster, and reports how long one iteration of the control
+loop takes as the total number of replicas grows. Once all replicas are running,
+`--num-changing-deployments` deployments are scaled back and forth on every
+iteration while the rest of the deployments stay in steady state.
+
+    python controller_loop.py --num-replicas 1000 --num-replicas 10000
+"""
+import time
+from typing import List, Optional
+from unittest.mock import Mock, patch
+
+import click
+import pandas as pd
+
+from ray.serve._private.autoscaling_state import AutoscalingStateManager
+from ray.serve._private.common import DeploymentID, ReplicaID
+from ray.serve._private.config import DeploymentConfig, ReplicaConfig
+from ray.serve._private.deployment_info import DeploymentInfo
+from ray.serve._private.deployment_scheduler import ReplicaSchedulingRequest
+from ray.serve._private.deployment_state import (
+    DeploymentStateManager,
+    DeploymentVersion,
+    ReplicaStartupStatus,
+)
+from ray.serve._private.long_poll import LongPollHost
+from ray.serve._private.test_utils import (
+    MockActorHandle,
+    MockClusterNodeInfoCache,
+    MockKVStore,
+)
+
+
+class _MockReplicaActorWrapper:
+    """Replica actor that starts, passes health checks, and stops immediately."""
+
+    def __init__(self, replica_id: ReplicaID, version: DeploymentVersion):
+        self.replica_id = replica_id
+        self.version = version
+        self.actor_handle = MockActorHandle()
+        self.is_cross_language = False
+        self.node_id = "node-id"
+        self.node_ip = None
+        self.node_instance_id = None
+        self.actor_id = None
+        self.worker_id = None
+        self.pid = None
+        self.log_file_path = None
+        self.docs_path = None
+        self.initialization_latency_s = 0.0
+        self._port = None
+
+    @property
+    def deployment_name(self) -> str:
+        return self.replica_id.deployment_id.name
+
+    @property
+    def max_ongoing_requests(self) -> int:
+        return self.version.deployment_config.max_ongoing_requests
+
+    @property
+    def graceful_shutdown_timeout_s(self) -> float:
+        return self.version.deployment_config.graceful_shutdown_timeout_s
+
+    def start(self, deployment_info: DeploymentInfo) -> ReplicaSchedulingRequest:
+        return ReplicaSchedulingRequest(
+            replica_id=self.replica_id,
+            actor_def=Mock(),
+            actor_resources={},
+            actor_options={"name": "placeholder"},
+            actor_init_args=(),
+            placement_group_bundles=None,
+            on_scheduled=lambda *args, **kwargs: None,
+        )
+
+    def reconfigure(self, version: DeploymentVersion) -> bool:
+        updating = self.version.requires_actor_reconfigure(version)
+        self.version = version
+        return updating
+
+    def recover(self) -> bool:
+        return True
+
+    def check_ready(self):
+        return ReplicaStartupStatus.SUCCEEDED, None
+
+    def resource_requirements(self):
+        return "{}", "{}"
+
+    def graceful_stop(self) -> float:
+        return self.graceful_shutdown_timeout_s
+
+    def check_stopped(self) -> bool:
+        return True
+
+    def force_stop(self):
+        pass
+
+    def check_health(self) -> bool:
+        return True
+
+    def get_routing_stats(self) -> Optional[dict]:
+        return None
+
+
+def _deployment_info(num_replicas: int) -> DeploymentInfo:
+    return DeploymentInfo(
+        version="1",
+        start_time_ms=0,
+        actor_name="abc",
+        deployment_config=DeploymentConfig(num_replicas=num_replicas),
+        replica_config=ReplicaConfig.create(lambda x: x),
+        deployer_job_id="",
+    )
+
+
+def _run(
+    num_replicas: int,
+    replicas_per_deployment: int,
+    num_changing_deployments: int,
+    num_iterations: int,
+) -> pd.Series:
+    cluster_node_info_cache = MockClusterNodeInfoCache()
+    cluster_node_info_cache.add_node("node-id")
+    dsm = DeploymentStateManager(
+        MockKVStore(),
+        LongPollHost(),
+        [],
+        [],
+        cluster_node_info_cache,
+        AutoscalingStateManager(),
+        head_node_id_override="fake-head-node-id",
+    )
+
+    deployment_ids = [
+        DeploymentID(name=f"deployment_{i}", app_name="app")
+        for i in range(max(num_replicas // replicas_per_deployment, 1))
+    ]
+    for deployment_id in deployment_ids:
+        dsm.deploy(deployment_id, _deployment_info(replicas_per_deployment))
+
+    # Start all of the replicas.
+    for _ in range(3):
+        dsm.update()
+
+    latencies = []
+    for i in range(num_iterations):
+        # Scale a few deployments up and down to simulate ongoing changes.
+        for deployment_id in deployment_ids[:num_changing_deployments]:
+            dsm.deploy(deployment_id, _deployment_info(replicas_per_deployment + i % 2))
+
+        start = time.perf_counter()
+        dsm.update()
+        latencies.append(1000 * (time.perf_counter() - start))
+
+    return pd.Series(latencies).describe(percentiles=[0.5, 0.9, 0.99])
+
+
+@click.command(help="Benchmark the controller loop against the number of replicas.")
+@click.option("--replicas-per-deployment", type=int, default=10)
+@click.option("--num-changing-deployments", type=int, default=1)
+@click.option("--num-iterations", type=int, default=20)
+@click.option(
+    "--num-replicas",
+    "num_replicas_list",
+    type=int,
+    multiple=True,
+    default=[100, 1000, 10000],
+    help="Total number of replicas. Can be passed multiple times.",
+)
+def main(
+    replicas_per_deployment: int,
+    num_changing_deployments: int,
+    num_iterations: int,
+    num_replicas_list: List[int],
+):
+    results = {}
+    with patch(
+        "ray.serve._private.deployment_state.ActorReplicaWrapper",
+        new=_MockReplicaActorWrapper,
+    ), patch("ray.get_runtime_context"):
+        for num_replicas in num_replicas_list:
+            results[num_replicas] = _run(
+                num_replicas,
+                replicas_per_deployment,
+                num_changing_deployments,
+                num_iterations,
+            )
+
+    print(
+        "Latency (ms) of DeploymentStateManager.update() by number of replicas "
+        f"(replicas_per_deployment={replicas_per_deployment},"
+        f"num_changing_deployments={num_changing_deployments}):"
+    )
+    print(pd.DataFrame(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark HTTP request latency for large request bodies.
+
+Run this with and without `RAY_SERVE_PROXY_ZERO_COPY_BODY_THRESHOLD_BYTES` set
+(e.g., to 1048576) to compare the pickled and zero-copy proxy -> replica paths.
+"""
+import asyncio
+from typing import List
+
+import click
+import pandas as pd
+import requests
+from starlette.requests import Request
+
+from ray import serve
+from ray.serve._private.benchmarks.common import run_latency_benchmark
+from ray.serve._private.constants import (
+    RAY_SERVE_PROXY_ZERO_COPY_BODY_THRESHOLD_BYTES,
+)
+
+DEFAULT_PAYLOAD_SIZES = [
+    1024,
+    100 * 1024,
+    1024 * 1024,
+    10 * 1024 * 1024,
+    50 * 1024 * 1024,
+    100 * 1024 * 1024,
+]
+
+
+@serve.deployment
+class BodyLength:
+    async def __call__(self, request: Request) -> int:
+        return len(await request.body())
+
+
+@click.command(help="Benchmark HTTP latency for increasing request body sizes.")
+@click.option("--num-replicas", type=int, default=1)
+@click.option("--num-requests", type=int, default=20)
+@click.option("--num-warmup-requests", type=int, default=2)
+@click.option(
+    "--payload-size",
+    "payload_sizes",
+    type=int,
+    multiple=True,
+    default=DEFAULT_PAYLOAD_SIZES,
+    help="Request body size in bytes. Can be passed multiple times.",
+)
+def main(
+    num_replicas: int,
+    num_requests: int,
+    num_warmup_requests: int,
+    payload_sizes: List[int],
+):
+    serve.run(BodyLength.options(num_replicas=num_replicas).bind())
+
+    results = {}
+    for payload_size in payload_sizes:
+        payload = b"x" * payload_size
+
+        def send():
+            r = requests.post("http://localhost:8000", data=payload)
+            assert r.json() == payload_size
+
+        latencies: pd.Series = asyncio.new_event_loop().run_until_complete(
+            run_latency_benchmark(
+                send,
+                num_requests=num_requests,
+                num_warmup_requests=num_warmup_requests,
+            )
+        )
+        results[payload_size] = latencies.describe(percentiles=[0.5, 0.9, 0.99])
+
+    print(
+        "Latency (ms) for HTTP requests by body size in bytes "
+        f"(num_replicas={num_replicas},num_requests={num_requests},"
+        "zero_copy_threshold_bytes="
+        f"{RAY_SERVE_PROXY_ZERO_COPY_BODY_THRESHOLD_BYTES}):"
+    )
+    print(pd.DataFrame(results))
+
+
+if __name__ == "__main__":
+    main()
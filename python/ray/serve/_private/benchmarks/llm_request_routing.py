@@ -0,0 +1,395 @@
+"""Compare LLM request routing policies by replaying multi-turn chat traces.
+
+Runs a discrete-event simulation of LLM replicas, so it doesn't need a Ray cluster
+or GPUs. Each replica serves up to `--max-concurrency` requests at once and keeps a
+prefix (KV) cache of the conversations it served with a fixed capacity, evicting
+the least recently used ones when it fills up. The time to first token (TTFT) of
+a request is its queueing delay plus the time to prefill the part of its prompt
+that isn't cached on the replica.
+
+The following routing policies are compared:
+    - pow2: power of two choices on queue length.
+    - prefix_aware: the threshold-based policy of `PrefixAwarePow2ReplicaRouter`.
+    - kv_cache_aware: the expected cost of `KVCacheAwarePrefixReplicaRouter`.
+
+Routers only see what they would in a real deployment: their own prefix tree of
+the prompts they routed, the current queue lengths, and KV cache usage that is
+refreshed every `--routing-stats-period-s`.
+
+A trace can be passed as a JSONL file with one request per line in the order the
+turns happen, e.g., `{"session_id": "a", "prompt": "...", "response": "..."}`,
+where each prompt contains the whole conversation so far. If no trace is passed,
+a synthetic one is generated.
+
+    python llm_request_routing.py --num-replicas 8 --num-sessions 400
+"""
+import heapq
+import json
+import os
+import random
+import string
+from collections import OrderedDict, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import click
+import pandas as pd
+
+from ray.llm._internal.serve.request_router.prefix_aware.prefix_tree import (
+    ChunkedPrefixTree,
+)
+from ray.serve._private.request_router.prefix_aware_router import ReplicaCostModel
+
+# (session_id, prompt, response)
+Turn = Tuple[str, str, int]
+
+
+def _random_text(rng: random.Random, num_chars: int) -> str:
+    return "".join(rng.choices(string.ascii_letters + " ", k=num_chars))
+
+
+def generate_trace(
+    num_sessions: int,
+    num_turns: int,
+    system_prompt_chars: int,
+    user_message_chars: int,
+    num_output_chars: int,
+    seed: int,
+) -> Dict[str, List[Turn]]:
+    """Generate multi-turn chats that share a system prompt."""
+    rng = random.Random(seed)
+    system_prompt = _random_text(rng, system_prompt_chars)
+    sessions: Dict[str, List[Turn]] = {}
+    for i in range(num_sessions):
+        session_id = f"session-{i}"
+        history = system_prompt
+        turns = []
+        for _ in range(rng.randint(1, num_turns)):
+            prompt = history + _random_text(
+                rng, rng.randint(user_message_chars // 2, user_message_chars)
+            )
+            response = _random_text(
+                rng, rng.randint(num_output_chars // 2, num_output_chars)
+            )
+            turns.append((session_id, prompt, response))
+            history = prompt + response
+        sessions[session_id] = turns
+
+    return sessions
+
+
+def load_trace(path: str) -> Dict[str, List[Turn]]:
+    sessions: Dict[str, List[Turn]] = defaultdict(list)
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            session_id = str(record["session_id"])
+            sessions[session_id].append(
+                (session_id, record["prompt"], record["response"])
+            )
+
+    return dict(sessions)
+
+
+class SimulatedReplica:
+    """A replica with a fixed number of request slots and an LRU prefix cache."""
+
+    def __init__(self, replica_id: str, max_concurrency: int, kv_cache_chars: int):
+        self.replica_id = replica_id
+        self.kv_cache_chars = kv_cache_chars
+        self._slot_free_at: List[float] = [0.0] * max_concurrency
+        # (finish time, KV cache chars) of each request that hasn't finished yet.
+        self._in_flight: List[Tuple[float, int]] = []
+        self._in_flight_chars = 0
+        # Conversation cached for each session, most recently used last.
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cached_chars = 0
+        self.kv_cache_usage = 0.0
+
+    def queue_len(self, now_s: float) -> int:
+        while self._in_flight and self._in_flight[0][0] <= now_s:
+            _, kv_chars = heapq.heappop(self._in_flight)
+            self._in_flight_chars -= kv_chars
+        return len(self._in_flight)
+
+    def update_kv_cache_usage(self, now_s: float):
+        # Like vLLM, only count the cache used by requests in flight. Cached
+        # prefixes of finished requests can be evicted at any time.
+        self.queue_len(now_s)
+        self.kv_cache_usage = min(self._in_flight_chars / self.kv_cache_chars, 1.0)
+
+    def _cached_prefix_chars(self, session_id: str, prompt: str) -> int:
+        cached = self._cache.get(session_id)
+        if cached is None:
+            # Other sessions can still share a prefix, e.g., the system prompt.
+            return max(
+                (len(os.path.commonprefix([text, prompt])) for text in self._cache),
+                default=0,
+            )
+        return len(os.path.commonprefix([cached, prompt]))
+
+    def _cache_conversation(self, session_id: str, text: str):
+        self._cached_chars -= len(self._cache.pop(session_id, ""))
+        self._cache[session_id] = text
+        self._cached_chars += len(text)
+        while (
+            self._cached_chars + self._in_flight_chars > self.kv_cache_chars
+            and len(self._cache) > 1
+        ):
+            _, evicted = self._cache.popitem(last=False)
+            self._cached_chars -= len(evicted)
+
+    def serve(
+        self,
+        now_s: float,
+        turn: Turn,
+        prefill_s_per_char: float,
+        decode_s_per_char: float,
+    ) -> Tuple[float, float]:
+        """Serve the request and return its (TTFT, finish time)."""
+        session_id, prompt, response = turn
+        start_s = max(now_s, heapq.heappop(self._slot_free_at))
+        prefill_s = (
+            len(prompt) - self._cached_prefix_chars(session_id, prompt)
+        ) * prefill_s_per_char
+        finish_s = start_s + prefill_s + len(response) * decode_s_per_char
+        heapq.heappush(self._slot_free_at, finish_s)
+        kv_chars = len(prompt) + len(response)
+        heapq.heappush(self._in_flight, (finish_s, kv_chars))
+        self._in_flight_chars += kv_chars
+        # The response is generated with the prompt as prefix, so both are cached.
+        self._cache_conversation(session_id, prompt + response)
+        return start_s + prefill_s - now_s, finish_s
+
+
+class SimulatedRouter:
+    """Chooses a replica for each request, mirroring the Serve request routers."""
+
+    def __init__(
+        self,
+        policy: str,
+        replicas: List[SimulatedReplica],
+        tree_chunk_size: int,
+        imbalanced_threshold: int,
+        match_rate_threshold: float,
+        cost_model: ReplicaCostModel,
+        seed: int,
+    ):
+        self._policy = policy
+        self._replicas = replicas
+        self._replicas_by_id = {r.replica_id: r for r in replicas}
+        self._tree = ChunkedPrefixTree(chunk_size=tree_chunk_size)
+        self._tree.add_tenants([r.replica_id for r in replicas], 0)
+        self._imbalanced_threshold = imbalanced_threshold
+        self._match_rate_threshold = match_rate_threshold
+        self._cost_model = cost_model
+        self._rng = random.Random(seed)
+
+    def _pow2(
+        self, candidates: List[SimulatedReplica], queue_lens: Dict[str, int]
+    ) -> SimulatedReplica:
+        chosen = self._rng.sample(candidates, k=min(2, len(candidates)))
+        return min(chosen, key=lambda r: queue_lens[r.replica_id])
+
+    def _prefix_aware(
+        self, prompt: str, queue_lens: Dict[str, int]
+    ) -> SimulatedReplica:
+        if (
+            max(queue_lens.values()) - min(queue_lens.values())
+            > self._imbalanced_threshold
+        ):
+            return self._pow2(self._replicas, queue_lens)
+
+        matched_text, matched_tenants = self._tree.prefix_match(prompt)
+        if len(matched_text) / len(prompt) < self._match_rate_threshold:
+            matched_tenants = self._tree.get_smallest_tenants()
+        if not matched_tenants:
+            return self._pow2(self._replicas, queue_lens)
+        return min(
+            (self._replicas_by_id[tenant] for tenant in matched_tenants),
+            key=lambda r: queue_lens[r.replica_id],
+        )
+
+    def _kv_cache_aware(
+        self, prompt: str, queue_lens: Dict[str, int]
+    ) -> SimulatedReplica:
+        match_lengths = self._tree.prefix_match_lengths(prompt)
+        replicas = list(self._replicas)
+        self._rng.shuffle(replicas)
+        return min(
+            replicas,
+            key=lambda r: self._cost_model.cost(
+                queue_lens[r.replica_id],
+                match_lengths.get(r.replica_id, 0) / len(prompt),
+                r.kv_cache_usage,
+            ),
+        )
+
+    def route(self, now_s: float, prompt: str) -> SimulatedReplica:
+        queue_lens = {r.replica_id: r.queue_len(now_s) for r in self._replicas}
+        if self._policy == "pow2":
+            replica = self._pow2(self._replicas, queue_lens)
+        elif self._policy == "prefix_aware":
+            replica = self._prefix_aware(prompt, queue_lens)
+        else:
+            replica = self._kv_cache_aware(prompt, queue_lens)
+
+        self._tree.insert(prompt, replica.replica_id, now_s)
+        return replica
+
+
+def simulate(
+    policy: str,
+    sessions: Dict[str, List[Turn]],
+    *,
+    num_replicas: int,
+    max_concurrency: int,
+    kv_cache_chars: int,
+    session_arrival_rate: float,
+    think_time_s: float,
+    prefill_s_per_char: float,
+    decode_s_per_char: float,
+    routing_stats_period_s: float,
+    tree_chunk_size: int,
+    cost_model: ReplicaCostModel,
+    seed: int,
+) -> pd.Series:
+    """Replay the sessions and return the TTFT of every request."""
+    rng = random.Random(seed)
+    replicas = [
+        SimulatedReplica(f"replica-{i}", max_concurrency, kv_cache_chars)
+        for i in range(num_replicas)
+    ]
+    router = SimulatedRouter(
+        policy,
+        replicas,
+        tree_chunk_size=tree_chunk_size,
+        imbalanced_threshold=10,
+        match_rate_threshold=0.1,
+        cost_model=cost_model,
+        seed=seed,
+    )
+
+    # (arrival time, sequence number, session ID, turn index)
+    events: List[Tuple[float, int, str, int]] = []
+    arrival_s = 0.0
+    for seq, session_id in enumerate(sessions):
+        arrival_s += rng.expovariate(session_arrival_rate)
+        heapq.heappush(events, (arrival_s, seq, session_id, 0))
+
+    ttfts: List[float] = []
+    next_stats_update_s = 0.0
+    seq = len(sessions)
+    while events:
+        now_s, _, session_id, turn_index = heapq.heappop(events)
+        while now_s >= next_stats_update_s:
+            for replica in replicas:
+                replica.update_kv_cache_usage(now_s)
+            next_stats_update_s += routing_stats_period_s
+
+        turn = sessions[session_id][turn_index]
+        replica = router.route(now_s, turn[1])
+        ttft_s, finish_s = replica.serve(
+            now_s, turn, prefill_s_per_char, decode_s_per_char
+        )
+        ttfts.append(ttft_s)
+
+        if turn_index + 1 < len(sessions[session_id]):
+            seq += 1
+            heapq.heappush(
+                events,
+                (
+                    finish_s + rng.expovariate(1 / think_time_s),
+                    seq,
+                    session_id,
+                    turn_index + 1,
+                ),
+            )
+
+    return pd.Series(ttfts)
+
+
+@click.command(help="Compare LLM request routing policies on multi-turn chat traces.")
+@click.option("--trace-file", type=str, default=None, help="JSONL trace to replay.")
+@click.option("--num-sessions", type=int, default=400)
+@click.option("--num-turns", type=int, default=8, help="Max turns per session.")
+@click.option("--system-prompt-chars", type=int, default=2000)
+@click.option("--user-message-chars", type=int, default=800)
+@click.option("--num-output-chars", type=int, default=800)
+@click.option("--num-replicas", type=int, default=8)
+@click.option("--max-concurrency", type=int, default=4)
+@click.option("--kv-cache-chars", type=int, default=200_000)
+@click.option("--session-arrival-rate", type=float, default=4.0)
+@click.option("--think-time-s", type=float, default=5.0)
+@click.option("--prefill-s-per-char", type=float, default=5e-5)
+@click.option("--decode-s-per-char", type=float, default=2e-3)
+@click.option("--routing-stats-period-s", type=float, default=1.0)
+@click.option("--tree-chunk-size", type=int, default=16)
+@click.option("--seed", type=int, default=0)
+def main(
+    trace_file: Optional[str],
+    num_sessions: int,
+    num_turns: int,
+    system_prompt_chars: int,
+    user_message_chars: int,
+    num_output_chars: int,
+    num_replicas: int,
+    max_concurrency: int,
+    kv_cache_chars: int,
+    session_arrival_rate: float,
+    think_time_s: float,
+    prefill_s_per_char: float,
+    decode_s_per_char: float,
+    routing_stats_period_s: float,
+    tree_chunk_size: int,
+    seed: int,
+):
+    if trace_file is not None:
+        sessions = load_trace(trace_file)
+    else:
+        sessions = generate_trace(
+            num_sessions,
+            num_turns,
+            system_prompt_chars,
+            user_message_chars,
+            num_output_chars,
+            seed,
+        )
+
+    results = {}
+    for policy in ["pow2", "prefix_aware", "kv_cache_aware"]:
+        ttfts = simulate(
+            policy,
+            sessions,
+            num_replicas=num_replicas,
+            max_concurrency=max_concurrency,
+            kv_cache_chars=kv_cache_chars,
+            session_arrival_rate=session_arrival_rate,
+            think_time_s=think_time_s,
+            prefill_s_per_char=prefill_s_per_char,
+            decode_s_per_char=decode_s_per_char,
+            routing_stats_period_s=routing_stats_period_s,
+            tree_chunk_size=tree_chunk_size,
+            cost_model=ReplicaCostModel(),
+            seed=seed,
+        )
+        results[policy] = (ttfts * 1000).describe(percentiles=[0.5, 0.9, 0.99])
+
+    df = pd.DataFrame(results)
+    print(
+        "TTFT (ms) by routing policy "
+        f"(num_sessions={len(sessions)},num_replicas={num_replicas},"
+        f"max_concurrency={max_concurrency},kv_cache_chars={kv_cache_chars}):"
+    )
+    print(df)
+    for baseline in ["pow2", "prefix_aware"]:
+        improvement = 1 - df.loc[["mean", "50%", "90%", "99%"], "kv_cache_aware"] / (
+            df.loc[["mean", "50%", "90%", "99%"], baseline]
+        )
+        print(f"TTFT reduction of kv_cache_aware vs {baseline}:")
+        print(improvement.map("{:.1%}".format).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Benchmark the controller-side cost of long poll updates against handle count.
+
+Simulates `num_handles` long poll clients listening on a single `LongPollHost`
+for a deployment's replica set and measures the CPU time spent by the host to
+notify them of an update (one replica replaced), including pickling the
+responses as Ray would when returning them to the clients.
+
+Compares full snapshots with delta updates, optionally with coalescing enabled:
+
+    python long_poll_host.py --num-replicas 100 --num-handles 10 --num-handles 1000
+"""
+import asyncio
+import pickle
+import time
+from typing import List
+
+import click
+import pandas as pd
+
+from ray.serve._private.common import (
+    DeploymentID,
+    DeploymentTargetInfo,
+    ReplicaID,
+    RunningReplicaInfo,
+)
+from ray.serve._private.long_poll import LongPollHost, LongPollNamespace
+
+KEY = (LongPollNamespace.DEPLOYMENT_TARGETS, "deployment_name")
+
+
+class _FakeActorHandle:
+    def __init__(self, actor_id: str):
+        self._actor_id = actor_id
+
+
+def _make_replica(i: int) -> RunningReplicaInfo:
+    return RunningReplicaInfo(
+        replica_id=ReplicaID(
+            str(i), deployment_id=DeploymentID(name="deployment_name")
+        ),
+        node_id=f"node-{i % 10}",
+        node_ip="127.0.0.1",
+        availability_zone=None,
+        actor_handle=_FakeActorHandle(str(i)),
+        max_ongoing_requests=100,
+    )
+
+
+async def _run_updates(
+    num_handles: int,
+    num_replicas: int,
+    num_updates: int,
+    accept_deltas: bool,
+    coalesce_window_s: float,
+) -> dict:
+    host = LongPollHost(coalesce_window_s=coalesce_window_s)
+    replicas = [_make_replica(i) for i in range(num_replicas)]
+    host.notify_changed(
+        {KEY: DeploymentTargetInfo(is_available=True, running_replicas=replicas)}
+    )
+
+    total_cpu_s = 0
+    total_bytes = 0
+    next_replica_idx = num_replicas
+    for _ in range(num_updates):
+        snapshot_ids = {KEY: host.snapshot_ids[KEY]}
+        listeners = [
+            asyncio.create_task(
+                host.listen_for_change(snapshot_ids, accept_deltas=accept_deltas)
+            )
+            for _ in range(num_handles)
+        ]
+        # Let all of the listeners start waiting.
+        await asyncio.sleep(0)
+
+        start = time.process_time()
+        replicas = replicas[1:] + [_make_replica(next_replica_idx)]
+        next_replica_idx += 1
+        host.notify_changed(
+            {KEY: DeploymentTargetInfo(is_available=True, running_replicas=replicas)}
+        )
+        for result in await asyncio.gather(*listeners):
+            total_bytes += len(pickle.dumps(result))
+        total_cpu_s += time.process_time() - start
+
+    return {
+        "cpu_ms_per_update": 1000 * total_cpu_s / num_updates,
+        "kb_per_update": total_bytes / num_updates / 1024,
+    }
+
+
+@click.command(help="Benchmark long poll host CPU time against the handle count.")
+@click.option("--num-replicas", type=int, default=100)
+@click.option("--num-updates", type=int, default=10)
+@click.option("--coalesce-window-s", type=float, default=0)
+@click.option(
+    "--num-handles",
+    "num_handles_list",
+    type=int,
+    multiple=True,
+    default=[10, 100, 1000, 5000],
+    help="Number of long poll clients. Can be passed multiple times.",
+)
+def main(
+    num_replicas: int,
+    num_updates: int,
+    coalesce_window_s: float,
+    num_handles_list: List[int],
+):
+    results = {}
+    for num_handles in num_handles_list:
+        for accept_deltas in [False, True]:
+            mode = "delta" if accept_deltas else "full"
+            results[(num_handles, mode)] = asyncio.new_event_loop().run_until_complete(
+                _run_updates(
+                    num_handles,
+                    num_replicas,
+                    num_updates,
+                    accept_deltas,
+                    coalesce_window_s,
+                )
+            )
+
+    print(
+        f"Long poll host cost per update (num_replicas={num_replicas},"
+        f"num_updates={num_updates},coalesce_window_s={coalesce_window_s}):"
+    )
+    print(pd.DataFrame(results).T)
+
+
+if __name__ == "__main__":
+    main()
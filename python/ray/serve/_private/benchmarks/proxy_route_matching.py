@@ -0,0 +1,68 @@
+"""Microbenchmark for matching request paths to routes in the proxy.
+
+Measures `ProxyRouter.match_route` for an increasing number of route prefixes,
+with request paths that match a route near the end of the route table as well
+as paths that don't match any route.
+"""
+import random
+import timeit
+from typing import List
+
+import click
+import pandas as pd
+
+from ray.serve._private.common import DeploymentID, EndpointInfo
+from ray.serve._private.proxy_router import ProxyRouter
+
+
+def _make_router(num_routes: int) -> ProxyRouter:
+    router = ProxyRouter(lambda endpoint, info: endpoint)
+    router.update_routes(
+        {
+            DeploymentID(name="ingress", app_name=f"app{i}"): EndpointInfo(
+                route=f"/api/v1/app{i}"
+            )
+            for i in range(num_routes)
+        }
+    )
+    return router
+
+
+@click.command(help="Benchmark proxy route matching against the number of routes.")
+@click.option("--num-iterations", type=int, default=100000)
+@click.option(
+    "--num-routes",
+    "num_routes_list",
+    type=int,
+    multiple=True,
+    default=[1, 10, 100, 500, 1000],
+    help="Number of routes in the route table. Can be passed multiple times.",
+)
+def main(num_iterations: int, num_routes_list: List[int]):
+    results = {}
+    for num_routes in num_routes_list:
+        router = _make_router(num_routes)
+        paths = [
+            f"/api/v1/app{random.randrange(num_routes)}/predict/123" for _ in range(100)
+        ]
+        missing_path = "/api/v2/unknown/predict/123"
+
+        def match():
+            for path in paths:
+                router.match_route(path)
+
+        match_s = timeit.timeit(match, number=num_iterations // len(paths))
+        miss_s = timeit.timeit(
+            lambda: router.match_route(missing_path), number=num_iterations
+        )
+        results[num_routes] = {
+            "match_us": 1e6 * match_s / num_iterations,
+            "no_match_us": 1e6 * miss_s / num_iterations,
+        }
+
+    print(f"Latency (us) of ProxyRouter.match_route (num_iterations={num_iterations}):")
+    print(pd.DataFrame(results).T)
+
+
+if __name__ == "__main__":
+    main()
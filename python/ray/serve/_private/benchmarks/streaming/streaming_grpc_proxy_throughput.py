@@ -0,0 +1,143 @@
+import asyncio
+import logging
+from typing import Tuple
+
+import click
+import grpc
+
+import ray
+from ray import serve
+from ray.serve._private.benchmarks.common import run_throughput_benchmark
+from ray.serve.config import gRPCOptions
+from ray.serve.generated import serve_pb2, serve_pb2_grpc
+
+GRPC_PORT = 9000
+
+
+@serve.deployment(ray_actor_options={"num_cpus": 0})
+class Downstream:
+    def __init__(self, tokens_per_request: int):
+        logging.getLogger("ray.serve").setLevel(logging.WARNING)
+
+        self._tokens_per_request = tokens_per_request
+
+    async def Streaming(self, user_message: serve_pb2.UserDefinedMessage):
+        for i in range(self._tokens_per_request):
+            yield serve_pb2.UserDefinedResponse(greeting="hi")
+
+
+async def _consume_single_stream(stub: serve_pb2_grpc.UserDefinedServiceStub):
+    request = serve_pb2.UserDefinedMessage(name="foo")
+    async for _ in stub.Streaming(request):
+        pass
+
+
+async def run_benchmark(
+    tokens_per_request: int,
+    batch_size: int,
+    num_trials: int,
+    trial_runtime: float,
+) -> Tuple[float, float]:
+    channel = grpc.aio.insecure_channel(f"localhost:{GRPC_PORT}")
+    stub = serve_pb2_grpc.UserDefinedServiceStub(channel)
+
+    async def _do_single_batch():
+        await asyncio.gather(*[_consume_single_stream(stub) for _ in range(batch_size)])
+
+    mean, stddev, _ = await run_throughput_benchmark(
+        fn=_do_single_batch,
+        multiplier=batch_size * tokens_per_request,
+        num_trials=num_trials,
+        trial_runtime=trial_runtime,
+    )
+    return mean, stddev
+
+
+@click.command(help="Benchmark streaming gRPC throughput through the Serve proxy.")
+@click.option(
+    "--tokens-per-request",
+    type=int,
+    default=1000,
+    help="Number of messages streamed back for each request.",
+)
+@click.option(
+    "--batch-size",
+    type=int,
+    default=10,
+    help="Number of concurrent requests sent in each trial.",
+)
+@click.option(
+    "--num-replicas",
+    type=int,
+    default=1,
+    help="Number of replicas in the downstream deployment.",
+)
+@click.option(
+    "--num-trials",
+    type=int,
+    default=5,
+    help="Number of trials of the benchmark to run.",
+)
+@click.option(
+    "--trial-runtime",
+    type=int,
+    default=1,
+    help="Duration to run each trial of the benchmark for (seconds).",
+)
+@click.option(
+    "--max-stream-batch-size",
+    type=int,
+    default=0,
+    help=(
+        "Value of RAY_SERVE_GRPC_STREAMING_MAX_BATCH_SIZE. `0` sends one object per "
+        "message from the replica to the proxy."
+    ),
+)
+def main(
+    tokens_per_request: int,
+    batch_size: int,
+    num_replicas: int,
+    num_trials: int,
+    trial_runtime: float,
+    max_stream_batch_size: int,
+):
+    ray.init(
+        runtime_env={
+            "env_vars": {
+                "RAY_SERVE_GRPC_STREAMING_MAX_BATCH_SIZE": str(max_stream_batch_size)
+            }
+        }
+    )
+    serve.start(
+        grpc_options=gRPCOptions(
+            port=GRPC_PORT,
+            grpc_servicer_functions=[
+                "ray.serve.generated.serve_pb2_grpc."
+                "add_UserDefinedServiceServicer_to_server",
+            ],
+        ),
+    )
+    serve.run(Downstream.options(num_replicas=num_replicas).bind(tokens_per_request))
+
+    mean, stddev = asyncio.new_event_loop().run_until_complete(
+        run_benchmark(
+            tokens_per_request,
+            batch_size,
+            num_trials,
+            trial_runtime,
+        )
+    )
+    print(
+        "gRPC proxy streaming throughput {}: {} +- {} tokens/s".format(
+            f"(num_replicas={num_replicas}, "
+            f"tokens_per_request={tokens_per_request}, "
+            f"batch_size={batch_size}, "
+            f"max_stream_batch_size={max_stream_batch_size})",
+            mean,
+            stddev,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
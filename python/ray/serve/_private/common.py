@@ -1,9 +1,9 @@
 import json
 from dataclasses import asdict, dataclass, field
 from enum import Enum
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 
-from starlette.types import Scope
+from starlette.types import Message, Scope
 
 import ray
 from ray.actor import ActorHandle
@@ -591,6 +591,10 @@ class gRPCRequest:
 
     user_request_proto: Any
 
+    # If set, the replica sends the messages of a streaming response to the proxy in
+    # lists of at most this many messages.
+    max_stream_batch_size: Optional[int] = None
+
 
 class RequestProtocol(str, Enum):
     UNDEFINED = "UNDEFINED"
@@ -629,6 +633,10 @@ class RequestMetadata:
     # If this request expects a streaming response.
     is_streaming: bool = False
 
+    # If set, the request is sent to another replica as well if it's still
+    # running after this percentile of recent latencies of the method.
+    hedge_after_percentile: Optional[float] = None
+
     # The protocol to serve this request
     _request_protocol: RequestProtocol = RequestProtocol.UNDEFINED
 
@@ -655,7 +663,7 @@ class StreamingHTTPRequest:
         *,
         proxy_actor_name: Optional[str] = None,
         receive_asgi_messages: Optional[
-            Callable[[RequestMetadata], Awaitable[bytes]]
+            Callable[[RequestMetadata], Awaitable[Union[bytes, List[Message]]]]
         ] = None,
     ):
         self._asgi_scope: Scope = asgi_scope
@@ -672,7 +680,7 @@ class StreamingHTTPRequest:
         # Need to keep the actor handle cached to avoid "lost reference to actor" error.
         self._cached_proxy_actor: Optional[ActorHandle] = None
         self._receive_asgi_messages: Optional[
-            Callable[[RequestMetadata], Awaitable[bytes]]
+            Callable[[RequestMetadata], Awaitable[Union[bytes, List[Message]]]]
         ] = receive_asgi_messages
 
     @property
@@ -680,7 +688,9 @@ class StreamingHTTPRequest:
         return self._asgi_scope
 
     @property
-    def receive_asgi_messages(self) -> Callable[[RequestMetadata], Awaitable[bytes]]:
+    def receive_asgi_messages(
+        self,
+    ) -> Callable[[RequestMetadata], Awaitable[Union[bytes, List[Message]]]]:
         if self._receive_asgi_messages is None:
             self._cached_proxy_actor = ray.get_actor(
                 self._proxy_actor_name, namespace=SERVE_NAMESPACE
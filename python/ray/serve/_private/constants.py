@@ -337,6 +337,22 @@ RAY_SERVE_QUEUE_LENGTH_CACHE_TIMEOUT_S = float(
     os.environ.get("RAY_SERVE_QUEUE_LENGTH_CACHE_TIMEOUT_S", 10.0)
 )
 
+# Extra requests that hedging can send, as a fraction of the requests made through
+# a handle with hedging enabled.
+RAY_SERVE_HANDLE_HEDGING_BUDGET_RATIO = float(
+    os.environ.get("RAY_SERVE_HANDLE_HEDGING_BUDGET_RATIO", "0.05")
+)
+
+# Number of recent request latencies per method used to compute the hedging delay.
+RAY_SERVE_HANDLE_HEDGING_WINDOW_SIZE = int(
+    os.environ.get("RAY_SERVE_HANDLE_HEDGING_WINDOW_SIZE", "1000")
+)
+
+# Requests aren't hedged until this many latencies have been recorded for a method.
+RAY_SERVE_HANDLE_HEDGING_MIN_SAMPLES = int(
+    os.environ.get("RAY_SERVE_HANDLE_HEDGING_MIN_SAMPLES", "20")
+)
+
 # The default autoscaling policy to use if none is specified.
 DEFAULT_AUTOSCALING_POLICY = "ray.serve.autoscaling_policy:default_autoscaling_policy"
 
@@ -380,6 +396,18 @@ RAY_SERVE_USE_COMPACT_SCHEDULING_STRATEGY = (
     os.environ.get("RAY_SERVE_USE_COMPACT_SCHEDULING_STRATEGY", "0") == "1"
 )
 
+# With the compact scheduling strategy, how often the controller looks for a node
+# whose replicas can all be moved to other nodes so that the node can be released.
+# Set to `0` to disable node compaction.
+RAY_SERVE_NODE_COMPACTION_INTERVAL_S = float(
+    os.environ.get("RAY_SERVE_NODE_COMPACTION_INTERVAL_S", "60")
+)
+
+# Deadline for moving all replicas off a node that is being compacted.
+RAY_SERVE_NODE_COMPACTION_TIMEOUT_S = float(
+    os.environ.get("RAY_SERVE_NODE_COMPACTION_TIMEOUT_S", "600")
+)
+
 
 def str_to_list(s: str) -> List[str]:
     """Return a list from a comma-separated string.
@@ -421,6 +449,40 @@ RAY_SERVE_ENABLE_PROXY_GC_OPTIMIZATIONS = (
     os.environ.get("RAY_SERVE_ENABLE_PROXY_GC_OPTIMIZATIONS", "1") == "1"
 )
 
+# Request bodies at least this large are passed from the HTTP proxy to replicas as a
+# single out-of-band buffer in the object store instead of pickled ASGI messages.
+# Replicas on the same node read it directly from shared memory and receive the body
+# as a read-only `memoryview`. Set to `0` to disable.
+RAY_SERVE_PROXY_ZERO_COPY_BODY_THRESHOLD_BYTES = int(
+    os.environ.get("RAY_SERVE_PROXY_ZERO_COPY_BODY_THRESHOLD_BYTES", "0")
+)
+
+# If positive, replicas send the messages of streaming gRPC responses to the gRPC
+# proxy in batches of at most this many messages, each as a single object of the
+# streaming generator, instead of one object per message. Set to `0` to disable.
+RAY_SERVE_GRPC_STREAMING_MAX_BATCH_SIZE = int(
+    os.environ.get("RAY_SERVE_GRPC_STREAMING_MAX_BATCH_SIZE", "0")
+)
+
+# Number of batches of a batched streaming gRPC response that a replica can send
+# ahead of the gRPC proxy before it pauses. Set to `-1` to disable backpressure.
+RAY_SERVE_GRPC_STREAMING_BACKPRESSURE_NUM_BATCHES = int(
+    os.environ.get("RAY_SERVE_GRPC_STREAMING_BACKPRESSURE_NUM_BATCHES", "16")
+)
+
+# Window during which the long poll host coalesces change notifications, so a
+# burst of updates wakes up each long poll client only once. Set to `0` to notify
+# clients immediately.
+RAY_SERVE_LONG_POLL_COALESCE_WINDOW_S = float(
+    os.environ.get("RAY_SERVE_LONG_POLL_COALESCE_WINDOW_S", "0")
+)
+
+# Number of replica set deltas the long poll host keeps per key. Clients at most
+# this many versions behind receive deltas instead of full snapshots.
+RAY_SERVE_LONG_POLL_MAX_DELTA_HISTORY = int(
+    os.environ.get("RAY_SERVE_LONG_POLL_MAX_DELTA_HISTORY", "10")
+)
+
 # Used for gc.set_threshold() when proxy GC optimizations are enabled.
 RAY_SERVE_PROXY_GC_THRESHOLD = int(
     os.environ.get("RAY_SERVE_PROXY_GC_THRESHOLD", "10000")
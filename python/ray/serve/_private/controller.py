@@ -300,18 +300,24 @@ class ServeController:
             deployment_id
         ]._stop_one_running_replica_for_testing()
 
-    async def listen_for_change(self, keys_to_snapshot_ids: Dict[str, int]):
+    async def listen_for_change(
+        self, keys_to_snapshot_ids: Dict[str, int], accept_deltas: bool = False
+    ):
         """Proxy long pull client's listen request.
 
         Args:
             keys_to_snapshot_ids (Dict[str, int]): Snapshot IDs are used to
               determine whether or not the host should immediately return the
               data or wait for the value to be changed.
+            accept_deltas: Whether the client can apply deltas to its current
+              objects instead of receiving full snapshots.
         """
         if not self.done_recovering_event.is_set():
             await self.done_recovering_event.wait()
 
-        return await self.long_poll_host.listen_for_change(keys_to_snapshot_ids)
+        return await self.long_poll_host.listen_for_change(
+            keys_to_snapshot_ids, accept_deltas=accept_deltas
+        )
 
     async def listen_for_change_java(self, keys_to_snapshot_ids_bytes: bytes):
         """Proxy long pull client's listen request.
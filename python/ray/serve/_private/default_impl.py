@@ -120,6 +120,7 @@ def get_request_metadata(init_options, handle_options):
         app_name=_request_context.app_name,
         multiplexed_model_id=handle_options.multiplexed_model_id,
         is_streaming=handle_options.stream,
+        hedge_after_percentile=handle_options.hedge_after_percentile,
         _request_protocol=request_protocol,
         grpc_context=_request_context.grpc_context,
         _by_reference=True,
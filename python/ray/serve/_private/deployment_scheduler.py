@@ -1,6 +1,8 @@
 import copy
 import logging
+import math
 import sys
+import time
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass
@@ -18,9 +20,12 @@ from ray.serve._private.common import (
 from ray.serve._private.config import ReplicaConfig
 from ray.serve._private.constants import (
     RAY_SERVE_HIGH_PRIORITY_CUSTOM_RESOURCES,
+    RAY_SERVE_NODE_COMPACTION_INTERVAL_S,
+    RAY_SERVE_NODE_COMPACTION_TIMEOUT_S,
     RAY_SERVE_USE_COMPACT_SCHEDULING_STRATEGY,
     SERVE_LOGGER_NAME,
 )
+from ray.serve._private.usage import ServeUsageTag
 from ray.util.scheduling_strategies import (
     LabelMatchExpressionsT,
     NodeAffinitySchedulingStrategy,
@@ -272,6 +277,49 @@ def _flatten(
     }
 
 
+def _get_stranded_fraction(
+    remaining: Resources, total: Resources, replica_shapes: List[Resources]
+) -> float:
+    """Estimates how much of a node's resources would be left unusable.
+
+    The remaining resources are filled with as many replicas of a single
+    shape as fit, and whatever is left over is stranded. The result is the
+    smallest stranded amount over all shapes, summed over the resources the
+    shapes request and normalized by the node's total of each resource.
+    """
+
+    keys = {
+        key
+        for shape in replica_shapes
+        for key in shape
+        if not key.startswith(ray._raylet.IMPLICIT_RESOURCE_PREFIX)
+        and total.get(key) > 0
+    }
+
+    min_stranded = None
+    for shape in replica_shapes:
+        requested = [key for key in shape if shape.get(key) > 0]
+        if not requested:
+            continue
+
+        # Small epsilon so fractional resources (e.g. 0.1 GPU) divide evenly.
+        num_fit = max(
+            0,
+            min(
+                math.floor(remaining.get(key) / shape.get(key) + 1e-6)
+                for key in requested
+            ),
+        )
+        stranded = sum(
+            max(0, remaining.get(key) - num_fit * shape.get(key)) / total.get(key)
+            for key in keys
+        )
+        if min_stranded is None or stranded < min_stranded:
+            min_stranded = stranded
+
+    return min_stranded or 0.0
+
+
 class DeploymentScheduler(ABC):
     """A centralized scheduler for all Serve deployments.
 
@@ -643,6 +691,21 @@ class DeploymentScheduler(ABC):
 
 
 class DefaultDeploymentScheduler(DeploymentScheduler):
+    def __init__(
+        self,
+        cluster_node_info_cache: ClusterNodeInfoCache,
+        head_node_id: str,
+        create_placement_group_fn: Callable,
+    ):
+        super().__init__(
+            cluster_node_info_cache, head_node_id, create_placement_group_fn
+        )
+        # Node that replicas are being moved off of, and its deadline in ms.
+        self._compacting_node_id: Optional[str] = None
+        self._compaction_deadline_ms: Optional[float] = None
+        self._last_compaction_check_s: float = 0
+        self._num_compactions: int = 0
+
     def schedule(
         self,
         upscales: Dict[DeploymentID, List[ReplicaSchedulingRequest]],
@@ -678,9 +741,12 @@ class DefaultDeploymentScheduler(DeploymentScheduler):
 
             # Schedule each replica
             for scheduling_request in all_scheduling_requests:
+                available_resources_per_node = self._get_available_resources_per_node()
+                # Don't place replicas back onto the node being compacted.
+                available_resources_per_node.pop(self._compacting_node_id, None)
                 target_node = self._find_best_available_node(
                     scheduling_request.required_resources,
-                    self._get_available_resources_per_node(),
+                    available_resources_per_node,
                 )
 
                 self._schedule_replica(
@@ -782,6 +848,14 @@ class DefaultDeploymentScheduler(DeploymentScheduler):
         over idle nodes.
         """
 
+        replica_shapes = self._get_replica_shapes()
+        total_resources_per_node = {
+            node_id: Resources(resources)
+            for node_id, resources in (
+                self._cluster_node_info_cache.get_total_resources_per_node().items()
+            )
+        }
+
         node_to_running_replicas = self._get_node_to_running_replicas()
 
         non_idle_nodes = {
@@ -796,16 +870,174 @@ class DefaultDeploymentScheduler(DeploymentScheduler):
         }
 
         # 1. Prefer non-idle nodes
-        chosen_node = self._best_fit_node(required_resources, non_idle_nodes)
+        chosen_node = self._least_stranding_node(
+            required_resources,
+            non_idle_nodes,
+            total_resources_per_node,
+            replica_shapes,
+        )
         if chosen_node:
             return chosen_node
 
         # 2. Consider idle nodes last
-        chosen_node = self._best_fit_node(required_resources, idle_nodes)
+        chosen_node = self._least_stranding_node(
+            required_resources,
+            idle_nodes,
+            total_resources_per_node,
+            replica_shapes,
+        )
         if chosen_node:
             return chosen_node
 
+    def _get_replica_shapes(self) -> List[Resources]:
+        """Returns the resources required by a replica of each deployment."""
+        return [
+            Resources(info.required_resources)
+            for info in self._deployments.values()
+            if info.actor_resources is not None
+        ]
+
+    def _least_stranding_node(
+        self,
+        required_resources: Resources,
+        available_resources: Dict[str, Resources],
+        total_resources: Dict[str, Resources],
+        replica_shapes: List[Resources],
+    ) -> Optional[str]:
+        """Chooses the node that leaves the fewest stranded resources.
+
+        Stranded resources are the ones that no replica of any deployment
+        could use after scheduling onto the node, e.g. GPUs left without
+        enough CPUs for any deployment that needs them. Ties are broken
+        with the best fit strategy.
+        """
+
+        min_key = None
+        chosen_node = None
+
+        for node_id, available in available_resources.items():
+            if not available.can_fit(required_resources):
+                continue
+
+            remaining_space = available - required_resources
+            stranded = _get_stranded_fraction(
+                remaining_space,
+                total_resources.get(node_id, Resources()),
+                replica_shapes,
+            )
+            key = (round(stranded, 6), remaining_space)
+            if min_key is None or key < min_key:
+                min_key = key
+                chosen_node = node_id
+
+        return chosen_node
+
     def get_node_to_compact(
         self, allow_new_compaction: bool
     ) -> Optional[Tuple[str, float]]:
+        """Returns a node to move all replicas off of, and its deadline in ms.
+
+        A compaction in progress is returned until the node has no replicas
+        left, is no longer active, or its deadline has passed. A new one is
+        only started if allowed, and at most every
+        RAY_SERVE_NODE_COMPACTION_INTERVAL_S seconds.
+        """
+
+        if self._compacting_node_id is not None:
+            node_id = self._compacting_node_id
+            if node_id not in self._cluster_node_info_cache.get_active_node_ids():
+                logger.info(f"Stopped compacting node {node_id}, it's not active.")
+            elif not self._get_node_to_running_replicas().get(node_id):
+                self._num_compactions += 1
+                ServeUsageTag.NUM_NODE_COMPACTIONS.record(str(self._num_compactions))
+                logger.info(f"Finished compacting node {node_id}.")
+            elif time.time() * 1000 >= self._compaction_deadline_ms:
+                logger.warning(
+                    f"Compacting node {node_id} didn't finish before its deadline."
+                )
+            else:
+                return node_id, self._compaction_deadline_ms
+
+            self._compacting_node_id = None
+            self._compaction_deadline_ms = None
+            return None
+
+        if not allow_new_compaction or RAY_SERVE_NODE_COMPACTION_INTERVAL_S <= 0:
+            return None
+
+        now_s = time.time()
+        if now_s - self._last_compaction_check_s < RAY_SERVE_NODE_COMPACTION_INTERVAL_S:
+            return None
+        self._last_compaction_check_s = now_s
+
+        node_id = self._find_node_to_compact()
+        if node_id is None:
+            return None
+
+        logger.info(
+            f"Compacting node {node_id}. Its replicas fit on other nodes, so they "
+            "will be migrated and the node can be released."
+        )
+        self._compacting_node_id = node_id
+        self._compaction_deadline_ms = (
+            now_s + RAY_SERVE_NODE_COMPACTION_TIMEOUT_S
+        ) * 1000
+        return node_id, self._compaction_deadline_ms
+
+    def _find_node_to_compact(self) -> Optional[str]:
+        """Finds a non-head node whose running replicas all fit on other nodes.
+
+        Nodes running the fewest replica resources are tried first. Nodes that
+        also use resources for anything other than replicas are skipped, since
+        moving the replicas wouldn't release them.
+        """
+
+        if any(d.is_non_strict_pack_pg() for d in self._deployments.values()):
+            return None
+
+        active_node_ids = self._cluster_node_info_cache.get_active_node_ids()
+        gcs_available_resources = (
+            self._cluster_node_info_cache.get_available_resources_per_node()
+        )
+        total_resources = self._cluster_node_info_cache.get_total_resources_per_node()
+        available_resources_per_node = self._get_available_resources_per_node()
+
+        node_to_required_resources: Dict[str, List[Resources]] = {}
+        for node_id, replicas in self._get_node_to_running_replicas().items():
+            if node_id == self._head_node_id or node_id not in active_node_ids:
+                continue
+
+            node_to_required_resources[node_id] = [
+                self._deployments[replica_id.deployment_id].required_resources
+                for replica_id in replicas
+            ]
+
+        for node_id, required in sorted(
+            node_to_required_resources.items(),
+            key=lambda item: sum(item[1], Resources()),
+        ):
+            used = Resources(total_resources.get(node_id, {})) - Resources(
+                gcs_available_resources.get(node_id, {})
+            )
+            used_by_replicas = sum(required, Resources())
+            if any(
+                used.get(key) > used_by_replicas.get(key) + 1e-6
+                for key in used
+                if not key.startswith(ray._raylet.IMPLICIT_RESOURCE_PREFIX)
+            ):
+                continue
+
+            other_nodes = {
+                other_node_id: resources
+                for other_node_id, resources in available_resources_per_node.items()
+                if other_node_id != node_id
+            }
+            for required_resources in sorted(required, reverse=True):
+                target_node = self._best_fit_node(required_resources, other_nodes)
+                if target_node is None:
+                    break
+                other_nodes[target_node] -= required_resources
+            else:
+                return node_id
+
         return None
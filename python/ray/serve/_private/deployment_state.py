@@ -1191,7 +1191,10 @@ class DeploymentReplica:
 
     def update_state(self, state: ReplicaState) -> None:
         """Updates state in actor details."""
-        self.update_actor_details(state=state)
+        # Replicas are re-added to the state container every control loop
+        # iteration, so avoid rebuilding the details if the state is unchanged.
+        if self._actor_details.state != state:
+            self.update_actor_details(state=state)
 
     def update_actor_details(self, **kwargs) -> None:
         details_kwargs = self._actor_details.dict()
@@ -1419,12 +1422,34 @@ class DeploymentState:
 
         self._docs_path: Optional[str] = None
 
+        # Whether the target state or the replicas changed since the deployment
+        # was last reconciled by the `DeploymentStateManager`.
+        self._needs_reconcile: bool = True
+
     def should_autoscale(self) -> bool:
         """
         Check if the deployment is under autoscaling
         """
         return self._id in self._autoscaling_state_manager._autoscaling_states
 
+    def needs_reconcile(self) -> bool:
+        """Check if the deployment has pending work for the control loop.
+
+        A deployment doesn't need to be reconciled if it's HEALTHY, all of its
+        replicas are RUNNING, and neither its target state nor its replicas have
+        changed since it was last reconciled.
+        """
+        return (
+            self._needs_reconcile
+            or self._curr_status_info.status != DeploymentStatus.HEALTHY
+            or self._replicas.count(states=[ReplicaState.RUNNING])
+            != self._replicas.count()
+        )
+
+    def mark_reconciled(self) -> None:
+        """Mark that the control loop has reconciled the deployment."""
+        self._needs_reconcile = False
+
     def get_checkpoint_data(self) -> DeploymentTargetState:
         """
         Return deployment's target state submitted by user's deployment call.
@@ -1652,6 +1677,7 @@ class DeploymentState:
         )
 
         self._target_state = target_state
+        self._needs_reconcile = True
         self._curr_status_info = self._curr_status_info.handle_transition(
             trigger=DeploymentStatusInternalTrigger.DELETE
         )
@@ -1691,6 +1717,7 @@ class DeploymentState:
                 ServeUsageTag.NUM_REPLICAS_LIGHTWEIGHT_UPDATED.record("True")
 
         self._target_state = new_target_state
+        self._needs_reconcile = True
 
     def deploy(self, deployment_info: DeploymentInfo) -> bool:
         """Deploy the deployment.
@@ -2114,6 +2141,7 @@ class DeploymentState:
                 # This replica should be now be added to handle's replica
                 # set.
                 self._replicas.add(ReplicaState.RUNNING, replica)
+                self._needs_reconcile = True
                 self._deployment_scheduler.on_replica_running(
                     replica.replica_id, replica.actor_node_id
                 )
@@ -2206,6 +2234,7 @@ class DeploymentState:
         logger.debug(f"Adding STOPPING to replica: {replica.replica_id}.")
         replica.stop(graceful=graceful_stop)
         self._replicas.add(ReplicaState.STOPPING, replica)
+        self._needs_reconcile = True
         self._deployment_scheduler.on_replica_stopping(replica.replica_id)
         self.health_check_gauge.set(
             0,
@@ -2237,6 +2266,9 @@ class DeploymentState:
                     },
                 )
                 routing_stats = replica.pull_routing_stats()
+                if routing_stats is not None and routing_stats != replica.routing_stats:
+                    # The running replica infos need to be broadcast.
+                    self._needs_reconcile = True
                 replica.record_routing_stats(routing_stats)
             else:
                 logger.warning(
@@ -2454,6 +2486,7 @@ class DeploymentState:
                 if info.routing_stats is not None:
                     replica.record_routing_stats(info.routing_stats)
                 self._request_routing_info_updated = True
+                self._needs_reconcile = True
                 return
 
         logger.warning(f"{info.replica_id} not found.")
@@ -2809,24 +2842,34 @@ class DeploymentStateManager:
 
             deployment_state.check_and_update_replicas()
 
+        # Only reconcile deployments with pending state transitions, health
+        # check failures, or target changes. Steady-state deployments are
+        # skipped, which keeps the control loop cheap with many replicas.
+        deployments_to_reconcile: Dict[DeploymentID, DeploymentState] = {}
+        for deployment_id, deployment_state in self._deployment_states.items():
+            if deployment_state.needs_reconcile():
+                deployments_to_reconcile[deployment_id] = deployment_state
+                deployment_state.mark_reconciled()
+
         # STEP 2: Check current status
-        for deployment_state in self._deployment_states.values():
+        for deployment_state in deployments_to_reconcile.values():
             deployment_state.check_curr_status()
 
         # STEP 3: Drain nodes
         draining_nodes = self._cluster_node_info_cache.get_draining_nodes()
-        allow_new_compaction = len(draining_nodes) == 0 and all(
-            ds.curr_status_info.status == DeploymentStatus.HEALTHY
-            # TODO(zcin): Make sure that status should never be healthy if
-            # the number of running replicas at target version is not at
-            # target number, so we can remove this defensive check.
-            and ds.get_num_running_replicas(ds.target_version) == ds.target_num_replicas
-            # To be extra conservative, only actively compact if there
-            # are no non-running replicas
-            and len(ds._replicas.get()) == ds.target_num_replicas
-            for ds in self._deployment_states.values()
-        )
         if RAY_SERVE_USE_COMPACT_SCHEDULING_STRATEGY:
+            allow_new_compaction = len(draining_nodes) == 0 and all(
+                ds.curr_status_info.status == DeploymentStatus.HEALTHY
+                # TODO(zcin): Make sure that status should never be healthy if
+                # the number of running replicas at target version is not at
+                # target number, so we can remove this defensive check.
+                and ds.get_num_running_replicas(ds.target_version)
+                == ds.target_num_replicas
+                # To be extra conservative, only actively compact if there
+                # are no non-running replicas
+                and ds._replicas.count() == ds.target_num_replicas
+                for ds in self._deployment_states.values()
+            )
             # Tuple of target node to compact, and its draining deadline
             node_info: Optional[
                 Tuple[str, float]
@@ -2837,11 +2880,17 @@ class DeploymentStateManager:
                 target_node_id, deadline = node_info
                 draining_nodes = {target_node_id: deadline}
 
-        for deployment_id, deployment_state in self._deployment_states.items():
+        if draining_nodes:
+            # Any deployment may have replicas on the draining nodes.
+            for deployment_state in self._deployment_states.values():
+                deployment_state.mark_reconciled()
+            deployments_to_reconcile = dict(self._deployment_states)
+
+        for deployment_id, deployment_state in deployments_to_reconcile.items():
             deployment_state.migrate_replicas_on_draining_nodes(draining_nodes)
 
         # STEP 4: Scale replicas
-        for deployment_id, deployment_state in self._deployment_states.items():
+        for deployment_id, deployment_state in deployments_to_reconcile.items():
             upscale, downscale = deployment_state.scale_deployment_replicas()
 
             if upscale:
@@ -2850,7 +2899,7 @@ class DeploymentStateManager:
                 downscales[deployment_id] = downscale
 
         # STEP 5: Update status
-        for deployment_id, deployment_state in self._deployment_states.items():
+        for deployment_id, deployment_state in deployments_to_reconcile.items():
             deleted, any_replicas_recovering = deployment_state.check_curr_status()
 
             if deleted:
@@ -2871,7 +2920,7 @@ class DeploymentStateManager:
             self._handle_scheduling_request_failures(deployment_id, scheduling_requests)
 
         # STEP 7: Broadcast long poll information
-        for deployment_id, deployment_state in self._deployment_states.items():
+        for deployment_id, deployment_state in deployments_to_reconcile.items():
             deployment_state.broadcast_running_replicas_if_changed()
             deployment_state.broadcast_deployment_config_if_changed()
             if deployment_state.should_autoscale():
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, fields
+from typing import Optional
 
 import ray
 from ray.serve._private.common import DeploymentHandleSource
@@ -52,6 +53,7 @@ class DynamicHandleOptionsBase(ABC):
     method_name: str = "__call__"
     multiplexed_model_id: str = ""
     stream: bool = False
+    hedge_after_percentile: Optional[float] = None
 
     @abstractmethod
     def copy_and_update(self, **kwargs) -> "DynamicHandleOptionsBase":
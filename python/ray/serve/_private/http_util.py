@@ -255,18 +255,88 @@ class MessageQueue(Send):
             raise StopAsyncIteration
 
 
+def serialize_asgi_receive_messages(
+    messages: List[Message], zero_copy_threshold_bytes: int = 0
+) -> Union[bytes, List[Message]]:
+    """Serialize ASGI messages sent from the proxy to a replica's `receive`.
+
+    By default, messages are returned as pickled bytes. If zero-copy is enabled
+    (`zero_copy_threshold_bytes > 0`) and the request body contained in the messages
+    is at least that large, the body chunks are coalesced into a single
+    `http.request` message whose body is a `pickle.PickleBuffer`. The messages are
+    then returned unpickled so that Ray serializes the buffer out-of-band: it's
+    written to the object store once and the replica maps it without copying.
+    """
+    if zero_copy_threshold_bytes <= 0:
+        return pickle.dumps(messages)
+
+    body_chunks = []
+    body_size = 0
+    for message in messages:
+        if message["type"] == "http.request":
+            body_chunks.append(message.get("body", b""))
+            body_size += len(body_chunks[-1])
+
+    if body_size < zero_copy_threshold_bytes:
+        return pickle.dumps(messages)
+
+    # All `http.request` messages precede a disconnect, so they can be merged into
+    # the position of the first one without reordering.
+    body = bytearray(body_size)
+    offset = 0
+    for chunk in body_chunks:
+        body[offset : offset + len(chunk)] = chunk
+        offset += len(chunk)
+
+    coalesced = []
+    body_message = None
+    for message in messages:
+        if message["type"] != "http.request":
+            coalesced.append(message)
+        elif body_message is None:
+            body_message = {
+                "type": "http.request",
+                "body": pickle.PickleBuffer(body),
+                "more_body": False,
+            }
+            coalesced.append(body_message)
+
+        if message["type"] == "http.request":
+            # The merged message continues if the last chunk does.
+            body_message["more_body"] = message.get("more_body", False)
+
+    return coalesced
+
+
+def _maybe_wrap_zero_copy_body(message: Message) -> Message:
+    """Expose an out-of-band request body as a read-only `memoryview`.
+
+    Bodies received as `bytes` are returned unchanged.
+    """
+    if message["type"] == "http.request":
+        body = message.get("body", b"")
+        if not isinstance(body, (bytes, bytearray, memoryview)):
+            message["body"] = memoryview(body)
+
+    return message
+
+
 class ASGIReceiveProxy:
     """Proxies ASGI receive from an actor.
 
     The `receive_asgi_messages` callback will be called repeatedly to fetch messages
-    until a disconnect message is received.
+    until a disconnect message is received. It returns either pickled messages or,
+    if they carry a large request body, the messages themselves (see
+    `serialize_asgi_receive_messages`).
     """
 
     def __init__(
         self,
         scope: Scope,
         request_metadata: RequestMetadata,
-        receive_asgi_messages: Callable[[RequestMetadata], Awaitable[bytes]],
+        receive_asgi_messages: Callable[
+            [RequestMetadata], Awaitable[Union[bytes, List[Message]]]
+        ],
     ):
         self._type = scope["type"]  # Either 'http' or 'websocket'.
         self._queue = asyncio.Queue()
@@ -315,7 +385,7 @@ class ASGIReceiveProxy:
                     )
 
                 for message in messages:
-                    self._queue.put_nowait(message)
+                    self._queue.put_nowait(_maybe_wrap_zero_copy_body(message))
 
                     if message["type"] in {"http.disconnect", "websocket.disconnect"}:
                         self._disconnect_message = message
@@ -3,6 +3,7 @@ import concurrent.futures
 import inspect
 import logging
 import queue
+import threading
 import time
 from functools import wraps
 from typing import Any, Callable, Coroutine, Dict, Optional, Tuple, Union
@@ -16,6 +17,7 @@ from ray.serve._private.constants import (
 )
 from ray.serve._private.replica import UserCallableWrapper
 from ray.serve._private.replica_result import ReplicaResult
+from ray.serve._private.request_hedging import RequestHedger
 from ray.serve._private.router import Router
 from ray.serve._private.utils import GENERATOR_COMPOSITION_NOT_SUPPORTED_ERROR
 from ray.serve.deployment import Deployment
@@ -243,6 +245,7 @@ class LocalRouter(Router):
         assert (
             self._user_callable_wrapper._callable is not None
         ), "User callable must already be initialized."
+        self._request_hedger = RequestHedger()
 
     def running_replicas_populated(self) -> bool:
         return True
@@ -277,6 +280,82 @@ class LocalRouter(Router):
             )
         )
 
+    def _call_user_method_with_hedging(
+        self,
+        request_meta: RequestMetadata,
+        request_args: Tuple[Any],
+        request_kwargs: Dict[str, Any],
+    ) -> concurrent.futures.Future:
+        """Call a unary user method and hedge the call if it's slow.
+
+        There is only one replica in local testing mode, so the duplicate call is
+        made to the same user callable.
+        """
+        method_name = request_meta.call_method
+        start_time_s = time.time()
+
+        def _call() -> concurrent.futures.Future:
+            return self._user_callable_wrapper.call_user_method(
+                request_meta, request_args, request_kwargs
+            )
+
+        self._request_hedger.on_request()
+        delay_s = self._request_hedger.get_hedge_delay_s(
+            method_name, request_meta.hedge_after_percentile
+        )
+        if delay_s is None or not self._request_hedger.has_budget():
+            call_future = _call()
+            call_future.add_done_callback(
+                lambda _: self._request_hedger.record_latency(
+                    method_name, time.time() - start_time_s
+                )
+            )
+            return call_future
+
+        result_future = concurrent.futures.Future()
+        call_futures = []
+        # Reentrant because setting the result runs `_cancel_calls`.
+        lock = threading.RLock()
+
+        def _on_call_done(call_future: concurrent.futures.Future):
+            with lock:
+                if result_future.done():
+                    return
+
+                if call_future.cancelled():
+                    result_future.cancel()
+                elif call_future.exception() is not None:
+                    result_future.set_exception(call_future.exception())
+                else:
+                    result_future.set_result(call_future.result())
+
+            hedge_timer.cancel()
+            self._request_hedger.record_latency(method_name, time.time() - start_time_s)
+
+        def _send_hedge():
+            with lock:
+                if result_future.done() or not self._request_hedger.try_acquire_hedge():
+                    return
+
+                call_future = _call()
+                call_futures.append(call_future)
+
+            call_future.add_done_callback(_on_call_done)
+
+        def _cancel_calls(_):
+            hedge_timer.cancel()
+            with lock:
+                for call_future in call_futures:
+                    call_future.cancel()
+
+        hedge_timer = threading.Timer(delay_s, _send_hedge)
+        hedge_timer.daemon = True
+        call_futures.append(_call())
+        call_futures[0].add_done_callback(_on_call_done)
+        result_future.add_done_callback(_cancel_calls)
+        hedge_timer.start()
+        return result_future
+
     def assign_request(
         self,
         request_meta: RequestMetadata,
@@ -297,16 +376,26 @@ class LocalRouter(Router):
             generator_result_queue = None
             generator_result_callback = None
 
+        if (
+            request_meta.hedge_after_percentile is not None
+            and not request_meta.is_streaming
+        ):
+            result_future = self._call_user_method_with_hedging(
+                request_meta, request_args, request_kwargs
+            )
+        else:
+            result_future = self._user_callable_wrapper.call_user_method(
+                request_meta,
+                request_args,
+                request_kwargs,
+                generator_result_callback=generator_result_callback,
+            )
+
         # Conform to the router interface of returning a future to the ReplicaResult.
         noop_future = concurrent.futures.Future()
         noop_future.set_result(
             LocalReplicaResult(
-                self._user_callable_wrapper.call_user_method(
-                    request_meta,
-                    request_args,
-                    request_kwargs,
-                    generator_result_callback=generator_result_callback,
-                ),
+                result_future,
                 request_id=request_meta.request_id,
                 is_streaming=request_meta.is_streaming,
                 generator_result_queue=generator_result_queue,
@@ -4,15 +4,35 @@ import os
 import random
 from asyncio import sleep
 from asyncio.events import AbstractEventLoop
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Callable, DefaultDict, Dict, Optional, Set, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import ray
 from ray._common.utils import get_or_create_event_loop
-from ray.serve._private.constants import SERVE_LOGGER_NAME
+from ray.serve._private.common import (
+    DeploymentTargetInfo as DeploymentTargetInfoObject,
+    ReplicaID,
+    RunningReplicaInfo,
+)
+from ray.serve._private.constants import (
+    RAY_SERVE_LONG_POLL_COALESCE_WINDOW_S,
+    RAY_SERVE_LONG_POLL_MAX_DELTA_HISTORY,
+    SERVE_LOGGER_NAME,
+)
 from ray.serve.generated.serve_pb2 import (
     DeploymentTargetInfo,
     EndpointInfo as EndpointInfoProto,
@@ -54,6 +74,76 @@ class UpdatedObject:
     # The identifier for the object's version. There is not sequential relation
     # among different object's snapshot_ids.
     snapshot_id: int
+    # If set, `object_snapshot` is `None` and the new object is obtained by
+    # applying these deltas in order to the client's current object.
+    deltas: Optional[List["DeploymentTargetsDelta"]] = None
+
+
+@dataclass
+class DeploymentTargetsDelta:
+    """Difference between two consecutive `DeploymentTargetInfo` snapshots.
+
+    Replicas are identified by ID; a replica whose info changed (e.g., its
+    multiplexed model IDs) is included in `upserted_replicas`.
+    """
+
+    is_available: bool
+    upserted_replicas: List[RunningReplicaInfo] = field(default_factory=list)
+    removed_replica_ids: List[ReplicaID] = field(default_factory=list)
+
+    @property
+    def size(self) -> int:
+        return len(self.upserted_replicas) + len(self.removed_replica_ids)
+
+
+def compute_deployment_targets_delta(
+    old: Any, new: Any
+) -> Optional[DeploymentTargetsDelta]:
+    """Compute the delta between two deployment target snapshots.
+
+    Returns `None` if the objects aren't `DeploymentTargetInfo`s or if the delta
+    isn't smaller than the new snapshot (so sending it would not save anything).
+    """
+    if not isinstance(old, DeploymentTargetInfoObject) or not isinstance(
+        new, DeploymentTargetInfoObject
+    ):
+        return None
+
+    old_replicas = {r.replica_id: r for r in old.running_replicas}
+    new_replica_ids = set()
+    delta = DeploymentTargetsDelta(is_available=new.is_available)
+    for replica in new.running_replicas:
+        new_replica_ids.add(replica.replica_id)
+        old_replica = old_replicas.get(replica.replica_id)
+        if old_replica is None or old_replica != replica:
+            delta.upserted_replicas.append(replica)
+    delta.removed_replica_ids = [
+        replica_id for replica_id in old_replicas if replica_id not in new_replica_ids
+    ]
+
+    if delta.size >= len(new.running_replicas):
+        return None
+
+    return delta
+
+
+def apply_deployment_targets_delta(
+    old: DeploymentTargetInfoObject, delta: DeploymentTargetsDelta
+) -> DeploymentTargetInfoObject:
+    """Apply a delta from `compute_deployment_targets_delta` to a snapshot.
+
+    Existing replicas keep their relative order and new replicas are appended.
+    """
+    replicas = {r.replica_id: r for r in old.running_replicas}
+    for replica_id in delta.removed_replica_ids:
+        replicas.pop(replica_id, None)
+    for replica in delta.upserted_replicas:
+        replicas[replica.replica_id] = replica
+
+    return DeploymentTargetInfoObject(
+        is_available=delta.is_available,
+        running_replicas=list(replicas.values()),
+    )
 
 
 # Type signature for the update state callbacks. E.g.
@@ -99,6 +189,8 @@ class LongPollClient:
             key: -1
             for key in self.key_listeners.keys()
         }
+        # Latest object for each key, used as the base to apply deltas to.
+        self._object_snapshots: Dict[KeyType, Any] = {}
         self.is_running = True
 
         self._poll_next()
@@ -158,7 +250,9 @@ class LongPollClient:
             return
 
         self._callbacks_processed_count = 0
-        self._current_ref = self.host_actor.listen_for_change.remote(self.snapshot_ids)
+        self._current_ref = self.host_actor.listen_for_change.remote(
+            self.snapshot_ids, accept_deltas=True
+        )
         self._current_ref._on_completed(lambda update: self._process_update(update))
 
     def _schedule_to_event_loop(self, callback):
@@ -204,20 +298,47 @@ class LongPollClient:
             f"{list(updates.keys())}.",
             extra={"log_to_stderr": False},
         )
-        if not updates:  # no updates, no callbacks to run, just poll again
-            self._schedule_to_event_loop(self._poll_next)
+        resolved_updates = {}
         for key, update in updates.items():
+            object_snapshot = self._resolve_object_snapshot(key, update)
+            if object_snapshot is None and update.deltas is not None:
+                # The base object is missing; request a full snapshot next time.
+                self.snapshot_ids[key] = -1
+                continue
+            resolved_updates[key] = UpdatedObject(object_snapshot, update.snapshot_id)
+
+        if not resolved_updates:  # no updates, no callbacks to run, just poll again
+            self._schedule_to_event_loop(self._poll_next)
+        for key, update in resolved_updates.items():
             self.snapshot_ids[key] = update.snapshot_id
+            self._object_snapshots[key] = update.object_snapshot
             callback = self.key_listeners[key]
 
             # Bind the parameters because closures are late-binding.
             # https://docs.python-guide.org/writing/gotchas/#late-binding-closures # noqa: E501
             def chained(callback=callback, arg=update.object_snapshot):
                 callback(arg)
-                self._on_callback_completed(trigger_at=len(updates))
+                self._on_callback_completed(trigger_at=len(resolved_updates))
 
             self._schedule_to_event_loop(chained)
 
+    def _resolve_object_snapshot(self, key: KeyType, update: UpdatedObject) -> Any:
+        """Return the full object for an update, applying deltas if necessary."""
+        if update.deltas is None:
+            return update.object_snapshot
+
+        object_snapshot = self._object_snapshots.get(key)
+        if object_snapshot is None:
+            logger.warning(
+                f"LongPollClient received a delta for key {key} without a base "
+                "snapshot, requesting a full snapshot."
+            )
+            return None
+
+        for delta in update.deltas:
+            object_snapshot = apply_deployment_targets_delta(object_snapshot, delta)
+        return object_snapshot
+
 
 class LongPollHost:
     """The server side object that manages long pulling requests.
@@ -231,6 +352,15 @@ class LongPollHost:
     outdated object and immediately return the result. If the client has the
     up-to-date version, then the listen_for_change call will only return when
     the object is updated.
+
+    To reduce the data sent to large numbers of clients, the host keeps a short
+    history of deltas between consecutive deployment target snapshots. Clients
+    that pass `accept_deltas=True` and are only a few versions behind receive the
+    replica set changes rather than the full snapshot.
+
+    If `coalesce_window_s` is positive, waiting clients are woken up at most once
+    per window, so that a burst of `notify_changed` calls results in a single
+    response containing the latest version of every changed key.
     """
 
     def __init__(
@@ -238,6 +368,8 @@ class LongPollHost:
         listen_for_change_request_timeout_s: Tuple[
             int, int
         ] = LISTEN_FOR_CHANGE_REQUEST_TIMEOUT_S,
+        coalesce_window_s: float = RAY_SERVE_LONG_POLL_COALESCE_WINDOW_S,
+        max_delta_history: int = RAY_SERVE_LONG_POLL_MAX_DELTA_HISTORY,
     ):
         # Map object_key -> int
         self.snapshot_ids: Dict[KeyType, int] = {}
@@ -248,6 +380,17 @@ class LongPollHost:
             set
         )
 
+        # Map object_key -> deque of (from_snapshot_id, delta to the next snapshot)
+        self.deltas: DefaultDict[
+            KeyType, Deque[Tuple[int, DeploymentTargetsDelta]]
+        ] = defaultdict(lambda: deque(maxlen=max_delta_history))
+        self._max_delta_history = max_delta_history
+
+        self._coalesce_window_s = coalesce_window_s
+        # Keys changed since the last flush when coalescing notifications.
+        self._pending_notify_keys: Set[KeyType] = set()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
         self._listen_for_change_request_timeout_s = listen_for_change_request_timeout_s
         self.transmission_counter = metrics.Counter(
             "serve_long_poll_host_transmission_counter",
@@ -284,15 +427,37 @@ class LongPollHost:
                     value=1, tags={"namespace_or_state": str(key)}
                 )
 
+    def _get_updated_object(
+        self, key: KeyType, client_snapshot_id: int, accept_deltas: bool
+    ) -> UpdatedObject:
+        """Build the update for a key, using deltas if the client can apply them."""
+        snapshot_id = self.snapshot_ids[key]
+        if accept_deltas and client_snapshot_id >= 0:
+            deltas_by_id = dict(self.deltas.get(key, ()))
+            deltas = []
+            from_id = client_snapshot_id
+            while from_id in deltas_by_id and from_id != snapshot_id:
+                deltas.append(deltas_by_id[from_id])
+                from_id += 1
+
+            if deltas and from_id == snapshot_id:
+                return UpdatedObject(None, snapshot_id, deltas=deltas)
+
+        return UpdatedObject(self.object_snapshots[key], snapshot_id)
+
     async def listen_for_change(
         self,
         keys_to_snapshot_ids: Dict[KeyType, int],
+        accept_deltas: bool = False,
     ) -> Union[LongPollState, Dict[KeyType, UpdatedObject]]:
         """Listen for changed objects.
 
         This method will return a dictionary of updated objects. It returns
         immediately if any of the snapshot_ids are outdated,
         otherwise it will block until there's an update.
+
+        If `accept_deltas` is set, updates may carry `deltas` to apply to the
+        client's current object instead of the full object snapshot.
         """
         # If there are no keys to listen for,
         # just wait for a short time to provide backpressure,
@@ -319,8 +484,8 @@ class LongPollHost:
                 continue
 
             if existing_id != client_snapshot_id:
-                updated_objects[key] = UpdatedObject(
-                    self.object_snapshots[key], existing_id
+                updated_objects[key] = self._get_updated_object(
+                    key, client_snapshot_id, accept_deltas
                 )
         if len(updated_objects) > 0:
             self._count_send(updated_objects)
@@ -364,9 +529,10 @@ class LongPollHost:
             updated_objects = {}
             for task in done:
                 updated_object_key = async_task_to_watched_keys[task]
-                updated_objects[updated_object_key] = UpdatedObject(
-                    self.object_snapshots[updated_object_key],
-                    self.snapshot_ids[updated_object_key],
+                updated_objects[updated_object_key] = self._get_updated_object(
+                    updated_object_key,
+                    keys_to_snapshot_ids[updated_object_key],
+                    accept_deltas,
                 )
             self._count_send(updated_objects)
             return updated_objects
@@ -468,7 +634,14 @@ class LongPollHost:
         """
         for object_key, updated_object in updates.items():
             try:
+                previous_snapshot_id = self.snapshot_ids[object_key]
                 self.snapshot_ids[object_key] += 1
+                self._record_delta(
+                    object_key,
+                    previous_snapshot_id,
+                    self.object_snapshots[object_key],
+                    updated_object,
+                )
             except KeyError:
                 # Initial snapshot id must be >= 0, so that the long poll client
                 # can send a negative initial snapshot id to get a fast update.
@@ -478,5 +651,41 @@ class LongPollHost:
             self.object_snapshots[object_key] = updated_object
             logger.debug(f"LongPollHost: Notify change for key {object_key}.")
 
-            for event in self.notifier_events.pop(object_key, set()):
-                event.set()
+            if self._coalesce_window_s > 0:
+                self._pending_notify_keys.add(object_key)
+            else:
+                self._wake_up_listeners(object_key)
+
+        if self._pending_notify_keys and self._flush_handle is None:
+            self._flush_handle = get_or_create_event_loop().call_later(
+                self._coalesce_window_s, self._flush_pending_notifications
+            )
+
+    def _record_delta(
+        self,
+        object_key: KeyType,
+        previous_snapshot_id: int,
+        previous_object: Any,
+        updated_object: Any,
+    ):
+        if self._max_delta_history <= 0:
+            return
+
+        delta = compute_deployment_targets_delta(previous_object, updated_object)
+        if delta is None:
+            # The history must be contiguous to be applied, so start over.
+            self.deltas.pop(object_key, None)
+        else:
+            self.deltas[object_key].append((previous_snapshot_id, delta))
+
+    def _wake_up_listeners(self, object_key: KeyType):
+        for event in self.notifier_events.pop(object_key, set()):
+            event.set()
+
+    def _flush_pending_notifications(self):
+        """Wake up the listeners of all keys changed during the coalescing window."""
+        self._flush_handle = None
+        pending_notify_keys = self._pending_notify_keys
+        self._pending_notify_keys = set()
+        for object_key in pending_notify_keys:
+            self._wake_up_listeners(object_key)
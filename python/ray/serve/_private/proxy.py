@@ -7,13 +7,13 @@ import pickle
 import time
 from abc import ABC, abstractmethod
 from copy import deepcopy
-from typing import Any, Callable, Dict, Generator, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Generator, List, Optional, Set, Tuple, Union
 
 import grpc
 import starlette
 import starlette.routing
 from packaging import version
-from starlette.types import Receive
+from starlette.types import Message, Receive
 
 import ray
 from ray._common.utils import get_or_create_event_loop
@@ -30,6 +30,7 @@ from ray.serve._private.constants import (
     RAY_SERVE_ENABLE_PROXY_GC_OPTIMIZATIONS,
     RAY_SERVE_HTTP_PROXY_CALLBACK_IMPORT_PATH,
     RAY_SERVE_PROXY_GC_THRESHOLD,
+    RAY_SERVE_PROXY_ZERO_COPY_BODY_THRESHOLD_BYTES,
     REQUEST_LATENCY_BUCKETS_MS,
     SERVE_CONTROLLER_NAME,
     SERVE_HTTP_REQUEST_ID_HEADER,
@@ -49,6 +50,7 @@ from ray.serve._private.http_util import (
     get_http_response_status,
     receive_http_body,
     send_http_response_on_exception,
+    serialize_asgi_receive_messages,
     start_asgi_http_server,
     validate_http_proxy_callback_return,
 )
@@ -633,6 +635,10 @@ class gRPCProxy(GenericProxy):
             async for message in self.proxy_request(proxy_request=proxy_request):
                 if isinstance(message, ResponseStatus):
                     status = message
+                elif isinstance(message, list):
+                    # A batch of messages sent by the replica in one object.
+                    for m in message:
+                        yield m
                 else:
                     yield message
 
@@ -1255,17 +1261,24 @@ class ProxyActor:
         """Called by the replica to initialize its handle to the proxy."""
         pass
 
-    async def receive_asgi_messages(self, request_metadata: RequestMetadata) -> bytes:
+    async def receive_asgi_messages(
+        self, request_metadata: RequestMetadata
+    ) -> Union[bytes, List[Message]]:
         """Get ASGI messages for the provided `request_metadata`.
 
         After the proxy has stopped receiving messages for this `request_metadata`,
         this will always return immediately.
 
+        Messages are returned pickled, unless they carry a request body larger than
+        `RAY_SERVE_PROXY_ZERO_COPY_BODY_THRESHOLD_BYTES`; see
+        `serialize_asgi_receive_messages`.
+
         Raises `KeyError` if this request ID is not found. This will happen when the
         request is no longer being handled (e.g., the user disconnects).
         """
-        return pickle.dumps(
-            await self.http_proxy.receive_asgi_messages(request_metadata)
+        return serialize_asgi_receive_messages(
+            await self.http_proxy.receive_asgi_messages(request_metadata),
+            zero_copy_threshold_bytes=RAY_SERVE_PROXY_ZERO_COPY_BODY_THRESHOLD_BYTES,
         )
 
     def _save_cpu_profile_data(self) -> str:
@@ -8,7 +8,10 @@ import grpc
 from starlette.types import Receive, Scope, Send
 
 from ray.serve._private.common import StreamingHTTPRequest, gRPCRequest
-from ray.serve._private.constants import SERVE_LOGGER_NAME
+from ray.serve._private.constants import (
+    RAY_SERVE_GRPC_STREAMING_MAX_BATCH_SIZE,
+    SERVE_LOGGER_NAME,
+)
 from ray.serve._private.utils import DEFAULT
 from ray.serve.grpc_util import RayServegRPCContext
 
@@ -170,7 +173,16 @@ class gRPCProxyRequest(ProxyRequest):
     def serialized_replica_arg(self) -> bytes:
         # NOTE(edoakes): it's important that the request is sent as raw bytes to
         # skip the Ray cloudpickle serialization codepath for performance.
-        return pickle.dumps(gRPCRequest(user_request_proto=self._request_proto))
+        max_stream_batch_size = None
+        if self.stream and RAY_SERVE_GRPC_STREAMING_MAX_BATCH_SIZE > 0:
+            max_stream_batch_size = RAY_SERVE_GRPC_STREAMING_MAX_BATCH_SIZE
+
+        return pickle.dumps(
+            gRPCRequest(
+                user_request_proto=self._request_proto,
+                max_stream_batch_size=max_stream_batch_size,
+            )
+        )
 
 
 @dataclass(frozen=True)
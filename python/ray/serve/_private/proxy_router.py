@@ -1,5 +1,5 @@
 import logging
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
 
 from ray.serve._private.common import ApplicationName, DeploymentID, EndpointInfo
 from ray.serve._private.constants import SERVE_LOGGER_NAME
@@ -11,6 +11,64 @@ NO_ROUTES_MESSAGE = "Route table is not populated yet."
 NO_REPLICAS_MESSAGE = "No replicas are available yet."
 
 
+class RouteTrie:
+    """Index of routes for longest prefix matching on path segments.
+
+    A route matches a path if it's equal to the path or is a prefix of it that
+    ends at a segment boundary, e.g. "/a" matches "/a" and "/a/b" but not "/ab".
+    Routes that end in "/" match any path that starts with them.
+
+    Matching is O(length of the path) regardless of the number of routes.
+    """
+
+    __slots__ = ("children", "route", "dir_route")
+
+    def __init__(self):
+        self.children: Dict[str, "RouteTrie"] = {}
+        # Route whose segments end at this node, e.g. "/a" for the node "", "a".
+        self.route: Optional[str] = None
+        # Route ending in "/" whose other segments end at this node, e.g. "/a/"
+        # for the node "", "a". It only matches if the path has more segments.
+        self.dir_route: Optional[str] = None
+
+    def insert(self, route: str):
+        segments = route.split("/")
+        is_dir = route.endswith("/")
+        if is_dir:
+            segments.pop()
+
+        node = self
+        for segment in segments:
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = RouteTrie()
+            node = child
+
+        if is_dir:
+            node.dir_route = route
+        else:
+            node.route = route
+
+    def longest_match(self, path: str) -> Optional[str]:
+        """Return the longest route that matches the path, if any."""
+        segments = path.split("/")
+        num_segments = len(segments)
+        matched = None
+        node = self
+        for i, segment in enumerate(segments):
+            node = node.children.get(segment)
+            if node is None:
+                break
+            # Deeper matches are always longer, and a directory route is longer
+            # than the route without the trailing "/".
+            if node.dir_route is not None and i + 1 < num_segments:
+                matched = node.dir_route
+            elif node.route is not None:
+                matched = node.route
+
+        return matched
+
+
 class ProxyRouter:
     """Router interface for the proxy to use."""
 
@@ -27,8 +85,8 @@ class ProxyRouter:
         self._route_table_populated = False
 
         # Info used for HTTP proxy
-        # Routes sorted in order of decreasing length.
-        self.sorted_routes: List[str] = list()
+        # Index of the routes for longest prefix matching.
+        self.route_trie: RouteTrie = RouteTrie()
         # Endpoints associated with the routes.
         self.route_info: Dict[str, DeploymentID] = dict()
         # Map of application name to is_cross_language.
@@ -77,11 +135,11 @@ class ProxyRouter:
         self.endpoints = endpoints
 
         existing_handles = set(self.handles.keys())
-        routes = []
+        route_trie = RouteTrie()
         route_info = {}
         app_to_is_cross_language = {}
         for endpoint, info in endpoints.items():
-            routes.append(info.route)
+            route_trie.insert(info.route)
             route_info[info.route] = endpoint
             app_to_is_cross_language[endpoint.app_name] = info.app_is_cross_language
             if endpoint in self.handles:
@@ -98,9 +156,7 @@ class ProxyRouter:
         for endpoint in existing_handles:
             del self.handles[endpoint]
 
-        # Routes are sorted in order of decreasing length to enable longest
-        # prefix matching.
-        self.sorted_routes = sorted(routes, key=lambda x: len(x), reverse=True)
+        self.route_trie = route_trie
         self.route_info = route_info
         self.app_to_is_cross_language = app_to_is_cross_language
 
@@ -114,31 +170,16 @@ class ProxyRouter:
             (route, handle, is_cross_language) if found, else None.
         """
 
-        for route in self.sorted_routes:
-            if target_route.startswith(route):
-                matched = False
-                # If the route we matched on ends in a '/', then so does the
-                # target route and this must be a match.
-                if route.endswith("/"):
-                    matched = True
-                # If the route we matched on doesn't end in a '/', we need to
-                # do another check to ensure that either this is an exact match
-                # or the next character in the target route is a '/'. This is
-                # to guard against the scenario where we have '/route' as a
-                # prefix and there's a request to '/routesuffix'. In this case,
-                # it should *not* be a match.
-                elif len(target_route) == len(route) or target_route[len(route)] == "/":
-                    matched = True
-
-                if matched:
-                    endpoint = self.route_info[route]
-                    return (
-                        route,
-                        self.handles[endpoint],
-                        self.app_to_is_cross_language[endpoint.app_name],
-                    )
+        route = self.route_trie.longest_match(target_route)
+        if route is None:
+            return None
 
-        return None
+        endpoint = self.route_info[route]
+        return (
+            route,
+            self.handles[endpoint],
+            self.app_to_is_cross_language[endpoint.app_name],
+        )
 
     def get_handle_for_endpoint(
         self, target_app_name: str
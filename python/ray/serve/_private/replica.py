@@ -20,6 +20,7 @@ from typing import (
     Callable,
     Dict,
     Generator,
+    List,
     Optional,
     Tuple,
     Union,
@@ -95,6 +96,7 @@ from ray.serve.exceptions import (
     DeploymentUnavailableError,
     RayServeException,
 )
+from ray.serve.grpc_util import RayServegRPCContext
 from ray.serve.schema import LoggingConfig
 
 logger = logging.getLogger(SERVE_LOGGER_NAME)
@@ -559,6 +561,12 @@ class ReplicaBase(ABC):
         """
         call_user_method_future = None
         wait_for_message_task = None
+        max_grpc_batch_size = None
+        if request_metadata.is_grpc_request and isinstance(
+            request_args[0], gRPCRequest
+        ):
+            max_grpc_batch_size = request_args[0].max_stream_batch_size
+
         try:
             result_queue = MessageQueue()
 
@@ -604,6 +612,11 @@ class ReplicaBase(ABC):
                                 status_code_callback(str(msg["status"]))
 
                         yield pickle.dumps(messages)
+                    elif max_grpc_batch_size:
+                        # gRPC messages are also only consumed by the proxy, so send
+                        # them in bounded batches to avoid one object per message.
+                        for i in range(0, len(messages), max_grpc_batch_size):
+                            yield messages[i : i + max_grpc_batch_size]
                     else:
                         for msg in messages:
                             yield msg
@@ -1073,6 +1086,18 @@ class ReplicaActor:
 
         return result
 
+    def _serialize_grpc_result(
+        self, request_metadata: RequestMetadata, result: Any
+    ) -> Tuple[RayServegRPCContext, Union[bytes, List[bytes]]]:
+        """Serialize a gRPC response message or a batch of them (a list)."""
+        if isinstance(result, list):
+            return (
+                request_metadata.grpc_context,
+                [message.SerializeToString() for message in result],
+            )
+
+        return (request_metadata.grpc_context, result.SerializeToString())
+
     async def handle_request_streaming(
         self,
         pickled_request_metadata: bytes,
@@ -1087,7 +1112,7 @@ class ReplicaActor:
             request_metadata, *request_args, **request_kwargs
         ):
             if request_metadata.is_grpc_request:
-                result = (request_metadata.grpc_context, result.SerializeToString())
+                result = self._serialize_grpc_result(request_metadata, result)
 
             yield result
 
@@ -1119,7 +1144,7 @@ class ReplicaActor:
                 yield pickle.dumps(result)
             else:
                 if request_metadata.is_grpc_request:
-                    result = (request_metadata.grpc_context, result.SerializeToString())
+                    result = self._serialize_grpc_result(request_metadata, result)
 
                 yield result
 
@@ -0,0 +1,102 @@
+import math
+import threading
+from collections import defaultdict, deque
+from typing import DefaultDict, Deque, Dict, Optional, Tuple
+
+from ray.serve._private.constants import (
+    RAY_SERVE_HANDLE_HEDGING_BUDGET_RATIO,
+    RAY_SERVE_HANDLE_HEDGING_MIN_SAMPLES,
+    RAY_SERVE_HANDLE_HEDGING_WINDOW_SIZE,
+)
+
+
+class RequestHedger:
+    """Tracks request latencies and the hedging budget of a router.
+
+    A request is hedged (duplicated to another replica) once it has been running
+    for longer than a percentile of the recent latencies of its method.
+
+    To cap the extra load, every request earns `budget_ratio` hedging tokens and
+    every hedge spends one. The number of tokens is capped so that an idle period
+    can't be followed by a burst of hedges.
+
+    This class is thread safe.
+    """
+
+    # Number of new latencies after which the cached hedging delay is recomputed.
+    _RECOMPUTE_DELAY_EVERY_N_SAMPLES = 10
+
+    def __init__(
+        self,
+        *,
+        budget_ratio: Optional[float] = None,
+        window_size: Optional[int] = None,
+        min_samples: Optional[int] = None,
+    ):
+        if budget_ratio is None:
+            budget_ratio = RAY_SERVE_HANDLE_HEDGING_BUDGET_RATIO
+        if window_size is None:
+            window_size = RAY_SERVE_HANDLE_HEDGING_WINDOW_SIZE
+        if min_samples is None:
+            min_samples = RAY_SERVE_HANDLE_HEDGING_MIN_SAMPLES
+
+        self._budget_ratio = budget_ratio
+        self._min_samples = max(1, min_samples)
+        self._max_tokens = max(1.0, budget_ratio * window_size)
+        self._tokens = 0.0
+
+        self._latencies_s: DefaultDict[str, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=window_size)
+        )
+        self._num_samples: DefaultDict[str, int] = defaultdict(int)
+        # (method, percentile) -> (number of samples when computed, delay).
+        self._cached_delays_s: Dict[Tuple[str, float], Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def on_request(self):
+        """Earns hedging tokens for a new request."""
+        with self._lock:
+            self._tokens = min(self._max_tokens, self._tokens + self._budget_ratio)
+
+    def has_budget(self) -> bool:
+        with self._lock:
+            return self._tokens >= 1
+
+    def try_acquire_hedge(self) -> bool:
+        """Spends a hedging token. Returns `False` if there are none left."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+
+            self._tokens -= 1
+            return True
+
+    def record_latency(self, method_name: str, latency_s: float):
+        with self._lock:
+            self._latencies_s[method_name].append(latency_s)
+            self._num_samples[method_name] += 1
+
+    def get_hedge_delay_s(self, method_name: str, percentile: float) -> Optional[float]:
+        """Returns how long to wait before hedging a request to the method.
+
+        Returns `None` if not enough latencies have been recorded yet.
+        """
+        with self._lock:
+            latencies_s = self._latencies_s.get(method_name)
+            if latencies_s is None or len(latencies_s) < self._min_samples:
+                return None
+
+            num_samples = self._num_samples[method_name]
+            key = (method_name, percentile)
+            cached = self._cached_delays_s.get(key)
+            if (
+                cached is None
+                or num_samples - cached[0] >= self._RECOMPUTE_DELAY_EVERY_N_SAMPLES
+            ):
+                sorted_latencies_s = sorted(latencies_s)
+                index = math.ceil(percentile / 100 * len(sorted_latencies_s)) - 1
+                delay_s = sorted_latencies_s[max(0, index)]
+                cached = (num_samples, delay_s)
+                self._cached_delays_s[key] = cached
+
+            return cached[1]
@@ -22,6 +22,8 @@ class RequestRoutingContext:
     tried_same_node: bool = False
     tried_same_az: bool = False
     should_backoff: bool = False
+    # Replicas to avoid, e.g. the replica that a hedged request was first sent to.
+    excluded_replica_ids: Set[ReplicaID] = field(default_factory=set)
 
 
 @PublicAPI(stability="alpha")
@@ -0,0 +1,235 @@
+import logging
+import math
+import random
+import time
+from dataclasses import dataclass
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
+
+from ray.serve._private.common import ReplicaID
+from ray.serve._private.constants import (
+    SERVE_LOGGER_NAME,
+)
+from ray.serve._private.replica_result import ReplicaResult
+from ray.serve._private.request_router.common import (
+    PendingRequest,
+)
+from ray.serve._private.request_router.replica_wrapper import (
+    RunningReplica,
+)
+from ray.serve._private.request_router.request_router import (
+    FIFOMixin,
+    LocalityMixin,
+    MultiplexMixin,
+    RequestRouter,
+)
+
+logger = logging.getLogger(SERVE_LOGGER_NAME)
+
+
+@dataclass
+class ReplicaLatencyStats:
+    """Latency statistics tracked by the router for a single replica."""
+
+    ewma_latency_s: Optional[float] = None
+    """Peak-sensitive EWMA of observed request latencies, `None` until sampled."""
+
+    last_update_s: float = 0.0
+    """Timestamp of the last latency sample."""
+
+    num_in_flight: int = 0
+    """Number of requests sent by this router that haven't completed yet."""
+
+    def record_latency(self, latency_s: float, now_s: float, decay_s: float):
+        """Fold a new latency sample into the EWMA.
+
+        Samples above the current average replace it outright ("peak" EWMA) so
+        the router reacts immediately to a replica slowing down, while decreases
+        decay towards the sample with a time-based weight.
+        """
+        if self.ewma_latency_s is None or latency_s > self.ewma_latency_s:
+            self.ewma_latency_s = latency_s
+        else:
+            elapsed_s = max(now_s - self.last_update_s, 0.0)
+            weight = math.exp(-elapsed_s / decay_s)
+            self.ewma_latency_s = self.ewma_latency_s * weight + latency_s * (
+                1 - weight
+            )
+        self.last_update_s = now_s
+
+
+class LeastLatencyRequestRouter(
+    FIFOMixin, LocalityMixin, MultiplexMixin, RequestRouter
+):
+    """Chooses replicas with the lowest expected completion time ("peak EWMA").
+
+    Requests are routed in FIFO order.
+
+    For every replica, the router tracks a peak-sensitive exponentially weighted
+    moving average of the latency of requests it routed there as well as the
+    number of those requests that are still in flight. The expected completion
+    time of a new request on a replica is estimated as
+    `ewma_latency * (num_outstanding + 1)`, where the number of outstanding
+    requests is the larger of the local in-flight count and the cached queue
+    length reported by the replica.
+
+    Like the power of two choices procedure, two candidate replicas are sampled
+    randomly (after applying multiplexing and locality preferences) and they are
+    ranked by expected completion time, so replicas on slower hardware receive
+    proportionally fewer requests without all routers herding onto the single
+    fastest replica.
+
+    Replicas without any latency samples use the replica's reported
+    `routing_stats[routing_stats_latency_key]` if present, else the average of
+    the known replicas, so newly added replicas are neither starved nor flooded.
+    Before any latency is known, `default_latency_s` is used, so replicas are
+    ranked by their queue lengths.
+    """
+
+    latency_decay_s: float = 10.0
+    """Time constant of the EWMA decay when latencies improve."""
+
+    routing_stats_latency_key: str = "latency_s"
+    """Key in a replica's routing stats used as its prior latency estimate."""
+
+    default_latency_s: float = 0.01
+    """Prior latency estimate used when no replica has a known latency."""
+
+    def __init__(
+        self,
+        *args,
+        get_curr_time_s: Optional[Callable[[], float]] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, get_curr_time_s=get_curr_time_s, **kwargs)
+        self._get_curr_time_s = (
+            get_curr_time_s if get_curr_time_s is not None else time.time
+        )
+        self._replica_latency_stats: Dict[ReplicaID, ReplicaLatencyStats] = {}
+
+    @property
+    def replica_latency_stats(self) -> Dict[ReplicaID, ReplicaLatencyStats]:
+        """Latency statistics for each replica known to this router."""
+        return self._replica_latency_stats
+
+    def update_replicas(self, replicas: List[RunningReplica]):
+        """Update the replica set, dropping stats for replicas that went away."""
+        super().update_replicas(replicas)
+        for replica_id in list(self._replica_latency_stats.keys()):
+            if replica_id not in self._replica_id_set:
+                del self._replica_latency_stats[replica_id]
+
+    def on_replica_actor_died(self, replica_id: ReplicaID):
+        super().on_replica_actor_died(replica_id)
+        self._replica_latency_stats.pop(replica_id, None)
+
+    def _get_prior_latency_s(self, replica: RunningReplica) -> float:
+        routing_stats = getattr(replica, "routing_stats", None) or {}
+        prior = routing_stats.get(self.routing_stats_latency_key)
+        if prior is not None:
+            return float(prior)
+
+        known = [
+            stats.ewma_latency_s
+            for stats in self._replica_latency_stats.values()
+            if stats.ewma_latency_s is not None
+        ]
+        return sum(known) / len(known) if known else self.default_latency_s
+
+    def expected_completion_time_s(self, replica: RunningReplica) -> float:
+        """Estimated time for a new request routed to the replica to complete."""
+        stats = self._replica_latency_stats.get(replica.replica_id)
+        num_in_flight = 0
+        latency_s = None
+        if stats is not None:
+            num_in_flight = stats.num_in_flight
+            latency_s = stats.ewma_latency_s
+        if latency_s is None:
+            latency_s = self._get_prior_latency_s(replica)
+
+        queue_len = self._replica_queue_len_cache.get(replica.replica_id)
+        num_outstanding = max(num_in_flight, queue_len or 0)
+        return latency_s * (num_outstanding + 1)
+
+    async def choose_replicas(
+        self,
+        candidate_replicas: List[RunningReplica],
+        pending_request: Optional[PendingRequest] = None,
+    ) -> List[List[RunningReplica]]:
+        """Sample two available replicas and rank them by expected completion time.
+
+        Each returned rank contains a single replica so the lowest-cost replica is
+        always attempted first; the other one is only used if its queue is full.
+        """
+        if (
+            pending_request is not None
+            and pending_request.metadata.multiplexed_model_id
+        ):
+            candidate_replica_ids = self.apply_multiplex_routing(
+                pending_request=pending_request,
+            )
+        else:
+            candidate_replica_ids = self.apply_locality_routing(
+                pending_request=pending_request,
+            )
+
+        if not candidate_replica_ids:
+            return []
+
+        chosen_ids = random.sample(
+            list(candidate_replica_ids),
+            k=min(2, len(candidate_replica_ids)),
+        )
+        replica_id_to_replica_map = {
+            replica.replica_id: replica for replica in candidate_replicas
+        }
+        chosen_replicas = sorted(
+            (replica_id_to_replica_map[chosen_id] for chosen_id in chosen_ids),
+            key=self.expected_completion_time_s,
+        )
+        return [[replica] for replica in chosen_replicas]
+
+    def on_request_routed(
+        self,
+        pending_request: PendingRequest,
+        replica_id: ReplicaID,
+        result: ReplicaResult,
+    ):
+        """Count the request as in flight and sample its latency on completion."""
+        # The replica rejected the request, it'll be routed again.
+        if result is None or replica_id not in self._replicas:
+            return
+
+        stats = self._replica_latency_stats.setdefault(
+            replica_id, ReplicaLatencyStats()
+        )
+        stats.num_in_flight += 1
+        start_time_s = self._get_curr_time_s()
+        loop = self._event_loop
+
+        def _on_completed(_):
+            # The callback runs on a core worker thread, so hop back to the loop
+            # that owns the router state before touching it.
+            loop.call_soon_threadsafe(
+                self._on_request_completed, replica_id, stats, start_time_s
+            )
+
+        result.add_done_callback(_on_completed)
+
+    def _on_request_completed(
+        self,
+        replica_id: ReplicaID,
+        stats: ReplicaLatencyStats,
+        start_time_s: float,
+    ):
+        stats.num_in_flight = max(stats.num_in_flight - 1, 0)
+        # Drop samples for replicas that were removed while the request ran.
+        if self._replica_latency_stats.get(replica_id) is not stats:
+            return
+
+        now_s = self._get_curr_time_s()
+        stats.record_latency(now_s - start_time_s, now_s, self.latency_decay_s)
@@ -1,13 +1,22 @@
 # These imports are used for metrics tracking, will remove for PR
+import asyncio
 import logging
+import random
 import time
+from collections import defaultdict
+from dataclasses import dataclass
 from typing import (
+    Any,
+    Dict,
     List,
     Optional,
+    Tuple,
 )
 
 import ray
 from ray.llm._internal.serve.request_router.prefix_aware.prefix_tree import (
+    ChunkedPrefixTree,
+    ChunkedPrefixTreeActor,
     PrefixTreeActor,
 )
 from ray.serve._private.common import ReplicaID
@@ -33,6 +42,41 @@ from ray.serve._private.request_router.request_router import (
 logger = logging.getLogger(SERVE_LOGGER_NAME)
 
 
+@dataclass
+class ReplicaCostModel:
+    """Expected cost of routing a request to a replica.
+
+    The cost is expressed relative to the time it takes to prefill a whole prompt:
+
+        cost = queue_len_weight * queue_len
+             + prefill_weight * (1 - prefix_match_rate)
+             + kv_cache_weight * kv_cache_usage / (1 - kv_cache_usage)
+
+    The KV cache term grows sharply as the cache fills up, because new requests on
+    a replica with a full cache have to wait for memory or preempt running ones.
+    """
+
+    queue_len_weight: float = 0.1
+    """Cost of each request that is already queued or running on the replica."""
+
+    prefill_weight: float = 1.0
+    """Cost of prefilling the whole prompt without any cached prefix."""
+
+    kv_cache_weight: float = 0.5
+    """Weight of the KV cache pressure term."""
+
+    max_kv_cache_usage: float = 0.99
+    """KV cache usage is clipped to this value to keep the cost finite."""
+
+    def cost(self, queue_len: int, match_rate: float, kv_cache_usage: float) -> float:
+        kv_cache_usage = min(max(kv_cache_usage, 0.0), self.max_kv_cache_usage)
+        return (
+            self.queue_len_weight * queue_len
+            + self.prefill_weight * (1.0 - match_rate)
+            + self.kv_cache_weight * kv_cache_usage / (1.0 - kv_cache_usage)
+        )
+
+
 class PrefixAwarePow2ReplicaRouter(LocalityMixin, MultiplexMixin, RequestRouter):
     """Extends the PowerOfTwoChoicesRequestRouter with prefix-matching capabilities.
 
@@ -50,8 +94,19 @@ class PrefixAwarePow2ReplicaRouter(LocalityMixin, MultiplexMixin, RequestRouter)
 
     This approach improves performance by routing related requests to the same replicas,
     increasing cache locality and reducing overhead for language model inference.
+
+    If `tree_chunk_size` is set, the shared tree matches prefixes in chunks of that
+    many characters instead of character by character. With chunked trees, setting
+    `local_tree_sync_interval_s` makes each router keep a local copy of the tree
+    that is synced incrementally from the shared tree actor in the background, so
+    routing decisions don't need a round trip to the actor. Otherwise, the prompts of
+    requests that are routed concurrently are matched against the shared tree in one
+    call to the actor.
     """
 
+    max_prefix_match_batch_size: int = 256
+    """Maximum number of prompts matched against the shared tree in one call."""
+
     def __init__(
         self,
         *args,
@@ -62,16 +117,60 @@ class PrefixAwarePow2ReplicaRouter(LocalityMixin, MultiplexMixin, RequestRouter)
         eviction_target_chars=360_000,
         eviction_interval_secs=10,
         tree_actor=None,
+        tree_chunk_size=None,
+        local_tree_sync_interval_s=None,
+        local_tree_max_recorded_ops=100_000,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
-        if tree_actor is None:
+        if local_tree_sync_interval_s is not None and tree_chunk_size is None:
+            raise ValueError(
+                "`local_tree_sync_interval_s` requires `tree_chunk_size` to be set."
+            )
+
+        if tree_actor is not None:
+            self._tree_actor = tree_actor
+        elif tree_chunk_size is not None:
+            # Use a detached actor to avoid issues with actor lifetime since this is shared between routers
+            self._tree_actor = ChunkedPrefixTreeActor.options(
+                name="LlmChunkedPrefixTreeActor",
+                get_if_exists=True,
+                lifetime="detached",
+            ).remote(
+                chunk_size=tree_chunk_size,
+                max_recorded_ops=local_tree_max_recorded_ops,
+            )
+            # The actor is reused if another router already created it, so make
+            # sure it matches prefixes in chunks of the requested size.
+            actual_chunk_size = ray.get(self._tree_actor.get_chunk_size.remote())
+            if actual_chunk_size != tree_chunk_size:
+                raise ValueError(
+                    f"`tree_chunk_size` is {tree_chunk_size}, but the existing "
+                    "shared prefix tree actor 'LlmChunkedPrefixTreeActor' uses "
+                    f"chunks of {actual_chunk_size} characters. All routers must "
+                    "use the same `tree_chunk_size`."
+                )
+        else:
             # Use a detached actor to avoid issues with actor lifetime since this is shared between routers
             self._tree_actor = PrefixTreeActor.options(
                 name="LlmPrefixTreeActor", get_if_exists=True, lifetime="detached"
             ).remote()
-        else:
-            self._tree_actor = tree_actor
+
+        # === Local copy of the prefix tree ===
+        self._local_tree: Optional[ChunkedPrefixTree] = None
+        self._local_tree_sync_interval_s = local_tree_sync_interval_s
+        self._local_tree_seq = 0
+        self._local_tree_sync_task: Optional[asyncio.Task] = None
+        if local_tree_sync_interval_s is not None:
+            self._local_tree = ChunkedPrefixTree(chunk_size=tree_chunk_size)
+
+        # === Batched matching against the shared prefix tree ===
+        # (tree method name, input text, candidate replica IDs, future for the
+        # result) of prefix matches waiting to be sent to the tree actor.
+        self._queued_prefix_matches: List[
+            Tuple[str, str, List[str], asyncio.Future]
+        ] = []
+        self._prefix_match_flush_task: Optional[asyncio.Task] = None
 
         # === Prefix-aware routing logic hyperparameters ===
         self._imbalanced_threshold = imbalanced_threshold
@@ -182,16 +281,15 @@ class PrefixAwarePow2ReplicaRouter(LocalityMixin, MultiplexMixin, RequestRouter)
                     candidate_replica_ids_strings = [
                         r.replica_id.to_full_id_str() for r in candidate_replicas
                     ]
-                    (matched_text, matched_tenant_id_strings,) = ray.get(
-                        self._tree_actor.prefix_match.remote(
-                            input_text, candidate_replica_ids_strings
-                        )
+                    (
+                        matched_text,
+                        matched_tenant_id_strings,
+                    ) = await self._prefix_match(
+                        input_text, candidate_replica_ids_strings
                     )
                     match_rate = len(matched_text) / len(input_text)
                     if match_rate < self._match_rate_threshold:
-                        smallest_tenants_id_strings = ray.get(
-                            self._tree_actor.get_smallest_tenants.remote()
-                        )
+                        smallest_tenants_id_strings = self._get_smallest_tenants()
                         if (
                             smallest_tenants_id_strings is not None
                             and len(smallest_tenants_id_strings) > 0
@@ -203,16 +301,158 @@ class PrefixAwarePow2ReplicaRouter(LocalityMixin, MultiplexMixin, RequestRouter)
                             and len(matched_tenant_id_strings) > 0
                         ):
                             chosen_replica_id_strings = matched_tenant_id_strings
+        # Replicas may have been removed while waiting for the prefix match.
+        chosen_replica_ids = [
+            ReplicaID.from_full_id_str(chosen_id_string)
+            for chosen_id_string in chosen_replica_id_strings
+        ]
         return [
             [
-                self._replicas[ReplicaID.from_full_id_str(chosen_id_string)]
-                for chosen_id_string in chosen_replica_id_strings
+                self._replicas[replica_id]
+                for replica_id in chosen_replica_ids
+                if replica_id in self._replicas
             ]
         ]
 
+    async def _prefix_match(
+        self, input_text: str, candidate_replica_ids_strings: List[str]
+    ) -> Tuple[str, Optional[List[str]]]:
+        if self._local_tree is not None:
+            return self._local_tree.prefix_match(
+                input_text, candidate_replica_ids_strings
+            )
+
+        return await self._queue_prefix_match(
+            "prefix_match", input_text, candidate_replica_ids_strings
+        )
+
+    async def _prefix_match_lengths(
+        self, input_text: str, candidate_replica_ids_strings: List[str]
+    ) -> Dict[str, int]:
+        if self._local_tree is not None:
+            return self._local_tree.prefix_match_lengths(
+                input_text, candidate_replica_ids_strings
+            )
+
+        return await self._queue_prefix_match(
+            "prefix_match_lengths", input_text, candidate_replica_ids_strings
+        )
+
+    async def _queue_prefix_match(
+        self,
+        method_name: str,
+        input_text: str,
+        candidate_replica_ids_strings: List[str],
+    ) -> Any:
+        """Queues a match against the shared tree and waits for its result.
+
+        The match is sent to the tree actor together with the matches of the
+        other requests that are being routed at the same time, using the batched
+        variant of the tree method `method_name`.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queued_prefix_matches.append(
+            (method_name, input_text, candidate_replica_ids_strings, future)
+        )
+        if self._prefix_match_flush_task is None:
+            self._prefix_match_flush_task = loop.create_task(
+                self._flush_prefix_matches()
+            )
+        return await future
+
+    async def _flush_prefix_matches(self):
+        """Sends the queued prefix matches to the tree actor in batches.
+
+        Matches queued while a batch is in flight are sent in the next batch.
+        """
+        batch = []
+        try:
+            while self._queued_prefix_matches:
+                batch = self._queued_prefix_matches[: self.max_prefix_match_batch_size]
+                del self._queued_prefix_matches[: len(batch)]
+                batch_by_method = defaultdict(list)
+                for method_name, input_text, replica_ids, future in batch:
+                    batch_by_method[method_name].append(
+                        (input_text, replica_ids, future)
+                    )
+                await asyncio.gather(
+                    *[
+                        self._send_prefix_match_batch(method_name, method_batch)
+                        for method_name, method_batch in batch_by_method.items()
+                    ]
+                )
+        finally:
+            self._prefix_match_flush_task = None
+            # Only reached with unresolved matches if this task was cancelled.
+            for *_, future in batch + self._queued_prefix_matches:
+                if not future.done():
+                    future.cancel()
+            self._queued_prefix_matches = []
+
+    async def _send_prefix_match_batch(
+        self,
+        method_name: str,
+        batch: List[Tuple[str, List[str], asyncio.Future]],
+    ):
+        try:
+            results = await getattr(self._tree_actor, f"{method_name}_batch").remote(
+                [input_text for input_text, _, _ in batch],
+                [replica_ids for _, replica_ids, _ in batch],
+            )
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def _get_smallest_tenants(self) -> Optional[List[str]]:
+        if self._local_tree is not None:
+            return self._local_tree.get_smallest_tenants()
+
+        return ray.get(self._tree_actor.get_smallest_tenants.remote())
+
+    def _maybe_start_local_tree_sync_task(self):
+        if self._local_tree is not None and self._local_tree_sync_task is None:
+            self._local_tree_sync_task = asyncio.get_running_loop().create_task(
+                self._run_local_tree_sync_loop()
+            )
+
+    async def _sync_local_tree(self):
+        """Apply the changes made to the shared tree since the last sync."""
+        next_seq, ops = await self._tree_actor.get_updates.remote(self._local_tree_seq)
+        if ops is None:
+            # The local tree fell too far behind, replace it with a snapshot.
+            state = await self._tree_actor.get_state.remote()
+            self._local_tree.set_state(state)
+            self._local_tree_seq = state["_next_op_seq"]
+        else:
+            self._local_tree.apply_updates(ops)
+            self._local_tree_seq = next_seq
+
+    def _stop_local_tree_sync_task(self):
+        if self._local_tree_sync_task is not None:
+            self._local_tree_sync_task.cancel()
+            self._local_tree_sync_task = None
+
+    async def _run_local_tree_sync_loop(self):
+        while True:
+            try:
+                await self._sync_local_tree()
+            except Exception:
+                logger.exception("Failed to sync the local prefix tree.")
+
+            await asyncio.sleep(self._local_tree_sync_interval_s)
+
     def on_replica_actor_died(self, replica_id: ReplicaID):
         """Drop replica from replica set so it's not considered for future requests."""
         super().on_replica_actor_died(replica_id)
+        if self._local_tree is not None:
+            self._local_tree.remove_tenants([replica_id.to_full_id_str()])
         ray.get(self._tree_actor.remove_tenants.remote([replica_id.to_full_id_str()]))
 
     def update_replicas(self, replicas: List[RunningReplica]):
@@ -235,12 +475,21 @@ class PrefixAwarePow2ReplicaRouter(LocalityMixin, MultiplexMixin, RequestRouter)
         # 4) Update the prefix tree with the changes
         if added:
             added_strings = [rid.to_full_id_str() for rid in added]
-            ray.get(self._tree_actor.add_tenants.remote(added_strings, time.time()))
+            now = time.time()
+            if self._local_tree is not None:
+                self._local_tree.add_tenants(added_strings, now)
+            ray.get(self._tree_actor.add_tenants.remote(added_strings, now))
 
         if removed:
             removed_strings = [rid.to_full_id_str() for rid in removed]
+            if self._local_tree is not None:
+                self._local_tree.remove_tenants(removed_strings)
             ray.get(self._tree_actor.remove_tenants.remote(removed_strings))
 
+        # The local tree is synced again when routing to the next replica set.
+        if not new_ids:
+            self._stop_local_tree_sync_task()
+
         # === Start tasks (if enabled and not already running) ===
         if self._do_eviction and not self._eviction_loop_running:
             ray.get(
@@ -265,6 +514,8 @@ class PrefixAwarePow2ReplicaRouter(LocalityMixin, MultiplexMixin, RequestRouter)
         model ID are available after that timeout, it will fall back to the regular
         procedure.
         """
+        self._maybe_start_local_tree_sync_task()
+
         # Get fallback replicas from PowerOfTwoChoicesRequestRouter
         fallback_replicas = await PowerOfTwoChoicesRequestRouter.choose_replicas(
             self,
@@ -306,6 +557,20 @@ class PrefixAwarePow2ReplicaRouter(LocalityMixin, MultiplexMixin, RequestRouter)
 
         return fallback_replicas
 
+    def _cancel_prefix_matches(self):
+        if self._prefix_match_flush_task is not None:
+            self._prefix_match_flush_task.cancel()
+            self._prefix_match_flush_task = None
+        for *_, future in self._queued_prefix_matches:
+            future.cancel()
+        self._queued_prefix_matches = []
+
+    def shutdown(self):
+        """Stop syncing the local prefix tree and cancel the queued prefix
+        matches when the router shuts down."""
+        self._stop_local_tree_sync_task()
+        self._cancel_prefix_matches()
+
     def on_request_routed(
         self,
         pending_request: PendingRequest,
@@ -326,8 +591,192 @@ class PrefixAwarePow2ReplicaRouter(LocalityMixin, MultiplexMixin, RequestRouter)
             input_text = self._extract_text_from_request(pending_request)
             if input_text is not None:
                 # Insert into prefix tree
-                ray.get(
-                    self._tree_actor.insert.remote(
-                        input_text, replica_id.to_full_id_str(), time.time()
+                replica_id_string = replica_id.to_full_id_str()
+                now = time.time()
+                if self._local_tree is not None:
+                    # Update the local tree right away, the shared tree is updated
+                    # asynchronously to keep the actor call off the routing path.
+                    self._local_tree.insert(input_text, replica_id_string, now)
+                    self._tree_actor.insert.remote(input_text, replica_id_string, now)
+                else:
+                    ray.get(
+                        self._tree_actor.insert.remote(
+                            input_text, replica_id_string, now
+                        )
                     )
-                )
+
+
+class KVCacheAwarePrefixReplicaRouter(PrefixAwarePow2ReplicaRouter):
+    """Routes each request to the replica with the lowest expected cost.
+
+    Instead of switching between prefix matching and power of two choices based on
+    thresholds, up to `max_replicas_to_score` candidate replicas (the ones with the
+    longest prefix matches, then random ones) are scored with a `ReplicaCostModel`
+    that combines:
+       - the length of the prompt prefix cached on the replica, from the prefix tree,
+       - the replica's queue length, and
+       - the replica's KV cache usage, as reported by the engine through
+         `record_routing_stats` under the `kv_cache_usage` key.
+
+    Replicas are attempted in increasing order of cost. Replicas that don't report
+    their KV cache usage are assumed to have an empty cache. Since routing stats are
+    only refreshed every `request_routing_stats_period_s`, deployments using this
+    router should set it to a few seconds or less.
+
+    Requests without a prompt are routed with the power of two choices procedure.
+    The prefix tree is maintained the same way as in `PrefixAwarePow2ReplicaRouter`.
+    """
+
+    routing_stats_kv_cache_usage_key: str = "kv_cache_usage"
+    """Key in a replica's routing stats that holds its KV cache usage in [0, 1]."""
+
+    max_replicas_to_score: int = 4
+    """Maximum number of candidate replicas scored for a request. These are the
+    replicas with the longest prefix matches, filled up with random replicas, so
+    the queue lengths of at most this many replicas are probed per request."""
+
+    def __init__(
+        self,
+        *args,
+        queue_len_weight=0.1,
+        prefill_weight=1.0,
+        kv_cache_weight=0.5,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self._cost_model = ReplicaCostModel(
+            queue_len_weight=queue_len_weight,
+            prefill_weight=prefill_weight,
+            kv_cache_weight=kv_cache_weight,
+        )
+
+    def replica_cost(
+        self, replica: RunningReplica, queue_len: int, match_rate: float
+    ) -> float:
+        """Expected cost of routing a request to the replica, see `ReplicaCostModel`."""
+        routing_stats = getattr(replica, "routing_stats", None) or {}
+        kv_cache_usage = float(
+            routing_stats.get(self.routing_stats_kv_cache_usage_key, 0.0)
+        )
+        return self._cost_model.cost(queue_len, match_rate, kv_cache_usage)
+
+    async def _get_queue_lens(
+        self, candidate_replicas: List[RunningReplica]
+    ) -> Dict[RunningReplica, int]:
+        """Returns the queue length of each replica that can accept a request.
+
+        Uses the queue length cache if enabled and probes the remaining replicas.
+        """
+        queue_lens: Dict[RunningReplica, int] = {}
+        not_in_cache: List[RunningReplica] = []
+        if self._use_replica_queue_len_cache:
+            for r in candidate_replicas:
+                queue_len = self._replica_queue_len_cache.get(r.replica_id)
+                if queue_len is None or queue_len >= r.max_ongoing_requests:
+                    not_in_cache.append(r)
+                else:
+                    queue_lens[r] = queue_len
+        else:
+            not_in_cache = candidate_replicas
+
+        if len(not_in_cache) > 0:
+            for r, queue_len in await self._probe_queue_lens(not_in_cache, 0):
+                if queue_len is not None and queue_len < r.max_ongoing_requests:
+                    queue_lens[r] = queue_len
+
+        return queue_lens
+
+    async def _rank_replicas_by_cost(
+        self,
+        pending_request: PendingRequest,
+        candidate_replicas: List[RunningReplica],
+    ) -> List[RunningReplica]:
+        input_text = self._extract_text_from_request(pending_request)
+        match_lengths = await self._prefix_match_lengths(
+            input_text, [r.replica_id.to_full_id_str() for r in candidate_replicas]
+        )
+
+        # Only score the replicas with the longest prefix matches and random
+        # others, like the power of two choices procedure, so that routing a
+        # request doesn't probe the queue length of every replica.
+        candidate_replicas = list(candidate_replicas)
+        random.shuffle(candidate_replicas)
+        candidate_replicas.sort(
+            key=lambda r: match_lengths.get(r.replica_id.to_full_id_str(), 0),
+            reverse=True,
+        )
+        queue_lens = await self._get_queue_lens(
+            candidate_replicas[: self.max_replicas_to_score]
+        )
+        if not queue_lens:
+            return []
+
+        costs: Dict[RunningReplica, float] = {}
+        for replica, queue_len in queue_lens.items():
+            match_rate = (
+                match_lengths.get(replica.replica_id.to_full_id_str(), 0)
+                / len(input_text)
+                if input_text
+                else 0.0
+            )
+            costs[replica] = self.replica_cost(replica, queue_len, match_rate)
+
+        # Shuffle so that ties are broken randomly.
+        ranked = list(costs)
+        random.shuffle(ranked)
+        ranked.sort(key=costs.__getitem__)
+        return ranked
+
+    async def choose_replicas(
+        self,
+        candidate_replicas: List[RunningReplica],
+        pending_request: Optional[PendingRequest] = None,
+    ) -> List[List[RunningReplica]]:
+        """Ranks the candidate replicas by expected cost, one replica per rank.
+
+        Multiplexing and locality preferences are applied before ranking. Falls
+        back to the power of two choices procedure for requests without a prompt
+        or if no candidate replica can currently accept the request.
+        """
+        self._maybe_start_local_tree_sync_task()
+
+        if (
+            pending_request is None
+            or pending_request.args is None
+            or len(pending_request.args) == 0
+        ):
+            return await PowerOfTwoChoicesRequestRouter.choose_replicas(
+                self,
+                candidate_replicas=candidate_replicas,
+                pending_request=pending_request,
+            )
+
+        if pending_request.metadata.multiplexed_model_id:
+            candidate_replica_ids = self.apply_multiplex_routing(
+                pending_request=pending_request,
+            )
+        else:
+            candidate_replica_ids = self.apply_locality_routing(
+                pending_request=pending_request,
+            )
+        if not candidate_replica_ids:
+            return []
+
+        replica_id_to_replica_map = {
+            replica.replica_id: replica for replica in candidate_replicas
+        }
+        ranked_replicas = await self._rank_replicas_by_cost(
+            pending_request,
+            [
+                replica_id_to_replica_map[candidate_replica_id]
+                for candidate_replica_id in candidate_replica_ids
+            ],
+        )
+        if not ranked_replicas:
+            return await PowerOfTwoChoicesRequestRouter.choose_replicas(
+                self,
+                candidate_replicas=candidate_replicas,
+                pending_request=pending_request,
+            )
+
+        return [[replica] for replica in ranked_replicas]
@@ -13,7 +13,11 @@ from ray.serve._private.common import (
     ReplicaQueueLengthInfo,
     RunningReplicaInfo,
 )
-from ray.serve._private.constants import SERVE_LOGGER_NAME
+from ray.serve._private.constants import (
+    RAY_SERVE_GRPC_STREAMING_BACKPRESSURE_NUM_BATCHES,
+    RAY_SERVE_GRPC_STREAMING_MAX_BATCH_SIZE,
+    SERVE_LOGGER_NAME,
+)
 from ray.serve._private.replica_result import ActorReplicaResult, ReplicaResult
 from ray.serve._private.request_router.common import PendingRequest
 from ray.serve._private.utils import JavaActorHandleProxy
@@ -81,16 +85,28 @@ class ActorReplicaWrapper(ReplicaWrapper):
         self, pr: PendingRequest, *, with_rejection: bool
     ) -> Union[ObjectRef, ObjectRefGenerator]:
         """Send the request to a Python replica."""
+        streaming_options = {"num_returns": "streaming"}
+        if (
+            pr.metadata.is_grpc_request
+            and pr.metadata.is_streaming
+            and RAY_SERVE_GRPC_STREAMING_MAX_BATCH_SIZE > 0
+        ):
+            # The replica sends batched gRPC messages, so bound how far it can run
+            # ahead of the proxy.
+            streaming_options[
+                "_generator_backpressure_num_objects"
+            ] = RAY_SERVE_GRPC_STREAMING_BACKPRESSURE_NUM_BATCHES
+
         if with_rejection:
             # Call a separate handler that may reject the request.
             # This handler is *always* a streaming call and the first message will
             # be a system message that accepts or rejects.
             method = self._actor_handle.handle_request_with_rejection.options(
-                num_returns="streaming"
+                **streaming_options
             )
         elif pr.metadata.is_streaming:
             method = self._actor_handle.handle_request_streaming.options(
-                num_returns="streaming"
+                **streaming_options
             )
         else:
             method = self._actor_handle.handle_request
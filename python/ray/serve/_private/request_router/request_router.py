@@ -909,6 +909,18 @@ class RequestRouter(ABC):
                     )
 
                 replica_ranks = list(self._replicas.values())
+                excluded_replica_ids = (
+                    pending_request.routing_context.excluded_replica_ids
+                    if pending_request is not None
+                    else None
+                )
+                if excluded_replica_ids:
+                    # Fall back to all replicas if they're all excluded.
+                    replica_ranks = [
+                        r
+                        for r in replica_ranks
+                        if r.replica_id not in excluded_replica_ids
+                    ] or replica_ranks
                 chosen_replicas: List[
                     List[RunningReplica]
                 ] = await self.choose_replicas(
@@ -1131,3 +1143,10 @@ class RequestRouter(ABC):
         after a response is generated.
         """
         pass
+
+    def shutdown(self):
+        """Called when the router that owns this request router shuts down.
+
+        This is used to stop any background tasks started by the request router.
+        """
+        pass
@@ -44,6 +44,7 @@ from ray.serve._private.constants import (
 from ray.serve._private.long_poll import LongPollClient, LongPollNamespace
 from ray.serve._private.metrics_utils import InMemoryMetricsStore, MetricsPusher
 from ray.serve._private.replica_result import ReplicaResult
+from ray.serve._private.request_hedging import RequestHedger
 from ray.serve._private.request_router import PendingRequest, RequestRouter
 from ray.serve._private.request_router.pow_2_router import (
     PowerOfTwoChoicesRequestRouter,
@@ -412,6 +413,7 @@ class AsyncioRouter:
             self._request_router_initialized.set()
         self._resolve_request_arg_func = resolve_request_arg_func
         self._running_replicas: Optional[List[RunningReplicaInfo]] = None
+        self._request_hedger = RequestHedger()
 
         # Flipped to `True` once the router has received a non-empty
         # replica set at least once.
@@ -631,6 +633,7 @@ class AsyncioRouter:
         # never reject requests in this code path.
         if not self._enable_strict_max_ongoing_requests or r.is_cross_language:
             result, _ = await r.send_request(pr, with_rejection=False)
+            self.request_router.on_request_routed(pr, r.replica_id, result)
             return result, r.replica_id
 
         while True:
@@ -673,6 +676,140 @@ class AsyncioRouter:
             # process of choosing candidates replicas (i.e., for locality-awareness).
             r = await self.request_router._choose_replica_for_request(pr, is_retry=True)
 
+    def _track_request_sent_to_replica(
+        self, replica_result: ReplicaResult, replica_id: ReplicaID, response_id: str
+    ):
+        """Keep track of requests that have been sent out to replicas."""
+        if RAY_SERVE_COLLECT_AUTOSCALING_METRICS_ON_HANDLE:
+            _request_context = ray.serve.context._get_serve_request_context()
+            request_id: str = _request_context.request_id
+            self._metrics_manager.inc_num_running_requests_for_replica(replica_id)
+            callback = partial(
+                self._process_finished_request,
+                replica_id,
+                request_id,
+                response_id,
+            )
+            replica_result.add_done_callback(callback)
+
+    def _get_completion_future(self, replica_result: ReplicaResult) -> asyncio.Future:
+        """Returns a future on the router's loop that's set when the result is done.
+
+        Done callbacks may be called from other threads.
+        """
+        future = self._event_loop.create_future()
+
+        def _set_done():
+            if not future.done():
+                future.set_result(None)
+
+        replica_result.add_done_callback(
+            lambda _: self._event_loop.call_soon_threadsafe(_set_done)
+        )
+        return future
+
+    def _record_latency_on_completion(
+        self, replica_result: ReplicaResult, method_name: str, start_time_s: float
+    ):
+        def _record(_):
+            self._request_hedger.record_latency(method_name, time.time() - start_time_s)
+
+        replica_result.add_done_callback(_record)
+
+    async def _maybe_hedge_request(
+        self,
+        pr: PendingRequest,
+        replica_result: ReplicaResult,
+        replica_id: ReplicaID,
+        response_id: str,
+    ) -> ReplicaResult:
+        """Sends a duplicate of the request to another replica if it's slow.
+
+        If the request hasn't finished after the hedging delay of its method and
+        the hedging budget allows it, a duplicate is routed to a replica other
+        than `replica_id`. Whichever finishes first is returned and the other is
+        cancelled. Otherwise, `replica_result` is returned.
+        """
+        method_name = pr.metadata.call_method
+        start_time_s = time.time()
+        self._request_hedger.on_request()
+        delay_s = self._request_hedger.get_hedge_delay_s(
+            method_name, pr.metadata.hedge_after_percentile
+        )
+        if (
+            delay_s is None
+            or len(self.request_router.curr_replicas) < 2
+            or not self._request_hedger.has_budget()
+        ):
+            self._record_latency_on_completion(
+                replica_result, method_name, start_time_s
+            )
+            return replica_result
+
+        primary_done = self._get_completion_future(replica_result)
+        done, _ = await asyncio.wait([primary_done], timeout=delay_s)
+        if done or not self._request_hedger.try_acquire_hedge():
+            self._record_latency_on_completion(
+                replica_result, method_name, start_time_s
+            )
+            return replica_result
+
+        hedge_pr = PendingRequest(
+            args=pr.args,
+            kwargs=pr.kwargs,
+            metadata=pr.metadata,
+        )
+        hedge_pr.routing_context.excluded_replica_ids.add(replica_id)
+        hedge_task = self._event_loop.create_task(self.route_and_send_request(hedge_pr))
+        results = {primary_done: replica_result}
+        pending = {primary_done, hedge_task}
+        hedge_sent = False
+        winner = None
+        try:
+            while winner is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                if hedge_task in done:
+                    if hedge_task.exception() is not None:
+                        logger.warning(
+                            "Failed to send hedged request: "
+                            f"{hedge_task.exception()!r}."
+                        )
+                    else:
+                        hedge_sent = True
+                        hedge_result, hedge_replica_id = hedge_task.result()
+                        self._track_request_sent_to_replica(
+                            hedge_result, hedge_replica_id, response_id
+                        )
+                        hedge_done = self._get_completion_future(hedge_result)
+                        results[hedge_done] = hedge_result
+                        pending.add(hedge_done)
+
+                for future in done:
+                    if future in results:
+                        winner = results[future]
+                        break
+
+            self._request_hedger.record_latency(method_name, time.time() - start_time_s)
+            return winner
+        finally:
+            if not hedge_sent:
+
+                def _cancel_sent_hedge(task: asyncio.Task):
+                    # The hedged request was sent after the original one finished.
+                    if not task.cancelled() and task.exception() is None:
+                        task.result()[0].cancel()
+
+                # The task may still send the hedged request after it's cancelled
+                # if it was about to finish.
+                hedge_task.cancel()
+                hedge_task.add_done_callback(_cancel_sent_hedge)
+
+            for result in results.values():
+                if result is not winner:
+                    result.cancel()
+
     async def assign_request(
         self,
         request_meta: RequestMetadata,
@@ -711,30 +848,15 @@ class AsyncioRouter:
                 request_args, request_kwargs = await self._resolve_request_arguments(
                     request_meta, request_args, request_kwargs
                 )
-                replica_result, replica_id = await self.route_and_send_request(
-                    PendingRequest(
-                        args=list(request_args),
-                        kwargs=request_kwargs,
-                        metadata=request_meta,
-                    ),
+                pr = PendingRequest(
+                    args=list(request_args),
+                    kwargs=request_kwargs,
+                    metadata=request_meta,
+                )
+                replica_result, replica_id = await self.route_and_send_request(pr)
+                self._track_request_sent_to_replica(
+                    replica_result, replica_id, response_id
                 )
-
-                # Keep track of requests that have been sent out to replicas
-                if RAY_SERVE_COLLECT_AUTOSCALING_METRICS_ON_HANDLE:
-                    _request_context = ray.serve.context._get_serve_request_context()
-                    request_id: str = _request_context.request_id
-                    self._metrics_manager.inc_num_running_requests_for_replica(
-                        replica_id
-                    )
-                    callback = partial(
-                        self._process_finished_request,
-                        replica_id,
-                        request_id,
-                        response_id,
-                    )
-                    replica_result.add_done_callback(callback)
-
-                return replica_result
             except asyncio.CancelledError:
                 # NOTE(edoakes): this is not strictly necessary because
                 # there are currently no `await` statements between
@@ -744,7 +866,26 @@ class AsyncioRouter:
 
                 raise
 
+        # The request is running on a replica now, so it's no longer counted as
+        # pending assignment while waiting to hedge it.
+        if (
+            request_meta.hedge_after_percentile is not None
+            and not request_meta.is_streaming
+        ):
+            try:
+                replica_result = await self._maybe_hedge_request(
+                    pr, replica_result, replica_id, response_id
+                )
+            except asyncio.CancelledError:
+                # `_maybe_hedge_request` cancels the hedged request, if any.
+                replica_result.cancel()
+                raise
+
+        return replica_result
+
     async def shutdown(self):
+        if self._request_router is not None:
+            self._request_router.shutdown()
         await self._metrics_manager.shutdown()
 
 
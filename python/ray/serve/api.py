@@ -748,7 +748,10 @@ def delete(name: str, _blocking: bool = True):
 
 @PublicAPI(stability="beta")
 def multiplexed(
-    func: Optional[Callable[..., Any]] = None, max_num_models_per_replica: int = 3
+    func: Optional[Callable[..., Any]] = None,
+    max_num_models_per_replica: int = 3,
+    max_model_memory_bytes_per_replica: Optional[int] = None,
+    get_model_size_bytes: Optional[Callable[[Any], int]] = None,
 ):
     """Wrap a callable or method used to load multiplexed models in a replica.
 
@@ -766,6 +769,18 @@ def multiplexed(
     When the number of models in one replica is larger than max_num_models_per_replica,
     the models will be unloaded using an LRU policy.
 
+    If max_model_memory_bytes_per_replica is set, the total size of the models
+    (as reported by get_model_size_bytes) is bounded as well, and models are unloaded
+    using a GreedyDual-Size-Frequency policy that weighs each model's load time and
+    access frequency against its size, so that cheap, large, or rarely used models
+    are unloaded before expensive, small, or frequently used ones.
+
+    Models can be loaded ahead of requests by calling the decorated function with
+    `prefetch=True`, e.g., `await self.load_model(model_id, prefetch=True)`. This
+    schedules the load in the background and returns `None` immediately. Prefetching
+    never unloads other models; it's skipped if the model doesn't fit in the cache,
+    and the prefetched model is unloaded again if it turns out to be too large.
+
     If you want to release resources after the model is loaded, you can define
     a `__del__` method in your model class. The `__del__` method will be called when
     the model is unloaded.
@@ -808,6 +823,10 @@ def multiplexed(
             set it to a larger number if you have enough memory on
             the node resource, in opposite, you can set it to a smaller
             number if you want to save memory on the node resource.
+        max_model_memory_bytes_per_replica: the maximum total size in bytes of
+            the models loaded on each replica. By default, there is no limit.
+        get_model_size_bytes: a function that takes a loaded model and returns its
+            size in bytes. Required if max_model_memory_bytes_per_replica is set.
     """
 
     if func is not None:
@@ -836,9 +855,22 @@ def multiplexed(
     if max_num_models_per_replica != -1 and max_num_models_per_replica <= 0:
         raise ValueError("max_num_models_per_replica must be positive.")
 
+    if max_model_memory_bytes_per_replica is not None:
+        if not isinstance(max_model_memory_bytes_per_replica, int):
+            raise TypeError("max_model_memory_bytes_per_replica must be an integer.")
+
+        if max_model_memory_bytes_per_replica <= 0:
+            raise ValueError("max_model_memory_bytes_per_replica must be positive.")
+
+        if not callable(get_model_size_bytes):
+            raise ValueError(
+                "get_model_size_bytes must be provided when "
+                "max_model_memory_bytes_per_replica is set."
+            )
+
     def _multiplex_decorator(func: Callable):
         @wraps(func)
-        async def _multiplex_wrapper(*args):
+        async def _multiplex_wrapper(*args, prefetch: bool = False):
             args_check_error_msg = (
                 "Functions decorated with `@serve.multiplexed` must take exactly one"
                 "the multiplexed model ID (str), but got {}"
@@ -872,11 +904,20 @@ def multiplexed(
             # create a model multiplex wrapper and cache it in the multiplex object.
             if not hasattr(multiplex_object, multiplex_attr):
                 model_multiplex_wrapper = _ModelMultiplexWrapper(
-                    func, self, max_num_models_per_replica
+                    func,
+                    self,
+                    max_num_models_per_replica,
+                    max_model_memory_bytes_per_replica=(
+                        max_model_memory_bytes_per_replica
+                    ),
+                    get_model_size_bytes=get_model_size_bytes,
                 )
                 setattr(multiplex_object, multiplex_attr, model_multiplex_wrapper)
             else:
                 model_multiplex_wrapper = getattr(multiplex_object, multiplex_attr)
+            if prefetch:
+                model_multiplex_wrapper.prefetch([model_id])
+                return None
             return await model_multiplex_wrapper.load_model(model_id)
 
         return _multiplex_wrapper
@@ -164,7 +164,23 @@ class _DeploymentHandleBase:
                 "connected to a remote Ray cluster using Ray Client."
             )
 
+        hedge_after_percentile = kwargs.get("hedge_after_percentile", DEFAULT.VALUE)
+        if hedge_after_percentile not in (DEFAULT.VALUE, None) and not (
+            0 < hedge_after_percentile < 100
+        ):
+            raise ValueError(
+                "`hedge_after_percentile` must be between 0 and 100, "
+                f"got {hedge_after_percentile}."
+            )
+
         new_handle_options = self.handle_options.copy_and_update(**kwargs)
+        if (
+            new_handle_options.stream
+            and new_handle_options.hedge_after_percentile is not None
+        ):
+            raise ValueError(
+                "Hedging is not supported for streaming DeploymentHandle calls."
+            )
 
         # TODO(zcin): remove when _prefer_local_routing is removed from options() path
         if _prefer_local_routing != DEFAULT.VALUE:
@@ -679,6 +695,7 @@ class DeploymentHandle(_DeploymentHandleBase):
         method_name: Union[str, DEFAULT] = DEFAULT.VALUE,
         multiplexed_model_id: Union[str, DEFAULT] = DEFAULT.VALUE,
         stream: Union[bool, DEFAULT] = DEFAULT.VALUE,
+        hedge_after_percentile: Union[Optional[float], DEFAULT] = DEFAULT.VALUE,
         use_new_handle_api: Union[bool, DEFAULT] = DEFAULT.VALUE,
         _prefer_local_routing: Union[bool, DEFAULT] = DEFAULT.VALUE,
     ) -> "DeploymentHandle":
@@ -692,6 +709,14 @@ class DeploymentHandle(_DeploymentHandleBase):
                 method_name="other_method",
                 multiplexed_model_id="model:v1",
             ).remote()
+
+        Setting `hedge_after_percentile` enables hedging for unary calls (this is
+        experimental): if a call is still running after that percentile of the
+        recent latencies of the method, a duplicate is sent to another replica.
+        The first one to finish is used and the other is cancelled, so only use
+        it for idempotent methods. The extra requests are capped to
+        `RAY_SERVE_HANDLE_HEDGING_BUDGET_RATIO` (5% by default) of the requests
+        made through the handle.
         """
         if use_new_handle_api is not DEFAULT.VALUE:
             warnings.warn(
@@ -709,6 +734,7 @@ class DeploymentHandle(_DeploymentHandleBase):
             method_name=method_name,
             multiplexed_model_id=multiplexed_model_id,
             stream=stream,
+            hedge_after_percentile=hedge_after_percentile,
             _prefer_local_routing=_prefer_local_routing,
         )
 
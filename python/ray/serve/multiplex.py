@@ -3,7 +3,8 @@ import inspect
 import logging
 import time
 from collections import OrderedDict
-from typing import Any, Callable, List, Set
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set
 
 from ray.serve import metrics
 from ray.serve._private.common import ReplicaID, RequestRoutingInfo
@@ -19,6 +20,16 @@ from ray.serve.context import _get_global_client, _get_internal_replica_context
 logger = logging.getLogger(SERVE_LOGGER_NAME)
 
 
+@dataclass
+class _CachedModelInfo:
+    """Bookkeeping for a model in the multiplexed model cache."""
+
+    size_bytes: int
+    load_latency_s: float
+    num_accesses: int = 1
+    priority: float = 0.0
+
+
 class _ModelMultiplexWrapper:
     """A wrapper class that wraps the model load function and
     provides the LRU caching functionality.
@@ -32,6 +43,15 @@ class _ModelMultiplexWrapper:
     The model will be unloaded in the LRU order, the model multiplexer will call the
     model's __del__ attribute if it exists to clean up the model resources eagerly.
 
+    If `max_model_memory_bytes_per_replica` is set, the cache is additionally
+    bounded by the total size of the loaded models (as reported by
+    `get_model_size_bytes`) and models are evicted using the GreedyDual-Size-Frequency
+    policy instead of LRU: each model has a priority of
+    `inflation + num_accesses * load_latency / size`, the model with the lowest
+    priority is evicted first and the inflation value is raised to the evicted
+    priority so that models which are no longer accessed age out. This keeps small,
+    expensive-to-load, frequently used models resident over large, cheap or cold
+    ones.
     """
 
     _PUSH_MULTIPLEXED_MODEL_IDS_TASK_NAME = "push_multiplexed_model_ids"
@@ -41,6 +61,8 @@ class _ModelMultiplexWrapper:
         model_load_func: Callable[[str], Any],
         self_arg: Any,
         max_num_models_per_replica: int,
+        max_model_memory_bytes_per_replica: Optional[int] = None,
+        get_model_size_bytes: Optional[Callable[[Any], int]] = None,
     ):
         """Initialize the model multiplexer.
         Args:
@@ -49,6 +71,11 @@ class _ModelMultiplexWrapper:
             max_num_models_per_replica: the maximum number of models to be loaded on the
                 current replica. If it is -1, there is no limit for the number of models
                 per replica.
+            max_model_memory_bytes_per_replica: the maximum total size in bytes of the
+                models loaded on the current replica. If set, models are evicted using
+                the GreedyDual-Size-Frequency policy.
+            get_model_size_bytes: function that returns the size in bytes of a loaded
+                model. Required if `max_model_memory_bytes_per_replica` is set.
         """
 
         ServeUsageTag.MULTIPLEXED_API_USED.record("1")
@@ -57,6 +84,22 @@ class _ModelMultiplexWrapper:
         self._func: Callable = model_load_func
         self.self_arg: Any = self_arg
         self.max_num_models_per_replica: int = max_num_models_per_replica
+        self.max_model_memory_bytes_per_replica: Optional[
+            int
+        ] = max_model_memory_bytes_per_replica
+        self._get_model_size_bytes: Optional[
+            Callable[[Any], int]
+        ] = get_model_size_bytes
+
+        # Cache bookkeeping used by the size-aware eviction policy.
+        self._model_info: Dict[str, _CachedModelInfo] = {}
+        # Sizes of models seen so far (including unloaded ones). Used to make room
+        # for a model before it is loaded again.
+        self._known_model_sizes: Dict[str, int] = {}
+        self._total_model_bytes: int = 0
+        self._priority_inflation: float = 0.0
+        # Background tasks loading models via `prefetch`.
+        self._prefetch_tasks: Dict[str, asyncio.Task] = {}
 
         # log MODEL_LOAD_LATENCY_BUCKET_MS
         logger.debug(f"MODEL_LOAD_LATENCY_BUCKET_MS: {MODEL_LOAD_LATENCY_BUCKETS_MS}")
@@ -187,6 +230,7 @@ class _ModelMultiplexWrapper:
             # Move the model to the end of the OrderedDict to ensure LRU caching.
             model = self.models.pop(model_id)
             self.models[model_id] = model
+            self._record_model_access(model_id)
             return self.models[model_id]
         else:
             # Set the flag to push the multiplexed replica info to the controller
@@ -198,50 +242,213 @@ class _ModelMultiplexWrapper:
             async with self._model_cache_lock:
                 # Check if the model has been loaded by another request.
                 if model_id in self.models:
+                    # E.g., it was prefetched, which doesn't count as an access.
+                    self._record_model_access(model_id)
                     return self.models[model_id]
                 try:
                     # If the number of models per replica is specified, check
                     # if the number of models on the current replica has
                     # reached the limit.
-                    if (
-                        self.max_num_models_per_replica > 0
-                        and len(self.models) >= self.max_num_models_per_replica
+                    # If the model was loaded before, make room for it up front.
+                    if await self._evict_models_to_fit(
+                        num_models=1,
+                        num_bytes=self._known_model_sizes.get(model_id, 0),
                     ):
-                        # Unload the least recently used model.
-                        await self.unload_model_lru()
                         self._push_multiplexed_replica_info = True
 
-                    # Load the model.
-                    logger.info(f"Loading model '{model_id}'.")
-                    self.models_load_counter.inc()
-                    load_start_time = time.time()
-                    if self.self_arg is None:
-                        self.models[model_id] = await self._func(model_id)
-                    else:
-                        self.models[model_id] = await self._func(
-                            self.self_arg, model_id
-                        )
-                    load_latency_ms = (time.time() - load_start_time) * 1000.0
-                    logger.info(
-                        f"Successfully loaded model '{model_id}' in "
-                        f"{load_latency_ms:.1f}ms."
-                    )
-                    self._model_load_tasks.discard(model_id)
-                    self.model_load_latency_ms.observe(load_latency_ms)
+                    await self._load_model_into_cache(model_id, num_accesses=1)
+                    # The model may be larger than previously known (or unknown),
+                    # evict other models until the memory budget is respected.
+                    if await self._evict_models_to_fit(
+                        num_models=0, num_bytes=0, keep_model_id=model_id
+                    ):
+                        self._push_multiplexed_replica_info = True
                     return self.models[model_id]
                 except Exception as e:
                     logger.error(
                         f"Failed to load model '{model_id}'. Error: {e}",
                     )
-                    self._model_load_tasks.discard(model_id)
                     raise e
+                finally:
+                    self._model_load_tasks.discard(model_id)
+
+    async def _load_model_into_cache(self, model_id: str, num_accesses: int):
+        """Call the model load function and add the model to the cache.
+
+        Must be called while holding `_model_cache_lock`. Doesn't evict any model.
+        """
+        logger.info(f"Loading model '{model_id}'.")
+        self.models_load_counter.inc()
+        load_start_time = time.time()
+        if self.self_arg is None:
+            model = await self._func(model_id)
+        else:
+            model = await self._func(self.self_arg, model_id)
+        load_latency_ms = (time.time() - load_start_time) * 1000.0
+        logger.info(
+            f"Successfully loaded model '{model_id}' in {load_latency_ms:.1f}ms."
+        )
+        self.model_load_latency_ms.observe(load_latency_ms)
+        # Record the model info first so that a model is never cached without it.
+        self._add_model_info(
+            model_id, model, load_latency_ms / 1000.0, num_accesses=num_accesses
+        )
+        self.models[model_id] = model
+
+    @property
+    def _size_aware_eviction(self) -> bool:
+        return self.max_model_memory_bytes_per_replica is not None
+
+    def _add_model_info(
+        self, model_id: str, model: Any, load_latency_s: float, num_accesses: int
+    ):
+        """Start tracking a newly loaded model for size-aware eviction."""
+        if not self._size_aware_eviction:
+            return
+
+        size_bytes = max(int(self._get_model_size_bytes(model)), 0)
+        self._known_model_sizes[model_id] = size_bytes
+        self._total_model_bytes += size_bytes
+        self._model_info[model_id] = _CachedModelInfo(
+            size_bytes=size_bytes,
+            load_latency_s=load_latency_s,
+            num_accesses=num_accesses,
+        )
+        self._update_model_priority(model_id)
+
+    def _record_model_access(self, model_id: str):
+        info = self._model_info.get(model_id)
+        if info is not None:
+            info.num_accesses += 1
+            self._update_model_priority(model_id)
+
+    def _update_model_priority(self, model_id: str):
+        """Recompute the GreedyDual-Size-Frequency priority of a cached model."""
+        info = self._model_info[model_id]
+        # Guard against zero sizes so that free models are treated as 1 byte.
+        info.priority = self._priority_inflation + (
+            info.num_accesses * info.load_latency_s / max(info.size_bytes, 1)
+        )
+
+    def _needs_eviction(self, num_models: int, num_bytes: int) -> bool:
+        """Whether adding `num_models` totalling `num_bytes` exceeds the limits."""
+        if (
+            self.max_num_models_per_replica > 0
+            and len(self.models) + num_models > self.max_num_models_per_replica
+        ):
+            return True
+
+        return (
+            self._size_aware_eviction
+            and self._total_model_bytes + num_bytes
+            > self.max_model_memory_bytes_per_replica
+        )
+
+    async def _evict_models_to_fit(
+        self,
+        num_models: int,
+        num_bytes: int,
+        keep_model_id: Optional[str] = None,
+    ) -> bool:
+        """Unload models until `num_models` totalling `num_bytes` can be added.
+
+        `keep_model_id` is never unloaded. Returns whether any model was unloaded.
+        """
+        unloaded = False
+        while self._needs_eviction(num_models, num_bytes):
+            evictable = [m for m in self.models if m != keep_model_id]
+            if not evictable:
+                break
+
+            if self._size_aware_eviction:
+                model_id = min(evictable, key=lambda m: self._model_info[m].priority)
+            else:
+                model_id = evictable[0]
+            await self.unload_model(model_id)
+            unloaded = True
+
+        return unloaded
+
+    def _can_fit_without_eviction(self, model_id: str) -> bool:
+        return not self._needs_eviction(
+            num_models=1, num_bytes=self._known_model_sizes.get(model_id, 0)
+        )
+
+    def prefetch(self, model_ids: List[str]) -> List[asyncio.Task]:
+        """Load the given models in the background, e.g., ahead of predicted requests.
+
+        Models that are already loaded or loading are skipped. Prefetching never
+        evicts other models: a model is only prefetched if it fits in the cache
+        (count and memory budget), and if it turns out to be larger than the
+        remaining memory budget once loaded, the prefetched model is unloaded
+        instead of the models that are serving requests.
+
+        Returns the tasks loading the prefetched models.
+        """
+        tasks = []
+        for model_id in model_ids:
+            if (
+                model_id in self.models
+                or model_id in self._model_load_tasks
+                or model_id in self._prefetch_tasks
+                or not self._can_fit_without_eviction(model_id)
+            ):
+                continue
+
+            task = asyncio.get_running_loop().create_task(
+                self._prefetch_model(model_id)
+            )
+            self._prefetch_tasks[model_id] = task
+            tasks.append(task)
+
+        return tasks
+
+    async def _prefetch_model(self, model_id: str):
+        try:
+            async with self._model_cache_lock:
+                # Re-check under the lock, a request may have filled the cache since.
+                if model_id in self.models or not self._can_fit_without_eviction(
+                    model_id
+                ):
+                    return
+
+                self._push_multiplexed_replica_info = True
+                self._model_load_tasks.add(model_id)
+                try:
+                    # A prefetch is not an access, don't count it towards the
+                    # frequency.
+                    await self._load_model_into_cache(model_id, num_accesses=0)
+                finally:
+                    self._model_load_tasks.discard(model_id)
+
+                # The size of a model isn't known before it's loaded for the first
+                # time. Its size is remembered for the next prefetch.
+                if self._needs_eviction(num_models=0, num_bytes=0):
+                    logger.info(
+                        f"Prefetched model '{model_id}' doesn't fit in the cache."
+                    )
+                    await self.unload_model(model_id)
+                    self._push_multiplexed_replica_info = True
+        except Exception:
+            logger.exception(f"Failed to prefetch model '{model_id}'.")
+        finally:
+            self._prefetch_tasks.pop(model_id, None)
 
     async def unload_model_lru(self) -> None:
         """Unload the least recently used model."""
+        await self.unload_model(next(iter(self.models)))
+
+    async def unload_model(self, model_id: str) -> None:
+        """Unload the model with the given ID."""
 
         self.models_unload_counter.inc()
         unload_start_time = time.time()
-        model_id, model = self.models.popitem(last=False)
+        model = self.models.pop(model_id)
+        info = self._model_info.pop(model_id, None)
+        if info is not None:
+            self._total_model_bytes -= info.size_bytes
+            # Age the remaining models relative to the evicted one.
+            self._priority_inflation = max(self._priority_inflation, info.priority)
         logger.info(f"Unloading model '{model_id}'.")
 
         # If the model has __del__ attribute, call it.
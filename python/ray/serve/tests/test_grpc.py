@@ -590,6 +590,59 @@ def test_using_grpc_context(ray_instance, ray_shutdown, streaming: bool):
     assert any([key == "request_id" for key, _ in rpc_error.trailing_metadata()])
 
 
+@pytest.mark.parametrize(
+    "ray_instance",
+    [
+        {"RAY_SERVE_GRPC_STREAMING_MAX_BATCH_SIZE": "4"},
+        {
+            "RAY_SERVE_GRPC_STREAMING_MAX_BATCH_SIZE": "4",
+            "RAY_SERVE_GRPC_STREAMING_BACKPRESSURE_NUM_BATCHES": "1",
+        },
+    ],
+    indirect=True,
+)
+def test_grpc_streaming_batched(ray_instance, ray_shutdown):
+    """Test streaming gRPC responses with batched messages from the replica.
+
+    All messages should arrive in order and the gRPC context set by the deployment
+    should still be sent back to the client.
+    """
+    grpc_port = 9000
+    grpc_servicer_functions = [
+        "ray.serve.generated.serve_pb2_grpc.add_UserDefinedServiceServicer_to_server",
+    ]
+
+    serve.start(
+        grpc_options=gRPCOptions(
+            port=grpc_port,
+            grpc_servicer_functions=grpc_servicer_functions,
+        ),
+    )
+    trailing_metadata = ("foo", "bar")
+
+    @serve.deployment()
+    class HelloModel:
+        async def Streaming(
+            self,
+            user_message: serve_pb2.UserDefinedMessage,
+            grpc_context: RayServegRPCContext,
+        ):
+            grpc_context.set_trailing_metadata([trailing_metadata])
+            for i in range(100):
+                yield serve_pb2.UserDefinedResponse(greeting=f"hello {i}")
+
+    serve.run(HelloModel.bind(), name="app1")
+
+    channel = grpc.insecure_channel("localhost:9000")
+    stub = serve_pb2_grpc.UserDefinedServiceStub(channel)
+    request = serve_pb2.UserDefinedMessage(name="foo", num=30, foo="bar")
+    responses = stub.Streaming(request=request)
+
+    assert [r.greeting for r in responses] == [f"hello {i}" for i in range(100)]
+    assert responses.code() == grpc.StatusCode.OK
+    assert trailing_metadata in responses.trailing_metadata()
+
+
 @pytest.mark.parametrize("streaming", [False, True])
 def test_using_grpc_context_exception(ray_instance, ray_shutdown, streaming: bool):
     """Test setting code on gRPC context then raised exception.
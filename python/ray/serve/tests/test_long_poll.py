@@ -197,6 +197,53 @@ async def test_client_threadsafe(serve_instance):
     await e.wait()
 
 
+@pytest.mark.asyncio
+async def test_client_applies_deltas(serve_instance):
+    host = ray.remote(LongPollHost).remote()
+    key = (LongPollNamespace.DEPLOYMENT_TARGETS, "deployment_name")
+
+    def make_replica(i: int) -> RunningReplicaInfo:
+        return RunningReplicaInfo(
+            replica_id=ReplicaID(
+                str(i), deployment_id=DeploymentID(name="deployment_name")
+            ),
+            node_id="node_id",
+            node_ip="node_ip",
+            availability_zone="some-az",
+            actor_handle=host,
+            max_ongoing_requests=1,
+        )
+
+    replicas = [make_replica(i) for i in range(10)]
+    ray.get(
+        host.notify_changed.remote(
+            {key: DeploymentTargetInfo(is_available=True, running_replicas=replicas)}
+        )
+    )
+
+    callback_results = []
+    _ = LongPollClient(
+        host,
+        {key: callback_results.append},
+        call_in_event_loop=get_or_create_event_loop(),
+    )
+    await async_wait_for_condition(lambda: len(callback_results) == 1, timeout=1)
+
+    # Replace one replica; the client receives a delta and rebuilds the set.
+    new_replicas = replicas[1:] + [make_replica(10)]
+    ray.get(
+        host.notify_changed.remote(
+            {
+                key: DeploymentTargetInfo(
+                    is_available=True, running_replicas=new_replicas
+                )
+            }
+        )
+    )
+    await async_wait_for_condition(lambda: len(callback_results) == 2, timeout=1)
+    assert callback_results[-1].running_replicas == new_replicas
+
+
 def test_listen_for_change_java(serve_instance):
     host = ray.remote(LongPollHost).remote()
     ray.get(host.notify_changed.remote({"key_1": 999}))
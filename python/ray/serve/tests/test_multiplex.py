@@ -219,6 +219,178 @@ class TestMultiplexWrapper:
         assert "3" in multiplexer.models
         assert len(multiplexer._model_load_tasks) == 0
 
+    async def test_size_aware_eviction(self, start_serve_with_context):
+        """Test GreedyDual-Size-Frequency eviction with a memory budget."""
+        model_sizes = {"small": 10, "large": 80, "medium": 40, "other": 40}
+
+        async def model_load_func(model_id: str):
+            return model_id
+
+        multiplexer = _ModelMultiplexWrapper(
+            model_load_func,
+            None,
+            max_num_models_per_replica=-1,
+            max_model_memory_bytes_per_replica=100,
+            get_model_size_bytes=lambda model: model_sizes[model],
+        )
+        await multiplexer.metrics_pusher.graceful_shutdown()
+        # Make load latencies equal so only size and frequency matter.
+        multiplexer._add_model_info = _with_fixed_load_latency(
+            multiplexer._add_model_info
+        )
+
+        await multiplexer.load_model("small")
+        await multiplexer.load_model("large")
+        assert multiplexer._total_model_bytes == 90
+
+        # Loading "medium" exceeds the budget, "large" has the lowest
+        # priority (cost / size) so it's evicted even though "small" is older.
+        await multiplexer.load_model("medium")
+        assert list(multiplexer.models) == ["small", "medium"]
+        assert multiplexer._total_model_bytes == 50
+        assert multiplexer._push_multiplexed_replica_info
+
+        # Frequently accessed models are kept over ones of the same size.
+        for _ in range(3):
+            await multiplexer.load_model("medium")
+        await multiplexer.load_model("other")
+        await multiplexer.load_model("large")
+        assert "large" in multiplexer.models
+        assert multiplexer._total_model_bytes <= 100
+
+    async def test_size_aware_eviction_before_reload(self, start_serve_with_context):
+        """A model seen before is made room for before it's loaded again."""
+        loaded_models_at_load_time = []
+
+        async def model_load_func(model_id: str):
+            loaded_models_at_load_time.append(set(multiplexer.models))
+            return model_id
+
+        multiplexer = _ModelMultiplexWrapper(
+            model_load_func,
+            None,
+            max_num_models_per_replica=-1,
+            max_model_memory_bytes_per_replica=100,
+            get_model_size_bytes=lambda model: 60,
+        )
+        await multiplexer.metrics_pusher.graceful_shutdown()
+
+        await multiplexer.load_model("1")
+        await multiplexer.load_model("2")
+        # Model "1" was only evicted after "2" had been loaded.
+        assert loaded_models_at_load_time[-1] == {"1"}
+        assert list(multiplexer.models) == ["2"]
+
+        await multiplexer.load_model("1")
+        # Model "2" was evicted before "1" was loaded again, since its size is known.
+        assert loaded_models_at_load_time[-1] == set()
+        assert list(multiplexer.models) == ["1"]
+
+    async def test_prefetch(self, start_serve_with_context):
+        loaded = []
+
+        async def model_load_func(model_id: str):
+            loaded.append(model_id)
+            return model_id
+
+        multiplexer = _ModelMultiplexWrapper(
+            model_load_func, None, max_num_models_per_replica=2
+        )
+        await multiplexer.metrics_pusher.graceful_shutdown()
+
+        await multiplexer.load_model("1")
+        tasks = multiplexer.prefetch(["1", "2", "3"])
+        # Model "1" is already loaded and "3" doesn't fit once "2" is prefetched.
+        assert len(tasks) == 2
+        await asyncio.gather(*tasks)
+        assert list(multiplexer.models) == ["1", "2"]
+        assert loaded == ["1", "2"]
+        assert multiplexer._prefetch_tasks == {}
+
+        # Prefetched models are served from the cache.
+        assert await multiplexer.load_model("2") == "2"
+        assert loaded == ["1", "2"]
+
+        # Prefetching never evicts models.
+        assert multiplexer.prefetch(["4"]) == []
+        assert list(multiplexer.models) == ["1", "2"]
+
+        # A request that fills the cache before the prefetch starts loading wins.
+        await multiplexer.unload_model("2")
+        tasks = multiplexer.prefetch(["5"])
+        assert len(tasks) == 1
+        await multiplexer.load_model("6")
+        await asyncio.gather(*tasks)
+        assert list(multiplexer.models) == ["1", "6"]
+        assert "5" not in loaded
+
+    async def test_prefetch_size_aware(self, start_serve_with_context):
+        model_sizes = {"1": 40, "2": 40, "large": 80, "small": 10}
+
+        async def model_load_func(model_id: str):
+            return model_id
+
+        multiplexer = _ModelMultiplexWrapper(
+            model_load_func,
+            None,
+            max_num_models_per_replica=-1,
+            max_model_memory_bytes_per_replica=100,
+            get_model_size_bytes=lambda model: model_sizes[model],
+        )
+        await multiplexer.metrics_pusher.graceful_shutdown()
+
+        await multiplexer.load_model("1")
+        await multiplexer.load_model("2")
+
+        # The size of "large" is unknown until it's loaded, so it's prefetched,
+        # then unloaded again instead of the models serving requests.
+        await asyncio.gather(*multiplexer.prefetch(["large"]))
+        assert list(multiplexer.models) == ["1", "2"]
+        assert multiplexer._total_model_bytes == 80
+        # Its size is known now, so it's not prefetched again.
+        assert multiplexer.prefetch(["large"]) == []
+
+        # Prefetches don't count as accesses.
+        await asyncio.gather(*multiplexer.prefetch(["small"]))
+        assert list(multiplexer.models) == ["1", "2", "small"]
+        assert multiplexer._model_info["small"].num_accesses == 0
+        await multiplexer.load_model("small")
+        assert multiplexer._model_info["small"].num_accesses == 1
+
+    async def test_get_model_size_failure(self, start_serve_with_context):
+        async def model_load_func(model_id: str):
+            return model_id
+
+        def get_model_size_bytes(model: str) -> int:
+            if model == "bad":
+                raise RuntimeError("Failed to get the model size.")
+            return 60
+
+        multiplexer = _ModelMultiplexWrapper(
+            model_load_func,
+            None,
+            max_num_models_per_replica=-1,
+            max_model_memory_bytes_per_replica=100,
+            get_model_size_bytes=get_model_size_bytes,
+        )
+        await multiplexer.metrics_pusher.graceful_shutdown()
+
+        await multiplexer.load_model("1")
+        with pytest.raises(RuntimeError):
+            await multiplexer.load_model("bad")
+        # The model isn't cached without its size, so eviction still works.
+        assert list(multiplexer.models) == ["1"]
+        assert len(multiplexer._model_load_tasks) == 0
+        await multiplexer.load_model("2")
+        assert list(multiplexer.models) == ["2"]
+
+
+def _with_fixed_load_latency(add_model_info):
+    def wrapper(model_id: str, model, load_latency_s: float, num_accesses: int):
+        return add_model_info(model_id, model, 1.0, num_accesses)
+
+    return wrapper
+
 
 class TestBasicAPI:
     def test_decorator_validation(self):
@@ -264,6 +436,30 @@ class TestBasicAPI:
             async def get_model4(model: str):
                 pass
 
+        @serve.multiplexed(
+            max_model_memory_bytes_per_replica=1024,
+            get_model_size_bytes=lambda model: 1,
+        )
+        async def get_model7(model: str):
+            return
+
+        # get_model_size_bytes is required with a memory budget.
+        with pytest.raises(ValueError):
+
+            @serve.multiplexed(max_model_memory_bytes_per_replica=1024)
+            async def get_model8(model: str):
+                pass
+
+        # max_model_memory_bytes_per_replica must be positive
+        with pytest.raises(ValueError):
+
+            @serve.multiplexed(
+                max_model_memory_bytes_per_replica=0,
+                get_model_size_bytes=lambda model: 1,
+            )
+            async def get_model9(model: str):
+                pass
+
         # multiplexed function must be async def
         with pytest.raises(TypeError):
 
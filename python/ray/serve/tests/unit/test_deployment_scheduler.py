@@ -1064,6 +1064,183 @@ class TestCompactScheduling:
             assert scheduling_strategy.node_id == "node1"
             assert call.kwargs == {"placement_group": None}
 
+    def test_stranded_resources(self):
+        """Test that replicas are placed to avoid stranding resources that
+        no deployment could use.
+        """
+
+        d_id1 = DeploymentID(name="deployment1")
+        d_id2 = DeploymentID(name="deployment2")
+
+        cluster_node_info_cache = MockClusterNodeInfoCache()
+        cluster_node_info_cache.add_node("node1", {"GPU": 1, "CPU": 4})
+        cluster_node_info_cache.add_node("node2", {"GPU": 2, "CPU": 2})
+        scheduler = default_impl.create_deployment_scheduler(
+            cluster_node_info_cache,
+            head_node_id_override="fake-head-node-id",
+            create_placement_group_fn_override=None,
+        )
+
+        scheduler.on_deployment_created(d_id1, SpreadDeploymentSchedulingPolicy())
+        scheduler.on_deployment_created(d_id2, SpreadDeploymentSchedulingPolicy())
+        scheduler.on_deployment_deployed(
+            d_id1,
+            ReplicaConfig.create(
+                dummy, ray_actor_options={"num_gpus": 1, "num_cpus": 1}
+            ),
+        )
+        scheduler.on_deployment_deployed(
+            d_id2,
+            ReplicaConfig.create(dummy, ray_actor_options={"num_cpus": 4}),
+        )
+
+        on_scheduled_mock = Mock()
+        on_scheduled_mock2 = Mock()
+        scheduler.schedule(
+            upscales={
+                d_id1: [
+                    ReplicaSchedulingRequest(
+                        replica_id=ReplicaID(unique_id="r0", deployment_id=d_id1),
+                        actor_def=MockActorClass(),
+                        actor_resources={"GPU": 1, "CPU": 1},
+                        actor_options={},
+                        actor_init_args=(),
+                        on_scheduled=on_scheduled_mock,
+                    )
+                ],
+                d_id2: [
+                    ReplicaSchedulingRequest(
+                        replica_id=ReplicaID(unique_id="r1", deployment_id=d_id2),
+                        actor_def=MockActorClass(),
+                        actor_resources={"CPU": 4},
+                        actor_options={},
+                        actor_init_args=(),
+                        on_scheduled=on_scheduled_mock2,
+                    )
+                ],
+            },
+            downscales={},
+        )
+
+        # Best fit would place the GPU replica on node1, leaving 3 CPUs that
+        # the CPU-only replica can't use. Placing it on node2 instead leaves
+        # node1 free for the CPU-only replica.
+        assert len(on_scheduled_mock.call_args_list) == 1
+        call = on_scheduled_mock.call_args_list[0]
+        scheduling_strategy = call.args[0]._options["scheduling_strategy"]
+        assert isinstance(scheduling_strategy, NodeAffinitySchedulingStrategy)
+        assert scheduling_strategy.node_id == "node2"
+
+        assert len(on_scheduled_mock2.call_args_list) == 1
+        call = on_scheduled_mock2.call_args_list[0]
+        scheduling_strategy = call.args[0]._options["scheduling_strategy"]
+        assert isinstance(scheduling_strategy, NodeAffinitySchedulingStrategy)
+        assert scheduling_strategy.node_id == "node1"
+
+    @mock.patch(
+        "ray.serve._private.deployment_scheduler.RAY_SERVE_NODE_COMPACTION_INTERVAL_S",
+        1000,
+    )
+    def test_get_node_to_compact(self):
+        d_id = DeploymentID(name="deployment1")
+
+        cluster_node_info_cache = MockClusterNodeInfoCache()
+        cluster_node_info_cache.add_node("node1", {"CPU": 4})
+        cluster_node_info_cache.add_node("node2", {"CPU": 4})
+        scheduler = default_impl.create_deployment_scheduler(
+            cluster_node_info_cache,
+            head_node_id_override="fake-head-node-id",
+            create_placement_group_fn_override=None,
+        )
+        scheduler.on_deployment_created(d_id, SpreadDeploymentSchedulingPolicy())
+        scheduler.on_deployment_deployed(
+            d_id, ReplicaConfig.create(dummy, ray_actor_options={"num_cpus": 1})
+        )
+
+        r1, r2, r3 = (ReplicaID(f"r{i}", deployment_id=d_id) for i in range(1, 4))
+        scheduler.on_replica_running(r1, "node1")
+        scheduler.on_replica_running(r2, "node1")
+        scheduler.on_replica_running(r3, "node2")
+        cluster_node_info_cache.set_available_resources_per_node("node1", {"CPU": 2})
+        cluster_node_info_cache.set_available_resources_per_node("node2", {"CPU": 3})
+
+        assert scheduler.get_node_to_compact(allow_new_compaction=False) is None
+
+        # The replica on node2 fits on node1, so node2 should be compacted.
+        node_id, deadline_ms = scheduler.get_node_to_compact(allow_new_compaction=True)
+        assert node_id == "node2"
+        assert scheduler.get_node_to_compact(allow_new_compaction=True) == (
+            "node2",
+            deadline_ms,
+        )
+
+        # The node being compacted shouldn't get new replicas.
+        on_scheduled_mock = Mock()
+        scheduler.schedule(
+            upscales={
+                d_id: [
+                    ReplicaSchedulingRequest(
+                        replica_id=ReplicaID(unique_id="r4", deployment_id=d_id),
+                        actor_def=MockActorClass(),
+                        actor_resources={"CPU": 1},
+                        actor_options={},
+                        actor_init_args=(),
+                        on_scheduled=on_scheduled_mock,
+                    )
+                ]
+            },
+            downscales={},
+        )
+        call = on_scheduled_mock.call_args_list[0]
+        scheduling_strategy = call.args[0]._options["scheduling_strategy"]
+        assert scheduling_strategy.node_id == "node1"
+
+        # Compaction finishes once no replicas are left on the node.
+        scheduler.on_replica_stopping(r3)
+        assert scheduler.get_node_to_compact(allow_new_compaction=True) is None
+
+        # A new compaction isn't started until the interval has passed.
+        scheduler.on_replica_running(r3, "node2")
+        assert scheduler.get_node_to_compact(allow_new_compaction=True) is None
+
+    @mock.patch(
+        "ray.serve._private.deployment_scheduler.RAY_SERVE_NODE_COMPACTION_INTERVAL_S",
+        1e-9,
+    )
+    def test_no_node_to_compact(self):
+        d_id = DeploymentID(name="deployment1")
+
+        cluster_node_info_cache = MockClusterNodeInfoCache()
+        cluster_node_info_cache.add_node("head", {"CPU": 4})
+        cluster_node_info_cache.add_node("node1", {"CPU": 2})
+        cluster_node_info_cache.add_node("node2", {"CPU": 2})
+        scheduler = default_impl.create_deployment_scheduler(
+            cluster_node_info_cache,
+            head_node_id_override="head",
+            create_placement_group_fn_override=None,
+        )
+        scheduler.on_deployment_created(d_id, SpreadDeploymentSchedulingPolicy())
+        scheduler.on_deployment_deployed(
+            d_id, ReplicaConfig.create(dummy, ray_actor_options={"num_cpus": 2})
+        )
+
+        # The head node is never compacted, and the replicas on node1 and
+        # node2 don't fit anywhere else since the head node is full.
+        for i, node_id in enumerate(["head", "node1", "node2"]):
+            scheduler.on_replica_running(ReplicaID(f"r{i}", d_id), node_id)
+            cluster_node_info_cache.set_available_resources_per_node(
+                node_id, {"CPU": 0}
+            )
+        assert scheduler.get_node_to_compact(allow_new_compaction=True) is None
+
+        # Once node1's replica fits on the head node, node1 can be compacted,
+        # unless it's also used by something other than replicas.
+        scheduler.on_replica_stopping(ReplicaID("r0", d_id))
+        cluster_node_info_cache.set_available_resources_per_node("head", {"CPU": 4})
+        cluster_node_info_cache.add_node("node1", {"CPU": 3})
+        cluster_node_info_cache.set_available_resources_per_node("node1", {"CPU": 0})
+        assert scheduler.get_node_to_compact(allow_new_compaction=True)[0] == "node2"
+
     def test_max_replicas_per_node(self):
         """Test that at most `max_replicas_per_node` number of replicas
         are scheduled onto a node even if that node has more resources.
@@ -1897,6 +1897,71 @@ def test_health_check(
     assert ds.curr_status_info.status_trigger == DeploymentStatusTrigger.UNSPECIFIED
 
 
+def test_only_reconcile_deployments_with_changes(mock_deployment_state_manager):
+    """Steady-state deployments are skipped by the control loop."""
+    create_dsm, _, _, _ = mock_deployment_state_manager
+    dsm: DeploymentStateManager = create_dsm()
+
+    info_1, v1 = deployment_info(num_replicas=2, version="1")
+    info_2, v2 = deployment_info(num_replicas=2, version="2")
+    assert dsm.deploy(TEST_DEPLOYMENT_ID, info_1)
+    assert dsm.deploy(TEST_DEPLOYMENT_ID_2, info_2)
+    ds_1 = dsm._deployment_states[TEST_DEPLOYMENT_ID]
+    ds_2 = dsm._deployment_states[TEST_DEPLOYMENT_ID_2]
+
+    dsm.update()
+    for ds in [ds_1, ds_2]:
+        for replica in ds._replicas.get():
+            replica._actor.set_ready()
+    dsm.update()
+    check_counts(ds_1, total=2, by_state=[(ReplicaState.RUNNING, 2, v1)])
+    check_counts(ds_2, total=2, by_state=[(ReplicaState.RUNNING, 2, v2)])
+    assert ds_1.curr_status_info.status == DeploymentStatus.HEALTHY
+    assert ds_2.curr_status_info.status == DeploymentStatus.HEALTHY
+
+    assert not ds_1.needs_reconcile()
+    assert not ds_2.needs_reconcile()
+
+    with patch.object(
+        ds_1, "scale_deployment_replicas", wraps=ds_1.scale_deployment_replicas
+    ) as scale_1, patch.object(
+        ds_2, "scale_deployment_replicas", wraps=ds_2.scale_deployment_replicas
+    ) as scale_2:
+        dsm.update()
+        scale_1.assert_not_called()
+        scale_2.assert_not_called()
+
+        # Health checks are still run for steady-state deployments.
+        ds_1._replicas.get()[0]._actor.set_unhealthy()
+        dsm.update()
+        scale_1.assert_called_once()
+        scale_2.assert_not_called()
+        check_counts(
+            ds_1,
+            total=3,
+            by_state=[
+                (ReplicaState.RUNNING, 1, v1),
+                (ReplicaState.STOPPING, 1, v1),
+                (ReplicaState.STARTING, 1, v1),
+            ],
+        )
+        assert ds_1.curr_status_info.status == DeploymentStatus.UNHEALTHY
+
+        # A target change is reconciled on the next update.
+        info_2_scaled, _ = deployment_info(num_replicas=3, version="2")
+        assert dsm.deploy(TEST_DEPLOYMENT_ID_2, info_2_scaled)
+        dsm.update()
+        scale_2.assert_called_once()
+        check_counts(
+            ds_2,
+            total=3,
+            by_state=[
+                (ReplicaState.RUNNING, 2, v2),
+                (ReplicaState.STARTING, 1, v2),
+            ],
+        )
+
+
 def test_update_while_unhealthy(mock_deployment_state_manager):
     create_dsm, _, _, _ = mock_deployment_state_manager
     dsm: DeploymentStateManager = create_dsm()
@@ -12,6 +12,7 @@ def test_dynamic_handle_options():
     assert default_options.method_name == "__call__"
     assert default_options.multiplexed_model_id == ""
     assert default_options.stream is False
+    assert default_options.hedge_after_percentile is None
 
     # Test setting method name.
     only_set_method = default_options.copy_and_update(method_name="hi")
@@ -52,6 +53,12 @@ def test_dynamic_handle_options():
     assert set_multiple.multiplexed_model_id == ""
     assert set_multiple.stream is True
 
+    # Test setting hedging.
+    set_hedging = default_options.copy_and_update(hedge_after_percentile=95)
+    assert set_hedging.hedge_after_percentile == 95
+    assert set_hedging.stream is False
+    assert default_options.hedge_after_percentile is None
+
 
 def test_init_handle_options():
     default_options = InitHandleOptions.create()
@@ -6,7 +6,11 @@ from typing import Generator, Tuple
 import pytest
 
 from ray._common.utils import get_or_create_event_loop
-from ray.serve._private.http_util import ASGIReceiveProxy, MessageQueue
+from ray.serve._private.http_util import (
+    ASGIReceiveProxy,
+    MessageQueue,
+    serialize_asgi_receive_messages,
+)
 
 
 @pytest.mark.asyncio
@@ -249,5 +253,71 @@ class TestASGIReceiveProxy:
             receiver_task.cancel()
 
 
+class TestSerializeASGIReceiveMessages:
+    def test_pickled_by_default(self):
+        messages = [
+            {"type": "http.request", "body": b"a" * 100, "more_body": False},
+            {"type": "http.disconnect"},
+        ]
+        assert pickle.loads(serialize_asgi_receive_messages(messages)) == messages
+        serialized = serialize_asgi_receive_messages(
+            messages, zero_copy_threshold_bytes=1000
+        )
+        assert pickle.loads(serialized) == messages
+
+    @pytest.mark.parametrize("more_body", [False, True])
+    def test_large_body_coalesced_out_of_band(self, more_body: bool):
+        messages = [
+            {"type": "http.request", "body": b"a" * 600, "more_body": True},
+            {"type": "http.request", "body": b"b" * 600, "more_body": more_body},
+        ]
+        if not more_body:
+            messages.append({"type": "http.disconnect"})
+
+        serialized = serialize_asgi_receive_messages(
+            messages, zero_copy_threshold_bytes=1000
+        )
+        assert isinstance(serialized, list)
+        assert serialized[0]["type"] == "http.request"
+        assert serialized[0]["more_body"] is more_body
+        assert isinstance(serialized[0]["body"], pickle.PickleBuffer)
+        assert serialized[1:] == messages[2:]
+
+        # The body is pickled out-of-band, without copying it into the stream.
+        buffers = []
+        data = pickle.dumps(serialized, protocol=5, buffer_callback=buffers.append)
+        assert len(data) < 600
+        assert len(buffers) == 1
+
+        restored = pickle.loads(data, buffers=buffers)
+        assert bytes(restored[0]["body"]) == b"a" * 600 + b"b" * 600
+
+    @pytest.mark.asyncio
+    async def test_receive_proxy_exposes_memoryview(self):
+        messages = serialize_asgi_receive_messages(
+            [
+                {"type": "http.request", "body": b"a" * 2000, "more_body": False},
+                {"type": "http.disconnect"},
+            ],
+            zero_copy_threshold_bytes=1000,
+        )
+
+        async def receive_asgi_messages(request_id: str):
+            return messages
+
+        loop = get_or_create_event_loop()
+        asgi_receive_proxy = ASGIReceiveProxy(
+            {"type": "http"}, "", receive_asgi_messages
+        )
+        receiver_task = loop.create_task(asgi_receive_proxy.fetch_until_disconnect())
+        try:
+            message = await asgi_receive_proxy()
+            assert isinstance(message["body"], memoryview)
+            assert message["body"] == b"a" * 2000
+            assert await asgi_receive_proxy() == {"type": "http.disconnect"}
+        finally:
+            receiver_task.cancel()
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(["-v", "-s", __file__]))
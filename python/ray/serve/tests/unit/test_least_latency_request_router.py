@@ -0,0 +1,215 @@
+import asyncio
+import sys
+from typing import Callable, List
+
+import pytest
+
+from ray.serve._private.common import DeploymentHandleSource, DeploymentID
+from ray.serve._private.request_router import LeastLatencyRequestRouter
+from ray.serve._private.request_router.least_latency_router import (
+    ReplicaLatencyStats,
+)
+from ray.serve._private.test_utils import MockTimer
+from ray.serve.tests.unit.test_pow_2_request_router import (
+    FakeRunningReplica,
+    fake_pending_request,
+)
+
+TIMER = MockTimer()
+
+
+class FakeReplicaResult:
+    """Stand-in for `ReplicaResult` that completes when told to."""
+
+    def __init__(self):
+        self._callbacks: List[Callable] = []
+
+    def add_done_callback(self, callback: Callable):
+        self._callbacks.append(callback)
+
+    def complete(self):
+        for callback in self._callbacks:
+            callback(None)
+
+
+@pytest.fixture
+def least_latency_router() -> LeastLatencyRequestRouter:
+    async def construct_request_router():
+        request_router = LeastLatencyRequestRouter(
+            deployment_id=DeploymentID(name="TEST_DEPLOYMENT"),
+            handle_source=DeploymentHandleSource.REPLICA,
+            self_actor_id="fake-actor-id",
+            self_actor_handle=None,
+            use_replica_queue_len_cache=False,
+            get_curr_time_s=TIMER.time,
+        )
+        request_router.backoff_sequence_s = [0, 0.001, 0.001]
+        return request_router
+
+    TIMER.reset()
+    s = asyncio.new_event_loop().run_until_complete(construct_request_router())
+
+    yield s
+
+    assert s.curr_num_routing_tasks == 0
+    assert s.num_pending_requests == 0
+
+
+async def _route_and_complete(s, replica, latency_s: float):
+    result = FakeReplicaResult()
+    s.on_request_routed(fake_pending_request(), replica.replica_id, result)
+    TIMER.advance(latency_s)
+    result.complete()
+    # Let the threadsafe callback run.
+    await asyncio.sleep(0)
+
+
+def test_peak_ewma_reacts_to_spikes_and_decays():
+    stats = ReplicaLatencyStats()
+    stats.record_latency(1.0, now_s=0, decay_s=10)
+    assert stats.ewma_latency_s == 1.0
+
+    # A higher sample replaces the average immediately.
+    stats.record_latency(5.0, now_s=1, decay_s=10)
+    assert stats.ewma_latency_s == 5.0
+
+    # Lower samples decay towards the sample, faster with more elapsed time.
+    stats.record_latency(1.0, now_s=2, decay_s=10)
+    assert 1.0 < stats.ewma_latency_s < 5.0
+    previous = stats.ewma_latency_s
+    stats.record_latency(1.0, now_s=100, decay_s=10)
+    assert 1.0 <= stats.ewma_latency_s < previous
+    assert stats.ewma_latency_s == pytest.approx(1.0, abs=1e-3)
+
+
+@pytest.mark.asyncio
+async def test_prefers_lower_latency_replica(least_latency_router):
+    s = least_latency_router
+    fast = FakeRunningReplica("fast")
+    fast.set_queue_len_response(0)
+    slow = FakeRunningReplica("slow")
+    slow.set_queue_len_response(0)
+    s.update_replicas([fast, slow])
+
+    await _route_and_complete(s, fast, 0.1)
+    await _route_and_complete(s, slow, 0.2)
+
+    assert s.replica_latency_stats[fast.replica_id].ewma_latency_s == pytest.approx(0.1)
+    assert s.replica_latency_stats[slow.replica_id].ewma_latency_s == pytest.approx(0.2)
+
+    for _ in range(10):
+        ranks = await s.choose_replicas(list(s.curr_replicas.values()))
+        assert ranks == [[fast], [slow]]
+
+    for _ in range(10):
+        assert (await s._choose_replica_for_request(fake_pending_request())) == fast
+
+
+@pytest.mark.asyncio
+async def test_in_flight_requests_increase_cost(least_latency_router):
+    s = least_latency_router
+    fast = FakeRunningReplica("fast")
+    fast.set_queue_len_response(0)
+    slow = FakeRunningReplica("slow")
+    slow.set_queue_len_response(0)
+    s.update_replicas([fast, slow])
+
+    await _route_and_complete(s, fast, 0.1)
+    await _route_and_complete(s, slow, 0.25)
+
+    # Two outstanding requests on the fast replica make it the more costly one.
+    results = [FakeReplicaResult() for _ in range(2)]
+    for result in results:
+        s.on_request_routed(fake_pending_request(), fast.replica_id, result)
+    assert s.replica_latency_stats[fast.replica_id].num_in_flight == 2
+    assert s.expected_completion_time_s(fast) == pytest.approx(0.3)
+    assert s.expected_completion_time_s(slow) == pytest.approx(0.25)
+    ranks = await s.choose_replicas(list(s.curr_replicas.values()))
+    assert ranks == [[slow], [fast]]
+
+    for result in results:
+        result.complete()
+    await asyncio.sleep(0)
+    assert s.replica_latency_stats[fast.replica_id].num_in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_rejected_request_is_not_tracked(least_latency_router):
+    s = least_latency_router
+    r1 = FakeRunningReplica("r1")
+    r1.set_queue_len_response(0)
+    s.update_replicas([r1])
+
+    s.on_request_routed(fake_pending_request(), r1.replica_id, None)
+    assert r1.replica_id not in s.replica_latency_stats
+
+
+@pytest.mark.asyncio
+async def test_new_replica_uses_average_latency(least_latency_router):
+    s = least_latency_router
+    r1 = FakeRunningReplica("r1")
+    r1.set_queue_len_response(0)
+    r2 = FakeRunningReplica("r2")
+    r2.set_queue_len_response(0)
+    s.update_replicas([r1, r2])
+
+    await _route_and_complete(s, r1, 0.1)
+    await _route_and_complete(s, r2, 0.3)
+
+    r3 = FakeRunningReplica("r3")
+    r3.set_queue_len_response(0)
+    s.update_replicas([r1, r2, r3])
+    assert s.expected_completion_time_s(r3) == pytest.approx(0.2)
+
+
+@pytest.mark.asyncio
+async def test_cold_replicas_ranked_by_queue_len(least_latency_router):
+    s = least_latency_router
+    busy = FakeRunningReplica("busy")
+    busy.set_queue_len_response(0)
+    idle = FakeRunningReplica("idle")
+    idle.set_queue_len_response(0)
+    s.update_replicas([busy, idle])
+
+    # No latencies are known yet, so the queue length decides.
+    result = FakeReplicaResult()
+    s.on_request_routed(fake_pending_request(), busy.replica_id, result)
+    assert s.expected_completion_time_s(busy) == pytest.approx(2 * s.default_latency_s)
+    assert s.expected_completion_time_s(idle) == pytest.approx(s.default_latency_s)
+    ranks = await s.choose_replicas(list(s.curr_replicas.values()))
+    assert ranks == [[idle], [busy]]
+
+    result.complete()
+    await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_replica_churn_drops_stats(least_latency_router):
+    s = least_latency_router
+    r1 = FakeRunningReplica("r1")
+    r1.set_queue_len_response(0)
+    r2 = FakeRunningReplica("r2")
+    r2.set_queue_len_response(0)
+    s.update_replicas([r1, r2])
+
+    await _route_and_complete(s, r1, 0.1)
+    await _route_and_complete(s, r2, 0.1)
+
+    # A request is still in flight to r2 when it's removed.
+    result = FakeReplicaResult()
+    s.on_request_routed(fake_pending_request(), r2.replica_id, result)
+    s.update_replicas([r1])
+    assert set(s.replica_latency_stats) == {r1.replica_id}
+
+    # Completion of the request to the removed replica is ignored.
+    TIMER.advance(1)
+    result.complete()
+    await asyncio.sleep(0)
+    assert set(s.replica_latency_stats) == {r1.replica_id}
+
+    s.on_replica_actor_died(r1.replica_id)
+    assert s.replica_latency_stats == {}
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-v", "-s", __file__]))
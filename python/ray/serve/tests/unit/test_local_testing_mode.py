@@ -1,6 +1,9 @@
+import asyncio
 import logging
 import os
 import sys
+import time
+from typing import List
 
 import pytest
 
@@ -207,5 +210,49 @@ def test_reconfigure():
     assert h.remote().result() == "Hi Charles!"
 
 
+def test_hedging_reduces_tail_latency(monkeypatch):
+    monkeypatch.setattr(
+        "ray.serve._private.request_hedging.RAY_SERVE_HANDLE_HEDGING_BUDGET_RATIO", 1.0
+    )
+    monkeypatch.setattr(
+        "ray.serve._private.request_hedging.RAY_SERVE_HANDLE_HEDGING_MIN_SAMPLES", 10
+    )
+
+    @serve.deployment
+    class SometimesSlow:
+        def __init__(self):
+            self._num_calls = 0
+
+        async def __call__(self):
+            # Every 10th call is slow, e.g. because of a GC pause.
+            self._num_calls += 1
+            if self._num_calls % 10 == 0:
+                await asyncio.sleep(1)
+
+    h = serve.run(SometimesSlow.bind(), _local_testing_mode=True)
+
+    def _get_latencies(handle: DeploymentHandle, num_requests: int) -> List[float]:
+        latencies = []
+        for _ in range(num_requests):
+            start = time.time()
+            handle.remote().result()
+            latencies.append(time.time() - start)
+        return latencies
+
+    assert max(_get_latencies(h, 20)) >= 1
+
+    hedged_h = h.options(hedge_after_percentile=50)
+    # Record enough latencies for hedging to start.
+    _get_latencies(hedged_h, 20)
+    # Slow calls are hedged, and the duplicate call finishes first.
+    assert max(_get_latencies(hedged_h, 20)) < 0.5
+
+    with pytest.raises(ValueError):
+        h.options(hedge_after_percentile=100)
+
+    with pytest.raises(ValueError):
+        h.options(stream=True, hedge_after_percentile=99)
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(["-v", "-s", __file__]))
@@ -0,0 +1,164 @@
+import asyncio
+import sys
+from typing import List
+
+import pytest
+
+from ray.serve._private.common import (
+    DeploymentID,
+    DeploymentTargetInfo,
+    ReplicaID,
+    RunningReplicaInfo,
+)
+from ray.serve._private.long_poll import (
+    LongPollHost,
+    LongPollNamespace,
+    UpdatedObject,
+    apply_deployment_targets_delta,
+    compute_deployment_targets_delta,
+)
+
+KEY = (LongPollNamespace.DEPLOYMENT_TARGETS, "deployment_name")
+
+
+class FakeActorHandle:
+    def __init__(self, actor_id: str):
+        self._actor_id = actor_id
+
+
+def make_replica(i: int, **kwargs) -> RunningReplicaInfo:
+    return RunningReplicaInfo(
+        replica_id=ReplicaID(
+            str(i), deployment_id=DeploymentID(name="deployment_name")
+        ),
+        node_id="node_id",
+        node_ip="node_ip",
+        availability_zone="some-az",
+        actor_handle=FakeActorHandle(str(i)),
+        max_ongoing_requests=1,
+        **kwargs,
+    )
+
+
+def make_targets(replicas: List[RunningReplicaInfo]) -> DeploymentTargetInfo:
+    return DeploymentTargetInfo(is_available=True, running_replicas=replicas)
+
+
+def test_compute_and_apply_delta():
+    replicas = [make_replica(i) for i in range(10)]
+    old = make_targets(replicas)
+    new = make_targets(
+        replicas[1:5]
+        + [make_replica(5, multiplexed_model_ids=["m1"])]
+        + replicas[6:]
+        + [make_replica(10)]
+    )
+
+    delta = compute_deployment_targets_delta(old, new)
+    assert delta is not None
+    assert delta.removed_replica_ids == [replicas[0].replica_id]
+    assert [r.replica_id.unique_id for r in delta.upserted_replicas] == ["5", "10"]
+
+    applied = apply_deployment_targets_delta(old, delta)
+    assert applied.is_available
+    assert applied.running_replicas == new.running_replicas
+
+
+def test_no_delta_when_not_smaller():
+    old = make_targets([make_replica(0)])
+    new = make_targets([make_replica(1)])
+    assert compute_deployment_targets_delta(old, new) is None
+
+    # Only deployment targets are delta-encoded.
+    assert compute_deployment_targets_delta(1, 2) is None
+
+
+@pytest.mark.asyncio
+async def test_host_sends_delta_chain():
+    host = LongPollHost(listen_for_change_request_timeout_s=(0.1, 0.1))
+    replicas = [make_replica(i) for i in range(10)]
+    host.notify_changed({KEY: make_targets(replicas)})
+    initial_snapshot_id = host.snapshot_ids[KEY]
+
+    host.notify_changed({KEY: make_targets(replicas[1:])})
+    host.notify_changed({KEY: make_targets(replicas[2:])})
+
+    # Clients that don't accept deltas get the full snapshot.
+    result = await host.listen_for_change({KEY: initial_snapshot_id})
+    assert result[KEY].deltas is None
+    assert result[KEY].object_snapshot.running_replicas == replicas[2:]
+
+    result = await host.listen_for_change(
+        {KEY: initial_snapshot_id}, accept_deltas=True
+    )
+    update: UpdatedObject = result[KEY]
+    assert update.object_snapshot is None
+    assert update.snapshot_id == initial_snapshot_id + 2
+    assert len(update.deltas) == 2
+
+    rebuilt = make_targets(replicas)
+    for delta in update.deltas:
+        rebuilt = apply_deployment_targets_delta(rebuilt, delta)
+    assert rebuilt.running_replicas == replicas[2:]
+
+    # New clients always get the full snapshot.
+    result = await host.listen_for_change({KEY: -1}, accept_deltas=True)
+    assert result[KEY].deltas is None
+
+
+@pytest.mark.asyncio
+async def test_host_falls_back_to_snapshot_outside_history():
+    host = LongPollHost(
+        listen_for_change_request_timeout_s=(0.1, 0.1), max_delta_history=2
+    )
+    replicas = [make_replica(i) for i in range(10)]
+    host.notify_changed({KEY: make_targets(replicas)})
+    initial_snapshot_id = host.snapshot_ids[KEY]
+    for i in range(1, 4):
+        host.notify_changed({KEY: make_targets(replicas[i:])})
+
+    result = await host.listen_for_change(
+        {KEY: initial_snapshot_id}, accept_deltas=True
+    )
+    assert result[KEY].deltas is None
+    assert result[KEY].object_snapshot.running_replicas == replicas[3:]
+
+    # A full replacement can't be delta-encoded and resets the history.
+    result = await host.listen_for_change(
+        {KEY: initial_snapshot_id + 2}, accept_deltas=True
+    )
+    assert len(result[KEY].deltas) == 1
+    host.notify_changed({KEY: make_targets([make_replica(100)])})
+    result = await host.listen_for_change(
+        {KEY: initial_snapshot_id + 3}, accept_deltas=True
+    )
+    assert result[KEY].deltas is None
+
+
+@pytest.mark.asyncio
+async def test_host_coalesces_notifications():
+    host = LongPollHost(
+        listen_for_change_request_timeout_s=(5, 5), coalesce_window_s=0.05
+    )
+    host.notify_changed({"key_1": 1, "key_2": 1})
+    snapshot_ids = dict(host.snapshot_ids)
+
+    listen_task = asyncio.create_task(host.listen_for_change(snapshot_ids))
+    await asyncio.sleep(0.01)
+
+    host.notify_changed({"key_1": 2})
+    host.notify_changed({"key_1": 3})
+    host.notify_changed({"key_2": 2})
+    await asyncio.sleep(0)
+    assert not listen_task.done()
+
+    result = await asyncio.wait_for(listen_task, timeout=1)
+    assert {k: v.object_snapshot for k, v in result.items()} == {
+        "key_1": 3,
+        "key_2": 2,
+    }
+    assert result["key_1"].snapshot_id == snapshot_ids["key_1"] + 2
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-v", "-s", __file__]))
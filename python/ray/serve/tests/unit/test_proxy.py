@@ -418,6 +418,32 @@ class TestgRPCProxy:
         assert context.code() == grpc.StatusCode.OK
         assert context.details() == ""
 
+    @pytest.mark.asyncio
+    async def test_unary_stream_unpacks_batches(self):
+        """Test that batches of messages from the replica are sent one by one."""
+        grpc_proxy = self.create_grpc_proxy()
+
+        async def fake_proxy_request(proxy_request):
+            yield [b"0", b"1", b"2"]
+            yield b"3"
+            yield [b"4"]
+            yield ResponseStatus(code=grpc.StatusCode.OK)
+
+        grpc_proxy.proxy_request = fake_proxy_request
+        streaming_entrypoint = grpc_proxy.service_handler_factory(
+            service_method="service_method", stream=True
+        )
+        context = FakeGrpcContext()
+        messages = [
+            message
+            async for message in streaming_entrypoint(
+                request_proto=serve_pb2.UserDefinedMessage(name="foo"),
+                context=context,
+            )
+        ]
+        assert messages == [b"0", b"1", b"2", b"3", b"4"]
+        assert context.code() == grpc.StatusCode.OK
+
 
 class TestHTTPProxy:
     """Test methods implemented on HTTPProxy"""
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from ray.serve._private import proxy_request_response
 from ray.serve._private.common import gRPCRequest
 from ray.serve._private.proxy_request_response import (
     ASGIProxyRequest,
@@ -236,6 +237,25 @@ class TestgRPCProxyRequest:
         request_object = pickle.loads(serialized_arg)
         assert isinstance(request_object, gRPCRequest)
         assert request_object.user_request_proto == request_proto
+        assert request_object.max_stream_batch_size is None
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_max_stream_batch_size(self, monkeypatch, stream: bool):
+        """Test that streaming requests ask for batched responses when enabled."""
+        monkeypatch.setattr(
+            proxy_request_response, "RAY_SERVE_GRPC_STREAMING_MAX_BATCH_SIZE", 8
+        )
+        context = MagicMock()
+        context.invocation_metadata.return_value = ()
+        proxy_request = gRPCProxyRequest(
+            request_proto=serve_pb2.UserDefinedMessage(name="foo"),
+            context=context,
+            service_method="/custom.defined.Service/Streaming",
+            stream=stream,
+        )
+
+        request_object = pickle.loads(proxy_request.serialized_replica_arg())
+        assert request_object.max_stream_batch_size == (8 if stream else None)
 
 
 if __name__ == "__main__":
@@ -121,6 +121,54 @@ def test_prefix_match(mock_router):
     assert route == "/" and handle == ("endpoint3", "default")
 
 
+def test_prefix_match_with_trailing_slash_routes(mock_router):
+    router = mock_router
+    router.update_routes(
+        {
+            DeploymentID(name="endpoint1", app_name="default"): EndpointInfo(
+                route="/a/"
+            ),
+            DeploymentID(name="endpoint2", app_name="default"): EndpointInfo(
+                route="/a"
+            ),
+            DeploymentID(name="endpoint3", app_name="default"): EndpointInfo(
+                route="/a/b/"
+            ),
+        },
+    )
+
+    route, handle, _ = router.match_route("/a")
+    assert route == "/a" and handle == ("endpoint2", "default")
+    route, handle, _ = router.match_route("/a/")
+    assert route == "/a/" and handle == ("endpoint1", "default")
+    route, handle, _ = router.match_route("/a/b")
+    assert route == "/a/" and handle == ("endpoint1", "default")
+    route, handle, _ = router.match_route("/a/b/")
+    assert route == "/a/b/" and handle == ("endpoint3", "default")
+    route, handle, _ = router.match_route("/a/b/c")
+    assert route == "/a/b/" and handle == ("endpoint3", "default")
+    assert router.match_route("/ab") is None
+    assert router.match_route("/") is None
+
+
+def test_match_many_routes(mock_router):
+    router = mock_router
+    router.update_routes(
+        {
+            DeploymentID(name=f"endpoint{i}", app_name=f"app{i}"): EndpointInfo(
+                route=f"/app{i}"
+            )
+            for i in range(500)
+        },
+    )
+
+    for i in [0, 1, 10, 250, 499]:
+        route, handle, _ = router.match_route(f"/app{i}/predict")
+        assert route == f"/app{i}" and handle == (f"endpoint{i}", f"app{i}")
+    assert router.match_route("/app500") is None
+    assert router.match_route("/app1x") is None
+
+
 def test_update_routes(mock_router):
     router = mock_router
     router.update_routes(
@@ -0,0 +1,58 @@
+import sys
+
+import pytest
+
+from ray.serve._private.request_hedging import RequestHedger
+
+
+def test_hedge_delay():
+    hedger = RequestHedger(budget_ratio=1, window_size=4, min_samples=3)
+
+    # Not enough latencies have been recorded yet.
+    hedger.record_latency("a", 1)
+    hedger.record_latency("a", 2)
+    assert hedger.get_hedge_delay_s("a", 50) is None
+
+    hedger.record_latency("a", 3)
+    assert hedger.get_hedge_delay_s("a", 50) == 2
+    assert hedger.get_hedge_delay_s("a", 99) == 3
+
+    # Latencies are tracked per method.
+    assert hedger.get_hedge_delay_s("b", 50) is None
+
+
+def test_hedge_delay_window():
+    hedger = RequestHedger(budget_ratio=1, window_size=10, min_samples=1)
+    for _ in range(10):
+        hedger.record_latency("a", 1)
+    assert hedger.get_hedge_delay_s("a", 50) == 1
+
+    # Old latencies are dropped from the window. The delay is recomputed once
+    # enough new latencies have been recorded.
+    for _ in range(10):
+        hedger.record_latency("a", 5)
+    assert hedger.get_hedge_delay_s("a", 50) == 5
+
+
+def test_budget():
+    hedger = RequestHedger(budget_ratio=0.5, window_size=4, min_samples=1)
+    assert not hedger.has_budget()
+    assert not hedger.try_acquire_hedge()
+
+    hedger.on_request()
+    assert not hedger.has_budget()
+    hedger.on_request()
+    assert hedger.has_budget()
+    assert hedger.try_acquire_hedge()
+    assert not hedger.try_acquire_hedge()
+
+    # Tokens are capped at `budget_ratio * window_size`.
+    for _ in range(100):
+        hedger.on_request()
+    assert hedger.try_acquire_hedge()
+    assert hedger.try_acquire_hedge()
+    assert not hedger.try_acquire_hedge()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-v", "-s", __file__]))
@@ -24,6 +24,7 @@ from ray.serve._private.common import (
 from ray.serve._private.config import DeploymentConfig
 from ray.serve._private.constants import RAY_SERVE_COLLECT_AUTOSCALING_METRICS_ON_HANDLE
 from ray.serve._private.replica_result import ReplicaResult
+from ray.serve._private.request_hedging import RequestHedger
 from ray.serve._private.request_router import (
     PendingRequest,
     RequestRouter,
@@ -46,6 +47,7 @@ class FakeReplicaResult(ReplicaResult):
     def __init__(self, replica_id, is_generator_object: bool):
         self._replica_id = replica_id
         self._is_generator_object = is_generator_object
+        self._done_callbacks: List[Callable] = []
         self.cancelled = False
 
     def get(self, timeout_s: Optional[float]):
@@ -61,7 +63,11 @@ class FakeReplicaResult(ReplicaResult):
         raise NotImplementedError
 
     def add_done_callback(self, callback: Callable):
-        pass
+        self._done_callbacks.append(callback)
+
+    def finish(self):
+        for callback in self._done_callbacks:
+            callback(None)
 
     def cancel(self):
         self.cancelled = True
@@ -89,6 +95,7 @@ class FakeReplica(RunningReplica):
         self._is_cross_language = is_cross_language
         self._queue_len_info = queue_len_info
         self._error = error
+        self.results: List[FakeReplicaResult] = []
 
     @property
     def replica_id(self) -> ReplicaID:
@@ -115,21 +122,15 @@ class FakeReplica(RunningReplica):
                 self._queue_len_info is not None
             ), "Must set queue_len_info to use `send_request_with_rejection`."
 
-            return (
-                FakeReplicaResult(self._replica_id, is_generator_object=True),
-                self._queue_len_info,
-            )
+            result = FakeReplicaResult(self._replica_id, is_generator_object=True)
+            self.results.append(result)
+            return result, self._queue_len_info
         else:
-            if pr.metadata.is_streaming:
-                return (
-                    FakeReplicaResult(self._replica_id, is_generator_object=True),
-                    None,
-                )
-            else:
-                return (
-                    FakeReplicaResult(self._replica_id, is_generator_object=False),
-                    None,
-                )
+            result = FakeReplicaResult(
+                self._replica_id, is_generator_object=pr.metadata.is_streaming
+            )
+            self.results.append(result)
+            return result, None
 
 
 class FakeRequestRouter(RequestRouter):
@@ -205,7 +206,11 @@ class FakeRequestRouter(RequestRouter):
             self._blocked_requests.append(event)
             await event.wait()
 
-        if is_retry:
+        excluded_replica_ids = pr.routing_context.excluded_replica_ids
+        if is_retry or (
+            self._replica_to_return is not None
+            and self._replica_to_return.replica_id in excluded_replica_ids
+        ):
             assert (
                 self._replica_to_return_on_retry is not None
             ), "Set a replica to return on retry."
@@ -747,6 +752,94 @@ class TestAssignRequest:
         # After the request is routed, on_request_routed_called should be False.
         assert fake_request_router.on_request_routed_called is True
 
+    async def test_hedging(self, setup_router: Tuple[AsyncioRouter, FakeRequestRouter]):
+        router, fake_request_router = setup_router
+        router._request_hedger = RequestHedger(budget_ratio=1, min_samples=1)
+        d_id = DeploymentID(name="test")
+        r1 = FakeReplica(ReplicaID(unique_id="r1", deployment_id=d_id))
+        r2 = FakeReplica(ReplicaID(unique_id="r2", deployment_id=d_id))
+        fake_request_router.set_replica_to_return(r1)
+        fake_request_router.set_replica_to_return_on_retry(r2)
+        request_metadata = RequestMetadata(
+            request_id="test-request-1",
+            internal_request_id="test-internal-request-1",
+            hedge_after_percentile=50,
+        )
+
+        # The request isn't hedged until a latency has been recorded.
+        replica_result = await router.assign_request(request_metadata)
+        assert replica_result is r1.results[0]
+        replica_result.finish()
+        await async_wait_for_condition(
+            lambda: router._request_hedger.get_hedge_delay_s("__call__", 50) is not None
+        )
+
+        # The request is hedged to the other replica, which finishes first.
+        task = get_or_create_event_loop().create_task(
+            router.assign_request(request_metadata)
+        )
+        await async_wait_for_condition(lambda: len(r2.results) == 1)
+        assert not task.done()
+        # The request is no longer counted as queued while it's being hedged.
+        assert router._metrics_manager.num_queued_requests == 0
+        r2.results[0].finish()
+        assert await task is r2.results[0]
+        assert r1.results[1].cancelled
+        assert not r2.results[0].cancelled
+
+        # The request is hedged, but the original one finishes first.
+        task = get_or_create_event_loop().create_task(
+            router.assign_request(request_metadata)
+        )
+        await async_wait_for_condition(lambda: len(r2.results) == 2)
+        r1.results[2].finish()
+        assert await task is r1.results[2]
+        assert r2.results[1].cancelled
+        assert not r1.results[2].cancelled
+
+        # Cancelling the request cancels both.
+        task = get_or_create_event_loop().create_task(
+            router.assign_request(request_metadata)
+        )
+        await async_wait_for_condition(lambda: len(r2.results) == 3)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert r1.results[3].cancelled
+        assert r2.results[2].cancelled
+
+    async def test_hedging_budget(
+        self, setup_router: Tuple[AsyncioRouter, FakeRequestRouter]
+    ):
+        router, fake_request_router = setup_router
+        router._request_hedger = RequestHedger(budget_ratio=0.5, min_samples=1)
+        router._request_hedger.record_latency("__call__", 0.001)
+        d_id = DeploymentID(name="test")
+        r1 = FakeReplica(ReplicaID(unique_id="r1", deployment_id=d_id))
+        r2 = FakeReplica(ReplicaID(unique_id="r2", deployment_id=d_id))
+        fake_request_router.set_replica_to_return(r1)
+        fake_request_router.set_replica_to_return_on_retry(r2)
+        request_metadata = RequestMetadata(
+            request_id="test-request-1",
+            internal_request_id="test-internal-request-1",
+            hedge_after_percentile=50,
+        )
+
+        # Each request earns half a hedge, so every other request is hedged.
+        for i in range(4):
+            task = get_or_create_event_loop().create_task(
+                router.assign_request(request_metadata)
+            )
+            if i % 2 == 0:
+                assert await task is r1.results[-1]
+            else:
+                await async_wait_for_condition(lambda: len(r2.results) == (i + 1) // 2)
+                r2.results[-1].finish()
+                assert await task is r2.results[-1]
+
+        assert len(r1.results) == 4
+        assert len(r2.results) == 2
+
 
 def running_replica_info(replica_id: ReplicaID) -> RunningReplicaInfo:
     return RunningReplicaInfo(
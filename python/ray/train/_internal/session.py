@@ -76,6 +76,9 @@ class _FutureTrainingResult:
 
     def __init__(self, future: ray.ObjectRef):
         self.future = future
+        # Reference to the checkpoint in the object store, if the future was
+        # returned by `Trainable.save_to_object_store`.
+        self.checkpoint_ref: Optional[ray.ObjectRef] = None
 
     def resolve(self, block: bool = True) -> Optional["_TrainingResult"]:
         """Resolve into ``_TrainingResult``.
@@ -88,12 +91,17 @@ class _FutureTrainingResult:
         else:
             timeout = 1e-9
         try:
-            return ray.get(self.future, timeout=timeout)
+            result = ray.get(self.future, timeout=timeout)
         except TimeoutError:
             # Not ready, yet
-            pass
+            return None
         except Exception as exc:
             logger.error(f"Error resolving result: {exc}")
+            return None
+
+        if isinstance(result, tuple):
+            result, self.checkpoint_ref = result
+        return result
 
 
 class _TrainingResult:
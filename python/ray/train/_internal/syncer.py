@@ -320,6 +320,8 @@ class _BackgroundSyncer(Syncer):
         )
         self._sync_process = None
         self._current_cmd = None
+        # Whether the last sync process that was waited on succeeded.
+        self.last_sync_succeeded: Optional[bool] = None
 
     def _should_continue_existing_sync(self):
         """Returns whether a previous sync is still running within the timeout."""
@@ -403,7 +405,9 @@ class _BackgroundSyncer(Syncer):
         if self._sync_process:
             try:
                 self._sync_process.wait(timeout=timeout or self.sync_timeout)
+                self.last_sync_succeeded = True
             except Exception as e:
+                self.last_sync_succeeded = False
                 raise e
             finally:
                 # Regardless of whether the sync process succeeded within the timeout,
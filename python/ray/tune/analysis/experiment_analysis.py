@@ -12,10 +12,14 @@ import pyarrow.fs
 from ray.air.constants import EXPR_PROGRESS_FILE, EXPR_RESULT_FILE, TRAINING_ITERATION
 from ray.train._internal.storage import _exists_at_fs_path, get_fs_and_path
 from ray.tune import Checkpoint
-from ray.tune.execution.experiment_state import _find_newest_experiment_checkpoint
+from ray.tune.execution.experiment_state import (
+    _find_newest_experiment_checkpoint,
+    _load_trial_data,
+)
 from ray.tune.execution.tune_controller import TuneController
 from ray.tune.experiment import Trial
-from ray.tune.result import CONFIG_PREFIX, DEFAULT_METRIC
+from ray.tune.logger.parquet import _has_trial_results, _read_trial_results
+from ray.tune.result import CONFIG_PREFIX, DEFAULT_METRIC, TRIAL_ID
 from ray.tune.utils import flatten_dict
 from ray.tune.utils.serialization import TuneFunctionDecoder
 from ray.tune.utils.util import is_nan, is_nan_or_inf, unflattened_lookup
@@ -102,7 +106,12 @@ class ExperimentAnalysis:
             self._experiment_json_fs_path = experiment_json_fs_path
 
         self.trials = trials or self._load_trials()
-        self._trial_dataframes = self._fetch_trial_dataframes()
+        # If the results of all trials were logged to Parquet files, the trial
+        # dataframes are loaded from them on first access.
+        self._has_trial_results = _has_trial_results(self._fs, self._experiment_fs_path)
+        self._trial_dataframes = (
+            None if self._has_trial_results else self._fetch_trial_dataframes()
+        )
         self._configs = self.get_all_configs()
 
     def _load_trials(self) -> List[Trial]:
@@ -112,7 +121,11 @@ class ExperimentAnalysis:
         experiment_fs_path = Path(self._experiment_fs_path)
 
         trials = []
-        trial_states = experiment_state["trial_data"]
+        trial_states = _load_trial_data(
+            experiment_state,
+            experiment_state_path=self._experiment_json_fs_path,
+            fs=self._fs,
+        )
         for trial_json_state, trial_runtime_metadata in trial_states:
             trial = Trial.from_json_state(trial_json_state, stub=True)
             trial.restore_run_metadata(trial_runtime_metadata)
@@ -362,8 +375,61 @@ class ExperimentAnalysis:
         Each dataframe is indexed by iterations and contains reported
         metrics.
         """
+        if self._trial_dataframes is None:
+            self._trial_dataframes = self.get_trial_dataframes()
         return self._trial_dataframes
 
+    def get_trial_dataframes(
+        self,
+        trial_ids: Optional[List[str]] = None,
+        columns: Optional[List[str]] = None,
+    ) -> Dict[str, DataFrame]:
+        """Returns the dataframes of some or all trials.
+
+        If the experiment logged results with the
+        :class:`~ray.tune.logger.ParquetLoggerCallback`, only the requested
+        trials and columns are read from storage.
+
+        Args:
+            trial_ids: IDs of the trials to return dataframes for.
+                Defaults to all trials.
+            columns: Flattened keys of the reported metrics
+                (e.g. ``"info/loss"``) to include in the dataframes.
+                Defaults to all metrics.
+
+        Returns:
+            A dictionary mapping trial_id -> pd.DataFrame
+        """
+        if trial_ids is None:
+            requested_trial_ids = [trial.trial_id for trial in self.trials]
+        else:
+            requested_trial_ids = list(trial_ids)
+
+        if not self._has_trial_results:
+            trial_dfs = {
+                trial_id: self._trial_dataframes[trial_id]
+                for trial_id in requested_trial_ids
+                if trial_id in self._trial_dataframes
+            }
+            if columns is not None:
+                trial_dfs = {
+                    trial_id: df[[column for column in columns if column in df]]
+                    for trial_id, df in trial_dfs.items()
+                }
+            return trial_dfs
+
+        results_df = _read_trial_results(
+            self._fs, self._experiment_fs_path, trial_ids=trial_ids, columns=columns
+        )
+        trial_dfs = {trial_id: DataFrame() for trial_id in requested_trial_ids}
+        for trial_id, df in results_df.groupby(TRIAL_ID, sort=False):
+            if trial_id not in trial_dfs:
+                continue
+            if columns is not None and TRIAL_ID not in columns:
+                df = df.drop(columns=TRIAL_ID)
+            trial_dfs[trial_id] = df.reset_index(drop=True)
+        return trial_dfs
+
     def dataframe(
         self, metric: Optional[str] = None, mode: Optional[str] = None
     ) -> DataFrame:
@@ -227,6 +227,32 @@ class Callback(metaclass=_CallbackMeta):
         """
         pass
 
+    def on_trial_results(
+        self,
+        iteration: int,
+        trials: List["Trial"],
+        trial_results: List[Tuple["Trial", Dict]],
+        **info,
+    ):
+        """Called after receiving results from several trials at once.
+
+        This is only called if results are processed in batches (see the
+        ``TUNE_BATCH_RESULT_PROCESSING`` environment variable). By default,
+        this calls ``on_trial_result`` for each result. Override it to handle
+        all results at once, e.g. to write them in bulk.
+
+        Arguments:
+            iteration: Number of iterations of the tuning loop.
+            trials: List of trials.
+            trial_results: List of ``(trial, result)`` tuples, at most one
+                per trial.
+            **info: Kwargs dict for forward compatibility.
+        """
+        for trial, result in trial_results:
+            self.on_trial_result(
+                iteration=iteration, trials=trials, trial=trial, result=result, **info
+            )
+
     def on_trial_complete(
         self, iteration: int, trials: List["Trial"], trial: "Trial", **info
     ):
@@ -295,6 +321,19 @@ class Callback(metaclass=_CallbackMeta):
         """
         pass
 
+    def on_experiment_checkpoint(self, iteration: int, trials: List["Trial"], **info):
+        """Called before the experiment state is saved.
+
+        Data written to the experiment directory here is synced to storage
+        along with the experiment state.
+
+        Arguments:
+            iteration: Number of iterations of the tuning loop.
+            trials: List of trials.
+            **info: Kwargs dict for forward compatibility.
+        """
+        pass
+
     def on_experiment_end(self, trials: List["Trial"], **info):
         """Called after experiment is over and all trials have concluded.
 
@@ -409,6 +448,10 @@ class CallbackList(Callback):
         for callback in self._callbacks:
             callback.on_trial_result(**info)
 
+    def on_trial_results(self, **info):
+        for callback in self._callbacks:
+            callback.on_trial_results(**info)
+
     def on_trial_complete(self, **info):
         for callback in self._callbacks:
             callback.on_trial_complete(**info)
@@ -425,6 +468,10 @@ class CallbackList(Callback):
         for callback in self._callbacks:
             callback.on_checkpoint(**info)
 
+    def on_experiment_checkpoint(self, **info):
+        for callback in self._callbacks:
+            callback.on_experiment_checkpoint(**info)
+
     def on_experiment_end(self, **info):
         for callback in self._callbacks:
             callback.on_experiment_end(**info)
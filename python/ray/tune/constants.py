@@ -5,6 +5,7 @@
 # NOTE: When adding a new environment variable, please track it in this list.
 TUNE_ENV_VARS = {
     "RAY_AIR_LOCAL_CACHE_DIR",
+    "TUNE_BATCH_RESULT_PROCESSING",
     "TUNE_DISABLE_AUTO_CALLBACK_LOGGERS",
     "TUNE_DISABLE_AUTO_INIT",
     "TUNE_DISABLE_DATED_SUBDIR",
@@ -13,6 +14,7 @@ TUNE_ENV_VARS = {
     "TUNE_FORCE_TRIAL_CLEANUP_S",
     "TUNE_FUNCTION_THREAD_TIMEOUT_S",
     "TUNE_GLOBAL_CHECKPOINT_S",
+    "TUNE_INCREMENTAL_EXPERIMENT_STATE",
     "TUNE_MAX_LEN_IDENTIFIER",
     "TUNE_MAX_PENDING_TRIALS_PG",
     "TUNE_PLACEMENT_GROUP_PREFIX",
@@ -23,6 +25,8 @@ TUNE_ENV_VARS = {
     "TUNE_RESULT_DELIM",
     "TUNE_RESULT_BUFFER_MAX_TIME_S",
     "TUNE_RESULT_BUFFER_MIN_TIME_S",
+    "TUNE_REUSE_ACTORS_ACROSS_RESOURCES",
+    "TUNE_SHARE_PARAMETERS_PER_NODE",
     "TUNE_WARN_THRESHOLD_S",
     "TUNE_WARN_INSUFFICENT_RESOURCE_THRESHOLD_S",
     "TUNE_WARN_INSUFFICENT_RESOURCE_THRESHOLD_S_AUTOSCALER",
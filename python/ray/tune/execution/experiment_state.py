@@ -1,10 +1,11 @@
 import fnmatch
+import json
 import logging
 import os
 import time
 from collections import Counter
 from pathlib import Path
-from typing import Callable, Dict, Optional, Union
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
 
 import pyarrow.fs
 
@@ -58,6 +59,41 @@ def _find_newest_experiment_checkpoint(
     return Path(experiment_fs_path, filename).as_posix()
 
 
+def _load_trial_data(
+    experiment_state: Dict, experiment_state_path: str, fs: pyarrow.fs.FileSystem
+) -> List[Tuple[str, str]]:
+    """Returns the ``(json_state, runtime_metadata)`` pairs of all trials.
+
+    Experiment state files either embed the trial states under ``"trial_data"``
+    or reference the segments of a trial state log in a directory next to them.
+    The first segment holds the states of all trials and each following segment
+    the states of the trials that changed since the previous one. Each line of
+    a segment holds the state of one trial, and later lines override earlier
+    lines of the same trial.
+
+    Args:
+        experiment_state: The loaded experiment state file.
+        experiment_state_path: Local or remote path to the experiment state file.
+        fs: The filesystem to read the trial state log from.
+    """
+    if "trial_data" in experiment_state:
+        return experiment_state["trial_data"]
+
+    trial_state_log = experiment_state["trial_state_log"]
+    log_dir = Path(os.path.dirname(experiment_state_path), trial_state_log["dir_name"])
+
+    trial_data = {}
+    for segment in trial_state_log["segments"]:
+        with fs.open_input_stream((log_dir / segment).as_posix()) as f:
+            lines = f.readall().decode("utf-8").split("\n")
+        for line in lines:
+            if not line:
+                continue
+            trial_id, trial_json_state, trial_runtime_metadata = json.loads(line)
+            trial_data[trial_id] = (trial_json_state, trial_runtime_metadata)
+    return list(trial_data.values())
+
+
 class _ExperimentCheckpointManager:
     """Helper class for managing experiment-level checkpoints.
 
@@ -70,6 +106,11 @@ class _ExperimentCheckpointManager:
     ``max(10, time_per_checkpoint * 19)``. This means that at most 5% of the
     time (1/20) will be used for writing checkpoints, while 95% of the time
     (19/20) will be used to handle the rest of the training loop.
+
+    Files in the driver staging directory that match ``immutable_file_pattern``
+    are never modified once written. They are excluded from the uploads once a
+    sync that included them has succeeded, so that the cost of a sync doesn't
+    grow with the number of such files.
     """
 
     def __init__(
@@ -78,9 +119,16 @@ class _ExperimentCheckpointManager:
         storage: Optional[StorageContext],
         checkpoint_period: Union[int, float, str],
         sync_every_n_trial_checkpoints: Optional[int] = None,
+        immutable_file_pattern: Optional[str] = None,
     ):
         self._storage = storage
 
+        self._immutable_file_pattern = immutable_file_pattern
+        # Immutable files (relative to the driver staging path) that have been
+        # uploaded, and the ones included in the last launched sync.
+        self._uploaded_immutable_files: Set[str] = set()
+        self._syncing_immutable_files: Set[str] = set()
+
         self._last_save_time = float("-inf")
         self._last_sync_time = None
 
@@ -169,6 +217,7 @@ class _ExperimentCheckpointManager:
         def wait_for_sync():
             try:
                 self._storage.syncer.wait()
+                self._on_sync_waited()
             except Exception:
                 logger.error(
                     "Saving experiment state to storage at "
@@ -194,10 +243,21 @@ class _ExperimentCheckpointManager:
             if self._last_sync_time is not None
             else None
         )
+        immutable_files = self._list_immutable_files(driver_staging_path)
+        # Forget the files that were removed since.
+        self._uploaded_immutable_files &= immutable_files
         launched_sync = self._storage.syncer.sync_up(
-            driver_staging_path, self._storage.experiment_fs_path
+            driver_staging_path,
+            self._storage.experiment_fs_path,
+            exclude=sorted(self._uploaded_immutable_files) or None,
         )
         if launched_sync:
+            # The previous sync was waited on before launching this one.
+            self._on_sync_waited()
+            self._syncing_immutable_files = (
+                immutable_files - self._uploaded_immutable_files
+            )
+
             if (
                 time_since_last_sync is not None
                 and time_since_last_sync < self._excessive_sync_threshold
@@ -250,6 +310,19 @@ class _ExperimentCheckpointManager:
         # Finish
         self._last_save_time = time.monotonic()
 
+    def _on_sync_waited(self):
+        if getattr(self._storage.syncer, "last_sync_succeeded", False):
+            self._uploaded_immutable_files |= self._syncing_immutable_files
+            self._syncing_immutable_files = set()
+
+    def _list_immutable_files(self, driver_staging_path: str) -> Set[str]:
+        if not self._immutable_file_pattern:
+            return set()
+        return {
+            path.relative_to(driver_staging_path).as_posix()
+            for path in Path(driver_staging_path).glob(self._immutable_file_pattern)
+        }
+
     def sync_down_experiment_state(self) -> None:
         fs = self._storage.storage_filesystem
         filepaths = _list_at_fs_path(fs=fs, fs_path=self._storage.experiment_fs_path)
@@ -9,7 +9,7 @@ from collections import defaultdict, deque
 from datetime import datetime
 from functools import partial
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import ray
 from ray.air import ResourceRequest
@@ -26,6 +26,7 @@ from ray.tune.execution.class_cache import _ActorClassCache
 from ray.tune.execution.experiment_state import (
     _ExperimentCheckpointManager,
     _find_newest_experiment_checkpoint,
+    _load_trial_data,
 )
 from ray.tune.execution.insufficient_resources_manager import (
     _InsufficientResourcesManager,
@@ -39,6 +40,7 @@ from ray.tune.experiment.trial import (
     _noop_logger_creator,
     _TrialInfo,
 )
+from ray.tune.registry import _start_parameter_holders, _stop_parameter_holders
 from ray.tune.result import (
     DEBUG_METRICS,
     DEFAULT_METRIC,
@@ -61,12 +63,16 @@ from ray.tune.utils.serialization import TuneFunctionDecoder, TuneFunctionEncode
 from ray.util.annotations import DeveloperAPI
 from ray.util.debug import log_once
 
+if TYPE_CHECKING:
+    from ray.tune.experimental.output import _TrialProgress
+
 logger = logging.getLogger(__name__)
 
 
 @DeveloperAPI
 class TuneController:
     CKPT_FILE_TMPL = "experiment_state-{}.json"
+    TRIAL_STATE_LOG_DIR_TMPL = "trial_state_log-{}"
     RAISE = "RAISE"
 
     def __init__(
@@ -148,12 +154,38 @@ class TuneController:
 
         # Reuse actors
         self._reuse_actors = reuse_actors
-        self._actor_cache = _ObjectCache(may_keep_one=True)
+        # If enabled, cached actors can also be reused for trials that request
+        # fewer resources of the same kinds, e.g. fewer GPUs.
+        self._reuse_actors_across_resources = bool(
+            int(os.environ.get("TUNE_REUSE_ACTORS_ACROSS_RESOURCES", "0"))
+        )
+        self._actor_cache = _ObjectCache(
+            may_keep_one=True,
+            reuse_cost=(
+                _get_resource_reuse_cost
+                if self._reuse_actors_across_resources
+                else None
+            ),
+        )
 
         # Trial metadata for experiment checkpoints
         self._trials_to_cache: Set[Trial] = set()
         self._trial_metadata: Dict[str, str] = {}
 
+        # If enabled, trial states are appended to a log on each experiment
+        # checkpoint instead of being written to the experiment state file.
+        self._incremental_experiment_state = bool(
+            int(os.environ.get("TUNE_INCREMENTAL_EXPERIMENT_STATE", "0"))
+        )
+        # Trials whose state changed since the last experiment checkpoint.
+        # This is an ordered set (the values are unused).
+        self._trial_ids_to_log: Dict[str, None] = {}
+        # File names of the segments of the trial state log, and their total
+        # number of entries.
+        self._trial_state_log_segments: List[str] = []
+        self._trial_state_log_num_entries = 0
+        self._next_trial_state_log_segment_index = 0
+
         # TRAINING
         self._buffer_length = int(os.getenv("TUNE_RESULT_BUFFER_LENGTH", 1))
         self._buffer_min_time_s = float(os.getenv("TUNE_RESULT_BUFFER_MIN_TIME_S", 0.0))
@@ -161,6 +193,13 @@ class TuneController:
             os.getenv("TUNE_RESULT_BUFFER_MAX_TIME_S", 100.0)
         )
 
+        # If enabled, all events available in a step are handled before the
+        # received training results are processed together.
+        self._batch_result_processing = bool(
+            int(os.environ.get("TUNE_BATCH_RESULT_PROCESSING", "0"))
+        )
+        self._trial_results_batch: List[Tuple[Trial, List[Dict]]] = []
+
         # Legacy TrialRunner init
         self._search_alg = search_alg or BasicVariantGenerator()
         self._placeholder_resolvers = placeholder_resolvers
@@ -201,6 +240,8 @@ class TuneController:
 
         self._trials: List[Trial] = []
         self._live_trials: Set[Trial] = set()  # Set of non-terminated trials
+        # Summary of the trials for progress reporting, see `_set_trial_progress`
+        self._trial_progress: Optional["_TrialProgress"] = None
         self._cached_trial_decisions = {}
         self._queued_trial_decisions = {}
 
@@ -290,6 +331,7 @@ class TuneController:
         spec = experiment.public_spec if experiment else {}
         spec["total_num_samples"] = total_num_samples
         self._callbacks.setup(**spec)
+        _start_parameter_holders()
 
     def end_experiment_callbacks(self) -> None:
         """Calls ``on_experiment_end`` method in callbacks."""
@@ -299,6 +341,10 @@ class TuneController:
     def experiment_state_file_name(self) -> str:
         return self.CKPT_FILE_TMPL.format(self._session_str)
 
+    @property
+    def trial_state_log_dir_name(self) -> str:
+        return self.TRIAL_STATE_LOG_DIR_TMPL.format(self._session_str)
+
     @property
     def experiment_state_path(self) -> str:
         """Returns the local experiment checkpoint path."""
@@ -316,6 +362,8 @@ class TuneController:
             storage=self._storage,
             checkpoint_period=self._checkpoint_period,
             sync_every_n_trial_checkpoints=self._trial_checkpoint_config.num_to_keep,
+            # Segments of the trial state log are never modified once written.
+            immutable_file_pattern=self.TRIAL_STATE_LOG_DIR_TMPL.format("*") + "/*",
         )
 
     def save_to_dir(self):
@@ -327,18 +375,26 @@ class TuneController:
         - the searcher state
         - the callback states
         """
+        driver_staging_path = self._storage.experiment_driver_staging_path
+        os.makedirs(driver_staging_path, exist_ok=True)
+
         # Get state from trial executor and runner
         runner_state = {
-            # Trials
-            "trial_data": list(self._get_trial_checkpoints().values()),
             # Experiment data
             "runner_data": self.__getstate__(),
             # Metadata
             "stats": {"start_time": self._start_time},
         }
+        # Trials
+        if self._incremental_experiment_state:
+            # The log is written first, so that the experiment state file never
+            # references trial states that haven't been written yet.
+            runner_state["trial_state_log"] = self._save_trial_state_log(
+                driver_staging_path
+            )
+        else:
+            runner_state["trial_data"] = list(self._get_trial_checkpoints().values())
 
-        driver_staging_path = self._storage.experiment_driver_staging_path
-        os.makedirs(driver_staging_path, exist_ok=True)
         with open(
             Path(driver_staging_path, self.experiment_state_file_name),
             "w",
@@ -346,8 +402,63 @@ class TuneController:
             json.dump(runner_state, f, cls=TuneFunctionEncoder)
 
         self._search_alg.save_to_dir(driver_staging_path, session_str=self._session_str)
+        self._callbacks.on_experiment_checkpoint(
+            iteration=self._iteration, trials=self._trials
+        )
         self._callbacks.save_to_dir(driver_staging_path, session_str=self._session_str)
 
+    def _save_trial_state_log(self, driver_staging_path: str) -> Dict:
+        """Writes the states of the trials that changed since the last save to a
+        new segment of the trial state log.
+
+        This keeps the cost of a save proportional to the number of changed trials
+        instead of the total number of trials. Segments are never modified once
+        written, so only the new segment is uploaded to the storage path. Once the
+        log holds more than twice as many entries as there are trials, it is
+        compacted into a new first segment with one entry per trial and the
+        previous segments are removed. The cost of compaction is thus amortized
+        over the entries written before it.
+
+        Returns:
+            The reference to the log that is stored in the experiment state file.
+        """
+        trial_metadata = self._get_trial_checkpoints()
+        log_dir = Path(driver_staging_path, self.trial_state_log_dir_name)
+        log_dir.mkdir(exist_ok=True)
+
+        num_trials = len(trial_metadata)
+        num_entries = self._trial_state_log_num_entries + len(self._trial_ids_to_log)
+        obsolete_segments = []
+        if not self._trial_state_log_segments or num_entries > 2 * num_trials:
+            obsolete_segments = self._trial_state_log_segments
+            self._trial_state_log_segments = []
+            trial_ids = list(trial_metadata)
+            num_entries = num_trials
+        else:
+            trial_ids = list(self._trial_ids_to_log)
+
+        if trial_ids or not self._trial_state_log_segments:
+            segment = f"{self._next_trial_state_log_segment_index:06d}.jsonl"
+            self._next_trial_state_log_segment_index += 1
+            tmp_segment_path = log_dir / (segment + ".tmp")
+            with open(tmp_segment_path, "w") as f:
+                f.writelines(
+                    json.dumps([trial_id, *trial_metadata[trial_id]]) + "\n"
+                    for trial_id in trial_ids
+                )
+            os.replace(tmp_segment_path, log_dir / segment)
+            self._trial_state_log_segments.append(segment)
+
+        for segment in obsolete_segments:
+            (log_dir / segment).unlink(missing_ok=True)
+
+        self._trial_ids_to_log.clear()
+        self._trial_state_log_num_entries = num_entries
+        return {
+            "dir_name": log_dir.name,
+            "segments": list(self._trial_state_log_segments),
+        }
+
     def checkpoint(self, force: bool = False, wait: bool = False):
         self._checkpoint_manager.sync_up_experiment_state(
             save_fn=self.save_to_dir, force=force, wait=wait
@@ -389,9 +500,9 @@ class TuneController:
 
             self.add_trial(trial_to_add)
 
-    def _restore_trials(self, experiment_state: Dict) -> List[Trial]:
+    def _restore_trials(self, trial_data: List[Tuple[str, str]]) -> List[Trial]:
         trials = []
-        for trial_json_state, trial_runtime_metadata in experiment_state["trial_data"]:
+        for trial_json_state, trial_runtime_metadata in trial_data:
             trial = Trial.from_json_state(trial_json_state)
             trial.restore_run_metadata(trial_runtime_metadata)
 
@@ -451,7 +562,12 @@ class TuneController:
         self.__setstate__(experiment_state["runner_data"])
 
         # 2. Get the trial states that the run left off at.
-        trials = self._restore_trials(experiment_state)
+        trial_data = _load_trial_data(
+            experiment_state,
+            experiment_state_path=newest_state_path,
+            fs=self._storage.storage_filesystem,
+        )
+        trials = self._restore_trials(trial_data)
 
         # 3. Restore search algorithm and callback state
         # Download the search algorithm and callback state to the driver staging dir.
@@ -552,6 +668,9 @@ class TuneController:
             self._pending_trials_list.append(trial)
             self._resources_to_pending_trials[trial.placement_group_factory].add(trial)
 
+        if self._trial_progress is not None:
+            self._trial_progress.on_trial_status(trial)
+
     def _update_trial_queue(self, blocking: bool = False, timeout: int = 600) -> bool:
         """Adds next trials to queue if possible.
 
@@ -689,6 +808,14 @@ class TuneController:
                 self._insufficient_resources_manager.on_no_available_trials(
                     self.get_trials()
                 )
+        elif self._batch_result_processing:
+            # Also handle all other events that are available already, so that
+            # their training results are processed in one batch.
+            for _ in range(self._actor_manager.num_live_actors):
+                if not self._actor_manager.next(timeout=0):
+                    break
+
+        self._process_trial_results_batch()
 
         # Maybe stop whole experiment
         self._stop_experiment_if_needed()
@@ -755,9 +882,20 @@ class TuneController:
 
         trial.set_status(status)
 
+        if self._trial_progress is not None:
+            self._trial_progress.on_trial_status(trial)
+
+    def _set_trial_progress(self, trial_progress: "_TrialProgress"):
+        """Keeps the statuses of all trials in the trial progress summary of a
+        progress reporter up to date."""
+        self._trial_progress = trial_progress
+        for trial in self._trials:
+            trial_progress.on_trial_status(trial)
+
     def _get_trial_checkpoints(self) -> Dict[str, str]:
         for trial in self._trials_to_cache:
             self._trial_metadata[trial.trial_id] = trial.get_json_state()
+            self._trial_ids_to_log[trial.trial_id] = None
         self._trials_to_cache.clear()
         return self._trial_metadata
 
@@ -941,7 +1079,9 @@ class TuneController:
         cached_actor = self._actor_cache.pop_cached_object(resource_request)
         logger.debug(f"Reusing ACTOR for trial {trial}: {cached_actor}")
 
-        if trial in self._trial_to_actor:
+        if trial not in self._trial_to_actor:
+            trial.temporary_state.startup_requested_time = time.monotonic()
+        else:
             original_actor = self._trial_to_actor.pop(trial)
             self._actor_to_trial.pop(original_actor)
 
@@ -975,6 +1115,8 @@ class TuneController:
         # We checkpoint metadata here to try mitigating logdir duplication
         self._mark_trial_to_checkpoint(trial)
 
+        trial.temporary_state.startup_requested_time = time.monotonic()
+
         if self._maybe_reuse_cached_actor(trial):
             return
 
@@ -1095,9 +1237,12 @@ class TuneController:
             )
             return False
 
-        if not self._actor_cache.cache_object(
-            trial.placement_group_factory, tracked_actor
-        ):
+        # The actor may have more resources than the trial requested if it was
+        # reused across resource requests.
+        actor_resources = self._actor_manager._live_actors_to_ray_actors_resources[
+            tracked_actor
+        ][1].resource_request
+        if not self._actor_cache.cache_object(actor_resources, tracked_actor):
             logger.debug(
                 f"Could not cache actor of trial {trial} for "
                 "reuse, as there are no pending trials "
@@ -1123,10 +1268,23 @@ class TuneController:
 
         self._unstage_trial_with_resources(trial)
 
-        ray_actor = self._actor_manager._live_actors_to_ray_actors_resources[
-            tracked_actor
-        ][0]
+        (
+            ray_actor,
+            acquired_resources,
+        ) = self._actor_manager._live_actors_to_ray_actors_resources[tracked_actor]
         trial.set_ray_actor(ray_actor)
+        # The resources the trial actually runs with, which may exceed its
+        # request if a cached actor was reused.
+        trial.run_metadata.last_resources = acquired_resources.resource_request.bundles
+
+        requested_time = trial.temporary_state.startup_requested_time
+        if requested_time is not None:
+            # Time from requesting an actor (or a reused actor) until the
+            # trial could be started on it.
+            startup_time_s = time.monotonic() - requested_time
+            trial.run_metadata.last_startup_time_s = startup_time_s
+            trial.run_metadata.total_startup_time_s += startup_time_s
+            trial.temporary_state.startup_requested_time = None
 
         self._callbacks.on_trial_start(
             iteration=self._iteration, trials=self._trials, trial=trial
@@ -1515,6 +1673,10 @@ class TuneController:
     def _on_training_result(self, trial, result):
         if not isinstance(result, list):
             result = [result]
+        if self._batch_result_processing:
+            # Processed at the end of the step in `_process_trial_results_batch`.
+            self._trial_results_batch.append((trial, result))
+            return
         with warn_if_slow("process_trial_result"):
             self._process_trial_results(trial, result)
         self._maybe_execute_queued_decision(trial, after_save=False)
@@ -1551,14 +1713,165 @@ class TuneController:
                     # ignore all results that came after that.
                     break
 
-    def _process_trial_result(self, trial, result):
+    def _process_trial_results_batch(self):
+        """Processes the training results received in this step together.
+
+        The scheduler, search algorithm, and callbacks are notified of the
+        results of all trials at once. Trials that reported several buffered
+        results are processed one after another, as their results have to be
+        processed in order.
+        """
+        if not self._trial_results_batch:
+            return
+
+        trial_results_batch = self._trial_results_batch
+        self._trial_results_batch = []
+
+        single_results = []
+        for trial, results in trial_results_batch:
+            if len(results) == 1:
+                single_results.append((trial, results[0]))
+                continue
+            with warn_if_slow("process_trial_result"):
+                self._process_trial_results(trial, results)
+            self._maybe_execute_queued_decision(trial, after_save=False)
+
+        if not single_results:
+            return
+
+        logger.debug(f"Processing results of {len(single_results)} trials together.")
+        with warn_if_slow(
+            "process_trial_results_batch",
+            message="Processing a batch of trial results took {duration:.3f} s, "
+            "which may be a performance bottleneck. Please consider "
+            "reporting results less frequently to Ray Tune.",
+        ):
+            self._process_trial_result_batch(single_results)
+
+        for trial, _ in single_results:
+            self._maybe_execute_queued_decision(trial, after_save=False)
+
+    def _process_trial_result_batch(self, trial_results: List[Tuple[Trial, Dict]]):
+        """Batched version of `_process_trial_result` (one result per trial)."""
+        prepared = []
+        decisions = {}
+        to_schedule = []
+        for trial, result in trial_results:
+            if trial.status != Trial.RUNNING:
+                continue
+            is_duplicate = RESULT_DUPLICATE in result
+            force_checkpoint = result.get(SHOULD_CHECKPOINT, False)
+            result, flat_result = self._prepare_trial_result(trial, result)
+            prepared.append(
+                (trial, result, flat_result, is_duplicate, force_checkpoint)
+            )
+            if self._stopper(trial.trial_id, result) or trial.should_stop(flat_result):
+                decisions[trial.trial_id] = TrialScheduler.STOP
+            else:
+                to_schedule.append((trial, flat_result))
+
+        changed_by_others = set()
+        if to_schedule:
+            with warn_if_slow("scheduler.on_trial_results"):
+                changed_by_others = self._scheduler_on_trial_results(
+                    to_schedule, decisions
+                )
+
+        processed = []
+        for trial, result, flat_result, is_duplicate, force_checkpoint in prepared:
+            if trial.trial_id in changed_by_others:
+                # The scheduler changed the status of this trial while handling
+                # the result of another trial (e.g. PBT pausing it to exploit).
+                # Its actor is stopped, like when processing results one by one.
+                logger.debug(
+                    f"Not processing result of trial {trial} further as it is "
+                    f"{trial.status} now."
+                )
+                continue
+            decision = decisions[trial.trial_id]
+            if decision == TrialScheduler.STOP:
+                result.update(done=True)
+            processed.append(
+                (trial, result, flat_result, is_duplicate, force_checkpoint, decision)
+            )
+
+        search_alg_results = [
+            (trial.trial_id, flat_result)
+            for trial, _, flat_result, _, _, decision in processed
+            if decision != TrialScheduler.STOP
+        ]
+        if search_alg_results:
+            # Only updating search alg for trials that are not to be stopped.
+            with warn_if_slow("search_alg.on_trial_results"):
+                self._search_alg.on_trial_results(search_alg_results)
+
+        callback_results = [
+            (trial, result)
+            for trial, result, _, is_duplicate, _, _ in processed
+            if not is_duplicate
+        ]
+        if callback_results:
+            with warn_if_slow("callbacks.on_trial_results"):
+                self._callbacks.on_trial_results(
+                    iteration=self._iteration,
+                    trials=self._trials,
+                    trial_results=[
+                        (trial, result.copy()) for trial, result in callback_results
+                    ],
+                )
+            for trial, result in callback_results:
+                trial.update_last_result(result)
+                # Include in next experiment checkpoint
+                self._mark_trial_to_checkpoint(trial)
+
+        for trial, _, _, _, force_checkpoint, decision in processed:
+            self._handle_trial_result_decision(trial, decision, force_checkpoint)
+
+    def _scheduler_on_trial_results(
+        self, trial_results: List[Tuple[Trial, Dict]], decisions: Dict[str, str]
+    ) -> Set[str]:
+        """Gets the scheduler decisions for the results of several trials.
+
+        The decisions are stored in ``decisions`` by trial ID.
+
+        Returns:
+            The IDs of the trials whose status was changed by the scheduler while
+            handling the result of another trial before their own. These trials
+            get no decision.
+        """
+        if (
+            type(self._scheduler_alg).on_trial_results
+            is not TrialScheduler.on_trial_results
+        ):
+            # The status changes of a batched scheduler hook can't be attributed
+            # to single results, so all results are processed.
+            scheduler_decisions = self._scheduler_alg.on_trial_results(
+                self._wrapped(), trial_results
+            )
+            for (trial, _), decision in zip(trial_results, scheduler_decisions):
+                decisions[trial.trial_id] = decision
+            return set()
+
+        # Call the hook for one result at a time, like when processing results
+        # one by one, so that trials changed by another trial's hook are known.
+        statuses = [trial.status for trial, _ in trial_results]
+        changed_by_others = set()
+        for (trial, flat_result), status in zip(trial_results, statuses):
+            if trial.status != status:
+                changed_by_others.add(trial.trial_id)
+                continue
+            decisions[trial.trial_id] = self._scheduler_alg.on_trial_result(
+                self._wrapped(), trial, flat_result
+            )
+        return changed_by_others
+
+    def _prepare_trial_result(self, trial: Trial, result: Dict) -> Tuple[Dict, Dict]:
+        """Returns the result to process and its validated, flattened version."""
         result.update(trial_id=trial.trial_id)
-        is_duplicate = RESULT_DUPLICATE in result
-        force_checkpoint = result.get(SHOULD_CHECKPOINT, False)
         # TrialScheduler and SearchAlgorithm still receive a
         # notification because there may be special handling for
         # the `on_trial_complete` hook.
-        if is_duplicate:
+        if RESULT_DUPLICATE in result:
             logger.debug("Trial finished without logging 'done'.")
             result = trial.last_result
             result.update(done=True)
@@ -1567,6 +1880,12 @@ class TuneController:
 
         flat_result = flatten_dict(result)
         self._validate_result_metrics(flat_result)
+        return result, flat_result
+
+    def _process_trial_result(self, trial, result):
+        is_duplicate = RESULT_DUPLICATE in result
+        force_checkpoint = result.get(SHOULD_CHECKPOINT, False)
+        result, flat_result = self._prepare_trial_result(trial, result)
 
         if self._stopper(trial.trial_id, result) or trial.should_stop(flat_result):
             decision = TrialScheduler.STOP
@@ -1596,6 +1915,11 @@ class TuneController:
             # Include in next experiment checkpoint
             self._mark_trial_to_checkpoint(trial)
 
+        return self._handle_trial_result_decision(trial, decision, force_checkpoint)
+
+    def _handle_trial_result_decision(
+        self, trial: Trial, decision: str, force_checkpoint: bool
+    ) -> Optional[str]:
         # Checkpoints to disk. This should be checked even if
         # the scheduler decision is STOP or PAUSE. Note that
         # PAUSE only checkpoints to memory and does not update
@@ -1692,6 +2016,7 @@ class TuneController:
         self,
         trial: Trial,
         result: Optional[Dict] = None,
+        to_object_store: bool = False,
     ) -> Optional[_FutureTrainingResult]:
         if trial not in self._trial_to_actor:
             logger.debug(
@@ -1704,7 +2029,10 @@ class TuneController:
 
         future = self._schedule_trial_task(
             trial=trial,
-            method_name="save",
+            # If requested, the checkpoint is also put into the object store, so
+            # that other trials can be restored from it (e.g. in PBT). The future
+            # then resolves to a tuple of the training result and an object ref.
+            method_name="save_to_object_store" if to_object_store else "save",
             on_result=self._on_saving_result,
             on_error=self._trial_task_failure,
             _return_future=True,
@@ -1722,6 +2050,11 @@ class TuneController:
         return trial.temporary_state.saving_to
 
     def _on_saving_result(self, trial, checkpoint_value: _TrainingResult):
+        if isinstance(checkpoint_value, tuple):
+            # Result of `save_to_object_store`. The object ref is only used by
+            # the caller of `_schedule_trial_save`.
+            checkpoint_value, _ = checkpoint_value
+
         with warn_if_slow("process_trial_save"):
             self._process_trial_save(trial, checkpoint_value)
 
@@ -1800,11 +2133,18 @@ class TuneController:
 
         method_name = "restore"
         args = (checkpoint_result,)
+        kwargs = {}
+        checkpoint_ref = trial.temporary_state.checkpoint_ref_to_restore
+        if checkpoint_ref is not None:
+            # Pass in a list so the ref isn't resolved before the call, which
+            # lets the trainable fall back to storage if the object was lost.
+            kwargs["checkpoint_refs"] = [checkpoint_ref]
+            trial.temporary_state.checkpoint_ref_to_restore = None
         self._schedule_trial_task(
             trial=trial,
             method_name=method_name,
             args=args,
-            kwargs={},
+            kwargs=kwargs,
             on_result=self._on_restoring_result,
             on_error=self._trial_task_failure,
         )
@@ -1973,6 +2313,7 @@ class TuneController:
     def cleanup(self):
         """Cleanup trials and callbacks."""
         self._cleanup_trials()
+        _stop_parameter_holders()
         self.end_experiment_callbacks()
 
     def __getstate__(self):
@@ -1985,6 +2326,7 @@ class TuneController:
         for k in [
             "_trials",
             "_live_trials",
+            "_trial_progress",
             "_stop_queue",
             "_search_alg",
             "_placeholder_resolvers",
@@ -1999,6 +2341,13 @@ class TuneController:
             "_resource_updater",
             "_trials_to_cache",
             "_trial_metadata",
+            "_incremental_experiment_state",
+            "_trial_ids_to_log",
+            "_trial_state_log_segments",
+            "_trial_state_log_num_entries",
+            "_next_trial_state_log_segment_index",
+            "_batch_result_processing",
+            "_trial_results_batch",
             "_actor_to_trial",
             "_trial_to_actor",
             "_resources_to_pending_trials",
@@ -2107,6 +2456,46 @@ class TrialRunnerWrapper:
         return getattr(self._tune_controller, attr)
 
 
+# Resources of which a reused actor may hold more than the trial requested.
+# Other resources, e.g. GPUs, are visible to the trial (or assigned to it, e.g.
+# via CUDA_VISIBLE_DEVICES), so their amounts have to match exactly.
+_EXCESS_REUSABLE_RESOURCES = {"CPU", "memory"}
+
+
+def _get_resource_reuse_cost(
+    cached: ResourceRequest, requested: ResourceRequest
+) -> Optional[float]:
+    """Return the cost of reusing an actor with ``cached`` resources for a trial
+    requesting ``requested`` resources.
+
+    The actor can be reused if its bundles request the same kinds of resources
+    as the requested bundles, in at least the requested amounts of CPU and memory
+    and in the same amounts of all other resources, e.g. GPUs. Returns None
+    otherwise. The cost is the total amount of resources exceeding the request.
+    """
+    if (
+        cached.strategy != requested.strategy
+        or cached.head_bundle_is_empty != requested.head_bundle_is_empty
+        or len(cached.bundles) != len(requested.bundles)
+    ):
+        return None
+
+    cost = 0.0
+    for cached_bundle, requested_bundle in zip(cached.bundles, requested.bundles):
+        if cached_bundle.keys() != requested_bundle.keys():
+            return None
+        for resource, amount in requested_bundle.items():
+            if cached_bundle[resource] == amount:
+                continue
+            if (
+                resource not in _EXCESS_REUSABLE_RESOURCES
+                or cached_bundle[resource] < amount
+            ):
+                return None
+            cost += cached_bundle[resource] - amount
+    return cost
+
+
 def _get_max_pending_trials(search_alg: SearchAlgorithm) -> int:
     max_pending_trials = os.getenv("TUNE_MAX_PENDING_TRIALS_PG", "auto")
 
@@ -163,6 +163,13 @@ class _TemporaryTrialState:
 
         self.num_restore_failures: int = 0
 
+        # Time at which an actor was requested to start the trial.
+        self.startup_requested_time: Optional[float] = None
+
+        # Reference to the checkpoint to restore from in the object store, if
+        # it was put there by another trial (see `Trainable.restore`).
+        self.checkpoint_ref_to_restore: Optional[ray.ObjectRef] = None
+
     def __getstate__(self):
         return {}
 
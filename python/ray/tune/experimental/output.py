@@ -1,6 +1,8 @@
 import argparse
 import collections
 import datetime
+import heapq
+import itertools
 import logging
 import math
 import numbers
@@ -10,7 +12,17 @@ import textwrap
 import time
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import Any, Collection, Dict, Iterable, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 import pandas as pd
@@ -98,6 +110,15 @@ ORDER = [
     Trial.ERROR,
 ]
 
+# If there are more trials than this, only the first few trials of each status
+# are shown in the trial table.
+_MAX_TRIALS_TO_SHOW = 20
+_MAX_TRIALS_TO_SHOW_PER_STATUS = 5
+
+# Heaps of `_TrialProgress` are rebuilt once they have this many more outdated
+# entries than up-to-date entries.
+_MIN_OUTDATED_HEAP_ENTRIES = 1000
+
 
 class AirVerbosity(IntEnum):
     SILENT = 0
@@ -248,6 +269,169 @@ def _current_best_trial(
     return best_trial, metric
 
 
+class _TrialProgress:
+    """Summary of the trials of an experiment that is updated incrementally.
+
+    Heartbeats show the number of trials per status, the first trials of each
+    status and the current best trial. Computing these from the list of all
+    trials takes time linear in the number of trials on every heartbeat.
+    Instead, this summary is updated whenever a trial is added, changes its
+    status, or reports a result, and reading ``k`` trials from it takes
+    ``O(k log n)`` time.
+
+    The trials of each status and the trials ranked by metric are kept in
+    heaps. Entries of trials that changed their status or reported a new
+    result are not removed right away, but skipped when reading the heaps.
+    Heaps are rebuilt once most of their entries are outdated.
+
+    Args:
+        metric: Metric to rank the trials by.
+        mode: One of "min" or "max".
+        infer_limit: Maximum number of user metrics to infer from the results.
+    """
+
+    def __init__(
+        self,
+        metric: Optional[str] = None,
+        mode: Optional[str] = None,
+        infer_limit: int = 4,
+    ):
+        self._metric = metric if mode else None
+        self._metric_op = 1.0 if mode == "max" else -1.0
+        self._infer_limit = infer_limit
+
+        # Entries are (order, sequence number, trial). Only the entry with the
+        # sequence number in `_status_entries` is up to date.
+        self._trials_by_status: Dict[str, List[Tuple]] = collections.defaultdict(list)
+        self._status_entries: Dict[Trial, int] = {}
+        self._statuses: Dict[Trial, str] = {}
+        self._status_counts: Dict[str, int] = collections.defaultdict(int)
+        self._order: Dict[Trial, int] = {}
+
+        # Entries are (-metric value * metric op, order, sequence number, trial).
+        self._trials_by_metric: List[Tuple] = []
+        self._metric_entries: Dict[Trial, int] = {}
+
+        self._sequence = itertools.count()
+        # Using a dict as an ordered set.
+        self._inferred_metrics: Dict[str, None] = {}
+        self._reported_keys: Set[str] = set()
+
+    @property
+    def num_trials(self) -> int:
+        return len(self._statuses)
+
+    @property
+    def status_counts(self) -> Dict[str, int]:
+        return {status: count for status, count in self._status_counts.items() if count}
+
+    @property
+    def inferred_metrics(self) -> List[str]:
+        return list(self._inferred_metrics)
+
+    def on_trial_status(self, trial: Trial):
+        """Updates the summary with the current status of a new or known trial."""
+        status = trial.status
+        previous_status = self._statuses.get(trial)
+        if previous_status == status:
+            return
+
+        if previous_status is None:
+            self._order[trial] = len(self._order)
+            if trial.last_result:
+                self.on_trial_result(trial, trial.last_result)
+        else:
+            self._status_counts[previous_status] -= 1
+            _maybe_rebuild_heap(
+                self._trials_by_status[previous_status],
+                self._status_entries,
+                self._status_counts[previous_status],
+            )
+
+        sequence = next(self._sequence)
+        self._statuses[trial] = status
+        self._status_counts[status] += 1
+        self._status_entries[trial] = sequence
+        heapq.heappush(
+            self._trials_by_status[status], (self._order[trial], sequence, trial)
+        )
+
+    def on_trial_result(self, trial: Trial, result: Dict):
+        """Updates the summary with the latest result of a trial."""
+        self._reported_keys.update(
+            key for key, value in result.items() if value is not None
+        )
+        if len(self._inferred_metrics) < self._infer_limit:
+            for metric, value in result.items():
+                if metric not in DEFAULT_COLUMNS:
+                    if metric not in AUTO_RESULT_KEYS:
+                        if type(value) in VALID_SUMMARY_TYPES:
+                            self._inferred_metrics[metric] = None
+
+                if len(self._inferred_metrics) >= self._infer_limit:
+                    break
+
+        if not self._metric:
+            return
+
+        metric_value = unflattened_lookup(self._metric, result, default=None)
+        if pd.isnull(metric_value):
+            # Like in `_current_best_trial`, only the last result of a trial
+            # is considered.
+            self._metric_entries.pop(trial, None)
+            return
+
+        sequence = next(self._sequence)
+        self._metric_entries[trial] = sequence
+        heapq.heappush(
+            self._trials_by_metric,
+            (
+                -metric_value * self._metric_op,
+                self._order.get(trial, -1),
+                sequence,
+                trial,
+            ),
+        )
+        _maybe_rebuild_heap(
+            self._trials_by_metric, self._metric_entries, len(self._metric_entries)
+        )
+
+    def has_reported(self, key: str) -> bool:
+        """Whether any trial reported a value for this (possibly nested) key."""
+        return key in self._reported_keys or key.split("/", 1)[0] in self._reported_keys
+
+    def get_trials(self, status: str, limit: int) -> List[Trial]:
+        """Returns the first ``limit`` trials with this status, in the order in
+        which they were added."""
+        return _peek_heap(self._trials_by_status[status], self._status_entries, limit)
+
+    def get_best_trials(self, limit: int = 1) -> List[Trial]:
+        """Returns the ``limit`` best trials by the metric of their last result."""
+        return _peek_heap(self._trials_by_metric, self._metric_entries, limit)
+
+
+def _peek_heap(heap: List[Tuple], entries: Dict[Trial, int], limit: int):
+    """Returns the trials of the first ``limit`` up-to-date entries of the heap.
+
+    Outdated entries that are popped on the way are dropped.
+    """
+    up_to_date = []
+    while heap and len(up_to_date) < limit:
+        entry = heapq.heappop(heap)
+        if entries.get(entry[-1]) == entry[-2]:
+            up_to_date.append(entry)
+    for entry in up_to_date:
+        heapq.heappush(heap, entry)
+    return [entry[-1] for entry in up_to_date]
+
+
+def _maybe_rebuild_heap(heap: List[Tuple], entries: Dict[Trial, int], num: int):
+    if len(heap) - num <= num + _MIN_OUTDATED_HEAP_ENTRIES:
+        return
+    heap[:] = [entry for entry in heap if entries.get(entry[-1]) == entry[-2]]
+    heapq.heapify(heap)
+
+
 @dataclass
 class _PerStatusTrialTableData:
     trial_infos: List[List[str]]
@@ -347,8 +531,7 @@ def _get_trial_table_data_per_status(
     Returns:
         All information of trials pertained to the `status`.
     """
-    # TODO: configure it.
-    max_row = 5 if force_max_rows else math.inf
+    max_row = _MAX_TRIALS_TO_SHOW_PER_STATUS if force_max_rows else math.inf
     if not trials:
         return None
 
@@ -384,9 +567,6 @@ def _get_trial_table_data(
     Returns:
         Trial table data, including header and trial table per each status.
     """
-    # TODO: configure
-    max_trial_num_to_show = 20
-    max_column_length = 20
     trials_by_state = _get_trials_by_state(trials)
 
     # get the right metric to show.
@@ -399,6 +579,63 @@ def _get_trial_table_data(
         )
     ]
 
+    header = _get_trial_table_header(param_keys, metric_keys, wrap_headers)
+
+    trial_data = list()
+    for t_status in ORDER:
+        trial_data_per_status = _get_trial_table_data_per_status(
+            t_status,
+            trials_by_state[t_status],
+            param_keys=param_keys,
+            metric_keys=metric_keys,
+            force_max_rows=not all_rows and len(trials) > _MAX_TRIALS_TO_SHOW,
+        )
+        if trial_data_per_status:
+            trial_data.append(trial_data_per_status)
+    return _TrialTableData(header, trial_data)
+
+
+def _get_trial_table_data_from_progress(
+    trial_progress: _TrialProgress,
+    param_keys: List[str],
+    metric_keys: List[str],
+    wrap_headers: bool = False,
+) -> _TrialTableData:
+    """Same as ``_get_trial_table_data`` without ``all_rows``, but only reads the
+    trials that are shown from the trial progress summary."""
+    metric_keys = [k for k in metric_keys if trial_progress.has_reported(k)]
+    header = _get_trial_table_header(param_keys, metric_keys, wrap_headers)
+
+    if trial_progress.num_trials > _MAX_TRIALS_TO_SHOW:
+        max_rows = _MAX_TRIALS_TO_SHOW_PER_STATUS
+    else:
+        max_rows = _MAX_TRIALS_TO_SHOW
+
+    status_counts = trial_progress.status_counts
+    trial_data = list()
+    for t_status in ORDER:
+        num_trials = status_counts.get(t_status, 0)
+        if not num_trials:
+            continue
+        trials = trial_progress.get_trials(t_status, max_rows)
+        more_info = None
+        if num_trials > len(trials):
+            more_info = f"{num_trials - len(trials)} more {t_status}"
+        trial_data.append(
+            _PerStatusTrialTableData(
+                [_get_trial_info(t, param_keys, metric_keys) for t in trials],
+                more_info,
+            )
+        )
+    return _TrialTableData(header, trial_data)
+
+
+def _get_trial_table_header(
+    param_keys: List[str], metric_keys: List[str], wrap_headers: bool = False
+) -> List[str]:
+    # TODO: configure
+    max_column_length = 20
+
     # get header from metric keys
     formatted_metric_columns = [
         _max_len(k, max_len=max_column_length, wrap=wrap_headers) for k in metric_keys
@@ -416,20 +653,7 @@ def _get_trial_table_data(
     param_header = formatted_param_columns
 
     # Map to the abbreviated version if necessary.
-    header = ["Trial name", "status"] + param_header + metric_header
-
-    trial_data = list()
-    for t_status in ORDER:
-        trial_data_per_status = _get_trial_table_data_per_status(
-            t_status,
-            trials_by_state[t_status],
-            param_keys=param_keys,
-            metric_keys=metric_keys,
-            force_max_rows=not all_rows and len(trials) > max_trial_num_to_show,
-        )
-        if trial_data_per_status:
-            trial_data.append(trial_data_per_status)
-    return _TrialTableData(header, trial_data)
+    return ["Trial name", "status"] + param_header + metric_header
 
 
 def _best_trial_str(
@@ -612,6 +836,12 @@ class ProgressReporter(Callback):
     def verbosity(self) -> AirVerbosity:
         return self._verbosity
 
+    @property
+    def trial_progress(self) -> Optional[_TrialProgress]:
+        """Summary of the trials whose statuses the controller should keep up to
+        date, if this reporter uses one."""
+        return None
+
     def setup(
         self,
         start_time: Optional[float] = None,
@@ -843,10 +1073,15 @@ class TuneReporterBase(ProgressReporter):
         # will be populated when first result comes in.
         self._inferred_metric = None
         self._inferred_params = _infer_params(config or {})
+        self._trial_progress = _TrialProgress(metric=metric, mode=mode)
         super(TuneReporterBase, self).__init__(
             verbosity=verbosity, progress_metrics=progress_metrics
         )
 
+    @property
+    def trial_progress(self) -> Optional[_TrialProgress]:
+        return self._trial_progress
+
     def setup(
         self,
         start_time: Optional[float] = None,
@@ -865,37 +1100,87 @@ class TuneReporterBase(ProgressReporter):
         )
         return f"Trial status: {result}"
 
+    def _get_overall_trial_progress_str_from_progress(self):
+        status_counts = self._trial_progress.status_counts
+        result = " | ".join(
+            [
+                f"{status_counts[status]} {status}"
+                for status in ORDER
+                if status in status_counts
+            ]
+        )
+        return f"Trial status: {result}"
+
+    def on_trial_result(
+        self,
+        iteration: int,
+        trials: List[Trial],
+        trial: Trial,
+        result: Dict,
+        **info,
+    ):
+        self._trial_progress.on_trial_result(trial, result)
+        super().on_trial_result(
+            iteration=iteration, trials=trials, trial=trial, result=result, **info
+        )
+
     # TODO: Return a more structured type to share code with Jupyter flow.
     def _get_heartbeat(
         self, trials, *sys_args, force_full_output: bool = False
     ) -> Tuple[List[str], _TrialTableData]:
+        # The controller keeps the statuses in the trial progress summary up to
+        # date. If it does, only read the trials that are shown from it, unless
+        # all trials are shown anyway.
+        use_trial_progress = (
+            self._trial_progress.num_trials > 0 and not force_full_output
+        )
+
         result = list()
         # Trial status: 1 RUNNING | 7 PENDING
-        result.append(self._get_overall_trial_progress_str(trials))
+        if use_trial_progress:
+            result.append(self._get_overall_trial_progress_str_from_progress())
+        else:
+            result.append(self._get_overall_trial_progress_str(trials))
         # Current time: 2023-02-24 12:35:39 (running for 00:00:37.40)
         result.append(self._time_heartbeat_str)
         # Logical resource usage: 8.0/64 CPUs, 0/0 GPUs
         result.extend(sys_args)
         # Current best trial: TRIAL NAME, metrics: {...}, parameters: {...}
-        current_best_trial, metric = _current_best_trial(
-            trials, self._metric, self._mode
-        )
+        if use_trial_progress:
+            best_trials = self._trial_progress.get_best_trials()
+            current_best_trial = best_trials[0] if best_trials else None
+            metric = self._metric
+        else:
+            current_best_trial, metric = _current_best_trial(
+                trials, self._metric, self._mode
+            )
         if current_best_trial:
             result.append(_best_trial_str(current_best_trial, metric))
         # Now populating the trial table data.
         if not self._inferred_metric:
             # try inferring again.
-            self._inferred_metric = _infer_user_metrics(trials)
+            if use_trial_progress:
+                self._inferred_metric = self._trial_progress.inferred_metrics
+            else:
+                self._inferred_metric = _infer_user_metrics(trials)
 
         all_metrics = list(DEFAULT_COLUMNS.keys()) + self._inferred_metric
 
-        trial_table_data = _get_trial_table_data(
-            trials,
-            param_keys=self._inferred_params,
-            metric_keys=all_metrics,
-            all_rows=force_full_output,
-            wrap_headers=self._wrap_headers,
-        )
+        if use_trial_progress:
+            trial_table_data = _get_trial_table_data_from_progress(
+                self._trial_progress,
+                param_keys=self._inferred_params,
+                metric_keys=all_metrics,
+                wrap_headers=self._wrap_headers,
+            )
+        else:
+            trial_table_data = _get_trial_table_data(
+                trials,
+                param_keys=self._inferred_params,
+                metric_keys=all_metrics,
+                all_rows=force_full_output,
+                wrap_headers=self._wrap_headers,
+            )
         return result, trial_table_data
 
     def _print_heartbeat(self, trials, *sys_args, force: bool = False):
@@ -7,6 +7,7 @@ from ray.tune.logger.logger import (
     pretty_print,
 )
 from ray.tune.logger.noop import NoopLogger
+from ray.tune.logger.parquet import ParquetLoggerCallback
 from ray.tune.logger.tensorboardx import TBXLogger, TBXLoggerCallback
 
 DEFAULT_LOGGERS = (JsonLogger, CSVLogger, TBXLogger)
@@ -26,6 +27,7 @@ __all__ = [
     "JsonLogger",
     "JsonLoggerCallback",
     "NoopLogger",
+    "ParquetLoggerCallback",
     "TBXLogger",
     "TBXLoggerCallback",
     "UnifiedLogger",
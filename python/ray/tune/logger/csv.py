@@ -1,7 +1,7 @@
 import csv
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, TextIO
+from typing import TYPE_CHECKING, Dict, List, TextIO, Tuple
 
 from ray.air.constants import EXPR_PROGRESS_FILE
 from ray.tune.logger.logger import _LOGGER_DEPRECATION_WARNING, Logger, LoggerCallback
@@ -107,6 +107,20 @@ class CSVLoggerCallback(LoggerCallback):
         self._trial_csv[trial] = None
 
     def log_trial_result(self, iteration: int, trial: "Trial", result: Dict):
+        self._write_trial_result(trial, result)
+        self._trial_files[trial].flush()
+
+    def log_trial_results(
+        self, iteration: int, trial_results: List[Tuple["Trial", Dict]]
+    ):
+        for trial, result in trial_results:
+            self._write_trial_result(trial, result)
+        # Flush each file only once after writing all results.
+        for trial in {trial for trial, _ in trial_results}:
+            if trial in self._trial_files:
+                self._trial_files[trial].flush()
+
+    def _write_trial_result(self, trial: "Trial", result: Dict):
         if trial not in self._trial_files:
             self._setup_trial(trial)
 
@@ -124,7 +138,6 @@ class CSVLoggerCallback(LoggerCallback):
         self._trial_csv[trial].writerow(
             {k: v for k, v in result.items() if k in self._trial_csv[trial].fieldnames}
         )
-        self._trial_files[trial].flush()
 
     def log_trial_end(self, trial: "Trial", failed: bool = False):
         if trial not in self._trial_files:
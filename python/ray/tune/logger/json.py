@@ -1,7 +1,7 @@
 import json
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, TextIO
+from typing import TYPE_CHECKING, Dict, List, TextIO, Tuple
 
 import numpy as np
 
@@ -97,11 +97,24 @@ class JsonLoggerCallback(LoggerCallback):
         self._trial_files[trial] = local_file.open("at")
 
     def log_trial_result(self, iteration: int, trial: "Trial", result: Dict):
+        self._write_trial_result(trial, result)
+        self._trial_files[trial].flush()
+
+    def log_trial_results(
+        self, iteration: int, trial_results: List[Tuple["Trial", Dict]]
+    ):
+        for trial, result in trial_results:
+            self._write_trial_result(trial, result)
+        # Flush each file only once after writing all results.
+        for trial in {trial for trial, _ in trial_results}:
+            if trial in self._trial_files:
+                self._trial_files[trial].flush()
+
+    def _write_trial_result(self, trial: "Trial", result: Dict):
         if trial not in self._trial_files:
             self.log_trial_start(trial)
         json.dump(result, self._trial_files[trial], cls=SafeFallbackEncoder)
         self._trial_files[trial].write("\n")
-        self._trial_files[trial].flush()
 
     def log_trial_end(self, trial: "Trial", failed: bool = False):
         if trial not in self._trial_files:
@@ -2,7 +2,7 @@ import abc
 import json
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Type
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple, Type
 
 import pyarrow
 import yaml
@@ -121,6 +121,20 @@ class LoggerCallback(Callback):
         """
         pass
 
+    def log_trial_results(
+        self, iteration: int, trial_results: List[Tuple["Trial", Dict]]
+    ):
+        """Handle logging when several trials report results at once.
+
+        By default, this calls ``log_trial_result`` for each result. Override
+        it to write all results in bulk.
+
+        Args:
+            trial_results: List of ``(trial, result)`` tuples.
+        """
+        for trial, result in trial_results:
+            self.log_trial_result(iteration, trial, result)
+
     def log_trial_end(self, trial: "Trial", failed: bool = False):
         """Handle logging when a trial ends.
 
@@ -141,6 +155,15 @@ class LoggerCallback(Callback):
     ):
         self.log_trial_result(iteration, trial, result)
 
+    def on_trial_results(
+        self,
+        iteration: int,
+        trials: List["Trial"],
+        trial_results: List[Tuple["Trial", Dict]],
+        **info,
+    ):
+        self.log_trial_results(iteration, trial_results)
+
     def on_trial_start(
         self, iteration: int, trials: List["Trial"], trial: "Trial", **info
     ):
@@ -0,0 +1,245 @@
+import logging
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pyarrow
+import pyarrow.dataset
+import pyarrow.fs
+import pyarrow.parquet
+
+from ray.tune.logger.logger import LoggerCallback
+from ray.tune.result import EXPR_RESULT_STORE_DIR, TRIAL_ID
+from ray.tune.utils import flatten_dict
+from ray.util.annotations import PublicAPI
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from ray.tune.experiment.trial import Trial  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+# Results are sorted by trial ID before they are written, so that small row
+# groups let readers skip most of a file when loading only a few trials.
+_ROW_GROUP_SIZE = 1000
+
+
+@PublicAPI(stability="alpha")
+class ParquetLoggerCallback(LoggerCallback):
+    """Logs the results of all trials to Parquet files in the experiment directory.
+
+    Unlike the JSON and CSV loggers, which write one file per trial, this callback
+    buffers the results of all trials and writes them in batches to
+    ``<experiment_dir>/trial_results/*.parquet``. Nested dicts are flattened
+    like in the CSV logger, and the trial config is not logged.
+
+    If these files exist, :class:`~ray.tune.ExperimentAnalysis` and
+    :class:`~ray.tune.ResultGrid` load the trial dataframes from them instead of
+    from the per-trial files, which is much faster for experiments with many
+    trials. :meth:`ExperimentAnalysis.get_trial_dataframes
+    <ray.tune.ExperimentAnalysis.get_trial_dataframes>` can also load only
+    some of the trials and columns.
+
+    Results are written to the same file until it holds ``max_rows_per_file``
+    results, by rewriting the file with the results written to it before. Thus
+    frequent writes, e.g. on every experiment checkpoint, don't create many
+    small files.
+
+    Args:
+        max_rows_per_file: Results are written to a new file once the current
+            file holds this many results.
+        flush_period_s: Buffered results are written once the oldest of them
+            has been buffered for this many seconds. In any case, all buffered
+            results are written when the experiment state is saved.
+    """
+
+    def __init__(self, max_rows_per_file: int = 10000, flush_period_s: float = 60):
+        self._max_rows_per_file = max_rows_per_file
+        self._flush_period_s = flush_period_s
+
+        # Files of a resumed run get a new prefix, so they never overwrite files
+        # of a previous run, and are read after them.
+        self._file_prefix = "part-{}-{}".format(
+            time.strftime("%Y-%m-%d_%H-%M-%S"), uuid.uuid4().hex[:8]
+        )
+        self._num_files = 0
+        self._result_store_path: Optional[str] = None
+
+        # Rows of the current file, of which the last `_num_buffered_rows` have
+        # not been written yet.
+        self._rows: List[Dict[str, Any]] = []
+        self._num_buffered_rows = 0
+        self._first_row_time: Optional[float] = None
+
+    def log_trial_result(self, iteration: int, trial: "Trial", result: Dict):
+        self._add_row(trial, result)
+        self._maybe_flush()
+
+    def log_trial_results(
+        self, iteration: int, trial_results: List[Tuple["Trial", Dict]]
+    ):
+        for trial, result in trial_results:
+            self._add_row(trial, result)
+        self._maybe_flush()
+
+    def _add_row(self, trial: "Trial", result: Dict):
+        if self._result_store_path is None:
+            self._result_store_path = Path(
+                trial.storage.experiment_driver_staging_path, EXPR_RESULT_STORE_DIR
+            ).as_posix()
+
+        tmp = result.copy()
+        tmp.pop("config", None)
+        row = {
+            key: _to_column_value(value)
+            for key, value in flatten_dict(tmp, delimiter="/").items()
+        }
+        row[TRIAL_ID] = trial.trial_id
+        self._rows.append(row)
+        self._num_buffered_rows += 1
+
+    def _maybe_flush(self):
+        if self._first_row_time is None:
+            self._first_row_time = time.monotonic()
+        if (
+            len(self._rows) >= self._max_rows_per_file
+            or time.monotonic() - self._first_row_time >= self._flush_period_s
+        ):
+            self.flush()
+
+    def flush(self):
+        """Writes all buffered results to the current file.
+
+        Once the file holds ``max_rows_per_file`` results, later results are
+        written to a new file.
+        """
+        if not self._num_buffered_rows:
+            return
+
+        table = _rows_to_table(self._rows).sort_by(TRIAL_ID)
+
+        os.makedirs(self._result_store_path, exist_ok=True)
+        file_name = f"{self._file_prefix}-{self._num_files:05d}.parquet"
+        # Write to a hidden file first, so that incomplete files are never read.
+        tmp_path = Path(self._result_store_path, f".{file_name}.tmp")
+        pyarrow.parquet.write_table(table, tmp_path, row_group_size=_ROW_GROUP_SIZE)
+        os.replace(tmp_path, Path(self._result_store_path, file_name))
+
+        if len(self._rows) >= self._max_rows_per_file:
+            self._num_files += 1
+            self._rows = []
+        self._num_buffered_rows = 0
+        self._first_row_time = None
+
+    def on_experiment_checkpoint(self, iteration: int, trials: List["Trial"], **info):
+        # Write the buffered results, so that they are synced to storage along
+        # with the experiment state.
+        self.flush()
+
+    def on_experiment_end(self, trials: List["Trial"], **info):
+        self.flush()
+
+
+def _to_column_value(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    # Like in the CSV logger, other values (e.g. lists) are logged as strings.
+    return str(value)
+
+
+def _rows_to_table(rows: List[Dict[str, Any]]) -> pyarrow.Table:
+    try:
+        return pyarrow.Table.from_pylist(rows)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        pass
+
+    # Some metric was reported with values of different types. Log the values of
+    # such metrics as strings.
+    value_types: Dict[str, set] = {}
+    for row in rows:
+        for key, value in row.items():
+            if value is not None:
+                value_types.setdefault(key, set()).add(type(value))
+    mixed_keys = {
+        key
+        for key, types in value_types.items()
+        if len(types) > 1 and types != {int, float}
+    }
+    logger.debug(f"Logging the values of {mixed_keys} as strings.")
+    return pyarrow.Table.from_pylist(
+        [
+            {
+                key: str(value) if key in mixed_keys and value is not None else value
+                for key, value in row.items()
+            }
+            for row in rows
+        ]
+    )
+
+
+def _has_trial_results(fs: pyarrow.fs.FileSystem, experiment_fs_path: str) -> bool:
+    """Returns whether the experiment has results written by the
+    ParquetLoggerCallback."""
+    file_info = fs.get_file_info(
+        Path(experiment_fs_path, EXPR_RESULT_STORE_DIR).as_posix()
+    )
+    return file_info.type == pyarrow.fs.FileType.Directory
+
+
+def _read_trial_results(
+    fs: pyarrow.fs.FileSystem,
+    experiment_fs_path: str,
+    trial_ids: Optional[List[str]] = None,
+    columns: Optional[List[str]] = None,
+) -> "pd.DataFrame":
+    """Reads the results written by the ParquetLoggerCallback.
+
+    Args:
+        fs: The filesystem of the experiment directory.
+        experiment_fs_path: The path of the experiment directory.
+        trial_ids: If set, only reads the results of these trials.
+        columns: If set, only reads these columns. The ``trial_id`` column is
+            always read.
+
+    Returns:
+        A dataframe with the results of all trials, in the order in which they
+        were reported.
+    """
+    import pandas as pd
+
+    dataset = pyarrow.dataset.dataset(
+        Path(experiment_fs_path, EXPR_RESULT_STORE_DIR).as_posix(),
+        format="parquet",
+        filesystem=fs,
+    )
+    row_filter = None
+    if trial_ids is not None:
+        row_filter = pyarrow.dataset.field(TRIAL_ID).isin(list(trial_ids))
+
+    dataframes = []
+    # Files are named so that sorting them orders them by the time of writing.
+    for fragment in sorted(dataset.get_fragments(), key=lambda f: f.path):
+        names = fragment.physical_schema.names
+        if TRIAL_ID not in names:
+            continue
+
+        fragment_columns = None
+        if columns is not None:
+            # Metrics might not be reported in every file.
+            fragment_columns = [TRIAL_ID] + [
+                column for column in columns if column in names and column != TRIAL_ID
+            ]
+
+        table = fragment.to_table(columns=fragment_columns, filter=row_filter)
+        if table.num_rows:
+            dataframes.append(table.to_pandas())
+
+    if not dataframes:
+        return pd.DataFrame(columns=[TRIAL_ID])
+    return pd.concat(dataframes, ignore_index=True)
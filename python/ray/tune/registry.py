@@ -1,8 +1,10 @@
 import atexit
 import logging
+import uuid
+import weakref
 from functools import partial
 from types import FunctionType
-from typing import Callable, Optional, Type, Union
+from typing import Callable, List, Optional, Type, Union
 
 import ray
 import ray.cloudpickle as pickle
@@ -14,6 +16,7 @@ from ray.experimental.internal_kv import (
 )
 from ray.tune.error import TuneError
 from ray.util.annotations import DeveloperAPI
+from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 
 TRAINABLE_CLASS = "trainable_class"
 ENV_CREATOR = "env_creator"
@@ -296,9 +299,34 @@ ray._private.worker._post_init_hooks.append(_global_registry.flush_values)
 
 
 class _ParameterRegistry:
-    def __init__(self):
+    """Stores the parameters passed to ``tune.with_parameters`` in the object store.
+
+    If ``share_per_node`` is set, trials fetch the parameters through a holder
+    actor on their node while an experiment runs. The holder keeps the node's
+    copy of the parameters in the object store pinned, so that all trials on the
+    node map the same buffers (zero-copy for NumPy arrays), instead of fetching
+    the parameters again after the copy has been evicted. Datasets are
+    materialized once, so trials share the blocks instead of executing the
+    dataset again.
+    """
+
+    def __init__(self, share_per_node: bool = False):
         self.to_flush = {}
         self.references = {}
+        self.share_per_node = share_per_node
+        # Objects to pin on the node of a trial for each parameter.
+        self.pinned_references = {}
+        # Trials look up the holder manager by name, as it is only created
+        # when an experiment starts, after the trainable has been registered.
+        self.holder_manager_name = f"tune_parameter_holders_{uuid.uuid4().hex}"
+        self.holder_manager = None
+        if share_per_node:
+            _shared_parameter_registries.add(self)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["holder_manager"] = None
+        return state
 
     def put(self, k, v):
         self.to_flush[k] = v
@@ -308,12 +336,161 @@ class _ParameterRegistry:
     def get(self, k):
         if not ray.is_initialized():
             return self.to_flush[k]
+        if self.share_per_node:
+            self._pin_on_current_node(k)
         return ray.get(self.references[k])
 
     def flush(self):
         for k, v in self.to_flush.items():
             if isinstance(v, ray.ObjectRef):
                 self.references[k] = v
+                pinned_references = [v]
             else:
+                pinned_references = None
+                if self.share_per_node:
+                    v, pinned_references = _materialize_dataset(v)
                 self.references[k] = ray.put(v)
+                pinned_references = pinned_references or [self.references[k]]
+            if self.share_per_node:
+                self.pinned_references[k] = pinned_references
         self.to_flush.clear()
+
+    def start_holders(self):
+        """Creates the holder manager, which creates holders on demand."""
+        if self.holder_manager is None and ray.is_initialized():
+            self.holder_manager = _ParameterHolderManager.options(
+                name=self.holder_manager_name
+            ).remote()
+
+    def stop_holders(self):
+        """Kills the holder manager and the holders, unpinning the parameters."""
+        if self.holder_manager is not None:
+            # The holders are owned by the manager, so they are killed with it.
+            ray.kill(self.holder_manager)
+            self.holder_manager = None
+
+    def _pin_on_current_node(self, k):
+        node_id = ray.get_runtime_context().get_node_id()
+        try:
+            holder_manager = ray.get_actor(self.holder_manager_name)
+        except ValueError:
+            logger.debug(
+                f"No experiment is sharing parameter `{k}`, fetching it without "
+                "sharing it with other trials."
+            )
+            return
+        try:
+            holder = ray.get(holder_manager.get_holder.remote(node_id))
+            # Wait until the holder has fetched the parameter, so that it is
+            # read from the node's object store below.
+            ray.get(holder.pin.remote(k, self.pinned_references[k]))
+        except ray.exceptions.RayActorError:
+            logger.debug(
+                f"Could not pin parameter `{k}` on node {node_id}, fetching it "
+                "without sharing it with other trials."
+            )
+
+
+# Parameter registries of this driver that share their parameters per node.
+_shared_parameter_registries: "weakref.WeakSet[_ParameterRegistry]" = weakref.WeakSet()
+
+
+def _start_parameter_holders():
+    """Starts sharing the parameters of ``tune.with_parameters`` per node.
+
+    Called when an experiment starts.
+    """
+    for registry in list(_shared_parameter_registries):
+        registry.start_holders()
+
+
+def _stop_parameter_holders():
+    """Stops sharing the parameters of ``tune.with_parameters`` per node.
+
+    Called when an experiment ends, so that the parameters don't stay pinned on
+    every node until the driver exits.
+    """
+    for registry in list(_shared_parameter_registries):
+        registry.stop_holders()
+
+
+def _materialize_dataset(value):
+    """Materializes ``value`` if it is a Dataset.
+
+    Returns the materialized dataset and the references of its blocks, or the
+    value itself and None if it is not a Dataset.
+    """
+    from ray.data import Dataset
+
+    if not isinstance(value, Dataset):
+        return value, None
+    dataset = value.materialize()
+    block_refs = [
+        block_ref
+        for bundle in dataset.iter_internal_ref_bundles()
+        for block_ref in bundle.block_refs
+    ]
+    return dataset, block_refs
+
+
+def _get_zero_copy_values(value) -> list:
+    """Returns the values inside ``value`` that were deserialized zero-copy.
+
+    These are NumPy arrays (also inside lists, tuples, and dicts) and Arrow
+    data, whose buffers stay pinned in the node's object store as long as they
+    are referenced.
+    """
+    import numpy as np
+
+    zero_copy_types = (np.ndarray,)
+    try:
+        import pyarrow as pa
+
+        zero_copy_types += (pa.Table, pa.RecordBatch, pa.Array)
+    except ImportError:
+        pass
+
+    if isinstance(value, zero_copy_types):
+        return [value]
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, (list, tuple)):
+        return []
+    return [v for item in value for v in _get_zero_copy_values(item)]
+
+
+@ray.remote(num_cpus=0)
+class _ParameterHolder:
+    """Keeps the parameters of ``tune.with_parameters`` pinned on one node."""
+
+    def __init__(self):
+        self._values = {}
+
+    def pin(self, key: str, refs: List[ray.ObjectRef]):
+        if key not in self._values:
+            # Only keep the values backed by the node's object store, and not
+            # the deserialized copies of other Python objects.
+            self._values[key] = [
+                v for value in ray.get(refs) for v in _get_zero_copy_values(value)
+            ]
+
+
+@ray.remote(num_cpus=0)
+class _ParameterHolderManager:
+    """Creates one ``_ParameterHolder`` per node.
+
+    The holders are owned by this actor, so that they are killed with it when
+    the experiment ends.
+    """
+
+    def __init__(self):
+        self._holders = {}
+
+    def get_holder(self, node_id: str) -> ray.actor.ActorHandle:
+        if node_id not in self._holders:
+            self._holders[node_id] = _ParameterHolder.options(
+                scheduling_strategy=NodeAffinitySchedulingStrategy(
+                    node_id=node_id, soft=False
+                )
+            ).remote()
+        return self._holders[node_id]
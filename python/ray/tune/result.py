@@ -129,5 +129,9 @@ JOB_META_FILE = "job_status.json"
 # by automlboard if exists.
 EXPR_META_FILE = "trial_status.json"
 
+# Directory under each experiment directory with the results of all trials
+# in Parquet files, written by the ParquetLoggerCallback.
+EXPR_RESULT_STORE_DIR = "trial_results"
+
 # Config prefix when using ExperimentAnalysis.
 CONFIG_PREFIX = "config"
@@ -1,6 +1,8 @@
+import heapq
 import logging
+import math
 import pickle
-from typing import TYPE_CHECKING, Dict, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 import numpy as np
 
@@ -147,9 +149,17 @@ class AsyncHyperBandScheduler(FIFOScheduler):
             action = TrialScheduler.STOP
         else:
             bracket = self._trial_info[trial.trial_id]
+            hyperband_info = {}
             action = bracket.on_result(
-                trial, result[self._time_attr], self._metric_op * result[self._metric]
+                trial,
+                result[self._time_attr],
+                self._metric_op * result[self._metric],
+                hyperband_info=hyperband_info,
             )
+            if hyperband_info:
+                # Tells searchers (e.g. TPESearch) at which budget the result
+                # was recorded.
+                result["hyperband_info"] = hyperband_info
         if action == TrialScheduler.STOP:
             self._num_stopped += 1
         return action
@@ -218,15 +228,44 @@ class _Bracket:
             (min_t * self.rf ** (k + s), {}) for k in reversed(range(MAX_RUNGS))
         ]
         self._stop_last_trials = stop_last_trials
+        self._init_rung_cutoffs()
+
+    def _init_rung_cutoffs(self):
+        # The cutoff of each rung is tracked as rewards are recorded, instead of
+        # computing the percentile over all recorded rewards on every result.
+        self._rung_cutoffs: List[_PercentileTracker] = []
+        for _, recorded in self._rungs:
+            rung_cutoff = _PercentileTracker((1 - 1 / self.rf) * 100)
+            for reward in recorded.values():
+                rung_cutoff.add(reward)
+            self._rung_cutoffs.append(rung_cutoff)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # Brackets saved by older versions don't track the rung cutoffs.
+        if "_rung_cutoffs" not in state:
+            self._init_rung_cutoffs()
 
     def cutoff(self, recorded) -> Optional[Union[int, float, complex, np.ndarray]]:
         if not recorded:
             return None
         return np.nanpercentile(list(recorded.values()), (1 - 1 / self.rf) * 100)
 
-    def on_result(self, trial: Trial, cur_iter: int, cur_rew: Optional[float]) -> str:
+    def on_result(
+        self,
+        trial: Trial,
+        cur_iter: int,
+        cur_rew: Optional[float],
+        hyperband_info: Optional[Dict] = None,
+    ) -> str:
+        """Records the result if it reached a new rung and decides whether
+        the trial should continue.
+
+        If the result is recorded, its rung milestone is set as the
+        ``budget`` in ``hyperband_info``.
+        """
         action = TrialScheduler.CONTINUE
-        for milestone, recorded in self._rungs:
+        for (milestone, recorded), rung_cutoff in zip(self._rungs, self._rung_cutoffs):
             if (
                 cur_iter >= milestone
                 and trial.trial_id in recorded
@@ -240,7 +279,7 @@ class _Bracket:
             if cur_iter < milestone or trial.trial_id in recorded:
                 continue
             else:
-                cutoff = self.cutoff(recorded)
+                cutoff = rung_cutoff.value()
                 if cutoff is not None and cur_rew < cutoff:
                     action = TrialScheduler.STOP
                 if cur_rew is None:
@@ -250,6 +289,9 @@ class _Bracket:
                     )
                 else:
                     recorded[trial.trial_id] = cur_rew
+                    rung_cutoff.add(cur_rew)
+                    if hyperband_info is not None:
+                        hyperband_info["budget"] = milestone
                 break
         return action
 
@@ -257,13 +299,81 @@ class _Bracket:
         # TODO: fix up the output for this
         iters = " | ".join(
             [
-                "Iter {:.3f}: {}".format(milestone, self.cutoff(recorded))
-                for milestone, recorded in self._rungs
+                "Iter {:.3f}: {}".format(milestone, rung_cutoff.value())
+                for (milestone, _), rung_cutoff in zip(self._rungs, self._rung_cutoffs)
             ]
         )
         return "Bracket: " + iters
 
 
+class _PercentileTracker:
+    """Tracks a fixed percentile of a growing collection of values.
+
+    This gives the same result as ``np.nanpercentile`` (with linear
+    interpolation) over all added values, but adding a value takes O(log n) and
+    querying the percentile takes O(1).
+
+    The values are split into two heaps: a max-heap with the smallest values, up
+    to the one just below the percentile, and a min-heap with the rest. The
+    percentile is then interpolated between the tops of the two heaps.
+    """
+
+    def __init__(self, percentile: float):
+        self._quantile = percentile / 100
+        # Max-heap of the lower values (stored negated) and min-heap of the
+        # upper values.
+        self._lower: List[float] = []
+        self._upper: List[float] = []
+        self._num_nan = 0
+
+    def __len__(self) -> int:
+        return len(self._lower) + len(self._upper) + self._num_nan
+
+    def _virtual_index(self, n: int) -> float:
+        # Same computation as numpy's linear method, so that results match.
+        return (n - 1) * self._quantile
+
+    def add(self, value: float):
+        if math.isnan(value):
+            # NaNs are ignored, like in `np.nanpercentile`.
+            self._num_nan += 1
+            return
+
+        if self._lower and value <= -self._lower[0]:
+            heapq.heappush(self._lower, -value)
+        else:
+            heapq.heappush(self._upper, value)
+
+        # Keep every value up to the interpolation start index in the lower heap.
+        n = len(self._lower) + len(self._upper)
+        num_lower = min(math.floor(self._virtual_index(n)), n - 1) + 1
+        while len(self._lower) < num_lower:
+            heapq.heappush(self._lower, -heapq.heappop(self._upper))
+        while len(self._lower) > num_lower:
+            heapq.heappush(self._upper, -heapq.heappop(self._lower))
+
+    def value(self) -> Optional[float]:
+        """Returns the percentile, or None if no values were added.
+
+        Returns NaN if all added values were NaN.
+        """
+        if not len(self):
+            return None
+        if not self._lower:
+            return float("nan")
+
+        n = len(self._lower) + len(self._upper)
+        virtual_index = self._virtual_index(n)
+        below = -self._lower[0]
+        # At the last index, numpy interpolates between the max value and itself.
+        above = self._upper[0] if virtual_index < n - 1 else below
+        gamma = virtual_index - math.floor(virtual_index)
+        diff = above - below
+        if gamma >= 0.5:
+            return float(above - diff * (1 - gamma))
+        return float(below + diff * gamma)
+
+
 ASHAScheduler = AsyncHyperBandScheduler
 
 if __name__ == "__main__":
@@ -36,6 +36,8 @@ class _PBTTrialState:
         self.orig_tag = trial.experiment_tag
         self.last_score = None
         self.last_checkpoint = None
+        # Reference to `last_checkpoint` in the object store, if available.
+        self.last_checkpoint_ref = None
         self.last_perturbation_time = 0
         self.last_train_time = 0  # Used for synchronous mode.
         self.last_result = None  # Used for synchronous mode.
@@ -304,6 +306,16 @@ class PopulationBasedTraining(FIFOScheduler):
             synced at the same time_attr every perturbation_interval.
             Defaults to False. See Appendix A.1 here
             https://arxiv.org/pdf/1711.09846.pdf.
+        exploit_from_object_store: If True, top trials also put the
+            checkpoints they save for exploitation into the object store, and
+            exploiting trials restore from there instead of reading the
+            checkpoint from storage. The checkpoints are still persisted to
+            storage, which is used as a fallback, e.g. if the trial that saved
+            the checkpoint has stopped. This is faster for large checkpoints
+            on remote storage, but keeps one copy of the checkpoint of each
+            top trial in the object store. Function trainables can only put
+            checkpoints into the object store if the storage path is local.
+            Defaults to False.
 
     .. code-block:: python
 
@@ -359,6 +371,7 @@ class PopulationBasedTraining(FIFOScheduler):
         log_config: bool = True,
         require_attrs: bool = True,
         synch: bool = False,
+        exploit_from_object_store: bool = False,
     ):
         hyperparam_mutations = hyperparam_mutations or {}
         for value in hyperparam_mutations.values():
@@ -417,6 +430,7 @@ class PopulationBasedTraining(FIFOScheduler):
         self._log_config = log_config
         self._require_attrs = require_attrs
         self._synch = synch
+        self._exploit_from_object_store = exploit_from_object_store
         self._next_perturbation_sync = max(
             self._perturbation_interval,
             self._burn_in_period,
@@ -660,6 +674,7 @@ class PopulationBasedTraining(FIFOScheduler):
     ):
         """Checkpoint if in upper quantile, exploits if in lower."""
         state = self._trial_state[trial]
+        state.last_checkpoint_ref = None
         if trial in upper_quantile:
             # The trial last result is only updated after the scheduler
             # callback. So, we override with the current result.
@@ -680,7 +695,9 @@ class PopulationBasedTraining(FIFOScheduler):
             else:
                 logger.debug(f"Instructing {trial} to save.")
                 state.last_checkpoint = tune_controller._schedule_trial_save(
-                    trial, result=state.last_result
+                    trial,
+                    result=state.last_result,
+                    to_object_store=self._exploit_from_object_store,
                 )
             self._num_checkpoints += 1
         else:
@@ -703,6 +720,7 @@ class PopulationBasedTraining(FIFOScheduler):
                 if training_result:
                     clone_state.last_result = training_result.metrics
                     clone_state.last_checkpoint = training_result.checkpoint
+                    clone_state.last_checkpoint_ref = last_checkpoint.checkpoint_ref
                     last_checkpoint = clone_state.last_checkpoint
                 else:
                     logger.debug(
@@ -936,6 +954,8 @@ class PopulationBasedTraining(FIFOScheduler):
                 checkpoint=checkpoint_to_exploit, metrics=new_state.last_result
             )
         )
+        # If available, the trial is restored from the object store.
+        trial.temporary_state.checkpoint_ref_to_restore = new_state.last_checkpoint_ref
 
         self._num_perturbations += 1
         # Transfer over the last perturbation time as well
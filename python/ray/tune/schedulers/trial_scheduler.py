@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from ray.air._internal.usage import tag_scheduler
 from ray.tune.experiment import Trial
@@ -89,6 +89,25 @@ class TrialScheduler:
 
         raise NotImplementedError
 
+    def on_trial_results(
+        self,
+        tune_controller: "TuneController",
+        trial_results: List[Tuple[Trial, Dict]],
+    ) -> List[str]:
+        """Called on intermediate results returned by several trials at once.
+
+        This is only called if results are processed in batches (see the
+        ``TUNE_BATCH_RESULT_PROCESSING`` environment variable). It receives at
+        most one result per trial and returns one decision per result, in the
+        same order. By default, this calls ``on_trial_result`` for each result.
+        If this is overridden, the results of all trials are processed afterwards,
+        even if their status was changed by this call.
+        """
+        return [
+            self.on_trial_result(tune_controller, trial, result)
+            for trial, result in trial_results
+        ]
+
     def on_trial_complete(
         self, tune_controller: "TuneController", trial: Trial, result: Dict
     ):
@@ -61,6 +61,12 @@ def _import_hebo_search():
     return HEBOSearch
 
 
+def _import_tpe_search():
+    from ray.tune.search.tpe.tpe_search import TPESearch
+
+    return TPESearch
+
+
 SEARCH_ALG_IMPORT = {
     "variant_generator": _import_variant_generator,
     "random": _import_variant_generator,
@@ -72,6 +78,7 @@ SEARCH_ALG_IMPORT = {
     "optuna": _import_optuna_search,
     "zoopt": _import_zoopt_search,
     "hebo": _import_hebo_search,
+    "tpe": _import_tpe_search,
 }
 
 
@@ -17,7 +17,8 @@ from ray.tune.search.variant_generator import (
     _count_spec_samples,
     _count_variants,
     _flatten_resolved_vars,
-    _get_preset_variants,
+    _get_preset_spec,
+    _IndexedVariants,
     format_vars,
     generate_variants,
 )
@@ -67,6 +68,27 @@ class _VariantIterator:
         return current_value
 
 
+class _IndexedVariantIterator:
+    """Iterates over indexed variants of the search space.
+
+    Variants are materialized one at a time. The state of this iterator is only
+    the spec and the index of the next variant, so it can be serialized
+    regardless of the size of the grid search.
+    """
+
+    def __init__(self, variants: _IndexedVariants):
+        self.variants = variants
+        self.index = 0
+
+    def has_next(self):
+        return self.index < len(self.variants)
+
+    def __next__(self):
+        current_value = self.variants.materialize(self.index)
+        self.index += 1
+        return current_value
+
+
 class _TrialIterator:
     """Generates trials from the spec.
 
@@ -81,7 +103,8 @@ class _TrialIterator:
         points_to_evaluate: Configurations that will be tried out without sampling.
         lazy_eval: Whether variants should be generated
             lazily or eagerly. This is toggled depending
-            on the size of the grid search.
+            on the size of the grid search. Variants of specs that
+            can be indexed are always generated one at a time.
         start: index at which to start counting trials.
         random_state (int | np.random.Generator | np.random.RandomState):
             Seed or numpy random generator to use for reproducible results.
@@ -155,32 +178,37 @@ class _TrialIterator:
         if self.points_to_evaluate:
             config = self.points_to_evaluate.pop(0)
             self.num_samples_left -= 1
-            self.variants = _VariantIterator(
-                _get_preset_variants(
-                    self.unresolved_spec,
-                    config,
-                    constant_grid_search=self.constant_grid_search,
-                    random_state=self.random_state,
-                ),
-                lazy_eval=self.lazy_eval,
+            self.variants = self._create_variant_iterator(
+                _get_preset_spec(self.unresolved_spec, config)
             )
             resolved_vars, spec = next(self.variants)
             return self.create_trial(resolved_vars, spec)
         elif self.num_samples_left > 0:
-            self.variants = _VariantIterator(
-                generate_variants(
-                    self.unresolved_spec,
-                    constant_grid_search=self.constant_grid_search,
-                    random_state=self.random_state,
-                ),
-                lazy_eval=self.lazy_eval,
-            )
+            self.variants = self._create_variant_iterator(self.unresolved_spec)
             self.num_samples_left -= 1
             resolved_vars, spec = next(self.variants)
             return self.create_trial(resolved_vars, spec)
         else:
             raise StopIteration
 
+    def _create_variant_iterator(self, spec: dict):
+        if _IndexedVariants.supports(spec):
+            return _IndexedVariantIterator(
+                _IndexedVariants(
+                    spec,
+                    constant_grid_search=self.constant_grid_search,
+                    random_state=self.random_state,
+                )
+            )
+        return _VariantIterator(
+            generate_variants(
+                spec,
+                constant_grid_search=self.constant_grid_search,
+                random_state=self.random_state,
+            ),
+            lazy_eval=self.lazy_eval,
+        )
+
     def __iter__(self):
         return self
 
@@ -332,14 +360,17 @@ class BasicVariantGenerator(SearchAlgorithm):
 
         for experiment in experiment_list:
             grid_vals = _count_spec_samples(experiment.spec, num_samples=1)
-            lazy_eval = grid_vals > SERIALIZATION_THRESHOLD
+            lazy_eval = grid_vals > SERIALIZATION_THRESHOLD and not (
+                _IndexedVariants.supports(experiment.spec)
+            )
             if lazy_eval:
                 warnings.warn(
                     f"The number of pre-generated samples ({grid_vals}) "
                     "exceeds the serialization threshold "
                     f"({int(SERIALIZATION_THRESHOLD)}). Resume ability is "
                     "disabled. To fix this, reduce the number of "
-                    "dimensions/size of the provided grid search."
+                    "dimensions/size of the provided grid search, or "
+                    "avoid `tune.sample_from` in the search space."
                 )
 
             previous_samples = self._total_samples
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
 from ray.util.annotations import DeveloperAPI
 
@@ -87,6 +87,20 @@ class SearchAlgorithm:
         """
         pass
 
+    def on_trial_results(self, trial_results: List[Tuple[str, Dict]]):
+        """Called on intermediate results returned by several trials at once.
+
+        This is only called if results are processed in batches (see the
+        ``TUNE_BATCH_RESULT_PROCESSING`` environment variable). By default,
+        this calls ``on_trial_result`` for each result.
+
+        Arguments:
+            trial_results: List of ``(trial_id, result)`` tuples, at most one
+                per trial.
+        """
+        for trial_id, result in trial_results:
+            self.on_trial_result(trial_id, result)
+
     def on_trial_complete(
         self, trial_id: str, result: Optional[Dict] = None, error: bool = False
     ):
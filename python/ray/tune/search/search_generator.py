@@ -1,6 +1,6 @@
 import copy
 import logging
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from ray.tune.error import TuneError
 from ray.tune.experiment import Experiment, Trial, _convert_to_experiment_list
@@ -130,6 +130,10 @@ class SearchGenerator(SearchAlgorithm):
         """Notifies the underlying searcher."""
         self.searcher.on_trial_result(trial_id, result)
 
+    def on_trial_results(self, trial_results: List[Tuple[str, Dict]]):
+        """Notifies the underlying searcher."""
+        self.searcher.on_trial_results(trial_results)
+
     def on_trial_complete(
         self, trial_id: str, result: Optional[Dict] = None, error: bool = False
     ):
@@ -3,7 +3,7 @@ import glob
 import logging
 import os
 import warnings
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from ray.air._internal.usage import tag_searcher
 from ray.tune.search.util import _set_search_properties_backwards_compatible
@@ -139,6 +139,22 @@ class Searcher:
         """
         pass
 
+    def on_trial_results(self, trial_results: List[Tuple[str, Dict]]) -> None:
+        """Optional notification for results of several trials at once.
+
+        This is only called if results are processed in batches (see the
+        ``TUNE_BATCH_RESULT_PROCESSING`` environment variable). By default,
+        this calls ``on_trial_result`` for each result. Searchers that update
+        a model on intermediate results can override it to update the model
+        only once per batch.
+
+        Args:
+            trial_results: List of ``(trial_id, result)`` tuples, at most one
+                per trial.
+        """
+        for trial_id, result in trial_results:
+            self.on_trial_result(trial_id, result)
+
     def on_trial_complete(
         self, trial_id: str, result: Optional[Dict] = None, error: bool = False
     ) -> None:
@@ -570,6 +586,9 @@ class ConcurrencyLimiter(Searcher):
     def on_trial_result(self, trial_id: str, result: Dict) -> None:
         self.searcher.on_trial_result(trial_id, result)
 
+    def on_trial_results(self, trial_results: List[Tuple[str, Dict]]) -> None:
+        self.searcher.on_trial_results(trial_results)
+
     def add_evaluated_point(
         self,
         parameters: Dict,
@@ -0,0 +1,3 @@
+from ray.tune.search.tpe.tpe_search import TPESearch
+
+__all__ = ["TPESearch"]
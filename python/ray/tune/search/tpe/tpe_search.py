@@ -0,0 +1,625 @@
+"""Tree-structured Parzen Estimator (TPE) search, implemented with NumPy."""
+
+import copy
+import logging
+import math
+import pickle
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ray.tune.result import DEFAULT_METRIC
+from ray.tune.search import (
+    UNDEFINED_METRIC_MODE,
+    UNDEFINED_SEARCH_SPACE,
+    Searcher,
+)
+from ray.tune.search.sample import (
+    Categorical,
+    Domain,
+    Float,
+    Integer,
+    LogUniform,
+    Quantized,
+    Uniform,
+)
+from ray.tune.search.variant_generator import parse_spec_vars
+from ray.tune.utils.util import flatten_dict, unflatten_dict
+from ray.util.annotations import PublicAPI
+
+logger = logging.getLogger(__name__)
+
+# Observations of completed trials that can't be attributed to a rung of the
+# scheduler are recorded at this budget.
+_FINAL_BUDGET = math.inf
+
+
+class _Dimension:
+    """A parameter of the search space.
+
+    Numerical parameters are modeled as floats between ``low`` and ``high``
+    (in log space for log-uniform parameters). Categorical parameters are
+    modeled as the index of the category.
+    """
+
+    def __init__(self, domain: Domain):
+        sampler = domain.get_sampler()
+        self.q = None
+        if isinstance(sampler, Quantized):
+            self.q = sampler.q
+            sampler = sampler.sampler
+
+        self.categories = None
+        self.is_int = isinstance(domain, Integer)
+        self.log = isinstance(sampler, LogUniform)
+
+        if isinstance(domain, Categorical) and isinstance(sampler, Uniform):
+            self.categories = list(domain.categories)
+            return
+
+        if not isinstance(domain, (Float, Integer)) or not isinstance(
+            sampler, (Uniform, LogUniform)
+        ):
+            raise ValueError(
+                "TPESearch does not support parameters of type "
+                "`{}` with samplers of type `{}`".format(
+                    type(domain).__name__, type(domain.sampler).__name__
+                )
+            )
+
+        # Inclusive bounds of the values, see `ray.tune.search.sample`.
+        self.lower, self.upper = domain.lower, domain.upper
+        if self.q:
+            self.lower = math.ceil(self.lower / self.q) * self.q
+            self.upper = math.floor(self.upper / self.q) * self.q
+        elif self.is_int:
+            # Tune search space integers are exclusive
+            self.upper -= 1
+
+        if self.log:
+            self.low, self.high = math.log(self.lower), math.log(self.upper)
+        else:
+            # Widen the bounds by half a step, so that rounding maps equally
+            # large intervals to every value.
+            step = self.q or (1 if self.is_int else 0)
+            self.low, self.high = self.lower - step / 2, self.upper + step / 2
+
+    @property
+    def is_categorical(self) -> bool:
+        return self.categories is not None
+
+    def sample_uniform(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        if self.is_categorical:
+            return rng.integers(len(self.categories), size=size).astype(float)
+        return rng.uniform(self.low, self.high, size=size)
+
+    def to_model(self, value: Any) -> float:
+        if self.is_categorical:
+            return float(self.categories.index(value))
+        return math.log(value) if self.log else float(value)
+
+    def from_model(self, x: float) -> Any:
+        if self.is_categorical:
+            return self.categories[int(x)]
+
+        value = math.exp(x) if self.log else x
+        if self.q:
+            value = round(value / self.q) * self.q
+        elif self.is_int:
+            value = round(value)
+        value = min(max(value, self.lower), self.upper)
+        return int(value) if self.is_int else float(value)
+
+
+class _ParzenEstimator:
+    """Kernel density estimate of observations of a single parameter.
+
+    The estimate is a mixture of the (uniform) prior and one kernel per
+    observation: a Gaussian for numerical parameters, and a point mass for
+    categorical parameters.
+    """
+
+    def __init__(self, dimension: _Dimension, xs: np.ndarray, prior_weight: float):
+        self._dimension = dimension
+        n = len(xs)
+
+        if dimension.is_categorical:
+            num_categories = len(dimension.categories)
+            # Like in hyperopt, every category gets a pseudocount of the prior
+            # weight.
+            counts = np.bincount(xs.astype(int), minlength=num_categories)
+            self._probs = (counts + prior_weight) / (n + prior_weight * num_categories)
+            return
+
+        # Like in hyperopt, the bandwidth of each kernel is the larger distance
+        # to its neighbors, clipped so that the kernels of few observations
+        # are wide enough to keep exploring.
+        width = dimension.high - dimension.low
+        self._mus = np.sort(xs)
+        if n > 1:
+            gaps = np.diff(self._mus)
+            sigmas = np.maximum(np.append(gaps[0], gaps), np.append(gaps, gaps[-1]))
+        else:
+            sigmas = np.full(n, width)
+        self._sigmas = np.clip(sigmas, width / min(100, n + 1), width)
+        self._weights = np.full(n + 1, 1.0)
+        self._weights[0] = prior_weight
+        self._weights /= self._weights.sum()
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        dimension = self._dimension
+        if dimension.is_categorical:
+            return rng.choice(len(self._probs), size=size, p=self._probs).astype(float)
+
+        components = rng.choice(len(self._weights), size=size, p=self._weights)
+        from_prior = components == 0
+        mus = self._mus[np.maximum(components - 1, 0)]
+        sigmas = self._sigmas[np.maximum(components - 1, 0)]
+        samples = rng.normal(mus, sigmas)
+        samples[from_prior] = rng.uniform(
+            dimension.low, dimension.high, size=from_prior.sum()
+        )
+        return np.clip(samples, dimension.low, dimension.high)
+
+    def log_pdf(self, xs: np.ndarray) -> np.ndarray:
+        dimension = self._dimension
+        if dimension.is_categorical:
+            return np.log(self._probs[xs.astype(int)])
+
+        z = (xs[:, None] - self._mus[None, :]) / self._sigmas[None, :]
+        kernels = np.exp(-0.5 * z**2) / (self._sigmas * math.sqrt(2 * math.pi))
+        pdf = self._weights[0] / (dimension.high - dimension.low) + kernels.dot(
+            self._weights[1:]
+        )
+        return np.log(np.maximum(pdf, 1e-300))
+
+
+class _TPEModel:
+    """Density estimates of good and bad configurations."""
+
+    def __init__(
+        self,
+        dimensions: List[_Dimension],
+        xs: np.ndarray,
+        losses: np.ndarray,
+        gamma: float,
+        prior_weight: float,
+        max_observations: int,
+        rng: np.random.Generator,
+    ):
+        self._dimensions = dimensions
+        order = np.argsort(losses, kind="stable")
+        num_good = max(1, math.ceil(gamma * len(losses)))
+        good, bad = xs[order[:num_good]], xs[order[num_good:]]
+
+        if len(losses) > max_observations:
+            # The cost of evaluating the densities grows with the number of
+            # observations, so only keep a random subset of both.
+            num_good = max(1, math.ceil(gamma * max_observations))
+            good = good[rng.choice(len(good), num_good, replace=False)]
+            bad = bad[rng.choice(len(bad), max_observations - num_good, replace=False)]
+        self._good = [
+            _ParzenEstimator(dimension, good[:, i], prior_weight)
+            for i, dimension in enumerate(dimensions)
+        ]
+        self._bad = [
+            _ParzenEstimator(dimension, bad[:, i], prior_weight)
+            for i, dimension in enumerate(dimensions)
+        ]
+
+    def suggest(
+        self, rng: np.random.Generator, num_suggestions: int, num_candidates: int
+    ) -> np.ndarray:
+        """Returns ``num_suggestions`` configurations (as rows), each of which
+        is the best of ``num_candidates`` samples from the good density."""
+        size = num_suggestions * num_candidates
+        candidates = np.empty((size, len(self._dimensions)))
+        scores = np.zeros(size)
+        for i, (good, bad) in enumerate(zip(self._good, self._bad)):
+            candidates[:, i] = good.sample(rng, size)
+            scores += good.log_pdf(candidates[:, i]) - bad.log_pdf(candidates[:, i])
+
+        scores = scores.reshape(num_suggestions, num_candidates)
+        best = num_candidates * np.arange(num_suggestions) + scores.argmax(axis=1)
+        return candidates[best]
+
+    def sample_good(self, rng: np.random.Generator) -> np.ndarray:
+        """Returns a sample from the good density, without scoring it."""
+        return np.array([good.sample(rng, 1)[0] for good in self._good])
+
+
+@PublicAPI(stability="alpha")
+class TPESearch(Searcher):
+    """Tree-structured Parzen Estimator (TPE) search that runs in the driver.
+
+    Unlike the other model-based searchers, this searcher does not depend on an
+    external library. It is meant for experiments with many concurrent trials:
+
+    - The model is fit in a background thread whenever new results arrive, so
+      that fitting it does not block the Tune driver.
+    - Each fit proposes a batch of ``batch_size`` configurations, which are
+      returned by subsequent ``suggest`` calls.
+    - It uses intermediate results. When used with the
+      :class:`~ray.tune.schedulers.AsyncHyperBandScheduler`, the results
+      recorded at each rung are used as observations at that budget, and the
+      model is fit on the largest budget with enough observations (like BOHB).
+      Final results are used as observations at the largest budget.
+
+    Until enough observations are available, configurations are sampled
+    randomly.
+
+    Tune search spaces are used directly:
+
+    .. code-block:: python
+
+        from ray import tune
+        from ray.tune.schedulers import ASHAScheduler
+        from ray.tune.search.tpe import TPESearch
+
+        tuner = tune.Tuner(
+            trainable,
+            param_space={
+                "lr": tune.loguniform(1e-4, 1e-1),
+                "layers": tune.randint(1, 5),
+                "activation": tune.choice(["relu", "tanh"]),
+            },
+            tune_config=tune.TuneConfig(
+                metric="loss",
+                mode="min",
+                search_alg=TPESearch(),
+                scheduler=ASHAScheduler(max_t=100),
+                num_samples=1000,
+            ),
+        )
+
+    Args:
+        space: Search space (a dict of Tune search space definitions). If not
+            set, the ``param_space`` passed to the ``Tuner`` is used.
+        metric: The training result objective value attribute. If None
+            but a mode was passed, the anonymous metric `_metric` will be used
+            per default.
+        mode: One of {min, max}. Determines whether objective is
+            minimizing or maximizing the metric attribute.
+        points_to_evaluate: Initial parameter suggestions to be run
+            first. Needs to be a list of dicts containing the configurations.
+        time_attr: The training result attribute the scheduler uses to measure
+            time. It is used to attribute the final results of trials stopped
+            by the scheduler to the rung they were stopped at.
+        n_initial_points: Number of observations at a budget required before
+            the model is fit on the observations at that budget.
+        gamma: Fraction of the observations that are considered good.
+        n_ei_candidates: Number of candidates sampled from the density of good
+            configurations for each suggestion. The candidate with the best
+            ratio of the good and bad densities is suggested.
+        batch_size: Number of configurations proposed by each fit of the model.
+        max_observations: If there are more observations at a budget, the model
+            is fit on a random subset of this many observations, to bound the
+            time it takes to fit it.
+        prior_weight: Weight of the uniform prior in the density estimates.
+        fit_in_background: If False, the model is fit in the driver whenever
+            new results arrive.
+        seed: Seed to initialize the random number generator with.
+    """
+
+    def __init__(
+        self,
+        space: Optional[Dict] = None,
+        metric: Optional[str] = None,
+        mode: Optional[str] = None,
+        points_to_evaluate: Optional[List[Dict]] = None,
+        time_attr: str = "training_iteration",
+        n_initial_points: int = 10,
+        gamma: float = 0.25,
+        n_ei_candidates: int = 24,
+        batch_size: int = 32,
+        max_observations: int = 1000,
+        prior_weight: float = 1.0,
+        fit_in_background: bool = True,
+        seed: Optional[int] = None,
+    ):
+        if mode:
+            assert mode in ["min", "max"], "`mode` must be 'min' or 'max'."
+        assert 0 < gamma < 1, "`gamma` must be between 0 and 1."
+
+        super(TPESearch, self).__init__(metric=metric, mode=mode)
+
+        self._points_to_evaluate = copy.deepcopy(points_to_evaluate)
+        self._time_attr = time_attr
+        # The model needs at least one good and one bad observation.
+        self._n_initial_points = max(2, n_initial_points)
+        self._gamma = gamma
+        self._n_ei_candidates = n_ei_candidates
+        self._batch_size = batch_size
+        self._max_observations = max(2, max_observations)
+        self._prior_weight = prior_weight
+        self._fit_in_background = fit_in_background
+        self._rng = np.random.default_rng(seed)
+
+        self._space: Optional[Dict[str, Domain]] = None
+        self._dimensions: List[_Dimension] = []
+        if space:
+            self._set_space(self.convert_search_space(space))
+
+        self._metric_op = None
+        self._setup_metric_op()
+
+        # Model space representation of the configs of all suggested trials.
+        self._trial_vectors: Dict[str, np.ndarray] = {}
+        # Budget -> trial ID -> loss (lower is better).
+        self._observations: Dict[float, Dict[str, float]] = {}
+
+        self._init_fit_state()
+
+    def _init_fit_state(self):
+        self._lock = threading.Lock()
+        self._fit_thread: Optional[threading.Thread] = None
+        self._fit_requested = False
+        self._model: Optional[_TPEModel] = None
+        self._suggestion_pool: Deque[np.ndarray] = deque()
+
+    def _set_space(self, space: Dict[str, Domain]):
+        self._space = space
+        self._dimensions = [_Dimension(domain) for domain in space.values()]
+
+    def _setup_metric_op(self):
+        if self._metric is None and self._mode:
+            # If only a mode was passed, use anonymous metric
+            self._metric = DEFAULT_METRIC
+
+        if self._mode == "max":
+            self._metric_op = -1.0
+        elif self._mode == "min":
+            self._metric_op = 1.0
+
+    def set_search_properties(
+        self, metric: Optional[str], mode: Optional[str], config: Dict, **spec
+    ) -> bool:
+        if self._space:
+            return False
+        space = self.convert_search_space(config)
+        self._set_space(space)
+
+        if metric:
+            self._metric = metric
+        if mode:
+            self._mode = mode
+
+        self._setup_metric_op()
+        return True
+
+    def suggest(self, trial_id: str) -> Optional[Dict]:
+        if not self._space:
+            raise RuntimeError(
+                UNDEFINED_SEARCH_SPACE.format(
+                    cls=self.__class__.__name__, space="space"
+                )
+            )
+        if not self._metric or not self._mode:
+            raise RuntimeError(
+                UNDEFINED_METRIC_MODE.format(
+                    cls=self.__class__.__name__, metric=self._metric, mode=self._mode
+                )
+            )
+
+        if self._points_to_evaluate:
+            config = self._points_to_evaluate.pop(0)
+            try:
+                flat_config = flatten_dict(config, prevent_delimiter=True)
+                self._trial_vectors[trial_id] = np.array(
+                    [
+                        dimension.to_model(flat_config[path])
+                        for path, dimension in zip(self._space, self._dimensions)
+                    ]
+                )
+            except (KeyError, ValueError, TypeError):
+                # Results of this trial can't be used to fit the model.
+                logger.debug(f"Could not use point to evaluate in the model: {config}")
+            return config
+
+        vector = self._next_vector()
+        self._trial_vectors[trial_id] = vector
+        return unflatten_dict(
+            {
+                path: dimension.from_model(x)
+                for path, dimension, x in zip(self._space, self._dimensions, vector)
+            }
+        )
+
+    def _next_vector(self) -> np.ndarray:
+        with self._lock:
+            if self._suggestion_pool:
+                vector = self._suggestion_pool.popleft()
+                pool_empty = not self._suggestion_pool
+            else:
+                vector = None
+                pool_empty = True
+            model = self._model
+
+            if vector is None and model is not None:
+                # The background fit hasn't refilled the pool yet. Don't score
+                # candidates in the driver, which is expensive for many
+                # observations.
+                vector = model.sample_good(self._rng)
+            elif vector is None:
+                vector = np.array(
+                    [
+                        dimension.sample_uniform(self._rng, 1)[0]
+                        for dimension in self._dimensions
+                    ]
+                )
+
+        if model is not None and pool_empty:
+            self._request_fit()
+        return vector
+
+    def on_trial_result(self, trial_id: str, result: Dict):
+        if self._add_rung_result(trial_id, result):
+            self._request_fit()
+
+    def on_trial_results(self, trial_results: List[Tuple[str, Dict]]):
+        # Fit the model only once for all results.
+        added = False
+        for trial_id, result in trial_results:
+            added = self._add_rung_result(trial_id, result) or added
+        if added:
+            self._request_fit()
+
+    def on_trial_complete(
+        self, trial_id: str, result: Optional[Dict] = None, error: bool = False
+    ):
+        if result and not error and self._add_final_result(trial_id, result):
+            self._request_fit()
+
+        if not any(trial_id in losses for losses in self._observations.values()):
+            self._trial_vectors.pop(trial_id, None)
+
+    def _add_rung_result(self, trial_id: str, result: Dict) -> bool:
+        # The AsyncHyperBandScheduler adds this to results recorded at a rung.
+        budget = result.get("hyperband_info", {}).get("budget")
+        if budget is None:
+            return False
+        return self._add_observation(trial_id, budget, result)
+
+    def _add_final_result(self, trial_id: str, result: Dict) -> bool:
+        # The result that made the scheduler stop a trial at a rung is only
+        # passed to `on_trial_complete`. Attribute it to the largest rung the
+        # trial has reached, unless it has been recorded there already.
+        budget = _FINAL_BUDGET
+        cur_time = result.get(self._time_attr)
+        if cur_time is not None:
+            rungs = [
+                rung
+                for rung in self._observations
+                if rung != _FINAL_BUDGET and rung <= cur_time
+            ]
+            if rungs and trial_id not in self._observations[max(rungs)]:
+                budget = max(rungs)
+        return self._add_observation(trial_id, budget, result)
+
+    def _add_observation(self, trial_id: str, budget: float, result: Dict) -> bool:
+        value = result.get(self._metric)
+        if trial_id not in self._trial_vectors or value is None:
+            return False
+        try:
+            loss = self._metric_op * float(value)
+        except (TypeError, ValueError):
+            return False
+        if not np.isfinite(loss):
+            return False
+
+        with self._lock:
+            self._observations.setdefault(budget, {})[trial_id] = loss
+        return True
+
+    def _request_fit(self):
+        if not self._fit_in_background:
+            self._fit()
+            return
+
+        with self._lock:
+            self._fit_requested = True
+            if self._fit_thread is not None:
+                # The running thread will fit the model again.
+                return
+            self._fit_thread = threading.Thread(
+                target=self._fit_loop, name="TPESearch.fit", daemon=True
+            )
+            self._fit_thread.start()
+
+    def _fit_loop(self):
+        while True:
+            with self._lock:
+                if not self._fit_requested:
+                    self._fit_thread = None
+                    return
+                self._fit_requested = False
+            try:
+                self._fit()
+            except Exception:
+                logger.exception("TPESearch failed to fit its model.")
+
+    def _fit(self):
+        with self._lock:
+            # Fit on the largest budget with enough observations.
+            budgets = [
+                budget
+                for budget, losses in self._observations.items()
+                if len(losses) >= self._n_initial_points
+            ]
+            if not budgets:
+                return
+            losses = self._observations[max(budgets)]
+            xs = np.stack([self._trial_vectors[trial_id] for trial_id in losses])
+            ys = np.array(list(losses.values()))
+            rng = np.random.default_rng(self._rng.integers(2**32))
+
+        model = _TPEModel(
+            self._dimensions,
+            xs,
+            ys,
+            self._gamma,
+            self._prior_weight,
+            self._max_observations,
+            rng,
+        )
+        suggestions = model.suggest(rng, self._batch_size, self._n_ei_candidates)
+
+        with self._lock:
+            self._model = model
+            # Replace the suggestions of the previous model.
+            self._suggestion_pool = deque(suggestions)
+
+    @staticmethod
+    def convert_search_space(spec: Dict) -> Dict[str, Domain]:
+        resolved_vars, domain_vars, grid_vars = parse_spec_vars(spec)
+
+        if grid_vars:
+            raise ValueError(
+                "Grid search parameters cannot be automatically converted "
+                "to a TPESearch search space."
+            )
+
+        # Flatten and resolve again after checking for grid search.
+        spec = flatten_dict(spec, prevent_delimiter=True)
+        resolved_vars, domain_vars, grid_vars = parse_spec_vars(spec)
+
+        space = {}
+        for path, domain in domain_vars:
+            # Raises an error for unsupported parameters.
+            _Dimension(domain)
+            space["/".join(str(p) for p in path)] = domain
+        return space
+
+    def __getstate__(self) -> Dict:
+        # The model is fit again after restoring.
+        state = self.__dict__.copy()
+        for key in [
+            "_lock",
+            "_fit_thread",
+            "_fit_requested",
+            "_model",
+            "_suggestion_pool",
+        ]:
+            state.pop(key)
+        return state
+
+    def __setstate__(self, state: Dict):
+        self.__dict__.update(state)
+        self._init_fit_state()
+
+    def get_state(self) -> Dict:
+        return copy.deepcopy(self.__getstate__())
+
+    def set_state(self, state: Dict):
+        self.__setstate__(state)
+        self._request_fit()
+
+    def save(self, checkpoint_path: str):
+        with open(checkpoint_path, "wb") as outputFile:
+            pickle.dump(self.get_state(), outputFile)
+
+    def restore(self, checkpoint_path: str):
+        with open(checkpoint_path, "rb") as inputFile:
+            self.set_state(pickle.load(inputFile))
@@ -283,13 +283,8 @@ def _generate_variants_internal(
             yield resolved_vars, spec
 
 
-def _get_preset_variants(
-    spec: Dict,
-    config: Dict,
-    constant_grid_search: bool = False,
-    random_state: "RandomState" = None,
-):
-    """Get variants according to a spec, initialized with a config.
+def _get_preset_spec(spec: Dict, config: Dict) -> Dict:
+    """Get a spec initialized with a config.
 
     Variables from the spec are overwritten by the variables in the config.
     Thus, we may end up with less sampled parameters.
@@ -334,9 +329,7 @@ def _get_preset_variants(
                     )
         assign_value(spec["config"], path, val)
 
-    return _generate_variants_internal(
-        spec, constant_grid_search=constant_grid_search, random_state=random_state
-    )
+    return spec
 
 
 @DeveloperAPI
@@ -436,6 +429,110 @@ def _grid_search_generator(
                 break
 
 
+class _IndexedVariants:
+    """The variants of a spec, indexed by integer.
+
+    Unlike ``generate_variants``, this does not generate all variants up front.
+    Instead, variant ``i`` is materialized on demand by decomposing ``i`` into
+    one value index per grid search variable. The first grid search variable
+    varies fastest, so that the variants are in the same order as in
+    ``generate_variants``.
+
+    Only the dicts and lists that contain the grid search and sampled values are
+    copied for each variant. All other values of the spec are shared between
+    the variants.
+
+    Only specs that are accepted by ``supports`` can be indexed.
+    """
+
+    def __init__(
+        self,
+        unresolved_spec: Dict,
+        constant_grid_search: bool = False,
+        random_state: "RandomState" = None,
+    ):
+        self._spec = copy.deepcopy(unresolved_spec)
+        self._random_state = random_state
+        _, self._domain_vars, self._grid_vars = parse_spec_vars(self._spec)
+
+        # Nested dict of the keys on the paths of all unresolved values.
+        self._path_tree = {}
+        for path, _ in self._domain_vars + self._grid_vars:
+            subtree = self._path_tree
+            for key in path:
+                subtree = subtree.setdefault(key, {})
+
+        self._constant_vars = {}
+        if constant_grid_search and self._domain_vars:
+            # Sample the random variables once and keep them constant for all
+            # grid search variants.
+            self._spec = _copy_paths(self._spec, self._path_tree)
+            _, self._constant_vars = _resolve_domain_vars(
+                self._spec, self._domain_vars, random_state=self._random_state
+            )
+            self._domain_vars = []
+
+        self._num_variants = 1
+        for _, values in self._grid_vars:
+            self._num_variants *= len(values)
+
+    @staticmethod
+    def supports(unresolved_spec: Dict) -> bool:
+        """Whether the variants of the spec can be indexed.
+
+        This is the case if all grid search values and categories are resolved
+        values, and no values are sampled from functions. Otherwise, sampling a
+        value can produce new grid search variables.
+        """
+        _, domain_vars, grid_vars = parse_spec_vars(unresolved_spec)
+        for _, domain in domain_vars + grid_vars:
+            if isinstance(domain, Function):
+                return False
+            if isinstance(domain, Categorical) and any(
+                _has_unresolved_values({0: value}) for value in domain.categories
+            ):
+                return False
+        return True
+
+    def __len__(self) -> int:
+        return self._num_variants
+
+    def materialize(self, index: int) -> Tuple[Dict, Dict]:
+        """Returns the resolved variables and the spec of the variant.
+
+        Random variables are sampled each time this is called.
+        """
+        if not 0 <= index < self._num_variants:
+            raise IndexError(f"Variant index out of range: {index}")
+
+        spec = _copy_paths(self._spec, self._path_tree)
+        grid_values = []
+        for path, values in self._grid_vars:
+            index, value_index = divmod(index, len(values))
+            value = values[value_index]
+            assign_value(spec, path, value)
+            grid_values.append((path, value))
+
+        resolved_vars = dict(self._constant_vars)
+        if self._domain_vars:
+            _, sampled_vars = _resolve_domain_vars(
+                spec, self._domain_vars, random_state=self._random_state
+            )
+            resolved_vars.update(sampled_vars)
+        resolved_vars.update(grid_values)
+        return resolved_vars, spec
+
+
+def _copy_paths(spec: Any, path_tree: Dict) -> Any:
+    """Shallowly copies the dicts, lists and tuples on the paths of the tree."""
+    is_tuple = isinstance(spec, tuple)
+    spec = list(spec) if is_tuple else copy.copy(spec)
+    for key, subtree in path_tree.items():
+        if subtree:
+            spec[key] = _copy_paths(spec[key], subtree)
+    return tuple(spec) if is_tuple else spec
+
+
 def _is_resolved(v) -> bool:
     resolved, _ = _try_resolve(v)
     return resolved
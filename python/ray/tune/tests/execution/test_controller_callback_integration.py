@@ -9,6 +9,7 @@ from ray.train.tests.util import mock_storage_context
 from ray.tune import Callback, ResumeConfig
 from ray.tune.execution.tune_controller import TuneController
 from ray.tune.experiment import Trial
+from ray.tune.schedulers import FIFOScheduler, PopulationBasedTraining
 from ray.tune.utils.mock_trainable import MOCK_TRAINABLE_NAME, register_mock_trainable
 
 
@@ -65,5 +66,130 @@ def test_callback_save_restore(
     assert callback.counter == 3
 
 
+class BatchRecordingCallback(Callback):
+    def __init__(self):
+        self.batch_sizes = []
+        self.results = []
+
+    def on_trial_result(self, iteration, trials, trial, result, **info):
+        self.results.append((trial.trial_id, result["training_iteration"]))
+
+    def on_trial_results(self, iteration, trials, trial_results, **info):
+        self.batch_sizes.append(len(trial_results))
+        super().on_trial_results(
+            iteration=iteration, trials=trials, trial_results=trial_results, **info
+        )
+
+
+class BatchRecordingScheduler(FIFOScheduler):
+    def __init__(self):
+        super().__init__()
+        self.batch_sizes = []
+
+    def on_trial_results(self, tune_controller, trial_results):
+        self.batch_sizes.append(len(trial_results))
+        return super().on_trial_results(tune_controller, trial_results)
+
+
+@pytest.mark.parametrize(
+    "resource_manager_cls", [FixedResourceManager, PlacementGroupResourceManager]
+)
+def test_callback_batch_result_processing(
+    ray_start_4_cpus_2_gpus_extra, resource_manager_cls, monkeypatch
+):
+    """Check that results are passed to the scheduler and callbacks in batches
+    if batched result processing is enabled."""
+    monkeypatch.setenv("TUNE_BATCH_RESULT_PROCESSING", "1")
+
+    storage = mock_storage_context()
+    callback = BatchRecordingCallback()
+    scheduler = BatchRecordingScheduler()
+    runner = TuneController(
+        resource_manager_factory=lambda: resource_manager_cls(),
+        callbacks=[callback],
+        scheduler=scheduler,
+        storage=storage,
+    )
+    trials = [
+        Trial(
+            MOCK_TRAINABLE_NAME,
+            stopping_criterion={"training_iteration": 3},
+            storage=storage,
+        )
+        for _ in range(4)
+    ]
+    for trial in trials:
+        runner.add_trial(trial)
+
+    while not runner.is_finished():
+        runner.step()
+
+    assert all(trial.status == Trial.TERMINATED for trial in trials)
+    assert all(trial.last_result["training_iteration"] == 3 for trial in trials)
+
+    # Each trial reported 3 results, which were all processed in batches.
+    assert sorted(callback.results) == sorted(
+        (trial.trial_id, i) for trial in trials for i in range(1, 4)
+    )
+    assert sum(callback.batch_sizes) == 12
+    # Results of stopped trials are not passed to the scheduler.
+    assert sum(scheduler.batch_sizes) == 8
+
+
+def test_batch_result_processing_pbt(ray_start_4_cpus_2_gpus_extra, monkeypatch):
+    """Check that no results are lost with batched result processing when PBT
+    pauses trials to exploit.
+
+    Async PBT pauses the trial whose result it is handling and returns NOOP. The
+    result must still be processed like when processing results one by one.
+    """
+    monkeypatch.setenv("TUNE_BATCH_RESULT_PROCESSING", "1")
+
+    storage = mock_storage_context()
+    callback = BatchRecordingCallback()
+    scheduler = PopulationBasedTraining(
+        time_attr="training_iteration",
+        metric="episode_reward_mean",
+        mode="max",
+        perturbation_interval=1,
+        quantile_fraction=0.25,
+        hyperparam_mutations={"height": [1, 2, 3, 4]},
+    )
+    runner = TuneController(
+        resource_manager_factory=lambda: FixedResourceManager(),
+        callbacks=[callback],
+        scheduler=scheduler,
+        storage=storage,
+    )
+    trials = [
+        Trial(
+            MOCK_TRAINABLE_NAME,
+            config={"height": i + 1},
+            stopping_criterion={"training_iteration": 5},
+            storage=storage,
+        )
+        for i in range(4)
+    ]
+    for trial in trials:
+        runner.add_trial(trial)
+
+    received = []
+    on_training_result = runner._on_training_result
+
+    def _on_training_result(trial, result):
+        for r in result if isinstance(result, list) else [result]:
+            received.append((trial.trial_id, r["training_iteration"]))
+        on_training_result(trial, result)
+
+    runner._on_training_result = _on_training_result
+
+    while not runner.is_finished():
+        runner.step()
+
+    assert scheduler._num_perturbations > 0
+    assert all(trial.status == Trial.TERMINATED for trial in trials)
+    assert sorted(callback.results) == sorted(received)
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(["-v", __file__]))
@@ -1,5 +1,7 @@
+import json
 import os
 import sys
+from pathlib import Path
 from unittest.mock import patch
 
 import pandas as pd
@@ -382,6 +384,96 @@ def test_controller_restore_trial_no_checkpoint_save(
         runner2.step()
 
 
+def test_controller_restore_incremental_experiment_state(
+    ray_start_4_cpus_2_gpus_extra, monkeypatch
+):
+    """Check that trials are restored from the trial state log.
+
+    The experiment state is saved on every step, so the log is both appended to
+    and compacted. The restored trials should match the latest trial states.
+    """
+    monkeypatch.setenv("TUNE_INCREMENTAL_EXPERIMENT_STATE", "1")
+    storage = mock_storage_context()
+
+    runner = TuneController(
+        resource_manager_factory=lambda: FixedResourceManager(),
+        checkpoint_period=0,
+        storage=storage,
+    )
+    trials = [
+        Trial(
+            MOCK_TRAINABLE_NAME,
+            trial_id=f"trial_{i}",
+            stopping_criterion={"training_iteration": i + 1},
+            storage=storage,
+        )
+        for i in range(4)
+    ]
+    for trial in trials:
+        runner.add_trial(trial)
+
+    while not runner.is_finished():
+        runner.step()
+
+    runner.checkpoint(force=True, wait=True)
+
+    staging_path = Path(storage.experiment_driver_staging_path)
+    with open(staging_path / runner.experiment_state_file_name) as f:
+        experiment_state = json.load(f)
+    assert "trial_data" not in experiment_state
+    trial_state_log = experiment_state["trial_state_log"]
+    assert trial_state_log["dir_name"] == runner.trial_state_log_dir_name
+    num_lines = 0
+    for segment in trial_state_log["segments"]:
+        # Each segment has been uploaded to the storage path.
+        assert Path(
+            storage.experiment_fs_path, trial_state_log["dir_name"], segment
+        ).exists()
+        with open(staging_path / trial_state_log["dir_name"] / segment) as f:
+            num_lines += len(f.readlines())
+    assert len(trials) <= num_lines <= 2 * len(trials)
+
+    # Compact the log, then save a change: only the new segment is uploaded.
+    runner._trial_state_log_num_entries = 2 * len(trials)
+    runner._trial_ids_to_log[trials[0].trial_id] = None
+    runner.checkpoint(force=True, wait=True)
+    with open(staging_path / runner.experiment_state_file_name) as f:
+        base_segment = json.load(f)["trial_state_log"]["segments"]
+    assert len(base_segment) == 1
+
+    sync_up = storage.syncer.sync_up
+    excluded = []
+
+    def spy_sync_up(local_dir, remote_dir, exclude=None):
+        excluded.append(exclude)
+        return sync_up(local_dir, remote_dir, exclude=exclude)
+
+    with patch.object(storage.syncer, "sync_up", spy_sync_up):
+        runner._trial_ids_to_log[trials[0].trial_id] = None
+        runner.checkpoint(force=True, wait=True)
+    with open(staging_path / runner.experiment_state_file_name) as f:
+        segments = json.load(f)["trial_state_log"]["segments"]
+    assert segments[:-1] == base_segment
+    assert excluded == [[f"{runner.trial_state_log_dir_name}/{base_segment[0]}"]]
+    assert Path(
+        storage.experiment_fs_path, runner.trial_state_log_dir_name, segments[-1]
+    ).exists()
+
+    runner2 = TuneController(
+        resource_manager_factory=lambda: FixedResourceManager(),
+        storage=storage,
+        resume_config=ResumeConfig(),
+    )
+    assert {t.trial_id for t in runner2.get_trials()} == {t.trial_id for t in trials}
+    for trial in trials:
+        restored_trial = runner2.get_trial(trial.trial_id)
+        assert restored_trial.status == Trial.TERMINATED
+        assert (
+            restored_trial.last_result["training_iteration"]
+            == trial.last_result["training_iteration"]
+        )
+
+
 @pytest.mark.parametrize(
     "resource_manager_cls", [FixedResourceManager, PlacementGroupResourceManager]
 )
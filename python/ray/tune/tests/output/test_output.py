@@ -18,10 +18,12 @@ from ray.tune.experimental.output import (
     _get_time_str,
     _get_trial_info,
     _get_trial_table_data,
+    _get_trial_table_data_from_progress,
     _get_trials_by_state,
     _infer_params,
     _infer_user_metrics,
     _max_len,
+    _TrialProgress,
 )
 from ray.tune.utils.mock_trainable import MOCK_TRAINABLE_NAME
 
@@ -195,6 +197,50 @@ def test_get_trial_table_data_more_than_20():
     assert table_data[2].more_info == "5 more PENDING"
 
 
+def test_trial_progress():
+    trial_progress = _TrialProgress(metric="episode_reward_mean", mode="max")
+    trials = []
+    for i in range(30):
+        t = Trial(MOCK_TRAINABLE_NAME, stub=True)
+        t.trial_id = str(i)
+        t.config = {"param": i}
+        trial_progress.on_trial_status(t)
+        trials.append(t)
+
+    for t in trials[:20]:
+        t.set_status(Trial.RUNNING)
+        trial_progress.on_trial_status(t)
+    for t in trials[:10]:
+        t.set_status(Trial.TERMINATED)
+        trial_progress.on_trial_status(t)
+    for i, t in enumerate(trials[:20]):
+        result = {"episode_reward_mean": 100 + i % 10}
+        trial_progress.on_trial_result(t, result)
+        t.run_metadata.last_result = result
+
+    assert trial_progress.status_counts == {
+        Trial.PENDING: 10,
+        Trial.RUNNING: 10,
+        Trial.TERMINATED: 10,
+    }
+    assert trial_progress.get_trials(Trial.RUNNING, 3) == trials[10:13]
+    # Ties are broken by the order in which trials were added.
+    assert trial_progress.get_best_trials(2) == [trials[9], trials[19]]
+
+    # Only the last result of a trial counts.
+    trial_progress.on_trial_result(trials[9], {"episode_reward_mean": 0})
+    assert trial_progress.get_best_trials(1) == [trials[19]]
+    trial_progress.on_trial_result(trials[19], {})
+    assert trial_progress.get_best_trials(1) == [trials[8]]
+
+    table_data = _get_trial_table_data_from_progress(
+        trial_progress, ["param"], ["episode_reward_mean"]
+    )
+    expected = _get_trial_table_data(trials, ["param"], ["episode_reward_mean"])
+    assert table_data == expected
+    assert table_data.header == ["Trial name", "status", "param", "reward"]
+
+
 def test_infer_params():
     assert _infer_params({}) == []
     assert _infer_params({"some": "val"}) == []
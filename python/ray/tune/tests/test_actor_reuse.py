@@ -10,9 +10,11 @@ import pytest
 
 import ray
 from ray import logger, tune
+from ray.air import ResourceRequest
 from ray.train.tests.util import create_dict_checkpoint, load_dict_checkpoint
 from ray.tune import CheckpointConfig, Trainable, register_trainable, run_experiments
 from ray.tune.error import TuneError
+from ray.tune.execution.tune_controller import _get_resource_reuse_cost
 from ray.tune.result_grid import ResultGrid
 from ray.tune.schedulers.trial_scheduler import FIFOScheduler, TrialScheduler
 from ray.tune.tune import _check_mixin
@@ -465,6 +467,68 @@ def test_multi_trial_reuse_heterogeneous(ray_start_4_cpus_extra):
     assert sorted([t.last_result["num_resets"] for t in trials]) == [0, 0, 0, 1, 1, 1]
 
 
+def test_multi_trial_reuse_across_resources(ray_start_4_cpus_extra, monkeypatch):
+    """Test that actors are reused for trials requesting fewer resources.
+
+    - Run 3 trials requesting 4, 2, and 1 CPUs
+    - Only 1 trial can run at the same time
+    - Assert that the actor of the first trial is reused for the other trials
+    """
+    monkeypatch.setenv("TUNE_MAX_PENDING_TRIALS_PG", "3")
+    monkeypatch.setenv("TUNE_REUSE_ACTORS_ACROSS_RESOURCES", "1")
+
+    register_trainable("foo2", MyResettableClass)
+
+    trials = tune.run(
+        "foo2",
+        config={
+            "required_resources": tune.grid_search(
+                [
+                    {"cpu": 4, "custom_resources": {"extra": 4}},
+                    {"cpu": 2, "custom_resources": {"extra": 4}},
+                    {"cpu": 1, "custom_resources": {"extra": 4}},
+                ]
+            ),
+            "id": -1,
+        },
+        reuse_actors=True,
+    ).trials
+
+    assert sorted([t.last_result["num_resets"] for t in trials]) == [0, 1, 2]
+    assert all(t.run_metadata.last_startup_time_s is not None for t in trials)
+    # All trials ran with the resources of the first trial's actor.
+    assert all(
+        t.run_metadata.last_resources == [{"CPU": 4, "extra": 4}] for t in trials
+    )
+
+
+def test_resource_reuse_cost():
+    """Test that actors are only reused for trials requesting fewer CPUs, or
+    less memory, but the same amounts of other resources, e.g. GPUs."""
+    cached = ResourceRequest([{"CPU": 4, "GPU": 2, "memory": 100}])
+
+    assert _get_resource_reuse_cost(cached, cached) == 0
+    assert (
+        _get_resource_reuse_cost(
+            cached, ResourceRequest([{"CPU": 1, "GPU": 2, "memory": 50}])
+        )
+        == 53
+    )
+    assert (
+        _get_resource_reuse_cost(
+            cached, ResourceRequest([{"CPU": 4, "GPU": 1, "memory": 100}])
+        )
+        is None
+    )
+    assert (
+        _get_resource_reuse_cost(
+            cached, ResourceRequest([{"CPU": 8, "GPU": 2, "memory": 100}])
+        )
+        is None
+    )
+    assert _get_resource_reuse_cost(cached, ResourceRequest([{"CPU": 4}])) is None
+
+
 def test_detect_reuse_mixins():
     class DummyMixin:
         pass
@@ -17,6 +17,7 @@ from ray.train.tests.test_new_persistence import mock_s3_bucket_uri
 from ray.train.tests.util import create_dict_checkpoint, load_dict_checkpoint
 from ray.tune.analysis.experiment_analysis import ExperimentAnalysis
 from ray.tune.experiment import Trial
+from ray.tune.logger import ParquetLoggerCallback
 from ray.tune.utils import flatten_dict
 
 NUM_TRIALS = 3
@@ -104,6 +105,36 @@ def experiment_analysis(request):
             raise NotImplementedError(f"Invalid param: {load_from}")
 
 
+def test_trial_dataframes_from_parquet(tmp_path):
+    tune.run(
+        train_fn,
+        config={"id": tune.grid_search(list(range(1, NUM_TRIALS + 1)))},
+        storage_path=str(tmp_path),
+        name="test_parquet",
+        callbacks=[ParquetLoggerCallback()],
+    )
+
+    experiment_analysis = ExperimentAnalysis(str(tmp_path / "test_parquet"))
+    # The dataframes are only loaded on first access.
+    assert experiment_analysis._trial_dataframes is None
+
+    dfs = experiment_analysis.trial_dataframes
+    assert {trial.trial_id for trial in experiment_analysis.trials} == set(dfs)
+    for trial_id, df in dfs.items():
+        trial_config = experiment_analysis.get_all_configs()[trial_id]
+        assert np.all(
+            df["ascending"].to_numpy() == np.arange(1, 8) * trial_config["id"]
+        )
+
+    trial = _get_trial_with_id(experiment_analysis.trials, 2)
+    dfs = experiment_analysis.get_trial_dataframes(
+        trial_ids=[trial.trial_id], columns=["ascending"]
+    )
+    assert list(dfs) == [trial.trial_id]
+    assert list(dfs[trial.trial_id].columns) == ["ascending"]
+    assert np.all(dfs[trial.trial_id]["ascending"].to_numpy() == np.arange(1, 8) * 2)
+
+
 @pytest.mark.parametrize("filetype", ["json", "csv"])
 def test_fetch_trial_dataframes(experiment_analysis, filetype):
     if filetype == "csv":
@@ -3,6 +3,7 @@ import os
 import sys
 import tempfile
 import unittest
+import unittest.mock
 
 import ray
 import ray.train
@@ -13,6 +14,7 @@ from ray.train.tests.util import mock_storage_context
 from ray.tune import Checkpoint, CheckpointConfig
 from ray.tune.execution.placement_groups import PlacementGroupFactory
 from ray.tune.logger import NoopLogger
+from ray.tune.registry import _shared_parameter_registries
 from ray.tune.result import DEFAULT_METRIC
 from ray.tune.schedulers import ResourceChangingScheduler
 from ray.tune.trainable import with_parameters, wrap_function
@@ -178,6 +180,47 @@ class FunctionApiTest(unittest.TestCase):
         dumped = cp.dumps(trainable)
         assert sys.getsizeof(dumped) < 100 * 1024
 
+    def testWithParametersSharedPerNode(self):
+        import numpy as np
+
+        data = np.arange(1_000_000)
+
+        def train_fn(config, data=None):
+            shared = any(
+                name.startswith("tune_parameter_holders_")
+                for name in ray.util.list_named_actors()
+            )
+            ray.tune.report(
+                dict(
+                    metric=int(data.sum()),
+                    writeable=data.flags.writeable,
+                    shared=shared,
+                )
+            )
+
+        with unittest.mock.patch.dict(
+            os.environ, {"TUNE_SHARE_PARAMETERS_PER_NODE": "1"}
+        ):
+            trainable = with_parameters(train_fn, data=data)
+
+        # The parameters are shared again by later experiments.
+        for _ in range(2):
+            trials = tune.run(trainable, num_samples=2).trials
+
+            for trial in trials:
+                self.assertEqual(trial.last_result["metric"], int(data.sum()))
+                # The array is mapped zero-copy from the object store.
+                self.assertFalse(trial.last_result["writeable"])
+                self.assertTrue(trial.last_result["shared"])
+
+            # The holders are killed when the experiment ends.
+            self.assertTrue(
+                all(
+                    registry.holder_manager is None
+                    for registry in _shared_parameter_registries
+                )
+            )
+
     def testNewResources(self):
         sched = ResourceChangingScheduler(
             resources_allocation_function=(
@@ -8,9 +8,11 @@ import tempfile
 import unittest
 from dataclasses import dataclass
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Optional
 
 import numpy as np
+import pyarrow.fs
 import pytest
 
 import ray
@@ -27,10 +29,13 @@ from ray.tune.logger import (
     CSVLoggerCallback,
     JsonLogger,
     JsonLoggerCallback,
+    ParquetLoggerCallback,
     TBXLogger,
     TBXLoggerCallback,
 )
 from ray.tune.logger.aim import AimLoggerCallback
+from ray.tune.logger.parquet import _read_trial_results
+from ray.tune.result import EXPR_RESULT_STORE_DIR
 from ray.tune.utils import flatten_dict
 
 
@@ -114,6 +119,20 @@ class LoggerSuite(unittest.TestCase):
         logger.on_trial_complete(3, [], t)
         self._validate_csv_result()
 
+    def testCSVBatch(self):
+        config = {"a": 2, "b": 5, "c": {"c": {"D": 123}, "e": None}}
+        t = Trial(evaluated_params=config, trial_id="csv", logdir=self.test_dir)
+        logger = CSVLoggerCallback()
+        logger.on_trial_results(0, [], [(t, result(0, 4))])
+        logger.on_trial_results(
+            1,
+            [],
+            [(t, result(1, 5)), (t, result(2, 6, score=[1, 2, 3]))],
+        )
+
+        logger.on_trial_complete(3, [], t)
+        self._validate_csv_result()
+
     def testCSVEmptyHeader(self):
         """Test that starting a trial twice does not lead to empty CSV headers.
 
@@ -173,6 +192,20 @@ class LoggerSuite(unittest.TestCase):
         logger.on_trial_complete(3, [], t)
         self._validate_json_result(config)
 
+    def testJSONBatch(self):
+        config = {"a": 2, "b": 5, "c": {"c": {"D": 123}, "e": None}}
+        t = Trial(evaluated_params=config, trial_id="json", logdir=self.test_dir)
+        logger = JsonLoggerCallback()
+        logger.on_trial_results(0, [], [(t, result(0, 4))])
+        logger.on_trial_results(
+            1,
+            [],
+            [(t, result(1, 5)), (t, result(2, 6, score=[1, 2, 3]))],
+        )
+
+        logger.on_trial_complete(3, [], t)
+        self._validate_json_result(config)
+
     def _validate_json_result(self, config):
         # Check result logs
         results = []
@@ -200,6 +233,68 @@ class LoggerSuite(unittest.TestCase):
 
         self.assertEqual(loaded_config, config)
 
+    def testParquet(self):
+        trials = [
+            Trial(evaluated_params={"a": i}, trial_id=f"trial_{i}", logdir=None)
+            for i in range(2)
+        ]
+        for t in trials:
+            t.storage = SimpleNamespace(experiment_driver_staging_path=self.test_dir)
+
+        logger = ParquetLoggerCallback(max_rows_per_file=4)
+
+        def log_results(i):
+            for t in trials:
+                logger.on_trial_result(
+                    i,
+                    [],
+                    t,
+                    result(
+                        i,
+                        i,
+                        score=[1, 2, 3],
+                        hello={"world": np.float32(1)},
+                        mixed="a" if i == 0 else i,
+                        config=t.config,
+                    ),
+                )
+
+        for i in range(3):
+            log_results(i)
+
+        # 4 results were written, 2 are still buffered.
+        store_dir = os.path.join(self.test_dir, EXPR_RESULT_STORE_DIR)
+        self.assertEqual(len(os.listdir(store_dir)), 1)
+        logger.on_experiment_checkpoint(0, [])
+        self.assertEqual(len(os.listdir(store_dir)), 2)
+        # The second file isn't full yet, so it is rewritten.
+        log_results(3)
+        logger.on_experiment_checkpoint(0, [])
+        self.assertEqual(len(os.listdir(store_dir)), 2)
+        logger.on_experiment_end([])
+        self.assertEqual(len(os.listdir(store_dir)), 2)
+
+        fs = pyarrow.fs.LocalFileSystem()
+        df = _read_trial_results(fs, self.test_dir)
+        self.assertEqual(len(df), 8)
+        self.assertNotIn("config/a", df)
+        trial_df = df[df["trial_id"] == "trial_0"]
+        self.assertSequenceEqual(list(trial_df["episode_reward_mean"]), [0, 1, 2, 3])
+        self.assertSequenceEqual(list(trial_df["hello/world"]), [1.0] * 4)
+        self.assertEqual(trial_df["score"].iloc[0], "[1, 2, 3]")
+        # Values of different types are logged as strings.
+        self.assertEqual(trial_df["mixed"].iloc[1], "1")
+
+        df = _read_trial_results(
+            fs,
+            self.test_dir,
+            trial_ids=["trial_1"],
+            columns=["training_iteration", "missing"],
+        )
+        self.assertSequenceEqual(list(df.columns), ["trial_id", "training_iteration"])
+        self.assertSequenceEqual(list(df["trial_id"]), ["trial_1"] * 4)
+        self.assertSequenceEqual(list(df["training_iteration"]), [0, 1, 2, 3])
+
     def testLegacyTBX(self):
         config = {
             "a": 2,
@@ -298,6 +298,22 @@ class InvalidValuesTest(unittest.TestCase):
 
         searcher.on_trial_complete("trial_1", {"training_iteration": 4, "metric": 1})
 
+    def testTPE(self):
+        from ray.tune.search.tpe import TPESearch
+
+        with self.check_searcher_checkpoint_errors_scope():
+            out = tune.run(
+                _invalid_objective,
+                # At least one nan, inf, -inf and float
+                search_alg=TPESearch(n_initial_points=4, seed=1234),
+                config=self.config,
+                metric="_metric",
+                mode="max",
+                num_samples=8,
+                reuse_actors=False,
+            )
+        self.assertCorrectExperimentOutput(out)
+
     def testZOOpt(self):
         self.skipTest(
             "Recent ZOOpt versions fail handling invalid values gracefully. "
@@ -695,6 +711,16 @@ class SaveRestoreCheckpointTest(unittest.TestCase):
         assert "not_completed" in searcher._ot_trials
         self.assertTrue(os.path.exists(storage_file_path))
 
+    def testTPE(self):
+        from ray.tune.search.tpe import TPESearch
+
+        searcher = TPESearch(space=self.config, metric=self.metric_name, mode="max")
+        self._save(searcher)
+
+        searcher = TPESearch()
+        self._restore(searcher)
+        assert "not_completed" in searcher._trial_vectors
+
     def testZOOpt(self):
         from ray.tune.search.zoopt import ZOOptSearch
 
@@ -797,6 +823,87 @@ class MultiObjectiveTest(unittest.TestCase):
         self.assertTrue(os.path.exists(storage_file_path))
 
 
+class TPESearchTest(unittest.TestCase):
+    """
+    Test the multi-fidelity and batching behavior of TPESearch.
+    """
+
+    def setUp(self):
+        self.config = {
+            "x": tune.uniform(-5, 5),
+            "n": tune.randint(1, 4),
+            "lr": tune.loguniform(1e-4, 1e-1),
+            "c": tune.choice(["a", "b"]),
+        }
+
+    def _searcher(self, **kwargs):
+        from ray.tune.search.tpe import TPESearch
+
+        return TPESearch(
+            space=self.config,
+            metric="loss",
+            mode="min",
+            n_initial_points=5,
+            seed=1234,
+            fit_in_background=False,
+            **kwargs,
+        )
+
+    def testSuggestInSearchSpace(self):
+        searcher = self._searcher()
+        for i in range(20):
+            config = searcher.suggest(str(i))
+            self.assertGreaterEqual(config["x"], -5)
+            self.assertLessEqual(config["x"], 5)
+            self.assertIn(config["n"], [1, 2, 3])
+            self.assertGreaterEqual(config["lr"], 1e-4)
+            self.assertLessEqual(config["lr"], 1e-1)
+            self.assertIn(config["c"], ["a", "b"])
+            searcher.on_trial_complete(str(i), {"loss": (config["x"] - 2) ** 2})
+
+        # After fitting, configs are suggested from a batch of proposals.
+        self.assertIsNotNone(searcher._model)
+        self.assertEqual(len(searcher._suggestion_pool), 32)
+        searcher.suggest("next")
+        self.assertEqual(len(searcher._suggestion_pool), 31)
+
+    def testUnsupportedSearchSpace(self):
+        from ray.tune.search.tpe import TPESearch
+
+        with self.assertRaises(ValueError):
+            TPESearch.convert_search_space({"x": tune.randn()})
+        with self.assertRaises(ValueError):
+            TPESearch.convert_search_space({"x": tune.grid_search([1, 2])})
+
+    def testRungResults(self):
+        searcher = self._searcher()
+        for i in range(6):
+            searcher.suggest(str(i))
+
+        # Results recorded at a rung by the AsyncHyperBandScheduler.
+        searcher.on_trial_results(
+            [(str(i), {"loss": i, "hyperband_info": {"budget": 1}}) for i in range(6)]
+        )
+        # Results that weren't recorded at a rung are ignored.
+        searcher.on_trial_result("0", {"loss": 0, TRAINING_ITERATION: 2})
+        self.assertEqual(list(searcher._observations), [1])
+        # The model is fit on the observations at budget 1.
+        self.assertIsNotNone(searcher._model)
+
+        searcher.on_trial_result("0", {"loss": 0, "hyperband_info": {"budget": 2}})
+        # Trial 1 was stopped at rung 2 by the scheduler.
+        searcher.on_trial_complete("1", {"loss": 1, TRAINING_ITERATION: 2})
+        # Trial 0 was not stopped at a rung.
+        searcher.on_trial_complete("0", {"loss": 0, TRAINING_ITERATION: 3})
+        # Invalid results are ignored.
+        searcher.on_trial_complete("2", {"loss": np.nan, TRAINING_ITERATION: 3})
+        searcher.on_trial_complete("3", error=True)
+
+        self.assertEqual(searcher._observations[2], {"0": 0, "1": 1})
+        self.assertEqual(searcher._observations[float("inf")], {"0": 0})
+        self.assertEqual(len(searcher._observations[1]), 6)
+
+
 if __name__ == "__main__":
     import sys
 
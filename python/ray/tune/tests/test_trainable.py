@@ -1,5 +1,6 @@
 import json
 import os
+import shutil
 from typing import Dict, Union
 
 import pytest
@@ -128,6 +129,38 @@ def test_save_load_checkpoint_path_fn(ray_start_2_cpus, tmp_path):
     ray.get(restoring_future)
 
 
+@pytest.mark.parametrize("return_type", ["object", "root"])
+def test_restore_from_object_store(ray_start_2_cpus, return_type, tmp_path):
+    """Assert that a checkpoint saved with Trainable.save_to_object_store() can be
+    restored by another trainable without reading it from storage."""
+
+    def create_trainable():
+        return ray.remote(SavingTrainable).remote(
+            return_type=return_type,
+            storage=StorageContext(
+                storage_path=str(tmp_path),
+                experiment_dir_name="exp",
+                trial_dir_name="trial",
+            ),
+        )
+
+    trainable = create_trainable()
+    ray.get(trainable.train.remote())
+
+    checkpoint_result, checkpoint_ref = ray.get(trainable.save_to_object_store.remote())
+    assert checkpoint_ref is not None
+
+    # The checkpoint can only be restored from the object store now.
+    shutil.rmtree(checkpoint_result.checkpoint.path)
+
+    other_trainable = create_trainable()
+    ray.get(
+        other_trainable.restore.remote(
+            checkpoint_result, checkpoint_refs=[checkpoint_ref]
+        )
+    )
+
+
 # TODO(justinvyu): [fallback_to_latest]
 @pytest.mark.skip("Fallback to latest checkpoint is not implemented.")
 def test_find_latest_checkpoint_local(tmpdir):
@@ -30,6 +30,7 @@ from ray.tune.schedulers import (
     PopulationBasedTraining,
     TrialScheduler,
 )
+from ray.tune.schedulers.async_hyperband import _Bracket, _PercentileTracker
 from ray.tune.schedulers.pbt import PopulationBasedTrainingReplay, _explore
 from ray.tune.search import ConcurrencyLimiter
 from ray.tune.search._mock import _MockSearcher
@@ -2301,6 +2302,31 @@ class AsyncHyperBandSuite(unittest.TestCase):
             scheduler.on_trial_result(None, t3, result(3, 10)), TrialScheduler.STOP
         )
 
+    def testAsyncHBHyperbandInfo(self):
+        scheduler = AsyncHyperBandScheduler(
+            metric="episode_reward_mean",
+            mode="max",
+            grace_period=1,
+            max_t=10,
+            reduction_factor=2,
+            brackets=1,
+        )
+        t1 = Trial(MOCK_TRAINABLE_NAME)
+        scheduler.on_trial_add(None, t1)
+
+        # Results recorded at a rung are annotated with its milestone.
+        res = result(1, 10)
+        scheduler.on_trial_result(None, t1, res)
+        self.assertEqual(res["hyperband_info"], {"budget": 1})
+
+        res = result(1.5, 10)
+        scheduler.on_trial_result(None, t1, res)
+        self.assertNotIn("hyperband_info", res)
+
+        res = result(2, 10)
+        scheduler.on_trial_result(None, t1, res)
+        self.assertEqual(res["hyperband_info"], {"budget": 2})
+
     def testAsyncHBAllCompletes(self):
         scheduler = AsyncHyperBandScheduler(
             metric="episode_reward_mean", mode="max", max_t=10, brackets=10
@@ -2405,6 +2431,39 @@ class AsyncHyperBandSuite(unittest.TestCase):
             TrialScheduler.STOP,
         )
 
+    def testAsyncHBPercentileTracker(self):
+        rng = random.Random(1234)
+        for percentile in [50, 2 / 3 * 100, 75, 90]:
+            tracker = _PercentileTracker(percentile)
+            assert tracker.value() is None
+
+            values = []
+            for _ in range(200):
+                value = rng.choice(
+                    [rng.random(), rng.randint(0, 5), np.nan, np.inf, -np.inf]
+                )
+                values.append(value)
+                tracker.add(value)
+                expected = np.nanpercentile(values, percentile)
+                if np.isnan(expected):
+                    assert np.isnan(tracker.value())
+                else:
+                    assert tracker.value() == expected
+
+    def testAsyncHBRestoreRungCutoffs(self):
+        bracket = _Bracket(min_t=1, max_t=10, reduction_factor=2, s=0)
+        trials = [Trial(MOCK_TRAINABLE_NAME) for i in range(4)]
+        for i, t in enumerate(trials):
+            bracket.on_result(t, 1, i)
+
+        # Brackets saved by older versions don't have the rung cutoffs.
+        state = bracket.__dict__.copy()
+        del state["_rung_cutoffs"]
+        restored = _Bracket.__new__(_Bracket)
+        restored.__setstate__(state)
+        for rung_cutoff, (_, recorded) in zip(restored._rung_cutoffs, restored._rungs):
+            assert rung_cutoff.value() == bracket.cutoff(recorded)
+
     def testAsyncHBNonStopTrials(self):
         trials = [Trial(MOCK_TRAINABLE_NAME) for i in range(4)]
         scheduler = AsyncHyperBandScheduler(
@@ -118,6 +118,48 @@ def test_force_all(eager):
     assert cache.num_cached_objects == 0
 
 
+def test_reuse_cost():
+    """Test using objects cached for one key for another key.
+
+    - Objects of key N can be used for keys up to N, with cost N - key
+    - Objects are only cached and kept if a key needs them
+    - Objects desired for their own key are not used for other keys
+    """
+
+    def reuse_cost(cached_key, key):
+        return cached_key - key if cached_key >= key else None
+
+    cache = _ObjectCache(may_keep_one=False, reuse_cost=reuse_cost)
+
+    cache.increase_max(1)
+    assert not cache.cache_object(0, "zero")
+    assert cache.cache_object(4, "four")
+    # Key 1 is already served
+    assert not cache.cache_object(2, "two")
+    assert not list(cache.flush_cached_objects())
+
+    # Object for key 4 is desired for its own key now
+    cache.increase_max(4)
+    assert not cache.has_cached_object(1)
+    assert cache.cache_object(2, "two")
+
+    assert cache.pop_cached_object(1) == "two"
+    cache.decrease_max(1)
+    assert cache.pop_cached_object(4) == "four"
+    assert cache.num_cached_objects == 0
+
+    # Objects with the lowest cost are used first
+    cache.decrease_max(4)
+    cache.increase_max(1, 2)
+    assert cache.cache_object(4, "four")
+    assert cache.cache_object(2, "two")
+    assert cache.pop_cached_object(1) == "two"
+
+    # Not needed anymore
+    cache.decrease_max(1, 2)
+    assert list(cache.flush_cached_objects()) == ["four"]
+
+
 if __name__ == "__main__":
     import sys
 
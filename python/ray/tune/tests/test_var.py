@@ -5,7 +5,7 @@ import unittest
 import numpy as np
 
 import ray
-from ray import tune
+from ray import cloudpickle, tune
 from ray.train.constants import DEFAULT_STORAGE_PATH
 from ray.tune.search import BasicVariantGenerator, grid_search
 from ray.tune.search.variant_generator import (
@@ -361,6 +361,31 @@ class VariantGeneratorTest(unittest.TestCase):
         else:
             raise
 
+    def testLargeGridSearchResume(self):
+        # 10^8 variants are indexed instead of generated up front, so the
+        # generator state can be saved and restored.
+        suggester = BasicVariantGenerator()
+        suggester.add_configurations(
+            {
+                "large_grid": {
+                    "run": MOCK_TRAINABLE_NAME,
+                    "config": {key: grid_search(list(range(100))) for key in "abcd"},
+                }
+            }
+        )
+        trials = [suggester.next_trial() for _ in range(3)]
+        self.assertEqual(trials[2].config, {"a": 2, "b": 0, "c": 0, "d": 0})
+        self.assertEqual(suggester.total_samples, 100**4)
+
+        state = suggester.get_state()
+        self.assertTrue(state)
+        restored = BasicVariantGenerator()
+        restored.set_state(cloudpickle.loads(cloudpickle.dumps(state)))
+
+        trial = restored.next_trial()
+        self.assertEqual(trial.config, {"a": 3, "b": 0, "c": 0, "d": 0})
+        self.assertEqual(trial.experiment_tag, "3_a=3,b=0,c=0,d=0")
+
 
 if __name__ == "__main__":
     import sys
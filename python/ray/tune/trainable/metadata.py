@@ -19,6 +19,13 @@ class _TrainingRunMetadata:
         # General metadata
         self.start_time = None
 
+        # Time it took to start the trial on an actor, measured from the
+        # request of a new (or cached) actor until the trial started on it.
+        self.last_startup_time_s = None
+        self.total_startup_time_s = 0.0
+        # Resource bundles of the actor the trial last started on.
+        self.last_resources = None
+
         # Errors
         self.num_failures = 0
         self.num_failures_after_restore = 0
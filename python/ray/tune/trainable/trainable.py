@@ -1,4 +1,5 @@
 import copy
+import io
 import logging
 import os
 import platform
@@ -9,7 +10,7 @@ import time
 from contextlib import redirect_stderr, redirect_stdout
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
 import ray
 import ray.cloudpickle as ray_pickle
@@ -39,6 +40,7 @@ from ray.tune.result import (
     TRIAL_INFO,
 )
 from ray.tune.utils import UtilMonitor
+from ray.tune.utils.file_transfer import _pack_dir, _unpack_dir
 from ray.tune.utils.log import disable_ipython
 from ray.tune.utils.util import Tee
 from ray.util.annotations import DeveloperAPI, PublicAPI
@@ -141,6 +143,8 @@ class Trainable:
         self._iterations_since_restore = 0
         self._last_result = None
         self._restored = False
+        # Local copy of a checkpoint restored from the object store.
+        self._unpacked_checkpoint_dir: Optional[str] = None
         self._trial_info = trial_info
         self._stdout_file = stdout_file
         self._stderr_file = stderr_file
@@ -478,6 +482,31 @@ class Trainable:
 
         Note the return value matches up with what is expected of `restore()`.
         """
+        checkpoint_result, _ = self._save(checkpoint_dir)
+        return checkpoint_result
+
+    @DeveloperAPI
+    def save_to_object_store(
+        self,
+    ) -> Tuple[_TrainingResult, Optional["ray.ObjectRef"]]:
+        """Saves a checkpoint like ``save()`` and also puts it into the object store.
+
+        Other trainables can then restore from this checkpoint without reading
+        it from storage (see ``restore()``), e.g. when Population Based Training
+        exploits this trial. The checkpoint is still persisted to storage.
+
+        Returns:
+            The result of ``save()`` and a reference to the packed checkpoint
+            directory. The reference is None if the checkpoint directory is not
+            available locally, e.g. if a function trainable persisted its last
+            checkpoint to remote storage.
+        """
+        return self._save(None, to_object_store=True)
+
+    def _save(
+        self, checkpoint_dir: Optional[str] = None, to_object_store: bool = False
+    ) -> Tuple[_TrainingResult, Optional["ray.ObjectRef"]]:
+        checkpoint_ref = None
         if not isinstance(self, ray.tune.trainable.FunctionTrainable):
             # Use a temporary directory if no checkpoint_dir is provided.
             use_temp_dir = not checkpoint_dir
@@ -488,6 +517,8 @@ class Trainable:
             checkpoint_result = self._report_class_trainable_checkpoint(
                 checkpoint_dir, checkpoint_dict_or_path
             )
+            if to_object_store:
+                checkpoint_ref = _put_checkpoint_dir(checkpoint_dir)
 
             # Clean up the temporary directory, since it's already been
             # reported + persisted to storage. If no storage is set, the user is
@@ -502,11 +533,25 @@ class Trainable:
             # Update the checkpoint result to include auto-filled metrics.
             checkpoint_result.metrics.update(self._last_result)
 
-        return checkpoint_result
+            # The directory reported by the training function may be gone
+            # already, so only the persisted checkpoint can be put into the
+            # object store, if it is stored locally.
+            checkpoint = checkpoint_result.checkpoint
+            if (
+                to_object_store
+                and checkpoint
+                and checkpoint.filesystem.type_name == "local"
+                and os.path.isdir(checkpoint.path)
+            ):
+                checkpoint_ref = _put_checkpoint_dir(checkpoint.path)
+
+        return checkpoint_result, checkpoint_ref
 
     @DeveloperAPI
     def restore(
-        self, checkpoint_path: Union[str, "ray.tune.Checkpoint", _TrainingResult]
+        self,
+        checkpoint_path: Union[str, "ray.tune.Checkpoint", _TrainingResult],
+        checkpoint_refs: Optional[List["ray.ObjectRef"]] = None,
     ):
         """Restores training state from a given model checkpoint.
 
@@ -521,6 +566,12 @@ class Trainable:
         Args:
             checkpoint_path: training result that was returned by a
                 previous call to `save()`.
+            checkpoint_refs: Optional list with a reference to the same
+                checkpoint in the object store, as returned by
+                `save_to_object_store()`. The reference is passed in a list so
+                that it is not resolved before this call. If the checkpoint is
+                not stored locally, it is restored from the object store
+                instead of storage, unless the object has been lost.
         """
         # TODO(justinvyu): This also supports restoring from a Checkpoint object
         # or a path, which are legacy APIs that RLlib depends on.
@@ -535,6 +586,13 @@ class Trainable:
         assert isinstance(checkpoint_result, _TrainingResult), type(checkpoint_result)
         checkpoint = checkpoint_result.checkpoint
         checkpoint_metrics = checkpoint_result.metrics
+        if checkpoint_refs:
+            checkpoint = self._get_checkpoint_from_object_store(
+                checkpoint, checkpoint_refs[0]
+            )
+            checkpoint_result = _TrainingResult(
+                checkpoint=checkpoint, metrics=checkpoint_metrics
+            )
         self._iteration = checkpoint_metrics.get(TRAINING_ITERATION, 0)
         self._time_total = checkpoint_metrics.get(TIME_TOTAL_S, 0)
         self._time_since_restore = 0.0
@@ -568,6 +626,7 @@ class Trainable:
                     self.load_checkpoint(checkpoint_dict)
                 else:
                     self.load_checkpoint(checkpoint_dir)
+            self._remove_unpacked_checkpoint()
         else:
             # TODO(justinvyu): The Function Trainable case doesn't conform
             # to the load_checkpoint API at the moment.
@@ -577,6 +636,38 @@ class Trainable:
 
         logger.info(f"Restored on {self._local_ip} from checkpoint: {checkpoint}")
 
+    def _get_checkpoint_from_object_store(
+        self, checkpoint: "ray.tune.Checkpoint", checkpoint_ref: "ray.ObjectRef"
+    ) -> "ray.tune.Checkpoint":
+        """Unpacks a checkpoint put into the object store by another trainable.
+
+        Returns ``checkpoint`` itself if it is stored locally or if the object
+        has been lost, e.g. because the trainable that saved it has stopped.
+        """
+        if checkpoint.filesystem.type_name == "local" and os.path.isdir(
+            checkpoint.path
+        ):
+            return checkpoint
+
+        try:
+            packed_checkpoint = ray.get(checkpoint_ref)
+        except ray.exceptions.ObjectLostError as e:
+            logger.warning(
+                f"Could not get checkpoint from the object store, restoring it "
+                f"from storage instead: {e}"
+            )
+            return checkpoint
+
+        self._remove_unpacked_checkpoint()
+        self._unpacked_checkpoint_dir = tempfile.mkdtemp(prefix="checkpoint_")
+        _unpack_dir(io.BytesIO(packed_checkpoint), self._unpacked_checkpoint_dir)
+        return ray.tune.Checkpoint.from_directory(self._unpacked_checkpoint_dir)
+
+    def _remove_unpacked_checkpoint(self):
+        if self._unpacked_checkpoint_dir:
+            shutil.rmtree(self._unpacked_checkpoint_dir, ignore_errors=True)
+            self._unpacked_checkpoint_dir = None
+
     def export_model(
         self, export_formats: Union[List[str], str], export_dir: Optional[str] = None
     ):
@@ -741,6 +832,7 @@ class Trainable:
             self._monitor.stop()
             self._monitor.join()
         self.cleanup()
+        self._remove_unpacked_checkpoint()
 
         self._close_logfiles()
 
@@ -988,3 +1080,8 @@ class Trainable:
 
     def _implements_method(self, key):
         return hasattr(self, key) and callable(getattr(self, key))
+
+
+def _put_checkpoint_dir(checkpoint_dir: str) -> "ray.ObjectRef":
+    """Puts the packed contents of a checkpoint directory into the object store."""
+    return ray.put(_pack_dir(checkpoint_dir).getvalue())
@@ -1,5 +1,6 @@
 import inspect
 import logging
+import os
 import types
 from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Type, Union
 
@@ -37,6 +38,14 @@ def with_parameters(trainable: Union[Type["Trainable"], Callable], **kwargs):
     instead pass the object refs to the training function via the ``config``
     or use Python partials.
 
+    If the ``TUNE_SHARE_PARAMETERS_PER_NODE`` environment variable is set to
+    ``1``, one copy of the parameters is kept pinned in the object store of
+    each node that runs trials until the experiment ends, and all trials on a
+    node read this copy. NumPy
+    arrays are then mapped zero-copy from the same buffers by all trials on a
+    node, and Ray Datasets are materialized once instead of being executed by
+    every trial. Other Python objects are still deserialized by every trial.
+
     Args:
         trainable: Trainable to wrap.
         **kwargs: parameters to store in object store.
@@ -98,7 +107,9 @@ def with_parameters(trainable: Union[Type["Trainable"], Callable], **kwargs):
             f"{type(trainable)}."
         )
 
-    parameter_registry = _ParameterRegistry()
+    parameter_registry = _ParameterRegistry(
+        share_per_node=bool(int(os.environ.get("TUNE_SHARE_PARAMETERS_PER_NODE", "0")))
+    )
     ray._private.worker._post_init_hooks.append(parameter_registry.flush)
 
     # Objects are moved into the object store
@@ -969,6 +969,8 @@ def run(
                 air_progress_reporter.setup(
                     start_time=tune_start, total_samples=search_alg.total_samples
                 )
+                if air_progress_reporter.trial_progress is not None:
+                    runner._set_trial_progress(air_progress_reporter.trial_progress)
                 break
 
     experiment_local_path = runner._storage.experiment_driver_staging_path
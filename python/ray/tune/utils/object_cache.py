@@ -1,5 +1,5 @@
 from collections import Counter, defaultdict
-from typing import Dict, Generator, List, Optional, TypeVar
+from typing import Callable, Dict, Generator, List, Optional, Tuple, TypeVar
 
 # Grouping key - must be hashable
 T = TypeVar("T")
@@ -22,18 +22,32 @@ class _ObjectCache:
     will increase shortly after (as is the case e.g. in the Ray Tune control
     loop).
 
+    If ``reuse_cost`` is passed, objects cached for one grouping key can also be
+    used for other compatible keys. ``reuse_cost(cached_key, key)`` returns None
+    if objects of ``cached_key`` can't be used for ``key``, and otherwise a cost
+    for using them (lower is better). Objects of the key itself are always used
+    first. Objects are then also cached (and kept) if they can serve a key that
+    has more desired objects than cached objects.
+
     Args:
         may_keep_one: If True, one object (globally) may be cached if no desired
             maximum objects are defined.
+        reuse_cost: Optional function returning the cost of using objects cached
+            for one key for another key.
 
     """
 
-    def __init__(self, may_keep_one: bool = True):
+    def __init__(
+        self,
+        may_keep_one: bool = True,
+        reuse_cost: Optional[Callable[[T, T], Optional[float]]] = None,
+    ):
         self._num_cached_objects: int = 0
         self._cached_objects: Dict[T, List[U]] = defaultdict(list)
         self._max_num_objects: Counter[T] = Counter()
 
         self._may_keep_one = may_keep_one
+        self._reuse_cost = reuse_cost
 
     @property
     def num_cached_objects(self):
@@ -71,7 +85,71 @@ class _ObjectCache:
         Returns:
             True if at least one cached object exists for this key.
         """
-        return bool(self._cached_objects[key])
+        return self._get_cached_key(key) is not None
+
+    def _get_cached_key(self, key: T) -> Optional[T]:
+        """Return the key of the cached objects to use for this key, if any."""
+        if self._cached_objects[key]:
+            return key
+        if not self._reuse_cost:
+            return None
+
+        best_key, best_cost = None, None
+        for cached_key, objs in self._cached_objects.items():
+            # Don't take objects that are desired for their own key.
+            if len(objs) <= self._max_num_objects[cached_key]:
+                continue
+            cost = self._reuse_cost(cached_key, key)
+            if cost is not None and (best_cost is None or cost < best_cost):
+                best_key, best_cost = cached_key, cost
+        return best_key
+
+    def _serves_missing_key(self, cached_key: T) -> bool:
+        """Return True if another object of ``cached_key`` could be used for a
+        different key with too few cached objects."""
+        if not self._reuse_cost:
+            return False
+        _, num_missing = self._match_surplus_objects()
+        return any(
+            key != cached_key and self._reuse_cost(cached_key, key) is not None
+            for key in num_missing
+        )
+
+    def _match_surplus_objects(self) -> Tuple[Dict[T, int], Dict[T, int]]:
+        """Match cached objects that exceed the max of their key to other keys.
+
+        Returns:
+            The number of objects to keep cached for each key (the max number of
+            objects of the key, plus its cached objects that serve other keys),
+            and the number of missing objects of each key after this matching.
+        """
+        num_desired = {key: self._max_num_objects[key] for key in self._cached_objects}
+        num_missing = {
+            key: max_num - len(self._cached_objects.get(key, []))
+            for key, max_num in self._max_num_objects.items()
+            if max_num > len(self._cached_objects.get(key, []))
+        }
+        if not self._reuse_cost:
+            return num_desired, num_missing
+
+        for cached_key, objs in self._cached_objects.items():
+            surplus = len(objs) - self._max_num_objects[cached_key]
+            while surplus > 0:
+                costs = {
+                    key: self._reuse_cost(cached_key, key)
+                    for key in num_missing
+                    if key != cached_key
+                }
+                costs = {key: cost for key, cost in costs.items() if cost is not None}
+                if not costs:
+                    break
+                key = min(costs, key=costs.get)
+                num_missing[key] -= 1
+                if not num_missing[key]:
+                    del num_missing[key]
+                num_desired[cached_key] += 1
+                surplus -= 1
+        return num_desired, num_missing
 
     def cache_object(self, key: T, obj: U) -> bool:
         """Cache object for a given key.
@@ -82,7 +160,8 @@ class _ObjectCache:
 
         An exception is made if `max_keep_one=True` and no other
         objects are cached globally. In that case, the object can
-        still be cached.
+        still be cached. With ``reuse_cost``, the object is also cached
+        if it can be used for another key with too few cached objects.
 
         Args:
             key: Group key.
@@ -93,7 +172,9 @@ class _ObjectCache:
 
         """
         # If we have more objects cached already than we desire
-        if len(self._cached_objects[key]) >= self._max_num_objects[key]:
+        if len(self._cached_objects[key]) >= self._max_num_objects[
+            key
+        ] and not self._serves_missing_key(key):
             # If may_keep_one is False, never cache
             if not self._may_keep_one:
                 return False
@@ -115,7 +196,8 @@ class _ObjectCache:
     def pop_cached_object(self, key: T) -> Optional[U]:
         """Get one cached object for a key.
 
-        This will remove the object from the cache.
+        This will remove the object from the cache. With ``reuse_cost``,
+        this may return an object cached for a compatible key.
 
         Args:
             key: Group key.
@@ -123,11 +205,12 @@ class _ObjectCache:
         Returns:
             Cached object.
         """
-        if not self.has_cached_object(key):
+        cached_key = self._get_cached_key(key)
+        if cached_key is None:
             return None
 
         self._num_cached_objects -= 1
-        return self._cached_objects[key].pop(0)
+        return self._cached_objects[cached_key].pop(0)
 
     def flush_cached_objects(self, force_all: bool = False) -> Generator[U, None, None]:
         """Return a generator over cached objects evicted from the cache.
@@ -137,7 +220,8 @@ class _ObjectCache:
 
         If the number of max objects is lower than the number of
         cached objects for a given key, objects are evicted until
-        the numbers are equal.
+        the numbers are equal. With ``reuse_cost``, objects that can
+        be used for other keys with too few cached objects are kept.
 
         If `max_keep_one=True` (and ``force_all=False``), one cached object
         may be retained.
@@ -156,9 +240,10 @@ class _ObjectCache:
         """
         # If force_all=True, don't keep one.
         keep_one = self._may_keep_one and not force_all
+        num_desired, _ = self._match_surplus_objects()
 
         for key, objs in self._cached_objects.items():
-            max_cached = self._max_num_objects[key] if not force_all else 0
+            max_cached = num_desired[key] if not force_all else 0
 
             if (
                 self._num_cached_objects == 1
@@ -0,0 +1,284 @@
+"""Measure the token throughput of the LLM processor with and without length
+bucketing.
+
+The engine stage runs a mock continuous batching engine instead of vLLM, so this
+doesn't need GPUs. Every step, the mock engine decodes one token of each running
+request and spends the rest of its token budget on prefilling waiting prompts
+(chunked prefill). Steps take a fixed time plus a time per token, so the token
+throughput only depends on how well the running batches fill the engine.
+
+The dataset mixes short prompts with a few long documents that also generate
+longer outputs (e.g., summaries).
+
+    python benchmark_length_bucketing.py --num-rows 4000
+"""
+import argparse
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Dict, List, Optional, Type
+
+import pandas as pd
+
+import ray
+from ray.data._internal.execution.operators.actor_pool_map_operator import (
+    DEFAULT_MAX_TASKS_IN_FLIGHT,
+)
+from ray.llm._internal.batch.processor import Processor, ProcessorConfig
+from ray.llm._internal.batch.stages import LengthBucketStage, StatefulStage
+from ray.llm._internal.batch.stages.base import StatefulStageUDF
+
+
+class _MockRequest:
+    def __init__(self, num_prompt_tokens: int, num_output_tokens: int):
+        self.num_prefill_tokens_left = num_prompt_tokens
+        self.num_decode_tokens_left = num_output_tokens
+        self.done = asyncio.get_running_loop().create_future()
+
+
+class MockEngine:
+    """A continuous batching engine that sleeps instead of running a model."""
+
+    def __init__(
+        self,
+        max_num_seqs: int,
+        max_num_batched_tokens: int,
+        step_time_s: float,
+        time_per_token_s: float,
+    ):
+        self.max_num_seqs = max_num_seqs
+        self.max_num_batched_tokens = max_num_batched_tokens
+        self.step_time_s = step_time_s
+        self.time_per_token_s = time_per_token_s
+        self.waiting: deque = deque()
+        self.running: List[_MockRequest] = []
+        self._step_loop: Optional[asyncio.Task] = None
+
+    async def generate(self, num_prompt_tokens: int, num_output_tokens: int):
+        request = _MockRequest(num_prompt_tokens, num_output_tokens)
+        self.waiting.append(request)
+        if self._step_loop is None or self._step_loop.done():
+            self._step_loop = asyncio.create_task(self._run_steps())
+        await request.done
+
+    async def _run_steps(self):
+        while self.waiting or self.running:
+            while self.waiting and len(self.running) < self.max_num_seqs:
+                self.running.append(self.waiting.popleft())
+
+            budget = self.max_num_batched_tokens
+            for request in self.running:
+                if request.num_prefill_tokens_left == 0 and budget > 0:
+                    request.num_decode_tokens_left -= 1
+                    budget -= 1
+            for request in self.running:
+                if request.num_prefill_tokens_left > 0 and budget > 0:
+                    num_tokens = min(budget, request.num_prefill_tokens_left)
+                    request.num_prefill_tokens_left -= num_tokens
+                    budget -= num_tokens
+
+            num_tokens = self.max_num_batched_tokens - budget
+            await asyncio.sleep(self.step_time_s + num_tokens * self.time_per_token_s)
+
+            still_running = []
+            for request in self.running:
+                if request.num_decode_tokens_left <= 0:
+                    request.done.set_result(None)
+                else:
+                    still_running.append(request)
+            self.running = still_running
+
+
+class MockEngineUDF(StatefulStageUDF):
+    def __init__(
+        self,
+        data_column: str,
+        expected_input_keys: List[str],
+        max_num_seqs: int,
+        max_num_batched_tokens: int,
+        step_time_s: float,
+        time_per_token_s: float,
+    ):
+        super().__init__(data_column, expected_input_keys)
+        self.engine = MockEngine(
+            max_num_seqs, max_num_batched_tokens, step_time_s, time_per_token_s
+        )
+
+    async def _generate(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        num_input_tokens = len(row["tokenized_prompt"])
+        num_generated_tokens = row["sampling_params"]["max_tokens"]
+        await self.engine.generate(num_input_tokens, num_generated_tokens)
+        return {
+            self.IDX_IN_BATCH_COLUMN: row[self.IDX_IN_BATCH_COLUMN],
+            "num_input_tokens": num_input_tokens,
+            "num_generated_tokens": num_generated_tokens,
+        }
+
+    async def udf(self, batch: List[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+        tasks = [asyncio.create_task(self._generate(row)) for row in batch]
+        for resp in asyncio.as_completed(tasks):
+            yield await resp
+
+
+class MockEngineStage(StatefulStage):
+    fn: Type[StatefulStageUDF] = MockEngineUDF
+
+    def get_required_input_keys(self) -> Dict[str, str]:
+        return {"tokenized_prompt": "", "sampling_params": ""}
+
+
+def generate_rows(
+    num_rows: int,
+    long_fraction: float,
+    short_prompt_tokens: int,
+    long_prompt_tokens: int,
+    short_output_tokens: int,
+    long_output_tokens: int,
+    seed: int,
+) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    rows = []
+    for i in range(num_rows):
+        if rng.random() < long_fraction:
+            num_prompt_tokens = rng.randint(long_prompt_tokens // 2, long_prompt_tokens)
+            num_output_tokens = long_output_tokens
+        else:
+            num_prompt_tokens = rng.randint(
+                short_prompt_tokens // 2, short_prompt_tokens
+            )
+            num_output_tokens = short_output_tokens
+        rows.append(
+            {
+                "id": i,
+                "prompt": "",
+                "tokenized_prompt": [0] * num_prompt_tokens,
+                "sampling_params": {"max_tokens": num_output_tokens},
+            }
+        )
+    return rows
+
+
+def run(
+    rows: List[Dict[str, Any]],
+    batch_size: int,
+    max_concurrent_batches: int,
+    length_bucketing_window: Optional[int],
+    engine_kwargs: Dict[str, Any],
+) -> Dict[str, float]:
+    stages = []
+    if length_bucketing_window:
+        stages.append(
+            LengthBucketStage(
+                map_batches_kwargs=dict(
+                    zero_copy_batch=True,
+                    concurrency=1,
+                    batch_size=length_bucketing_window,
+                ),
+            )
+        )
+    stages.append(
+        MockEngineStage(
+            fn_constructor_kwargs=engine_kwargs,
+            map_batches_kwargs=dict(
+                zero_copy_batch=True,
+                compute=ray.data.ActorPoolStrategy(
+                    size=1,
+                    max_tasks_in_flight_per_actor=max(
+                        DEFAULT_MAX_TASKS_IN_FLIGHT, max_concurrent_batches
+                    ),
+                ),
+                max_concurrency=max_concurrent_batches,
+            ),
+        )
+    )
+    processor = Processor(ProcessorConfig(batch_size=batch_size), stages)
+
+    ds = ray.data.from_items(rows)
+    start = time.perf_counter()
+    outputs = processor(ds).take_all()
+    duration_s = time.perf_counter() - start
+
+    assert len(outputs) == len(rows)
+    num_tokens = sum(
+        row["num_input_tokens"] + row["num_generated_tokens"] for row in outputs
+    )
+    return {
+        "duration_s": duration_s,
+        "rows_per_s": len(rows) / duration_s,
+        "tokens_per_s": num_tokens / duration_s,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-rows", type=int, default=4000)
+    parser.add_argument("--long-fraction", type=float, default=0.1)
+    parser.add_argument("--short-prompt-tokens", type=int, default=256)
+    parser.add_argument("--long-prompt-tokens", type=int, default=4096)
+    parser.add_argument("--short-output-tokens", type=int, default=32)
+    parser.add_argument("--long-output-tokens", type=int, default=256)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--max-concurrent-batches", type=int, default=8)
+    parser.add_argument(
+        "--length-bucketing-window",
+        type=int,
+        default=256,
+        help="The length bucketing window to compare with no bucketing.",
+    )
+    parser.add_argument("--max-num-seqs", type=int, default=128)
+    parser.add_argument("--max-num-batched-tokens", type=int, default=2048)
+    parser.add_argument("--step-time-s", type=float, default=0.002)
+    parser.add_argument("--time-per-token-s", type=float, default=1e-6)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rows = generate_rows(
+        args.num_rows,
+        args.long_fraction,
+        args.short_prompt_tokens,
+        args.long_prompt_tokens,
+        args.short_output_tokens,
+        args.long_output_tokens,
+        args.seed,
+    )
+    engine_kwargs = dict(
+        max_num_seqs=args.max_num_seqs,
+        max_num_batched_tokens=args.max_num_batched_tokens,
+        step_time_s=args.step_time_s,
+        time_per_token_s=args.time_per_token_s,
+    )
+
+    # Warm up the worker processes so that they aren't started in the first run.
+    run(
+        rows[: args.batch_size],
+        args.batch_size,
+        args.max_concurrent_batches,
+        None,
+        engine_kwargs,
+    )
+
+    results = {}
+    for name, window in [
+        ("no_bucketing", None),
+        ("length_bucketing", args.length_bucketing_window),
+    ]:
+        results[name] = run(
+            rows,
+            args.batch_size,
+            args.max_concurrent_batches,
+            window,
+            engine_kwargs,
+        )
+
+    print(
+        f"Mock engine throughput (num_rows={args.num_rows},"
+        f"batch_size={args.batch_size},"
+        f"max_concurrent_batches={args.max_concurrent_batches},"
+        f"max_num_seqs={args.max_num_seqs}):"
+    )
+    print(pd.DataFrame(results).T)
+
+
+if __name__ == "__main__":
+    main()
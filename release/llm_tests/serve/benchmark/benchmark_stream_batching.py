@@ -0,0 +1,130 @@
+"""Measure streaming throughput and token latency of the response Batcher with
+fixed and adaptive batching intervals.
+
+A fake generator stands in for the engine: each stream yields one token every
+`--token-interval-ms`. The consumer of each stream stands in for the proxy: it
+spends `--chunk-cost-us` of CPU on every batch it takes, blocking the event
+loop that all streams share. With too many small batches, this cost saturates
+the event loop and delays the tokens of every stream.
+
+For each setup, this reports the token throughput, the number of batches per
+second, and the mean and p99 delay between when a token is generated and when
+the consumer gets it.
+
+    python benchmark_stream_batching.py --num-streams 1 16 128
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List, Optional
+
+from ray.llm._internal.serve.deployments.utils.batcher import (
+    AdaptiveBatchInterval,
+    Batcher,
+)
+
+
+async def fake_token_generator(num_tokens: int, token_interval_s: float):
+    """Yield the time at which each token is generated."""
+    for _ in range(num_tokens):
+        await asyncio.sleep(token_interval_s)
+        yield time.monotonic()
+
+
+def _burn_cpu(duration_s: float):
+    end = time.perf_counter() + duration_s
+    while time.perf_counter() < end:
+        pass
+
+
+async def run_setup(
+    num_streams: int,
+    num_tokens: int,
+    token_interval_s: float,
+    chunk_cost_s: float,
+    interval_ms: Optional[float],
+    adaptive_interval: Optional[AdaptiveBatchInterval],
+) -> Dict[str, float]:
+    delays: List[float] = []
+    num_batches = 0
+
+    async def consume():
+        nonlocal num_batches
+        batcher = Batcher(
+            fake_token_generator(num_tokens, token_interval_s),
+            interval_ms=interval_ms,
+            adaptive_interval=adaptive_interval,
+        )
+        async for batch in batcher.stream():
+            _burn_cpu(chunk_cost_s)
+            received_s = time.monotonic()
+            num_batches += 1
+            delays.extend(received_s - generated_s for generated_s in batch)
+
+    start_s = time.monotonic()
+    await asyncio.gather(*(consume() for _ in range(num_streams)))
+    duration_s = time.monotonic() - start_s
+
+    return {
+        "tokens_per_s": len(delays) / duration_s,
+        "batches_per_s": num_batches / duration_s,
+        "mean_delay_ms": 1000 * statistics.mean(delays),
+        "p99_delay_ms": 1000 * statistics.quantiles(delays, n=100)[98],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-streams", type=int, nargs="+", default=[1, 16, 128])
+    parser.add_argument("--num-tokens", type=int, default=200)
+    parser.add_argument("--token-interval-ms", type=float, default=10)
+    parser.add_argument("--chunk-cost-us", type=float, default=200)
+    parser.add_argument("--fixed-intervals-ms", type=float, nargs="+", default=[5, 50])
+    parser.add_argument("--min-interval-ms", type=float, default=5)
+    parser.add_argument("--max-interval-ms", type=float, default=100)
+    parser.add_argument("--saturation-streams", type=int, default=64)
+    args = parser.parse_args()
+
+    setups = {
+        f"fixed {interval_ms:g}ms": lambda interval_ms=interval_ms: (
+            interval_ms,
+            None,
+        )
+        for interval_ms in args.fixed_intervals_ms
+    }
+    setups["adaptive"] = lambda: (
+        None,
+        AdaptiveBatchInterval(
+            min_interval_ms=args.min_interval_ms,
+            max_interval_ms=args.max_interval_ms,
+            saturation_num_streams=args.saturation_streams,
+        ),
+    )
+
+    print(
+        f"{'streams':>8} {'setup':>14} {'tokens/s':>10} {'batches/s':>10} "
+        f"{'mean ms':>8} {'p99 ms':>8}"
+    )
+    for num_streams in args.num_streams:
+        for name, make_setup in setups.items():
+            interval_ms, adaptive_interval = make_setup()
+            result = asyncio.run(
+                run_setup(
+                    num_streams=num_streams,
+                    num_tokens=args.num_tokens,
+                    token_interval_s=args.token_interval_ms / 1000,
+                    chunk_cost_s=args.chunk_cost_us / 1e6,
+                    interval_ms=interval_ms,
+                    adaptive_interval=adaptive_interval,
+                )
+            )
+            print(
+                f"{num_streams:>8} {name:>14} {result['tokens_per_s']:>10.0f} "
+                f"{result['batches_per_s']:>10.0f} {result['mean_delay_ms']:>8.1f} "
+                f"{result['p99_delay_ms']:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""ASHA scheduler overhead (driver only, no cluster)
+
+In this benchmark, we feed results of an increasing number of trials directly to
+the AsyncHyperBandScheduler and measure the time it takes to make a scheduling
+decision. Every trial reports once per rung milestone, so each rung of the
+bracket fills up with results of all trials.
+
+For comparison, we also measure the time it takes to compute the rung cutoffs
+by calling `np.nanpercentile` over all recorded results, which is what the
+scheduler did on every result before tracking the cutoffs incrementally.
+
+    python benchmark_asha_scheduler.py --num-trials 1000 10000 100000
+"""
+import argparse
+import random
+import time
+from types import SimpleNamespace
+
+from ray.tune.schedulers import AsyncHyperBandScheduler
+
+
+def run_scheduler(num_trials: int, max_t: int, reduction_factor: int) -> float:
+    scheduler = AsyncHyperBandScheduler(
+        time_attr="training_iteration",
+        metric="metric",
+        mode="max",
+        max_t=max_t,
+        grace_period=1,
+        reduction_factor=reduction_factor,
+        brackets=1,
+    )
+    trials = [SimpleNamespace(trial_id=str(i)) for i in range(num_trials)]
+    for trial in trials:
+        scheduler.on_trial_add(None, trial)
+
+    rng = random.Random(0)
+    milestones = sorted(milestone for milestone, _ in scheduler._brackets[0]._rungs)
+
+    num_results = 0
+    start = time.perf_counter()
+    for milestone in milestones:
+        for trial in trials:
+            scheduler.on_trial_result(
+                None, trial, {"training_iteration": milestone, "metric": rng.random()}
+            )
+            num_results += 1
+    return (time.perf_counter() - start) / num_results
+
+
+def run_full_percentile(num_trials: int, max_t: int, reduction_factor: int) -> float:
+    scheduler = AsyncHyperBandScheduler(
+        max_t=max_t, grace_period=1, reduction_factor=reduction_factor, brackets=1
+    )
+    bracket = scheduler._brackets[0]
+
+    rng = random.Random(0)
+    recorded = {}
+    start = time.perf_counter()
+    for i in range(num_trials):
+        bracket.cutoff(recorded)
+        recorded[str(i)] = rng.random()
+    return (time.perf_counter() - start) / num_trials
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--num-trials", type=int, nargs="+", default=[1000, 10000, 100000]
+    )
+    parser.add_argument("--max-t", type=int, default=81)
+    parser.add_argument("--reduction-factor", type=int, default=3)
+    parser.add_argument(
+        "--max-full-percentile-trials",
+        type=int,
+        default=20000,
+        help="Skip the full percentile baseline above this number of trials, "
+        "since it is quadratic in the number of trials.",
+    )
+    args = parser.parse_args()
+
+    print(f"{'trials':>8} {'scheduler us/result':>20} {'full percentile us':>20}")
+    for num_trials in args.num_trials:
+        scheduler_s = run_scheduler(num_trials, args.max_t, args.reduction_factor)
+        if num_trials <= args.max_full_percentile_trials:
+            full_percentile = "{:.1f}".format(
+                1e6 * run_full_percentile(num_trials, args.max_t, args.reduction_factor)
+            )
+        else:
+            full_percentile = "skipped"
+        print(f"{num_trials:>8} {1e6 * scheduler_s:>20.1f} {full_percentile:>20}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""PBT exploit latency with large model states
+
+In this benchmark, we measure how long it takes to transfer the state of one
+trainable to another, as PBT does when a trial exploits another trial: the donor
+saves a checkpoint and the recipient restores from it. The model state is a
+synthetic NumPy array.
+
+We compare restoring from storage with restoring from the object store
+(`PopulationBasedTraining(exploit_from_object_store=True)`). In both cases, the
+checkpoint is persisted to storage. Use a remote storage path and place the
+trainables on different nodes to measure the multi-node case:
+
+    python benchmark_pbt_exploit.py --size-mb 1024 \
+        --storage-path s3://bucket/path --spread
+"""
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+import ray
+from ray import tune
+from ray.train._internal.storage import StorageContext
+
+
+class _LargeStateTrainable(tune.Trainable):
+    def setup(self, config):
+        num_values = config["size_mb"] * 1024 * 1024 // 8
+        self.weights = np.random.rand(num_values)
+
+    def step(self):
+        return {"score": float(self.weights[0])}
+
+    def save_checkpoint(self, checkpoint_dir: str):
+        return {"weights": self.weights}
+
+    def load_checkpoint(self, checkpoint):
+        self.weights = checkpoint["weights"]
+
+
+def exploit(
+    size_mb: int, storage_path: str, from_object_store: bool, spread: bool
+) -> dict:
+    options = {"scheduling_strategy": "SPREAD"} if spread else {}
+    trainable_cls = ray.remote(_LargeStateTrainable).options(**options)
+
+    def create_trainable(trial_name: str):
+        return trainable_cls.remote(
+            config={"size_mb": size_mb},
+            storage=StorageContext(
+                storage_path=storage_path,
+                experiment_dir_name="benchmark_pbt_exploit",
+                trial_dir_name=trial_name,
+            ),
+        )
+
+    donor = create_trainable("donor")
+    recipient = create_trainable("recipient")
+    ray.get([donor.train.remote(), recipient.train.remote()])
+
+    start = time.monotonic()
+    if from_object_store:
+        checkpoint_result, checkpoint_ref = ray.get(donor.save_to_object_store.remote())
+        save_s = time.monotonic() - start
+        ray.get(
+            recipient.restore.remote(
+                checkpoint_result, checkpoint_refs=[checkpoint_ref]
+            )
+        )
+    else:
+        checkpoint_result = ray.get(donor.save.remote())
+        save_s = time.monotonic() - start
+        ray.get(recipient.restore.remote(checkpoint_result))
+    total_s = time.monotonic() - start
+
+    ray.get([donor.stop.remote(), recipient.stop.remote()])
+    return {"save_s": save_s, "restore_s": total_s - save_s, "total_s": total_s}
+
+
+def main(size_mb: int, storage_path: str, spread: bool, repeat: int):
+    ray.init(address="auto")
+
+    print(f"{'mode':>14} {'save s':>8} {'restore s':>10} {'total s':>8}")
+    for from_object_store in [False, True]:
+        for _ in range(repeat):
+            timings = exploit(size_mb, storage_path, from_object_store, spread)
+            mode = "object store" if from_object_store else "storage"
+            print(
+                f"{mode:>14} {timings['save_s']:>8.2f} "
+                f"{timings['restore_s']:>10.2f} {timings['total_s']:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument("--storage-path", type=str, default=None)
+    parser.add_argument(
+        "--spread",
+        action="store_true",
+        help="Place the donor and the recipient on different nodes.",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    main(
+        args.size_mb, args.storage_path or tempfile.mkdtemp(), args.spread, args.repeat
+    )
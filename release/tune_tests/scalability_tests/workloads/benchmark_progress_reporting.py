@@ -0,0 +1,116 @@
+"""Progress reporting overhead with many trials
+
+In this benchmark, we measure how long it takes the Tune progress reporter to
+build a heartbeat (status counts, current best trial and trial table) for a
+large experiment. Trials are stubs that are never scheduled, so this does not
+need a Ray cluster.
+
+We compare building the heartbeat from the full list of trials with building it
+from the incrementally updated trial progress summary that the controller keeps
+up to date. We also report the time spent updating the summary on every status
+change and result:
+
+    python benchmark_progress_reporting.py --num-trials 50000
+"""
+import argparse
+import random
+import time
+
+from ray.tune.experiment.trial import Trial
+from ray.tune.experimental.output import AirVerbosity, TuneTerminalReporter
+from ray.tune.utils.mock_trainable import MOCK_TRAINABLE_NAME
+
+_STATUSES = [Trial.RUNNING, Trial.PAUSED, Trial.TERMINATED, Trial.ERROR]
+
+
+def create_reporter(num_trials: int) -> TuneTerminalReporter:
+    reporter = TuneTerminalReporter(
+        AirVerbosity.DEFAULT,
+        num_samples=num_trials,
+        metric="score",
+        mode="max",
+        config={"param": None},
+    )
+    reporter.setup(start_time=time.time(), total_samples=num_trials)
+    return reporter
+
+
+def run_experiment(
+    reporter: TuneTerminalReporter, num_trials: int, num_updates: int
+) -> tuple:
+    trial_progress = reporter.trial_progress
+    update_s = 0.0
+
+    trials = []
+    for i in range(num_trials):
+        trial = Trial(MOCK_TRAINABLE_NAME, stub=True)
+        trial.trial_id = f"{i:05d}"
+        trial.config = {"param": i}
+        trials.append(trial)
+        start = time.monotonic()
+        trial_progress.on_trial_status(trial)
+        update_s += time.monotonic() - start
+
+    for iteration in range(num_updates):
+        trial = random.choice(trials)
+        if iteration % 2:
+            trial.set_status(random.choice(_STATUSES))
+            start = time.monotonic()
+            trial_progress.on_trial_status(trial)
+            update_s += time.monotonic() - start
+        else:
+            result = {"score": random.random(), "training_iteration": iteration}
+            trial.run_metadata.last_result = result
+            start = time.monotonic()
+            trial_progress.on_trial_result(trial, result)
+            update_s += time.monotonic() - start
+
+    return trials, update_s
+
+
+def time_heartbeat(
+    reporter: TuneTerminalReporter, trials: list, force_full_output: bool, repeat: int
+) -> float:
+    start = time.monotonic()
+    for _ in range(repeat):
+        reporter._get_heartbeat(trials, force_full_output=force_full_output)
+    return (time.monotonic() - start) / repeat
+
+
+def main(num_trials: int, num_updates: int, repeat: int):
+    reporter = create_reporter(num_trials)
+    trials, update_s = run_experiment(reporter, num_trials, num_updates)
+
+    # The full output is built from the list of trials and shows all rows.
+    full_s = time_heartbeat(reporter, trials, force_full_output=True, repeat=repeat)
+    incremental_s = time_heartbeat(
+        reporter, trials, force_full_output=False, repeat=repeat
+    )
+
+    # Without the summary being updated, the reporter falls back to the list of
+    # trials, which is how every heartbeat was built before.
+    list_reporter = create_reporter(num_trials)
+    list_s = time_heartbeat(
+        list_reporter, trials, force_full_output=False, repeat=repeat
+    )
+
+    num_events = num_trials + num_updates
+    print(f"Trials: {num_trials}, status changes and results: {num_updates}")
+    print(
+        f"Summary updates: {update_s:.2f} s total, "
+        f"{update_s / num_events * 1e6:.2f} us per event"
+    )
+    print(f"{'heartbeat':>22} {'ms':>10}")
+    print(f"{'from trial list':>22} {list_s * 1000:>10.2f}")
+    print(f"{'from trial summary':>22} {incremental_s * 1000:>10.2f}")
+    print(f"{'full output':>22} {full_s * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-trials", type=int, default=50000)
+    parser.add_argument("--num-updates", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    main(args.num_trials, args.num_updates, args.repeat)
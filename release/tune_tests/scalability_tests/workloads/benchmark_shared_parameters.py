@@ -0,0 +1,104 @@
+"""Per-node memory of parameters passed with `tune.with_parameters`
+
+In this benchmark, we pass a large NumPy array or a Ray Dataset to many concurrent
+trials with `tune.with_parameters`. Every trial reads the data and then keeps it
+referenced while it reports a few results. While the trials are running, we sample
+the object store usage of every node and the unique memory (USS) of the trial
+processes.
+
+Run it once with and once without sharing the parameters per node:
+
+    python benchmark_shared_parameters.py --data numpy
+    TUNE_SHARE_PARAMETERS_PER_NODE=1 python benchmark_shared_parameters.py --data numpy
+"""
+import argparse
+import os
+import time
+from collections import defaultdict
+
+import numpy as np
+import psutil
+
+import ray
+from ray import tune
+from ray._private.internal_api import node_stats
+from ray.tune import Callback
+
+
+class _MemoryCallback(Callback):
+    def __init__(self):
+        self.max_store_bytes = defaultdict(int)
+        self.max_trial_uss = 0
+
+    def on_trial_result(self, iteration, trials, trial, result, **info):
+        self.max_trial_uss = max(self.max_trial_uss, result["uss"])
+        for node in ray.nodes():
+            if not node["Alive"]:
+                continue
+            stats = node_stats(
+                node["NodeManagerAddress"],
+                node["NodeManagerPort"],
+                include_memory_info=False,
+            )
+            self.max_store_bytes[node["NodeManagerAddress"]] = max(
+                self.max_store_bytes[node["NodeManagerAddress"]],
+                stats.store_stats.object_store_bytes_used,
+            )
+
+
+def train_fn(config, data=None):
+    if isinstance(data, np.ndarray):
+        checksum = float(data[:: 1024 * 1024].sum())
+    else:
+        checksum = 0.0
+        for batch in data.iter_batches(batch_format="numpy"):
+            checksum += float(batch["data"].sum())
+
+    uss = psutil.Process().memory_full_info().uss
+    for _ in range(config["num_results"]):
+        tune.report({"checksum": checksum, "uss": uss})
+        time.sleep(1)
+
+
+def main(data_type: str, size_mb: int, num_trials: int, num_results: int):
+    ray.init(address="auto")
+
+    num_values = size_mb * 1024 * 1024 // 8
+    if data_type == "numpy":
+        data = np.random.rand(num_values)
+    else:
+        data = ray.data.range_tensor(num_values // 128, shape=(128,)).map_batches(
+            lambda batch: {"data": batch["data"].astype(np.float64)}
+        )
+
+    callback = _MemoryCallback()
+    start = time.monotonic()
+    tuner = tune.Tuner(
+        tune.with_parameters(train_fn, data=data),
+        param_space={"num_results": num_results},
+        tune_config=tune.TuneConfig(num_samples=num_trials),
+        run_config=tune.RunConfig(callbacks=[callback], verbose=0),
+    )
+    tuner.fit()
+    time_taken = time.monotonic() - start
+
+    print(
+        f"TUNE_SHARE_PARAMETERS_PER_NODE="
+        f"{os.environ.get('TUNE_SHARE_PARAMETERS_PER_NODE', '0')}, "
+        f"{num_trials} trials, {size_mb} MB of {data_type} data, "
+        f"{time_taken:.1f} s"
+    )
+    print(f"Max trial USS: {callback.max_trial_uss / 1024 ** 2:.1f} MB")
+    for node_ip, store_bytes in sorted(callback.max_store_bytes.items()):
+        print(f"Max object store usage of {node_ip}: {store_bytes / 1024 ** 2:.1f} MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--data", choices=["numpy", "dataset"], default="numpy")
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument("--num-trials", type=int, default=64)
+    parser.add_argument("--num-results", type=int, default=10)
+    args = parser.parse_args()
+
+    main(args.data, args.size_mb, args.num_trials, args.num_results)